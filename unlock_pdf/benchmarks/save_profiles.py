@@ -0,0 +1,150 @@
+"""
+Benchmark of the profiles to save unlocked PDF files with.
+
+Each profile unlocks copies of the same generated PDF file,
+and its throughput and the size of its unlocked PDF files are logged.
+Run via
+
+    poetry run python benchmarks/save_profiles.py --pages 2000 --repeat 3
+"""
+
+from argparse import ArgumentParser
+from os import urandom
+from pathlib import Path
+from shutil import copyfile
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from pikepdf import (
+    Dictionary,
+    Encryption,
+    Name,
+    ObjectStreamMode,
+    Pdf,
+    Stream
+)
+from unlock_pdf.classes import UniquePaths
+from unlock_pdf.enumerations import FileState, SaveProfile
+from unlock_pdf.functions import _unlock_pdf_file # pyright: ignore[reportPrivateUsage]
+from unlock_pdf.types import GroupedPaths
+
+PASSWORD = "password"
+"""Password that the generated PDF file is encrypted with."""
+
+def generate_pdf_file(file_path: Path, page_count: int) -> None:
+    """
+    Generate an encrypted PDF file resembling a scan,
+    where each page has an uncompressed content stream and an incompressible image,
+    and no object streams.
+
+    :param file_path: Path of the PDF file to generate.
+    :param page_count: Number of pages of the PDF file.
+    """
+
+    with Pdf.new() as pdf:
+        for page_index in range(page_count):
+            pdf.add_blank_page()
+
+            image = Stream(pdf, urandom(64 * 1024))
+            image.stream_dict = Dictionary(
+                BitsPerComponent = 8,
+                ColorSpace = Name.DeviceGray,
+                Height = 256,
+                Subtype = Name.Image,
+                Type = Name.XObject,
+                Width = 256
+            )
+
+            page = pdf.pages[page_index]
+            page.Resources = Dictionary(XObject = Dictionary(Im0 = image))
+            page.Contents = Stream(
+                pdf,
+                b"q 612 0 0 792 0 0 cm /Im0 Do Q\n"
+                + f"BT /F1 12 Tf 72 72 Td (Page {page_index}) Tj ET\n".encode() * 1024
+            )
+
+        pdf.save(
+            file_path,
+            compress_streams = False,
+            encryption = Encryption(
+                aes = True,
+                owner = PASSWORD,
+                R = 6,
+                user = PASSWORD
+            ),
+            object_stream_mode = ObjectStreamMode.disable
+        )
+
+def benchmark_save_profile(
+        file_path: Path,
+        save_profile: SaveProfile,
+        repeat_count: int
+    ) -> tuple[float, int]:
+    """
+    Benchmark unlocking copies of a PDF file with a profile to save them with.
+
+    :param file_path: Path of the encrypted PDF file to copy.
+    :param save_profile: Profile to save the unlocked PDF files with.
+    :param repeat_count: Number of copies to unlock.
+    :returns: Median seconds taken to unlock a copy, and the size of an unlocked copy in bytes.
+    """
+
+    durations: list[float] = []
+    unlocked_file_path = file_path.with_name(f"{save_profile}.pdf")
+
+    for _ in range(repeat_count):
+        copyfile(file_path, unlocked_file_path)
+
+        grouped_pdf_file_paths: GroupedPaths = {
+            file_state: UniquePaths()
+            for file_state in FileState
+        }
+        start_time = perf_counter()
+
+        _unlock_pdf_file(
+            file_path = str(unlocked_file_path),
+            grouped_pdf_file_paths = grouped_pdf_file_paths,
+            passwords = [PASSWORD],
+            save_profile = save_profile
+        )
+
+        durations.append(perf_counter() - start_time)
+
+        assert str(unlocked_file_path) in grouped_pdf_file_paths[FileState.UNLOCKED]
+
+    return median(durations), unlocked_file_path.stat().st_size
+
+def main() -> None:
+    """Benchmark every profile to save unlocked PDF files with and log a table of results."""
+
+    parser = ArgumentParser(description = "Benchmark the profiles to save unlocked PDF files with.")
+
+    parser.add_argument("--pages", default = 500, type = int)
+    parser.add_argument("--repeat", default = 3, type = int)
+
+    arguments = parser.parse_args()
+
+    with TemporaryDirectory() as directory_path:
+        file_path = Path(directory_path) / "encrypted.pdf"
+
+        generate_pdf_file(file_path, arguments.pages)
+
+        input_size = file_path.stat().st_size
+
+        print(f"Input: {arguments.pages} pages, {input_size / 2 ** 20:.1f} MiB")
+        print(f"{'profile':<10}{'seconds':>10}{'MiB/s':>10}{'output MiB':>12}{'ratio':>8}")
+
+        for save_profile in SaveProfile:
+            duration, output_size = benchmark_save_profile(
+                file_path = file_path,
+                repeat_count = arguments.repeat,
+                save_profile = save_profile
+            )
+
+            print(
+                f"{save_profile:<10}{duration:>10.2f}{input_size / 2 ** 20 / duration:>10.1f}"
+                f"{output_size / 2 ** 20:>12.1f}{output_size / input_size:>8.2f}"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,17 @@
 """`unlock-pdf` classes."""
 
+from abc import ABC, abstractmethod
+from argparse import Namespace
+from collections.abc import Iterable, Iterator
 from enum import Enum
-from typing import override
+from hashlib import sha256
+from json import dump, load
+from math import ceil
+from os import stat
+from os.path import realpath
+from secrets import token_hex
+from typing import Any, NamedTuple, override
+from typeguard import typechecked
 
 class MessageEnum(Enum):
     """`Enum` wrapper to emulate `StrEnum` behavior for its members with string values."""
@@ -16,3 +26,755 @@ class MessageEnum(Enum):
             if isinstance(self.value, str)
             else super().__str__()
         )
+
+@typechecked
+class JsonCache(ABC):
+    """Abstract base class of caches that can be persisted across runs as JSON files."""
+
+    @staticmethod
+    def _load(file_path: str) -> Any:
+        """
+        Load the contents of a JSON file.
+
+        :param file_path: Path of the JSON file.
+        :raises OSError: If the JSON file cannot be read.
+        :raises ValueError: If the JSON file is malformed.
+        :returns: Contents of the JSON file.
+        """
+
+        with open(file_path, encoding = "utf-8") as file:
+            return load(file)
+
+    def dump(self, file_path: str) -> None:
+        """
+        Dump the cache into a JSON file,
+        which callers are expected to replace atomically.
+
+        :param file_path: Path of the JSON file.
+        """
+
+        with open(file_path, "w", encoding = "utf-8") as file:
+            dump(self.to_json(), file)
+
+    @abstractmethod
+    def to_json(self) -> dict[str, object]:
+        """
+        Convert the cache into a JSON-serializable object.
+
+        :returns: JSON-serializable object of the cache.
+        """
+
+@typechecked
+class DirectoryManifest(JsonCache):
+    """
+    PDF files and subdirectories of directories keyed on their paths,
+    along with the modification times of said directories, which can be persisted across runs.
+    """
+
+    def __init__(self, directories: dict[str, tuple[int, dict[str, int | None], list[str]]] | None = None) -> None:
+        """
+        Initialize PDF files and subdirectories of directories.
+
+        :param directories: Modification times in nanoseconds, inode numbers of PDF files keyed on their names,
+                            and names of subdirectories of directories keyed on their paths.
+        """
+
+        self._directories = dict(directories or {})
+
+    def add(
+        self,
+        directory_path: str,
+        modification_time: int,
+        pdf_file_inodes: dict[str, int | None],
+        subdirectory_names: list[str]
+    ) -> None:
+        """
+        Remember the PDF files and subdirectories of a directory as of a modification time.
+
+        :param directory_path: Path of the directory.
+        :param modification_time: Modification time of the directory in nanoseconds.
+        :param pdf_file_inodes: Inode numbers of the PDF files of the directory keyed on their names,
+                                in discovery order, or `None` for symbolic links.
+        :param subdirectory_names: Names of the subdirectories of the directory, in discovery order.
+        """
+
+        self._directories[directory_path] = (modification_time, pdf_file_inodes, subdirectory_names)
+
+    def get(
+        self,
+        directory_path: str,
+        modification_time: int
+    ) -> tuple[dict[str, int | None], list[str]] | None:
+        """
+        Get the PDF files and subdirectories of a directory if it has not changed since.
+
+        :param directory_path: Path of the directory.
+        :param modification_time: Current modification time of the directory in nanoseconds.
+        :returns: Inode numbers of the PDF files keyed on their names and names of the subdirectories
+                  of the directory, or `None` if the directory is unknown or has changed since.
+        """
+
+        directory = self._directories.get(directory_path)
+
+        if directory is None or directory[0] != modification_time:
+            return None
+
+        return directory[1], directory[2]
+
+    @classmethod
+    def read(cls, file_path: str) -> "DirectoryManifest":
+        """
+        Read PDF files and subdirectories of directories from a JSON file.
+
+        :param file_path: Path of the JSON file.
+        :returns: Directories read from the JSON file,
+                  or no directories if said file is missing or malformed.
+        """
+
+        try:
+            directories = cls._load(file_path)["directories"]
+        except (KeyError, OSError, TypeError, ValueError):
+            return cls()
+
+        if (
+            not isinstance(directories, dict)
+            or not all(
+                isinstance(directory_path, str)
+                and isinstance(directory, list)
+                and len(directory) == 3 # pyright: ignore[reportUnknownArgumentType]
+                and type(directory[0]) is int
+                and isinstance(directory[1], dict)
+                and all(
+                    isinstance(name, str)
+                    and (inode is None or type(inode) is int)
+                    for name, inode in directory[1].items() # pyright: ignore[reportUnknownVariableType]
+                )
+                and isinstance(directory[2], list)
+                and all(isinstance(name, str) for name in directory[2]) # pyright: ignore[reportUnknownVariableType]
+                for directory_path, directory in directories.items() # pyright: ignore[reportUnknownVariableType]
+            )
+        ):
+            return cls()
+
+        return cls(
+            {
+                directory_path: (modification_time, pdf_file_inodes, subdirectory_names)
+                for directory_path, (modification_time, pdf_file_inodes, subdirectory_names)
+                in directories.items() # pyright: ignore[reportUnknownVariableType]
+            }
+        )
+
+    @override
+    def to_json(self) -> dict[str, object]:
+        """
+        Convert the directories into a JSON-serializable object.
+
+        :returns: Modification times, inode numbers of PDF files keyed on their names,
+                  and names of subdirectories of directories keyed on their paths.
+        """
+
+        return {"directories": self._directories}
+
+class EncryptionParameters(NamedTuple):
+    """Parameters of the standard security handler of an encrypted PDF file."""
+
+    document_id: bytes
+    """First element of the file identifier of the PDF file."""
+
+    key_length: int
+    """Length of the file encryption key in bytes, which is only used before revision 5."""
+
+    owner_hash: bytes
+    """Owner password hash, which is the `/O` entry of the encryption dictionary."""
+
+    permissions: int
+    """Permission flags, which is the `/P` entry of the encryption dictionary."""
+
+    revision: int
+    """
+    Revision of the standard security handler, from 2 to 5,
+    since revision 6 is intentionally left to `pikepdf` instead of being verified directly.
+    """
+
+    should_encrypt_metadata: bool
+    """Whether the document metadata is encrypted or not."""
+
+    user_hash: bytes
+    """User password hash, which is the `/U` entry of the encryption dictionary."""
+
+@typechecked
+class FileOutcomes(JsonCache):
+    """
+    Last outcomes of attempting to unlock PDF files keyed on their signatures,
+    which can be persisted across runs.
+    """
+
+    def __init__(
+        self,
+        passwords: Iterable[str],
+        outcomes: dict[str, str | None] | None = None,
+        salt: str | None = None
+    ) -> None:
+        """
+        Initialize last outcomes of attempting to unlock PDF files.
+
+        :param passwords: Passwords that PDF files are attempted to be unlocked with.
+        :param outcomes: Salted hashes of the sets of passwords that PDF files are still locked with,
+                         or `None` for PDF files that are not locked, keyed on signatures of said PDF files.
+        :param salt: Hexadecimal salt of the hashes, or `None` to generate a new one.
+        """
+
+        self._salt = salt if salt is not None else token_hex(16)
+        self._password_set = sha256(
+            bytes.fromhex(self._salt) + "\0".join(sorted(set(passwords))).encode()
+        ).hexdigest()
+        self._outcomes = {
+            signature: password_set
+            for signature, password_set in (outcomes or {}).items()
+            if password_set is None or password_set == self._password_set
+        }
+
+    def add(self, file_signature: tuple[int, int, int, int], is_locked: bool) -> None:
+        """
+        Remember whether a PDF file is still locked with the current set of passwords or not locked.
+
+        :param file_signature: Signature of the PDF file.
+        :param is_locked: Whether the PDF file is still locked or not locked.
+        """
+
+        self._outcomes[self.identify(file_signature)] = (
+            self._password_set
+            if is_locked
+            else None
+        )
+
+    @staticmethod
+    def identify(file_signature: tuple[int, int, int, int]) -> str:
+        """
+        Identify a PDF file by its signature.
+
+        :param file_signature: Signature of the PDF file.
+        :returns: Signature of the PDF file as a string.
+        """
+
+        return ":".join(str(value) for value in file_signature)
+
+    def is_locked(self, file_signature: tuple[int, int, int, int]) -> bool | None:
+        """
+        Get whether a PDF file is still locked with the current set of passwords or not locked.
+
+        :param file_signature: Signature of the PDF file.
+        :returns: Whether the PDF file is still locked or not locked,
+                  or `None` if its outcome is unknown.
+        """
+
+        identity = self.identify(file_signature)
+
+        if identity not in self._outcomes:
+            return None
+
+        return self._outcomes[identity] is not None
+
+    @classmethod
+    def read(cls, file_path: str, passwords: Iterable[str]) -> "FileOutcomes":
+        """
+        Read last outcomes of attempting to unlock PDF files from a JSON file,
+        dropping those of PDF files that are still locked with another set of passwords.
+
+        :param file_path: Path of the JSON file.
+        :param passwords: Passwords that PDF files are attempted to be unlocked with.
+        :returns: Outcomes read from the JSON file,
+                  or no outcomes if said file is missing or malformed.
+        """
+
+        try:
+            data = cls._load(file_path)
+            outcomes = data["outcomes"]
+            salt = data["salt"]
+
+            bytes.fromhex(salt)
+        except (KeyError, OSError, TypeError, ValueError):
+            return cls(passwords)
+
+        if (
+            not isinstance(outcomes, dict)
+            or not all(
+                isinstance(signature, str) and (password_set is None or isinstance(password_set, str))
+                for signature, password_set in outcomes.items() # pyright: ignore[reportUnknownVariableType]
+            )
+        ):
+            return cls(passwords)
+
+        return cls(
+            outcomes = outcomes, # pyright: ignore[reportUnknownArgumentType]
+            passwords = passwords,
+            salt = salt
+        )
+
+    @override
+    def to_json(self) -> dict[str, object]:
+        """
+        Convert the outcomes into a JSON-serializable object.
+
+        :returns: Salted hashes of the sets of passwords that PDF files are still locked with,
+                  or `None` for PDF files that are not locked, keyed on signatures of said PDF files,
+                  along with their salt.
+        """
+
+        return {"outcomes": self._outcomes, "salt": self._salt}
+
+@typechecked
+class FingerprintPasswords(JsonCache):
+    """
+    Passwords that unlocked PDF files keyed on their encryption fingerprints,
+    which can be persisted across runs.
+    """
+
+    def __init__(
+        self,
+        passwords: list[str],
+        identities: dict[str, str] | None = None,
+        salt: str | None = None
+    ) -> None:
+        """
+        Initialize passwords that unlocked PDF files keyed on their encryption fingerprints.
+
+        :param passwords: Passwords in the order they were given.
+        :param identities: Salted hashes of said passwords keyed on encryption fingerprints.
+        :param salt: Hexadecimal salt of the hashes, or `None` to generate a new one.
+        """
+
+        self._identities = dict(identities or {})
+        self._passwords = passwords
+        self._passwords_by_identity: dict[str, str] = {}
+        self._salt = salt if salt is not None else token_hex(16)
+        self._should_identify_passwords = bool(self._identities)
+
+    def __getitem__(self, fingerprint: str) -> str | None:
+        """
+        Get the password that unlocked the latest PDF file with an encryption fingerprint.
+
+        :param fingerprint: Encryption fingerprint.
+        :returns: Password that unlocked said PDF file, or `None` if there is none.
+        """
+
+        identity = self._identities.get(fingerprint)
+
+        if identity is None:
+            return None
+
+        if identity not in self._passwords_by_identity and self._should_identify_passwords:
+            # <NOTE>
+            # Every password is only hashed once, and only if a password read from a previous run is looked up.
+            self._passwords_by_identity |= {
+                self.identify(password): password
+                for password in self._passwords
+            }
+            self._should_identify_passwords = False
+
+        return self._passwords_by_identity.get(identity)
+
+    def add(self, fingerprint: str, password: str) -> None:
+        """
+        Remember the password that unlocked a PDF file with an encryption fingerprint.
+
+        :param fingerprint: Encryption fingerprint.
+        :param password: Password that unlocked the PDF file.
+        """
+
+        identity = self.identify(password)
+
+        self._identities[fingerprint] = identity
+        self._passwords_by_identity[identity] = password
+
+    def identify(self, password: str) -> str:
+        """
+        Identify a password by its salted hash.
+
+        :param password: Password.
+        :returns: Hexadecimal salted hash of the password.
+        """
+
+        return sha256(bytes.fromhex(self._salt) + password.encode()).hexdigest()
+
+    @classmethod
+    def read(cls, file_path: str, passwords: list[str]) -> "FingerprintPasswords":
+        """
+        Read passwords that unlocked PDF files keyed on their encryption fingerprints
+        from a JSON file.
+
+        :param file_path: Path of the JSON file.
+        :param passwords: Passwords in the order they were given.
+        :returns: Passwords read from the JSON file,
+                  or no passwords if said file is missing or malformed.
+        """
+
+        try:
+            data = cls._load(file_path)
+            identities = data["identities"]
+            salt = data["salt"]
+
+            bytes.fromhex(salt)
+        except (KeyError, OSError, TypeError, ValueError):
+            return cls(passwords)
+
+        if (
+            not isinstance(identities, dict)
+            or not isinstance(salt, str)
+            or not all(
+                isinstance(fingerprint, str) and isinstance(identity, str)
+                for fingerprint, identity in identities.items() # pyright: ignore[reportUnknownVariableType]
+            )
+        ):
+            return cls(passwords)
+
+        return cls(
+            identities = identities, # pyright: ignore[reportUnknownArgumentType]
+            passwords = passwords,
+            salt = salt
+        )
+
+    @override
+    def to_json(self) -> dict[str, object]:
+        """
+        Convert the passwords into a JSON-serializable object.
+
+        :returns: Salted hashes of the passwords keyed on encryption fingerprints, along with their salt.
+        """
+
+        return {"identities": self._identities, "salt": self._salt}
+
+@typechecked
+class MemoryFootprints:
+    """
+    Estimates of the memory that unlocking PDF files takes on top of an idle worker process.
+    """
+
+    def __init__(self, ratio: float, minimum_size: int) -> None:
+        """
+        Initialize estimates of the memory that unlocking PDF files takes.
+
+        :param ratio: Initial ratio of the memory footprint of a PDF file to its size.
+        :param minimum_size: Minimum size of a PDF file to measure, in bytes.
+        """
+
+        self._is_measured = False
+        self._minimum_size = minimum_size
+        self._ratio = ratio
+
+    def estimate(self, size: int) -> int:
+        """
+        Estimate the memory that unlocking a PDF file takes.
+
+        :param size: Size of the PDF file, in bytes.
+        :returns: Estimated memory footprint of the PDF file, in bytes.
+        """
+
+        return ceil(size * self._ratio)
+
+    def measure(self, size: int, peak_memory_usage: int) -> None:
+        """
+        Feed back the peak memory measured while unlocking a PDF file.
+
+        :param size: Size of the PDF file, in bytes.
+        :param peak_memory_usage: Peak memory usage on top of the idle worker process, in bytes.
+        """
+
+        if size < self._minimum_size:
+            return
+
+        ratio = peak_memory_usage / size
+
+        self._ratio = (
+            max(self._ratio, ratio)
+            if self._is_measured
+            else ratio
+        )
+        self._is_measured = True
+
+class Options(Namespace):
+    """Command-line options."""
+
+    cache_dir: str | None
+    """Directory to persist caches across runs in, if any."""
+
+    classify_only: bool
+    """Whether to only count how many PDF files are locked or not without unlocking any."""
+
+    jobs: int
+    """Number of worker processes to unlock PDF files with."""
+
+    journal: str | None
+    """File to append the final file state of each PDF file to, if any."""
+
+    memory_budget: int | None
+    """Maximum memory in MiB that PDF files being unlocked at once are estimated to take, if any."""
+
+    memory_limit: int | None
+    """Maximum address space in MiB of each worker process, if any."""
+
+    null: bool
+    """Whether inputs read from input sources are separated by NUL characters instead of newlines or not."""
+
+    output_dir: str | None
+    """Directory to write unlocked PDF files in instead of overwriting them, if any."""
+
+    passwords_from: str | None
+    """Input source to read passwords from instead of entering them, if any."""
+
+    paths: list[str]
+    """Directory paths and/or file paths of the PDF files to unlock instead of entering them."""
+
+    paths_from: str | None
+    """Input source to stream paths from instead of entering them, if any."""
+
+    resume: bool
+    """Whether to skip PDF files whose final file state is in the journal or not."""
+
+    save_profile: str
+    """Profile to save unlocked PDF files with."""
+
+    schedule: str
+    """Order to unlock PDF files in."""
+
+    shard_passwords: bool
+    """Whether to unlock PDF files one at a time with their passwords split across workers or not."""
+
+    sniff: bool
+    """Whether to skip PDF files that do not start with the PDF file signature or not."""
+
+    timeout: float | None
+    """Maximum seconds to unlock each PDF file in, if any."""
+
+    watch: bool
+    """Whether to keep watching directories and unlock PDF files as soon as they are written or not."""
+
+@typechecked
+class PasswordHits(JsonCache):
+    """
+    Counts of how many PDF files each password unlocked, which can be persisted across runs.
+
+    Counts are keyed on salted hashes of passwords, so no password is ever persisted as is.
+    """
+
+    def __init__(self, counts: dict[str, int] | None = None, salt: str | None = None) -> None:
+        """
+        Initialize counts of how many PDF files each password unlocked.
+
+        :param counts: Counts keyed on salted hashes of passwords.
+        :param salt: Hexadecimal salt of the hashes, or `None` to generate a new one.
+        """
+
+        self._counts = dict(counts or {})
+        self._salt = salt if salt is not None else token_hex(16)
+
+    def __getitem__(self, password: str) -> int:
+        """
+        Get how many PDF files a password unlocked.
+
+        :param password: Password.
+        :returns: Number of PDF files the password unlocked.
+        """
+
+        return self._counts.get(self.identify(password), 0)
+
+    def add(self, password: str) -> None:
+        """
+        Count one more PDF file that a password unlocked.
+
+        :param password: Password that unlocked a PDF file.
+        """
+
+        identity = self.identify(password)
+
+        self._counts[identity] = self._counts.get(identity, 0) + 1
+
+    def identify(self, password: str) -> str:
+        """
+        Identify a password by its salted hash.
+
+        :param password: Password.
+        :returns: Hexadecimal salted hash of the password.
+        """
+
+        return sha256(bytes.fromhex(self._salt) + password.encode()).hexdigest()
+
+    @classmethod
+    def read(cls, file_path: str) -> "PasswordHits":
+        """
+        Read counts of how many PDF files each password unlocked from a JSON file.
+
+        :param file_path: Path of the JSON file.
+        :returns: Counts read from the JSON file,
+                  or empty counts if said file is missing or malformed.
+        """
+
+        try:
+            data = cls._load(file_path)
+            counts = data["counts"]
+            salt = data["salt"]
+
+            bytes.fromhex(salt)
+        except (KeyError, OSError, TypeError, ValueError):
+            return cls()
+
+        if (
+            not isinstance(counts, dict)
+            or not isinstance(salt, str)
+            or not all(
+                isinstance(identity, str) and type(count) is int
+                for identity, count in counts.items() # pyright: ignore[reportUnknownVariableType]
+            )
+        ):
+            return cls()
+
+        return cls(
+            counts = counts, # pyright: ignore[reportUnknownArgumentType]
+            salt = salt
+        )
+
+    @override
+    def to_json(self) -> dict[str, object]:
+        """
+        Convert the counts into a JSON-serializable object.
+
+        :returns: Counts keyed on salted hashes of passwords, along with their salt.
+        """
+
+        return {"counts": self._counts, "salt": self._salt}
+
+class ServeOptions(Namespace):
+    """Command-line options of the unlock server."""
+
+    host: str
+    """Host to serve unlock requests on."""
+
+    jobs: int
+    """Number of worker processes to unlock PDF files with."""
+
+    max_concurrency: int | None
+    """Number of unlock requests to unlock at once, or `None` to use the job count."""
+
+    max_request_size: int
+    """Maximum size of the body of an unlock request, in bytes."""
+
+    null: bool
+    """Whether passwords read from the input source are separated by NUL characters instead of newlines or not."""
+
+    passwords_from: str | None
+    """Input source to read the passwords of unlock requests without any from, if any."""
+
+    port: int
+    """Port to serve unlock requests on."""
+
+    save_profile: str
+    """Profile to save unlocked PDF files with."""
+
+@typechecked
+class UniquePaths:
+    """
+    Insertion-ordered set of paths that are unique by the file they point to.
+    """
+
+    def __init__(self, paths: Iterable[str] = ()) -> None:
+        """
+        Initialize an insertion-ordered set of paths.
+
+        :param paths: Paths to add in order.
+        """
+
+        self._paths: dict[tuple[int, int] | str, str] = {}
+
+        for path in paths:
+            self.add(path)
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare with another insertion-ordered set of paths by its paths and their order.
+
+        :param other: Object to compare with.
+        :returns: Whether both sets have the same paths in the same order or not.
+        """
+
+        return (
+            isinstance(other, UniquePaths)
+            and list(self) == list(other)
+        )
+
+    def __contains__(self, path: object) -> bool:
+        """
+        Check if a path points to a file already in the set.
+
+        :param path: Path of a file.
+        :returns: Whether the file the path points to is in the set or not.
+        """
+
+        return (
+            isinstance(path, str)
+            and self.identify(path) in self._paths
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the paths in insertion order.
+
+        :returns: Iterator of the paths in insertion order.
+        """
+
+        return iter(self._paths.values())
+
+    def __len__(self) -> int:
+        """
+        Count the paths.
+
+        :returns: Number of paths in the set.
+        """
+
+        return len(self._paths)
+
+    @override
+    def __repr__(self) -> str:
+        """
+        Represent the set by its paths in insertion order.
+
+        :returns: Representation of the set.
+        """
+
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def add(self, path: str, identity: tuple[int, int] | None = None) -> bool:
+        """
+        Add a path if the file it points to is not yet in the set.
+
+        :param path: Path of a file.
+        :param identity: Device number and inode number of the file if already known,
+                         so that the file is not queried again.
+        :returns: Whether the path was added or not.
+        """
+
+        key = identity if identity is not None else self.identify(path)
+
+        if key in self._paths:
+            return False
+
+        self._paths[key] = path
+
+        return True
+
+    @staticmethod
+    def identify(path: str) -> tuple[int, int] | str:
+        """
+        Identify the file a path points to.
+
+        :param path: Path of a file.
+        :returns: Device number and inode number of the file if it can be queried.
+                  Otherwise, its resolved real path.
+        """
+
+        try:
+            file_stat = stat(path)
+        except OSError:
+            return realpath(path)
+
+        return (file_stat.st_dev, file_stat.st_ino)
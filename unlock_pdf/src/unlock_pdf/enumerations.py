@@ -1,9 +1,46 @@
 """`unlock-pdf` enumerations."""
 
-from enum import StrEnum
+from enum import Enum, IntEnum, StrEnum
+from errno import EAGAIN, EBUSY
 from typeguard import typechecked
 from unlock_pdf.classes import MessageEnum
 
+class ByteCount(IntEnum):
+    """Enumeration of byte count constants."""
+
+    HTTP_REQUEST_BODY = 64 << 20
+    HTTP_REQUEST_HEAD = 65536
+    INOTIFY_EVENT_BUFFER = 65536
+    INOTIFY_EVENT_HEADER = 16
+    INPUT_BATCH = 1 << 20
+    KIBIBYTE = 1024
+    MEBIBYTE = 1 << 20
+    MEMORY_FOOTPRINT_SAMPLE = 1 << 20
+    PDF_FILE_FOOTER = 1024
+    PDF_FILE_HEADER = 1024
+    XREF_ENTRY = 20
+
+class CharacterCount(IntEnum):
+    """Enumeration of character count constants."""
+
+    INPUT_CHUNK = 65536
+
+class ClearRefsCommand(bytes, Enum):
+    """Enumeration of commands that can be written to `/proc/self/clear_refs`."""
+
+    RESET_PEAK_MEMORY_USAGE = b"5"
+
+class Command(StrEnum):
+    """Enumeration of command-line subcommands."""
+
+    SERVE = "serve"
+
+class ContentType(StrEnum):
+    """Enumeration of HTTP content types."""
+
+    JSON = "application/json"
+    PDF = "application/pdf"
+
 class ErrorMessage(MessageEnum):
     """Enumeration of error messages."""
 
@@ -24,32 +61,227 @@ class ErrorMessage(MessageEnum):
 
         return f"Unlocking {file_path} failed."
 
+    @classmethod
+    @typechecked
+    def _generate_failed_classification_error_message(cls, file_path: str) -> str:
+        """
+        Generate an error message for failed classification based on the path of a PDF file.
+
+        :param file_path: Path of a PDF file.
+        :raises TypeCheckError: If any argument or return value has an invalid type.
+        :raises ValueError: If the file path is an empty string.
+        :returns: Error message for failed classification.
+        """
+
+        if not file_path:
+            raise ValueError(cls.EMPTY_FILE_PATH)
+
+        return f"Classifying {file_path} failed."
+
+    @classmethod
+    @typechecked
+    def _generate_timed_out_error_message(cls, timeout: float) -> str:
+        """
+        Generate an error message for a timed out unlock attempt based on the timeout it went over.
+
+        :param timeout: Timeout of the unlock attempt, in seconds.
+        :raises TypeCheckError: If any argument or return value has an invalid type.
+        :raises ValueError: If the timeout is not positive.
+        :returns: Error message for a timed out unlock attempt, described like an exception.
+        """
+
+        if timeout <= 0:
+            raise ValueError(cls.NON_POSITIVE_TIMEOUT)
+
+        return f"TimeoutError: Unlocking took longer than {timeout:g} s."
+
     EMPTY_FILE_PATH = "File path must be a non-empty string."
+    FAILED_CLASSIFICATION = _generate_failed_classification_error_message
+    FAILED_DATA_UNLOCK = "Unlocking PDF data failed."
     FAILED_OVERWRITE = _generate_failed_overwrite_error_message
+    HTTP_REQUEST_TOO_LARGE = "HTTP request body must not exceed the maximum request size."
+    ISOLATION_CONFLICT = "Limiting each PDF file cannot be combined with sharding passwords, " + \
+                         "watching, or a memory budget."
+    LOW_AVERAGE_ATTEMPT_COUNT = "Average attempt count must be at least 1."
+    MALFORMED_HTTP_REQUEST = "HTTP request must be well-formed."
+    MALFORMED_PASSWORDS_HEADER = "Passwords header must be a JSON array of strings."
+    MALFORMED_PDF_OBJECT = "PDF object must be well-formed."
+    MEMORY_BUDGET_WITH_SHARD_PASSWORDS = "A memory budget cannot be combined with sharding passwords."
+    MEMORY_BUDGET_WITH_SINGLE_JOB = "A memory budget cannot be combined with a single job."
+    MEMORY_BUDGET_WITH_WATCH = "A memory budget cannot be combined with watching."
     NEGATIVE_FILE_STATE_COUNT = "File state count must be a non-negative integer."
+    NON_POSITIVE_CONCURRENCY = "Maximum concurrency must be a positive integer."
+    NON_POSITIVE_JOB_COUNT = "Job count must be a positive integer."
+    NON_POSITIVE_MEMORY_BUDGET = "Memory budget must be a positive integer."
+    NON_POSITIVE_MEMORY_LIMIT = "Memory limit must be a positive integer."
+    NON_POSITIVE_REQUEST_SIZE = "Maximum request size must be a positive integer."
+    NON_POSITIVE_TIMEOUT = "Timeout must be a positive number."
+    NO_CONTENT_LENGTH = "HTTP request must have a content length."
+    NO_HTTP_METHOD = "HTTP request method must be supported by its route."
+    NO_HTTP_ROUTE = "HTTP request must target an existing route."
     NO_INVALID_EXECUTION = "`unlock_pdf` must only be executed if directly imported from " + \
                            "`unlock_pdf.functions` and not from here."
+    NO_JOURNAL_TO_RESUME = "A journal must be given to resume from."
+    NO_UNLOCKING_PASSWORD = "At least one password must unlock the PDF data."
+    NO_VALID_DIRECTORY_PATH = "At least one path must point to a directory."
     NO_VALID_PASSWORD = "At least one password must be given."
     NO_VALID_PATH = "At least one path must ultimately point to a PDF file."
+    SHARD_PASSWORDS_WITH_SINGLE_JOB = "Sharding passwords cannot be combined with a single job."
+    STANDARD_INPUT_CONFLICT = "Paths cannot be streamed from standard input while passwords are read from it too."
+    TIMED_OUT = _generate_timed_out_error_message
+    WATCH_WITH_CLASSIFY_ONLY = "Watching cannot be combined with only classifying."
+    WORKER_EXITED = "ChildProcessError: Worker process exited while unlocking."
 
 class FileState(StrEnum):
     """Enumeration of states that a PDF file may be after an unlock attempt."""
 
+    ABORTED = "aborted"
+    FAILED = "in error"
     LOCKED = "still locked"
     NOT_LOCKED = "not locked"
     UNLOCKED = "unlocked"
 
+class Host(StrEnum):
+    """Enumeration of host constants."""
+
+    LOCALHOST = "127.0.0.1"
+
+class HttpHeader(StrEnum):
+    """Enumeration of HTTP header names, in lowercase as they are compared case-insensitively."""
+
+    ATTEMPT_COUNT = "x-attempt-count"
+    CONTENT_LENGTH = "content-length"
+    FILE_STATE = "x-file-state"
+    PASSWORDS = "x-passwords"
+
+class HttpRoute(StrEnum):
+    """Enumeration of HTTP routes of the unlock server."""
+
+    STATS = "/stats"
+    UNLOCK = "/unlock"
+
+class InotifyFlag(IntEnum):
+    """Enumeration of flags to initialize an inotify instance with."""
+
+    CLOSE_ON_EXEC = 0o2000000
+    NON_BLOCKING = 0o4000
+
+class InotifyMask(IntEnum):
+    """Enumeration of inotify event masks."""
+
+    CLOSE_WRITE = 0x8
+    CREATE = 0x100
+    IS_DIRECTORY = 0x40000000
+    MOVED_TO = 0x80
+    QUEUE_OVERFLOW = 0x4000
+
 class InputPrompt(StrEnum):
     """Enumeration of input prompt constants."""
 
+    DIRECTORY_PATHS = "Enter every directory path to watch for PDF files to unlock."
     END = "Enter an empty string to quit."
     MARKER = ">"
     PASSWORDS = "Enter every password to attempt unlocking each PDF file with."
     PATHS = "Enter every directory path and/or file path of the PDF files to unlock."
 
+class InputSeparator(StrEnum):
+    """Enumeration of separators between inputs read from input sources."""
+
+    NEWLINE = "\n"
+    NULL = "\0"
+
+class InputSource(StrEnum):
+    """Enumeration of input source constants."""
+
+    ENVIRONMENT_VARIABLE_PREFIX = "env:"
+    FILE_DESCRIPTOR_PREFIX = "fd:"
+    STANDARD_INPUT = "-"
+
+class JournalField(StrEnum):
+    """Enumeration of fields of journal entries."""
+
+    DEVICE = "device"
+    FILE_PATH = "file_path"
+    FILE_STATE = "file_state"
+    INODE = "inode"
+    MODIFIED_TIME = "mtime_ns"
+    SIZE = "size"
+
+class LatencyPercentile(IntEnum):
+    """Enumeration of latency percentiles to report."""
+
+    P50 = 50
+    P90 = 90
+    P99 = 99
+
+class LogCount(IntEnum):
+    """Enumeration of how many items to log at most."""
+
+    COSTLIEST_PDF_FILES = 5
+
 class LogMessage(MessageEnum):
     """Enumeration of log messages."""
 
+    @classmethod
+    @typechecked
+    def _generate_average_attempt_count_log_message(cls, average_attempt_count: float) -> str:
+        """
+        Generate a log message based on how many passwords were attempted on average
+        until each unlocked PDF file was unlocked.
+
+        :param average_attempt_count: Average number of passwords attempted per unlocked PDF file.
+        :raises TypeCheckError: If any argument or return value has an invalid type.
+        :raises ValueError: If the average attempt count is less than 1.
+        :returns: Log message detailing the average number of attempts per unlocked PDF file.
+        """
+
+        if average_attempt_count < 1:
+            raise ValueError(ErrorMessage.LOW_AVERAGE_ATTEMPT_COUNT)
+
+        return f"Each unlocked PDF file took {average_attempt_count:.2f} attempts on average."
+
+    @classmethod
+    @typechecked
+    def _generate_file_error_log_message(cls, file_path: str, error: str) -> str:
+        """
+        Generate a log message based on
+
+        - the path of a PDF file, and
+        - the error that made attempting to unlock said PDF file fail.
+
+        :param file_path: Path of a PDF file.
+        :param error: Description of the error that made attempting to unlock said PDF file fail.
+        :raises TypeCheckError: If any argument or return value has an invalid type.
+        :raises ValueError: If the file path is an empty string.
+        :returns: Log message detailing why attempting to unlock said PDF file failed.
+        """
+
+        if not file_path:
+            raise ValueError(ErrorMessage.EMPTY_FILE_PATH)
+
+        return f"Unlocking {file_path} failed due to {error}"
+
+    @classmethod
+    @typechecked
+    def _generate_file_result_log_message(cls, file_path: str, file_state: FileState) -> str:
+        """
+        Generate a log message based on
+
+        - the path of a PDF file, and
+        - the state said PDF file is in after an unlock attempt.
+
+        :param file_path: Path of a PDF file.
+        :param file_state: State of said PDF file after an unlock attempt.
+        :raises TypeCheckError: If any argument or return value has an invalid type.
+        :raises ValueError: If the file path is an empty string.
+        :returns: Log message detailing the state said PDF file is in.
+        """
+
+        if not file_path:
+            raise ValueError(ErrorMessage.EMPTY_FILE_PATH)
+
+        return f"{file_path} is {file_state}."
+
     @classmethod
     @typechecked
     def _generate_file_state_count_log_message(
@@ -78,8 +310,127 @@ class LogMessage(MessageEnum):
 
         return f"{file_state_count} PDF file{plural_suffix} {be_verb} {file_state}:"
 
+    @classmethod
+    @typechecked
+    def _generate_file_state_total_log_message(
+        cls,
+        file_state: FileState,
+        file_state_count: int
+    ) -> str:
+        """
+        Generate a standalone log message based on
+
+        - a file state, and
+        - the number of PDF files that are in said file state.
+
+        :param file_state: State of a PDF file after an unlock attempt.
+        :param file_state_count: Number of PDF files that are in said file state.
+        :raises TypeCheckError: If any argument or return value has an invalid type.
+        :raises ValueError: If the file state count is a negative integer.
+        :returns: Log message detailing the number of PDF files that are in said file state.
+        """
+
+        return cls.FILE_STATE_COUNT(
+            file_state = file_state,
+            file_state_count = file_state_count
+        ).removesuffix(":") + "."
+
+    @classmethod
+    @typechecked
+    def _generate_latency_percentiles_log_message(cls, latency_percentiles: dict[str, float]) -> str:
+        """
+        Generate a log message based on the latency percentiles of served unlock requests.
+
+        :param latency_percentiles: Latency percentiles in milliseconds keyed on their names.
+        :raises TypeCheckError: If any argument or return value has an invalid type.
+        :returns: Log message detailing said latency percentiles.
+        """
+
+        if not latency_percentiles:
+            return "No unlock request was served."
+
+        return "Unlock requests took " + ", ".join(
+            f"{latency:.2f} ms at {name}"
+            for name, latency in latency_percentiles.items()
+        ) + "."
+
+    @classmethod
+    @typechecked
+    def _generate_unlock_cost_log_message(cls, file_path: str, unlock_cost: float) -> str:
+        """
+        Generate a log message based on
+
+        - the path of a PDF file, and
+        - the estimated cost of unlocking said PDF file.
+
+        :param file_path: Path of a PDF file.
+        :param unlock_cost: Estimated cost of unlocking said PDF file, in seconds.
+        :raises TypeCheckError: If any argument or return value has an invalid type.
+        :raises ValueError: If the file path is an empty string.
+        :returns: Log message detailing the estimated cost of unlocking said PDF file.
+        """
+
+        if not file_path:
+            raise ValueError(ErrorMessage.EMPTY_FILE_PATH)
+
+        return f"{file_path} (~{unlock_cost:.2f} s)"
+
+    @classmethod
+    @typechecked
+    def _generate_unlock_cost_total_log_message(cls, unlock_cost_total: float) -> str:
+        """
+        Generate a log message based on the estimated cost of unlocking every scheduled PDF file.
+
+        :param unlock_cost_total: Estimated cost of unlocking every scheduled PDF file, in seconds.
+        :raises TypeCheckError: If any argument or return value has an invalid type.
+        :returns: Log message detailing said cost, introducing the costliest PDF files.
+        """
+
+        return f"Unlocking was estimated to take ~{unlock_cost_total:.2f} s of work, costliest first:"
+
+    @classmethod
+    @typechecked
+    def _generate_serving_log_message(cls, host: str, port: int) -> str:
+        """
+        Generate a log message based on the address the unlock server is serving on.
+
+        :param host: Host the unlock server is bound to.
+        :param port: Port the unlock server is bound to.
+        :raises TypeCheckError: If any argument or return value has an invalid type.
+        :returns: Log message detailing where unlock requests are served.
+        """
+
+        return f"Serving unlock requests on http://{host}:{port} until interrupted."
+
+    AVERAGE_ATTEMPT_COUNT = _generate_average_attempt_count_log_message
+    FILE_ERROR = _generate_file_error_log_message
+    FILE_RESULT = _generate_file_result_log_message
     FILE_STATE_COUNT = _generate_file_state_count_log_message
+    FILE_STATE_TOTAL = _generate_file_state_total_log_message
+    LATENCY_PERCENTILES = _generate_latency_percentiles_log_message
     NO_PDF_FILE_PATH = "-"
+    SERVING = _generate_serving_log_message
+    UNLOCK_COST = _generate_unlock_cost_log_message
+    UNLOCK_COST_TOTAL = _generate_unlock_cost_total_log_message
+
+class MemoryField(StrEnum):
+    """Enumeration of memory usage fields of `/proc/self/status`."""
+
+    CURRENT = "VmRSS"
+    PEAK = "VmHWM"
+
+class MemoryFootprintRatio(float, Enum):
+    """
+    Enumeration of memory footprint ratio constants,
+    as multiples of the size of the PDF file being unlocked.
+    """
+
+    INITIAL = 4.0
+
+class ModificationTime(IntEnum):
+    """Enumeration of modification time constants, in nanoseconds."""
+
+    RACY_THRESHOLD = 2_000_000_000
 
 class Module(StrEnum):
     """Enumeration of module names."""
@@ -87,9 +438,201 @@ class Module(StrEnum):
     DIRECT_EXECUTION = "__main__"
     PACKAGE_EXECUTION = "unlock_pdf.__main__"
 
+class OptionHelp(StrEnum):
+    """Enumeration of command-line option help messages."""
+
+    CACHE_DIR = "directory to persist caches across runs in, such as password hit counts and file outcomes"
+    CLASSIFY_ONLY = "only count how many PDF files are locked or not without unlocking any"
+    HOST = "host to serve unlock requests on, defaulting to localhost"
+    JOBS = "number of worker processes to unlock PDF files with, defaulting to the CPU count"
+    JOURNAL = "file to append the final file state of each PDF file to as soon as it is done with"
+    MAX_CONCURRENCY = "number of unlock requests to unlock at once, defaulting to the job count"
+    MAX_REQUEST_SIZE = "maximum size of the body of an unlock request, in bytes"
+    MEMORY_BUDGET = "maximum memory in MiB that PDF files being unlocked at once are estimated to take, " + \
+                    "where a PDF file estimated to take more is unlocked alone"
+    MEMORY_LIMIT = "maximum address space in MiB of each worker process, " + \
+                   "beyond which the PDF file being unlocked is aborted and the worker process is replaced"
+    NULL = "separate inputs read from input sources by NUL characters instead of newlines"
+    OUTPUT_DIR = "directory to write unlocked PDF files in, mirroring their paths, instead of overwriting them"
+    PASSWORDS_FROM = "input source to read passwords from instead of entering them, " + \
+                     "either a file, - for standard input, env:NAME, or fd:N"
+    PATHS = "directory paths and/or file paths of the PDF files to unlock instead of entering them"
+    PATHS_FROM = "input source to stream paths from instead of entering them, " + \
+                 "either a file, - for standard input, env:NAME, or fd:N"
+    PORT = "port to serve unlock requests on"
+    RESUME = "skip PDF files whose final file state is in the journal and which have not changed since"
+    SAVE_PROFILE = "how to save unlocked PDF files, either as fast as possible or as small as possible"
+    SCHEDULE = "order to unlock PDF files in, either as discovered or from the costliest " + \
+               "as estimated from their size and encryption revision"
+    SERVE_PASSWORDS_FROM = "input source to read the passwords of unlock requests without any from, " + \
+                           "either a file, - for standard input, env:NAME, or fd:N"
+    SHARD_PASSWORDS = "unlock PDF files one at a time with their passwords split across workers"
+    SNIFF = "skip PDF files that do not start with the PDF file signature within their first KiB"
+    TIMEOUT = "maximum seconds to unlock each PDF file in, " + \
+              "beyond which it is aborted and the worker process unlocking it is replaced"
+    WATCH = "keep watching directories and unlock PDF files as soon as they are written, until interrupted"
+
 class Path(StrEnum):
     """Enumeration of path constants."""
 
+    CLEAR_REFS_FILE = "/proc/self/clear_refs"
+    DIRECTORY_MANIFEST_FILE_NAME = "directory-manifest.json"
+    FILE_OUTCOMES_FILE_NAME = "file-outcomes.json"
+    FINGERPRINT_PASSWORDS_FILE_NAME = "fingerprint-passwords.json"
+    HIDDEN_FILE_PREFIX = "."
+    PASSWORD_HITS_FILE_NAME = "password-hits.json"
     PDF_FILE_EXTENSION = ".pdf"
-    PDF_FILE_SEARCH_PATTERN = "/**/*.pdf"
     QUOTATION_MARK = '"'
+    STATUS_FILE = "/proc/self/status"
+    TEMPORARY_FILE_EXTENSION = ".tmp"
+
+class PdfName(StrEnum):
+    """Enumeration of PDF names."""
+
+    COLUMNS = "/Columns"
+    DECODE_PARMS = "/DecodeParms"
+    ENCRYPT = "/Encrypt"
+    ENCRYPT_METADATA = "/EncryptMetadata"
+    FILTER = "/Filter"
+    FLATE_DECODE = "/FlateDecode"
+    ID = "/ID"
+    INDEX = "/Index"
+    LENGTH = "/Length"
+    O = "/O"
+    P = "/P"
+    PREDICTOR = "/Predictor"
+    PREV = "/Prev"
+    R = "/R"
+    SIZE = "/Size"
+    STANDARD = "/Standard"
+    TYPE = "/Type"
+    U = "/U"
+    V = "/V"
+    W = "/W"
+    XREF = "/XRef"
+
+class PdfPattern(bytes, Enum):
+    """Enumeration of raw PDF syntax patterns."""
+
+    HEXADECIMAL_STRING = rb"<([0-9A-Fa-f\x00\t\n\x0c\r ]*)>"
+    KEYWORD = rb"(?:false|null|true)(?![^\x00\t\n\x0c\r ()<>\[\]{}/%])"
+    NAME = rb"/[^\x00\t\n\x0c\r ()<>\[\]{}/%]*"
+    NAME_ESCAPE = rb"#([0-9A-Fa-f]{2})"
+    NUMBER = rb"[+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)"
+    OBJECT_HEADER = rb"[\x00\t\n\x0c\r ]*[0-9]+[\x00\t\n\x0c\r ]+[0-9]+[\x00\t\n\x0c\r ]+obj" + \
+                    rb"(?![^\x00\t\n\x0c\r ()<>\[\]{}/%])"
+    REFERENCE = rb"([0-9]+)[\x00\t\n\x0c\r ]+([0-9]+)[\x00\t\n\x0c\r ]+R" + \
+                rb"(?![^\x00\t\n\x0c\r ()<>\[\]{}/%])"
+    START_XREF_VALUE = rb"[\x00\t\n\x0c\r ]*([0-9]+)"
+    STREAM_START = rb"[\x00\t\n\x0c\r ]*stream(?:\r\n|\n)"
+    WHITESPACE = rb"(?:[\x00\t\n\x0c\r ]|%[^\r\n]*)+"
+    WHITESPACE_CHARACTER = rb"[\x00\t\n\x0c\r ]"
+    XREF_ENTRY = rb"([0-9]{10}) [0-9]{5} ([fn])"
+    XREF_SUBSECTION = rb"[\x00\t\n\x0c\r ]*([0-9]+) ([0-9]+)[ ]*(?:\r\n|\r|\n)"
+    XREF_TABLE = rb"[\x00\t\n\x0c\r ]*xref(?![^\x00\t\n\x0c\r ()<>\[\]{}/%])"
+
+class PdfToken(bytes, Enum):
+    """Enumeration of raw PDF syntax tokens."""
+
+    ARRAY_END = b"]"
+    ARRAY_START = b"["
+    CARRIAGE_RETURN = b"\r"
+    DICTIONARY_END = b">>"
+    DICTIONARY_START = b"<<"
+    ESCAPE = b"\\"
+    LINE_FEED = b"\n"
+    LITERAL_STRING_END = b")"
+    LITERAL_STRING_START = b"("
+    OCTAL_DIGITS = b"01234567"
+    PASSWORD_PADDING = bytes.fromhex(
+        "28BF4E5E4E758A4164004E56FFFA01082E2E00B6D0683E802F0CA9FE6453697A"
+    )
+    SIGNATURE = b"%PDF-"
+    START_XREF = b"startxref"
+    TRAILER = b"trailer"
+
+class PendingTaskCount(IntEnum):
+    """Enumeration of pending task count constants."""
+
+    PER_WORKER = 2
+
+class Port(IntEnum):
+    """Enumeration of port constants."""
+
+    SERVE = 8765
+
+class Program(StrEnum):
+    """Enumeration of program constants."""
+
+    DESCRIPTION = "Unlock password-protected PDF files."
+    NAME = "unlock-pdf"
+    SERVE_DESCRIPTION = "Serve unlocking password-protected PDF files over HTTP with warm worker processes."
+
+class RetryCount(IntEnum):
+    """Enumeration of retry count constants."""
+
+    TRANSIENT_ERROR = 5
+
+class RetryDelay(float, Enum):
+    """Enumeration of retry delay constants, in seconds."""
+
+    INITIAL = 0.1
+    MAXIMUM = 1.0
+
+class SampleCount(IntEnum):
+    """Enumeration of sample count constants."""
+
+    LATENCY = 1024
+
+class SaveProfile(StrEnum):
+    """Enumeration of profiles to save unlocked PDF files with."""
+
+    COMPACT = "compact"
+    FAST = "fast"
+
+class Schedule(StrEnum):
+    """Enumeration of orders to unlock PDF files in."""
+
+    DISCOVERY = "discovery"
+    LONGEST_FIRST = "longest-first"
+
+class ShardCount(IntEnum):
+    """Enumeration of password shard count constants."""
+
+    PER_WORKER = 4
+
+class StageConcurrency(IntEnum):
+    """Enumeration of how many PDF files each I/O stage of an asynchronous pipeline handles at once."""
+
+    READ = 4
+    WRITE = 4
+
+class TransientErrorNumber(IntEnum):
+    """Enumeration of error numbers of I/O errors that may go away if retried."""
+
+    BUSY = EBUSY
+    TRY_AGAIN = EAGAIN
+
+class TransientWindowsErrorNumber(IntEnum):
+    """Enumeration of Windows error numbers of I/O errors that may go away if retried."""
+
+    LOCK_VIOLATION = 33
+    SHARING_VIOLATION = 32
+
+class UnlockCost(float, Enum):
+    """
+    Enumeration of the estimated costs of unlocking a PDF file, in seconds,
+    per byte of said PDF file and per password attempted on it by revision of its standard security handler.
+    """
+
+    PER_BYTE = 1.5e-7
+    PER_R2_PASSWORD = 0.0004
+    PER_R3_PASSWORD = 0.005
+    PER_R5_PASSWORD = 0.0001
+    PER_R6_PASSWORD = 0.01
+
+class WatchDelay(float, Enum):
+    """Enumeration of watch delay constants, in seconds."""
+
+    DEBOUNCE = 0.25
+    POLL = 0.5
@@ -1,276 +1,4534 @@
 """`unlock-pdf` functions."""
 
-from glob import glob
-from os.path import isdir, isfile
+from argparse import ArgumentParser
+from collections import deque
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator
+)
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait
+)
+from contextlib import nullcontext, suppress
+from ctypes import CDLL
+from ctypes.util import find_library
+from hashlib import md5, sha256
+from io import BytesIO
+from itertools import chain, islice
+from json import dumps, loads
+from math import ceil
+from mmap import ACCESS_READ, mmap
+from multiprocessing import Pipe, Process, Value
+from multiprocessing.connection import Connection, wait as connection_wait
+from multiprocessing.sharedctypes import Synchronized
+from os import (
+    O_RDONLY,
+    DirEntry,
+    close,
+    environ,
+    fsdecode,
+    fstat,
+    fsencode,
+    fsync,
+    makedirs,
+    open as open_file_descriptor,
+    process_cpu_count,
+    read,
+    remove,
+    replace,
+    scandir,
+    stat,
+    walk
+)
+from os.path import (
+    abspath,
+    basename,
+    dirname,
+    isdir,
+    isfile,
+    join,
+    splitdrive
+)
+from re import compile, sub
+from select import select
+from shutil import copyfileobj, copymode
+from signal import SIG_IGN, SIGINT, signal
+from struct import unpack_from
+from sys import argv, stdin
+from tempfile import mkstemp
+from time import monotonic, sleep, time_ns
+from typing import Any, TextIO, cast
+from zlib import decompress, error as zlib_error
 from pikepdf import (
+    ObjectStreamMode,
     PasswordError,
     Pdf,
-    PdfError
+    PdfError,
+    StreamDecodeLevel
 )
 from typeguard import typechecked
+from unlock_pdf.classes import (
+    DirectoryManifest,
+    EncryptionParameters,
+    FileOutcomes,
+    FingerprintPasswords,
+    JsonCache,
+    MemoryFootprints,
+    Options,
+    PasswordHits,
+    ServeOptions,
+    UniquePaths
+)
 from unlock_pdf.enumerations import (
+    ByteCount,
+    CharacterCount,
+    ClearRefsCommand,
+    Command,
     ErrorMessage,
     FileState,
+    Host,
+    InotifyFlag,
+    InotifyMask,
     InputPrompt,
+    InputSeparator,
+    InputSource,
+    JournalField,
+    LogCount,
     LogMessage,
-    Path
+    MemoryField,
+    MemoryFootprintRatio,
+    ModificationTime,
+    OptionHelp,
+    Path,
+    PdfName,
+    PdfPattern,
+    PdfToken,
+    PendingTaskCount,
+    Port,
+    Program,
+    RetryCount,
+    RetryDelay,
+    SaveProfile,
+    Schedule,
+    ShardCount,
+    TransientErrorNumber,
+    TransientWindowsErrorNumber,
+    UnlockCost,
+    WatchDelay
 )
 from unlock_pdf.types import (
+    DecryptedPdfFile,
+    FileErrors,
+    FileIdentity,
+    FileSignature,
+    FileStateCounts,
     GroupedPaths,
+    Inotify,
+    IsolatedUnlock,
+    IsolatedWorker,
     MainInputPrompt,
     Inputs,
+    Journal,
     Passwords,
-    Paths
+    Paths,
+    PdfData,
+    PdfDictionary,
+    PdfObject,
+    UnlockCosts,
+    UnlockResult,
+    UnlockedFileSignatures
 )
 
+try:
+    from fcntl import FICLONE, ioctl
+except ImportError: # pragma: no cover
+    # <NOTE>
+    # Copy-on-write reflinks are only attempted where `fcntl` supports them, i.e. on Linux.
+    FICLONE = None
+
+try:
+    from resource import RLIMIT_AS, setrlimit
+except ImportError: # pragma: no cover
+    # <NOTE>
+    # The address space of worker processes is only limited where `resource` supports it, i.e. on Unix.
+    RLIMIT_AS = None
+
+_shared_password_index: Synchronized | None = None # pyright: ignore[reportMissingTypeArgument]
+"""
+Shared index of the earliest password found so far by any password shard,
+which is only set in worker processes for password shards.
+"""
+
+_worker_passwords: Passwords = []
+"""
+Passwords to attempt unlocking each PDF file with, in the order that this worker process last left them,
+which is only set in worker processes so that they are sent to each of them once instead of with every PDF file.
+"""
+
 @typechecked
-def _get_passwords() -> Passwords:
+def _check_password(
+        file_path: str,
+        encryption_parameters: EncryptionParameters | None,
+        password: str
+    ) -> bool:
     """
-    Get the passwords to attempt unlocking each PDF file with.
+    Check if a password opens a PDF file without overwriting it,
+    verifying it against the encryption dictionary of said PDF file if possible
+    and falling back to opening it via `pikepdf` otherwise.
 
+    :param file_path: Sanitized file path of the PDF file.
+    :param encryption_parameters: Parameters of the standard security handler of the PDF file,
+                                  or `None` if they cannot be read.
+    :param password: Password to check.
+    :raises PdfError: If opening the PDF file via `pikepdf` failed.
     :raises TypeCheckError: If any argument or return value has an invalid type.
-    :raises ValueError: If no password was given.
-    :returns: Ordered list of unique passwords to attempt unlocking each PDF file with.
+    :returns: Whether the password opens the PDF file or not.
     """
 
-    passwords = _get_unique_inputs(InputPrompt.PASSWORDS)
+    if encryption_parameters is not None:
+        if _verify_password(encryption_parameters, password):
+            return True
 
-    if not passwords:
-        raise ValueError(ErrorMessage.NO_VALID_PASSWORD)
+        # <NOTE>
+        # As `pikepdf` may encode non-ASCII passwords differently,
+        # those are still checked via `pikepdf`.
+        if password.isascii():
+            return False
 
-    return passwords
+    try:
+        with Pdf.open(file_path, password = password):
+            return True
+    except PasswordError:
+        return False
+    except Exception as exception:
+        raise PdfError(
+            ErrorMessage.FAILED_OVERWRITE(file_path)
+        ) from exception
 
 @typechecked
-def _get_pdf_file_paths() -> Paths:
+def _classify_pdf_data(data: PdfData) -> FileState | None:
     """
-    Get the paths of all PDF files to unlock from every inputted
-
-    - directory path where some PDF files are, and/or
-    - file path of a PDF file.
+    Classify raw PDF data as locked or not without `pikepdf`
+    by scanning its trailer for an encryption dictionary.
 
-    :raises FileNotFoundError: If every path does not ultimately point to a PDF file.
+    :param data: Raw PDF data.
     :raises TypeCheckError: If any argument or return value has an invalid type.
-    :returns: Ordered list of unique paths of all PDF files to unlock.
+    :returns: `FileState.LOCKED` if the PDF data is encrypted,
+              `FileState.NOT_LOCKED` if it is not, or
+              `None` if the scan is ambiguous.
     """
 
-    paths = _get_unique_inputs(InputPrompt.PATHS)
-    pdf_file_paths: Paths = []
+    trailer = _read_trailer(data)
 
-    for path in paths:
-        subpaths = _get_pdf_file_subpaths(
-            _sanitize_path(path)
-        )
+    if trailer is None:
+        return None
+
+    return (
+        FileState.LOCKED
+        if PdfName.ENCRYPT in trailer
+        else FileState.NOT_LOCKED
+    )
 
-        for subpath in subpaths:
-            if subpath not in pdf_file_paths:
-                pdf_file_paths.append(subpath)
+@typechecked
+def _classify_pdf_file(file_path: str) -> FileState | None:
+    """
+    Classify a PDF file as locked or not without `pikepdf`
+    by memory-mapping it and scanning its trailer for an encryption dictionary.
 
-    if not pdf_file_paths:
-        raise FileNotFoundError(ErrorMessage.NO_VALID_PATH)
+    Only the pages around the end of the PDF file and its last cross-reference section
+    are ever read.
 
-    return pdf_file_paths
+    :param file_path: Sanitized file path of the PDF file to classify.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: `FileState.LOCKED` if the PDF file is encrypted,
+              `FileState.NOT_LOCKED` if it is not, or
+              `None` if the scan is ambiguous.
+    """
+
+    return _scan_pdf_file(file_path, _classify_pdf_data)
 
 @typechecked
-def _get_pdf_file_subpaths(path: str) -> Paths:
+def _clone_file(source_file_path: str, destination_file_path: str) -> None:
     """
-    Get the paths of some PDF files to unlock from either
+    Clone a file via a copy-on-write reflink if the file system supports it,
+    falling back to copying its contents otherwise.
 
-    - a directory path where some PDF files are, or
-    - a file path of a PDF file.
+    :param source_file_path: Path of the file to clone.
+    :param destination_file_path: Path of the clone, which is overwritten if it exists.
+    :raises OSError: If either file cannot be opened or copying failed.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
 
-    :param path: Directory path or file path of some PDF files to unlock.
+    with (
+        open(source_file_path, "rb") as source_file,
+        open(destination_file_path, "wb") as destination_file
+    ):
+        if FICLONE is not None:
+            try:
+                ioctl(destination_file.fileno(), FICLONE, source_file.fileno())
+
+                return
+            except OSError:
+                pass
+
+        copyfileobj(source_file, destination_file)
+
+@typechecked
+def _compute_rc4_key(encryption_parameters: EncryptionParameters, password: bytes) -> bytes:
+    """
+    Compute the RC4 file encryption key of revisions 2 to 4 of the standard security handler
+    from a user password.
+
+    :param encryption_parameters: Parameters of the standard security handler.
+    :param password: User password, encoded.
     :raises TypeCheckError: If any argument or return value has an invalid type.
-    :returns: Ordered list of unique paths of some PDF files to unlock.
+    :returns: File encryption key.
     """
 
-    if isdir(path):
-        return glob(
-                pathname = path + Path.PDF_FILE_SEARCH_PATTERN,
-                recursive = True
+    digest = md5(
+        (password + PdfToken.PASSWORD_PADDING)[:32]
+        + encryption_parameters.owner_hash
+        + (encryption_parameters.permissions & 0xFFFFFFFF).to_bytes(4, "little")
+        + encryption_parameters.document_id
+        + (
+            b"\xff" * 4
+            if encryption_parameters.revision >= 4
+            and not encryption_parameters.should_encrypt_metadata
+            else b""
         )
-    elif _is_pdf_file(path):
-        return [path]
+    ).digest()
+
+    if encryption_parameters.revision >= 3:
+        for _ in range(50):
+            digest = md5(digest[:encryption_parameters.key_length]).digest()
 
-    return []
+    return digest[:encryption_parameters.key_length]
 
 @typechecked
-def _get_unique_inputs(prompt: MainInputPrompt) -> Inputs:
+def _count_file_states(pdf_file_paths: Iterable[str]) -> FileStateCounts:
     """
-    Get unique inputs until an empty string is given.
-    
-    :param prompt: Prompt detailing what inputs are being asked of the user.
+    Count how many PDF files are locked or not without unlocking any of them,
+    counting those that fail to be classified as failed instead of stopping.
+
+    :param pdf_file_paths: Sanitized file paths of the PDF files to classify.
     :raises TypeCheckError: If any argument or return value has an invalid type.
-    :returns: Ordered list of unique inputs.
+    :returns: Dictionary that maps file states with how many PDF files are in them.
     """
 
-    print(prompt)
-    print(InputPrompt.END)
-    print(InputPrompt.MARKER)
+    file_state_counts: FileStateCounts = {
+        FileState.LOCKED: 0,
+        FileState.NOT_LOCKED: 0,
+        FileState.FAILED: 0
+    }
 
-    user_inputs: Inputs = []
+    for pdf_file_path in pdf_file_paths:
+        try:
+            file_state = _detect_file_state(pdf_file_path)
+        except PdfError:
+            file_state = FileState.FAILED
 
-    user_input = input()
-    while user_input != "":
-        if user_input not in user_inputs:
-            user_inputs.append(user_input)
+        file_state_counts[file_state] += 1
 
-        user_input = input()
+    return file_state_counts
+
+@typechecked
+def _crypt_rc4(key: bytes, data: bytes) -> bytes:
+    """
+    Encrypt or decrypt data via RC4.
+
+    :param key: Encryption key.
+    :param data: Data to encrypt or decrypt.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Encrypted or decrypted data.
+    """
+
+    state = list(range(256))
+    j = 0
+
+    for i in range(256):
+        j = (j + state[i] + key[i % len(key)]) & 0xFF
+        state[i], state[j] = state[j], state[i]
 
-    return user_inputs
+    i = j = 0
+    output = bytearray()
+
+    for byte in data:
+        i = (i + 1) & 0xFF
+        j = (j + state[i]) & 0xFF
+        state[i], state[j] = state[j], state[i]
+        output.append(byte ^ state[(state[i] + state[j]) & 0xFF])
+
+    return bytes(output)
 
 @typechecked
-def _is_pdf_file(file_path: str) -> bool:
+def _decode_xref_stream(data: PdfData, trailer: PdfDictionary, offset: int) -> bytes:
     """
-    Validate if a file path
+    Decode the data of a cross-reference stream,
+    undoing its Flate compression and PNG predictor if any.
 
-    - has the PDF file extension, and
-    - points to a file.
+    :param data: Raw PDF data.
+    :param trailer: Dictionary of the cross-reference stream.
+    :param offset: Offset right after the dictionary of the cross-reference stream.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :raises ValueError: If the cross-reference stream is malformed or uses unsupported filters.
+    :returns: Decoded data of the cross-reference stream.
+    """
 
-    :param file_path: Path of a file.
+    match = compile(PdfPattern.STREAM_START).match(data, offset)
+    length = trailer.get(PdfName.LENGTH)
+    filter_name = trailer.get(PdfName.FILTER)
+    decode_parameters = trailer.get(PdfName.DECODE_PARMS, {})
+
+    if (
+        match is None
+        or not isinstance(length, int)
+        or filter_name not in [None, PdfName.FLATE_DECODE, [PdfName.FLATE_DECODE]]
+        or not isinstance(decode_parameters, dict)
+    ):
+        raise ValueError(ErrorMessage.MALFORMED_PDF_OBJECT)
+
+    try:
+        decoded_data = data[match.end():match.end() + length]
+
+        if filter_name is not None:
+            decoded_data = decompress(decoded_data)
+    except zlib_error as exception:
+        raise ValueError(ErrorMessage.MALFORMED_PDF_OBJECT) from exception
+
+    predictor = decode_parameters.get(PdfName.PREDICTOR, 1)
+    columns = decode_parameters.get(PdfName.COLUMNS, 1)
+
+    if predictor == 1:
+        return decoded_data
+
+    if (
+        not isinstance(predictor, int)
+        or not isinstance(columns, int)
+        or predictor < 10
+        or columns < 1
+    ):
+        raise ValueError(ErrorMessage.MALFORMED_PDF_OBJECT)
+
+    # <NOTE>
+    # Undo the PNG predictor row by row,
+    # where every row is prefixed by the type of its filter.
+    previous_row = bytearray(columns)
+    rows = bytearray()
+
+    for row_offset in range(0, len(decoded_data) - columns, columns + 1):
+        filter_type = decoded_data[row_offset]
+        row = bytearray(decoded_data[row_offset + 1:row_offset + 1 + columns])
+
+        for column in range(columns):
+            left = row[column - 1] if column else 0
+            above = previous_row[column]
+            upper_left = previous_row[column - 1] if column else 0
+
+            if filter_type == 1:
+                row[column] = (row[column] + left) & 0xFF
+            elif filter_type == 2:
+                row[column] = (row[column] + above) & 0xFF
+            elif filter_type == 3:
+                row[column] = (row[column] + (left + above) // 2) & 0xFF
+            elif filter_type == 4:
+                estimate = left + above - upper_left
+                distances = [
+                    abs(estimate - left),
+                    abs(estimate - above),
+                    abs(estimate - upper_left)
+                ]
+                row[column] = (
+                    row[column]
+                    + [left, above, upper_left][distances.index(min(distances))]
+                ) & 0xFF
+            elif filter_type != 0:
+                raise ValueError(ErrorMessage.MALFORMED_PDF_OBJECT)
+
+        rows += row
+        previous_row = row
+
+    return bytes(rows)
+
+@typechecked
+def _decrypt_pdf_data(
+        data: bytes,
+        passwords: Passwords,
+        save_profile: SaveProfile
+    ) -> tuple[FileState, str | None, bytes | None]:
+    """
+    Unlock raw PDF data in memory, which is small enough to send back from a worker process.
+
+    :param data: Raw PDF data.
+    :param passwords: Passwords to attempt unlocking the PDF data with.
+    :param save_profile: Profile to save the unlocked PDF data with.
+    :raises PdfError: If reading or unlocking the PDF data failed,
+                      with the description of its root cause as its message.
     :raises TypeCheckError: If any argument or return value has an invalid type.
-    :returns: Whether the file path directly points to a PDF file or not.
+    :returns: File state of the PDF data after attempting to unlock it,
+              along with the password that unlocked it and its unlocked version, if any.
     """
 
+    output = BytesIO()
+
+    try:
+        file_state, unlocking_password = _unlock_pdf_data(
+            data,
+            passwords,
+            lambda pdf: pdf.save(
+                output,
+                **_get_save_arguments(save_profile)
+            )
+        )
+    except Exception as exception:
+        # <NOTE>
+        # The chain of causes of an exception does not survive being sent back from a worker process,
+        # so its root cause is described beforehand.
+        raise PdfError(_get_error_description(exception)) from exception
+
     return (
-        file_path.endswith(Path.PDF_FILE_EXTENSION)
-        and isfile(file_path)
+        file_state,
+        unlocking_password,
+        output.getvalue() if file_state == FileState.UNLOCKED else None
     )
 
 @typechecked
-def _log_unlock_attempt(grouped_pdf_file_paths: GroupedPaths) -> None:
+def _decrypt_worker_pdf_data(
+        data: bytes,
+        prioritized_passwords: Passwords,
+        save_profile: SaveProfile
+    ) -> tuple[FileState, str | None, bytes | None, int]:
     """
-    Log for every file state
+    Unlock raw PDF data in memory as by `_decrypt_pdf_data`
+    with the passwords of this worker process, after moving the passwords to attempt first to their front.
 
-    - how many PDF files are in such file state, and
-    - what are the file paths of those PDF files.
+    :param data: Raw PDF data.
+    :param prioritized_passwords: Passwords to attempt first, in order,
+                                  before the other passwords of this worker process.
+    :param save_profile: Profile to save the unlocked PDF data with.
+    :raises PdfError: If reading or unlocking the PDF data failed,
+                      with the description of its root cause as its message.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: File state of the PDF data after attempting to unlock it,
+              along with the password that unlocked it and its unlocked version, if any,
+              and how many passwords were attempted to unlock it.
+    """
 
-    :param grouped_pdf_file_paths: Dictionary that maps file states with file paths of PDF files.
+    passwords = _get_worker_passwords(prioritized_passwords)
+    file_state, unlocking_password, unlocked_data = _decrypt_pdf_data(data, passwords, save_profile)
+
+    return (
+        file_state,
+        unlocking_password,
+        unlocked_data,
+        passwords.index(unlocking_password) + 1 if unlocking_password is not None else 0
+    )
+
+@typechecked
+def _detect_file_state(file_path: str) -> FileState:
+    """
+    Detect whether a PDF file is locked or not,
+    falling back to opening it via `pikepdf` only if scanning its trailer is not conclusive.
+
+    :param file_path: Sanitized file path of the PDF file to classify.
+    :raises PdfError: If opening the PDF file via `pikepdf` failed.
     :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Either `FileState.LOCKED` or `FileState.NOT_LOCKED`.
     """
 
-    for file_state, pdf_file_paths in grouped_pdf_file_paths.items():
-        file_state_count = len(pdf_file_paths)
+    file_state = _classify_pdf_file(file_path)
 
-        print(
-            LogMessage.FILE_STATE_COUNT(
-                file_state = file_state,
-                file_state_count = file_state_count
+    if file_state == FileState.NOT_LOCKED:
+        return file_state
+
+    if file_state == FileState.LOCKED:
+        encryption_parameters = _read_encryption_parameters(file_path)
+
+        if encryption_parameters is not None:
+            return (
+                FileState.NOT_LOCKED
+                if _verify_password(encryption_parameters, "")
+                else FileState.LOCKED
             )
+
+    # <NOTE>
+    # Revision 6 of the standard security handler is not checked without `pikepdf`,
+    # so it is checked by opening the PDF file with an empty password instead.
+    try:
+        with Pdf.open(file_path):
+            return FileState.NOT_LOCKED
+    except PasswordError:
+        return FileState.LOCKED
+    except Exception as exception:
+        raise PdfError(
+            ErrorMessage.FAILED_CLASSIFICATION(file_path)
+        ) from exception
+
+@typechecked
+def _dispatch_unlock_results(
+        options: Options,
+        directory_paths: Paths,
+        pdf_file_paths: Iterable[str],
+        passwords: Passwords,
+        fingerprint_passwords: FingerprintPasswords
+    ) -> Iterable[UnlockResult]:
+    """
+    Dispatch PDF files to the way of unlocking them that the command-line options ask for.
+
+    :param options: Command-line options.
+    :param directory_paths: Paths of the directories to watch, if watching is asked for.
+    :param pdf_file_paths: Sanitized file paths of the PDF files to unlock otherwise.
+    :param passwords: Passwords to attempt unlocking each PDF file with, in order.
+    :param fingerprint_passwords: Passwords that unlocked PDF files keyed on encryption fingerprints.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Results of unlocking each PDF file, which may be generated lazily.
+    """
+
+    save_profile = SaveProfile(options.save_profile)
+    should_preserve_order = options.schedule == Schedule.DISCOVERY
+
+    if options.watch:
+        return _generate_watched_unlock_results(
+            directory_paths = directory_paths,
+            fingerprint_passwords = fingerprint_passwords,
+            job_count = options.jobs,
+            passwords = passwords,
+            output_dir = options.output_dir,
+            save_profile = save_profile,
+            should_sniff = options.sniff
         )
 
-        if file_state_count:
-            for pdf_file_path in pdf_file_paths:
-                print(pdf_file_path)
-        else:
-            print(LogMessage.NO_PDF_FILE_PATH)
+    if options.timeout is not None or options.memory_limit is not None:
+        return _generate_isolated_unlock_results(
+            fingerprint_passwords = fingerprint_passwords,
+            job_count = options.jobs,
+            memory_limit = (
+                options.memory_limit * ByteCount.MEBIBYTE
+                if options.memory_limit is not None
+                else None
+            ),
+            passwords = passwords,
+            output_dir = options.output_dir,
+            pdf_file_paths = pdf_file_paths,
+            save_profile = save_profile,
+            should_preserve_order = should_preserve_order,
+            timeout = options.timeout
+        )
 
-        print()
+    if options.shard_passwords:
+        return _generate_sharded_unlock_results(
+            fingerprint_passwords = fingerprint_passwords,
+            job_count = options.jobs,
+            passwords = passwords,
+            output_dir = options.output_dir,
+            pdf_file_paths = pdf_file_paths,
+            save_profile = save_profile
+        )
+
+    if options.memory_budget is not None:
+        return _generate_budgeted_unlock_results(
+            fingerprint_passwords = fingerprint_passwords,
+            job_count = options.jobs,
+            memory_budget = options.memory_budget * ByteCount.MEBIBYTE,
+            passwords = passwords,
+            output_dir = options.output_dir,
+            pdf_file_paths = pdf_file_paths,
+            save_profile = save_profile,
+            should_preserve_order = should_preserve_order
+        )
+
+    return _generate_unlock_results(
+        fingerprint_passwords = fingerprint_passwords,
+        job_count = options.jobs,
+        passwords = passwords,
+        output_dir = options.output_dir,
+        pdf_file_paths = pdf_file_paths,
+        save_profile = save_profile,
+        should_preserve_order = should_preserve_order
+    )
 
 @typechecked
-def _sanitize_path(path: str) -> str:
+def _estimate_unlock_cost(file_path: str, password_count: int) -> float:
     """
-    Remove quotation marks from a pasted path.
+    Estimate the cost of unlocking a PDF file without `pikepdf`,
+    from its size and the revision of its standard security handler,
+    as key derivation dominates for small PDF files and parsing and saving for large ones.
 
-    :param path: Directory path or file path of some PDF files to unlock.
+    :param file_path: Sanitized file path of the PDF file.
+    :param password_count: Number of passwords that may be attempted on the PDF file.
     :raises TypeCheckError: If any argument or return value has an invalid type.
-    :returns: Sanitized aforementioned path.
+    :returns: Estimated cost of unlocking the PDF file, in seconds,
+              which is none if the PDF file is not encrypted or if it cannot be read.
     """
 
-    return path \
-        .removeprefix(Path.QUOTATION_MARK) \
-        .removesuffix(Path.QUOTATION_MARK)
+    revision = _read_encryption_revision(file_path)
+
+    if revision is None:
+        return 0.0
+
+    try:
+        file_size = stat(file_path).st_size
+    except OSError:
+        return 0.0
+
+    if revision <= 2:
+        password_cost = UnlockCost.PER_R2_PASSWORD
+    elif revision <= 4:
+        password_cost = UnlockCost.PER_R3_PASSWORD
+    elif revision == 5:
+        password_cost = UnlockCost.PER_R5_PASSWORD
+    else:
+        password_cost = UnlockCost.PER_R6_PASSWORD
+
+    return file_size * UnlockCost.PER_BYTE + password_count * password_cost
 
 @typechecked
-def _unlock_pdf_file(
-        file_path: str,
-        grouped_pdf_file_paths: GroupedPaths,
-        passwords: Passwords
-    ) -> None:
+def _estimate_unlock_costs(pdf_file_paths: Iterable[str], password_count: int) -> UnlockCosts:
     """
-    Overwrite a PDF file as its unlocked version.
+    Estimate the cost of unlocking every PDF file,
+    so that the costliest PDF files can be unlocked first
+    instead of stretching the run by being unlocked last.
 
-    :param file_path: Sanitized file path of the PDF file to unlock.
-    :param grouped_pdf_file_paths: Dictionary that maps file states with file paths of PDF files.
-    :param passwords: Passwords to attempt unlocking the PDF file with.
-    :raises PdfError: If unlocking the PDF file via `pikepdf` failed.
+    :param pdf_file_paths: Sanitized file paths of the PDF files, in order.
+    :param password_count: Number of passwords that may be attempted on each PDF file.
     :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Estimated costs of unlocking the PDF files, from the costliest,
+              where PDF files with the same cost stay in order.
     """
 
-    pdf_file_paths: Paths = []
+    unlock_costs = {
+        pdf_file_path: _estimate_unlock_cost(pdf_file_path, password_count)
+        for pdf_file_path in pdf_file_paths
+    }
 
-    try:
-        Pdf.open(file_path)
+    return dict(
+        sorted(
+            unlock_costs.items(),
+            key = lambda item: item[1],
+            reverse = True
+        )
+    )
 
-        pdf_file_paths = grouped_pdf_file_paths[FileState.NOT_LOCKED]
+@typechecked
+def _find_password_index(
+        file_path: str,
+        encryption_parameters: EncryptionParameters | None,
+        prioritized_passwords: Passwords,
+        start_index: int,
+        end_index: int
+    ) -> int | None:
+    """
+    Find the index of the first password of a shard of passwords that opens a PDF file,
+    giving up as soon as another shard has found a password that comes earlier.
 
-        if file_path not in pdf_file_paths:
-            pdf_file_paths.append(file_path)
-    except PasswordError:
-        did_unlock = False
+    The shard is sliced out of the passwords of this worker process,
+    which are never reordered so that every shard slices them the same way.
 
-        for password in passwords:
-            try:
-                Pdf \
-                    .open(
-                        allow_overwriting_input = True,
-                        filename_or_stream = file_path,
-                        password = password
-                    ) \
-                    .save(file_path)
-
-                did_unlock = True
-
-                break
-            except PasswordError:
-                continue
-            except Exception as exception:
-                raise PdfError(
-                    ErrorMessage.FAILED_OVERWRITE(file_path)
-                ) from exception
+    :param file_path: Sanitized file path of the PDF file.
+    :param encryption_parameters: Parameters of the standard security handler of the PDF file,
+                                  or `None` if they cannot be read.
+    :param prioritized_passwords: Passwords to attempt first, in order, before the other passwords.
+    :param start_index: Index of the first password of the shard among every password.
+    :param end_index: Index of the password right after the shard among every password.
+    :raises PdfError: If opening the PDF file via `pikepdf` failed.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Index of the first password of the shard that opens the PDF file among every password,
+              or `None` if there is none or if another shard has found an earlier one.
+    """
 
-        pdf_file_paths = grouped_pdf_file_paths \
-            [FileState.UNLOCKED if did_unlock else FileState.LOCKED]
+    passwords = _prioritize_passwords(_worker_passwords, prioritized_passwords)
 
-        if file_path not in pdf_file_paths:
-            pdf_file_paths.append(file_path)
-    except Exception as exception:
-        raise PdfError(
-            ErrorMessage.FAILED_OVERWRITE(file_path)
-        ) from exception
+    for index, password in enumerate(passwords[start_index:end_index], start_index):
+        if _shared_password_index is not None and _shared_password_index.value <= index:
+            return None
+
+        if _check_password(file_path, encryption_parameters, password):
+            if _shared_password_index is not None:
+                with _shared_password_index.get_lock():
+                    _shared_password_index.value = min(_shared_password_index.value, index)
+
+            return index
+
+    return None
 
 @typechecked
-def unlock_pdf() -> None:
+def _find_start_xref(data: PdfData) -> int | None:
     """
-    Unlock password-protected PDF files for every inputted
+    Find the offset of the last cross-reference section of raw PDF data
+    via the last `startxref` keyword near its end.
 
-    - directory path where some PDF files are, and/or
-    - file path of a PDF file
+    :param data: Raw PDF data.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Offset of the last cross-reference section, or `None` if it cannot be found.
+    """
+
+    start_xref_offset = data.rfind(
+        PdfToken.START_XREF,
+        max(len(data) - ByteCount.PDF_FILE_FOOTER, 0)
+    )
 
-    using inputted passwords to attempt unlocking each PDF file with.
+    if start_xref_offset == -1:
+        return None
 
-    :raises FileNotFoundError: If every path does not ultimately point to a PDF file.
-    :raises PdfError: If unlocking a PDF file via `_unlock_pdf` failed.
+    match = compile(PdfPattern.START_XREF_VALUE).match(
+        data,
+        start_xref_offset + len(PdfToken.START_XREF)
+    )
+
+    if match is None or int(match[1]) >= start_xref_offset:
+        return None
+
+    return int(match[1])
+
+@typechecked
+def _find_xref_entry(
+        data: PdfData,
+        trailer: PdfDictionary,
+        offset: int,
+        object_number: int
+    ) -> int | None:
+    """
+    Find the offset of an uncompressed indirect object in a cross-reference section.
+
+    :param data: Raw PDF data.
+    :param trailer: Trailer dictionary of the cross-reference section.
+    :param offset: Offset right after either the `xref` keyword of the cross-reference table or
+                   the dictionary of the cross-reference stream.
+    :param object_number: Object number of the indirect object.
     :raises TypeCheckError: If any argument or return value has an invalid type.
-    :raises ValueError: If no password was given.
+    :raises ValueError: If the cross-reference section is malformed or
+                        if the indirect object is either free or compressed.
+    :returns: Offset of the indirect object, or `None` if it is not in the cross-reference section.
     """
 
-    # <NOTE>
-    # Enforce input order via order of variable declaration.
-    pdf_file_paths = _get_pdf_file_paths()
-    passwords = _get_passwords()
+    if trailer.get(PdfName.TYPE) != PdfName.XREF:
+        while match := compile(PdfPattern.XREF_SUBSECTION).match(data, offset):
+            first_object_number, object_count = int(match[1]), int(match[2])
+            offset = match.end()
 
-    grouped_pdf_file_paths: GroupedPaths = {
-        key: []
-        for key in [
-            file_state for file_state in FileState
-        ]
-    }
+            if first_object_number <= object_number < first_object_number + object_count:
+                entry_offset = offset + ByteCount.XREF_ENTRY * (object_number - first_object_number)
+                entry_match = compile(PdfPattern.XREF_ENTRY).match(data, entry_offset)
 
-    for pdf_file_path in pdf_file_paths:
-        _unlock_pdf_file(
-            grouped_pdf_file_paths = grouped_pdf_file_paths,
-            file_path = pdf_file_path,
-            passwords = passwords
-        )
+                if entry_match is None or entry_match[2] != b"n":
+                    raise ValueError(ErrorMessage.MALFORMED_PDF_OBJECT)
 
-    _log_unlock_attempt(grouped_pdf_file_paths)
+                return int(entry_match[1])
+
+            offset += ByteCount.XREF_ENTRY * object_count
+
+        return None
+
+    field_widths = trailer.get(PdfName.W)
+    size = trailer.get(PdfName.SIZE)
+    index = trailer.get(PdfName.INDEX, [0, size])
+
+    if (
+        not isinstance(field_widths, list)
+        or len(field_widths) != 3
+        or not all(isinstance(field_width, int) for field_width in field_widths)
+        or not isinstance(index, list)
+        or not all(isinstance(number, int) for number in index)
+    ):
+        raise ValueError(ErrorMessage.MALFORMED_PDF_OBJECT)
+
+    entry_widths = cast(list[int], field_widths)
+    entry_length = sum(entry_widths)
+    numbers = cast(list[int], index)
+    row_number = 0
+
+    for first_object_number, object_count in zip(numbers[::2], numbers[1::2]):
+        if first_object_number <= object_number < first_object_number + object_count:
+            row_number += object_number - first_object_number
+            decoded_data = _decode_xref_stream(data, trailer, offset)
+            entry = decoded_data[row_number * entry_length:(row_number + 1) * entry_length]
+
+            if len(entry) != entry_length:
+                raise ValueError(ErrorMessage.MALFORMED_PDF_OBJECT)
+
+            entry_type = int.from_bytes(entry[:entry_widths[0]]) if entry_widths[0] else 1
+
+            if entry_type != 1:
+                raise ValueError(ErrorMessage.MALFORMED_PDF_OBJECT)
+
+            return int.from_bytes(
+                entry[entry_widths[0]:entry_widths[0] + entry_widths[1]]
+            )
+
+        row_number += object_count
+
+    return None
+
+@typechecked
+def _generate_budgeted_unlock_results(
+        pdf_file_paths: Iterable[str],
+        passwords: Passwords,
+        job_count: int,
+        fingerprint_passwords: FingerprintPasswords,
+        save_profile: SaveProfile,
+        output_dir: str | None,
+        memory_budget: int,
+        should_preserve_order: bool = True
+    ) -> Iterator[UnlockResult]:
+    """
+    Lazily unlock PDF files across worker processes while their estimated memory footprints fit in a budget,
+    generating their results in the same order as their file paths if asked for, or else as they are done with.
+
+    :param pdf_file_paths: Sanitized file paths of the PDF files to unlock, in order.
+    :param passwords: Passwords to attempt unlocking each PDF file with.
+    :param job_count: Number of worker processes.
+    :param fingerprint_passwords: Passwords that unlocked PDF files keyed on their encryption fingerprints,
+                                  which is updated with every PDF file that gets unlocked.
+    :param save_profile: Profile to save unlocked PDF files with.
+    :param output_dir: Output directory to write unlocked PDF files in,
+                       or `None` to overwrite PDF files.
+    :param memory_budget: Maximum memory that the PDF files being unlocked at once are estimated to take, in bytes.
+    :param should_preserve_order: Whether to generate results in the same order as their file paths or not.
+    :raises TypeCheckError: If any argument or yielded value has an invalid type.
+    :returns: Iterator of the results of unlocking each PDF file.
+    """
+
+    memory_footprints = MemoryFootprints(
+        minimum_size = ByteCount.MEMORY_FOOTPRINT_SAMPLE,
+        ratio = MemoryFootprintRatio.INITIAL
+    )
+    pending_results: deque[tuple[str | None, Future[tuple[UnlockResult, int | None]]]] = deque()
+    pending_footprints: dict[Future[tuple[UnlockResult, int | None]], tuple[int, int]] = {}
+    prioritized_passwords: Passwords = []
+    reserved_memory = 0
+
+    with ProcessPoolExecutor(
+        initargs = (passwords,),
+        initializer = _initialize_worker,
+        max_workers = job_count
+    ) as executor:
+        for pdf_file_path in pdf_file_paths:
+            file_size = _get_file_size(pdf_file_path)
+            memory_footprint = memory_footprints.estimate(file_size)
+
+            # <NOTE>
+            # Only as many PDF files as worker processes are admitted at once,
+            # so that no memory is reserved for PDF files merely queued behind them.
+            while pending_results and (
+                len(pending_results) >= job_count
+                or reserved_memory + memory_footprint > memory_budget
+            ):
+                fingerprint, pending_result = _pop_pending_result(pending_results, should_preserve_order)
+                unlock_result, peak_memory_usage = pending_result.result()
+                pending_file_size, pending_memory_footprint = pending_footprints.pop(pending_result)
+                reserved_memory -= pending_memory_footprint
+                prioritized_passwords = _record_unlock_result(
+                    unlock_result,
+                    fingerprint,
+                    prioritized_passwords,
+                    fingerprint_passwords
+                )[:1]
+
+                if peak_memory_usage is not None:
+                    memory_footprints.measure(pending_file_size, peak_memory_usage)
+
+                yield unlock_result
+
+            fingerprint, file_passwords = _prioritize_fingerprint_password(
+                pdf_file_path,
+                prioritized_passwords,
+                fingerprint_passwords
+            )
+            pending_result = executor.submit(
+                _get_measured_unlock_result,
+                pdf_file_path,
+                file_passwords,
+                save_profile,
+                output_dir
+            )
+            pending_results.append((fingerprint, pending_result))
+            pending_footprints[pending_result] = (file_size, memory_footprint)
+            reserved_memory += memory_footprint
+
+        while pending_results:
+            fingerprint, pending_result = _pop_pending_result(pending_results, should_preserve_order)
+            unlock_result, peak_memory_usage = pending_result.result()
+            pending_file_size, _ = pending_footprints.pop(pending_result)
+            prioritized_passwords = _record_unlock_result(
+                unlock_result,
+                fingerprint,
+                prioritized_passwords,
+                fingerprint_passwords
+            )[:1]
+
+            if peak_memory_usage is not None:
+                memory_footprints.measure(pending_file_size, peak_memory_usage)
+
+            yield unlock_result
+
+@typechecked
+def _generate_isolated_unlock_results(
+        pdf_file_paths: Iterable[str],
+        passwords: Passwords,
+        job_count: int,
+        fingerprint_passwords: FingerprintPasswords,
+        save_profile: SaveProfile,
+        output_dir: str | None,
+        timeout: float | None,
+        memory_limit: int | None,
+        should_preserve_order: bool = True
+    ) -> Iterator[UnlockResult]:
+    """
+    Lazily unlock PDF files across isolated worker processes within a timeout and/or a memory limit,
+    yielding a PDF file as aborted and replacing its worker process if it goes over either.
+
+    :param pdf_file_paths: Sanitized file paths of the PDF files to unlock, in order.
+    :param passwords: Passwords to attempt unlocking each PDF file with.
+    :param job_count: Number of isolated worker processes.
+    :param fingerprint_passwords: Passwords that unlocked PDF files keyed on their encryption fingerprints,
+                                  which is updated with every PDF file that gets unlocked.
+    :param save_profile: Profile to save unlocked PDF files with.
+    :param output_dir: Output directory to write unlocked PDF files in,
+                       or `None` to overwrite PDF files.
+    :param timeout: Maximum seconds to unlock each PDF file in, or `None` for no timeout.
+    :param memory_limit: Maximum address space of each worker process in bytes, or `None` for no limit.
+    :param should_preserve_order: Whether to generate results in the same order as their file paths or not.
+    :raises TypeCheckError: If any argument or yielded value has an invalid type.
+    :returns: Iterator of the results of unlocking each PDF file.
+    """
+
+    pdf_file_paths = iter(pdf_file_paths)
+    prioritized_passwords: Passwords = []
+    idle_workers = [
+        _start_isolated_worker(memory_limit, passwords)
+        for _ in range(job_count)
+    ]
+    isolated_unlocks: dict[Connection, IsolatedUnlock] = {}
+    done_results: dict[int, tuple[str | None, UnlockResult]] = {}
+    file_count = 0
+    next_index = 0
+    is_exhausted = False
+
+    try:
+        while True:
+            while (
+                idle_workers
+                and not is_exhausted
+                and len(isolated_unlocks) + len(done_results) < job_count * PendingTaskCount.PER_WORKER
+            ):
+                pdf_file_path = next(pdf_file_paths, None)
+
+                if pdf_file_path is None:
+                    is_exhausted = True
+
+                    break
+
+                fingerprint, file_passwords = _prioritize_fingerprint_password(
+                    pdf_file_path,
+                    prioritized_passwords,
+                    fingerprint_passwords
+                )
+                worker = idle_workers.pop()
+                worker.connection.send((pdf_file_path, file_passwords, save_profile, output_dir))
+                isolated_unlocks[worker.connection] = IsolatedUnlock(
+                    deadline = (
+                        monotonic() + timeout
+                        if timeout is not None
+                        else None
+                    ),
+                    file_path = pdf_file_path,
+                    fingerprint = fingerprint,
+                    index = file_count,
+                    worker = worker
+                )
+                file_count += 1
+
+            if not isolated_unlocks:
+                return
+
+            deadlines = [
+                isolated_unlock.deadline
+                for isolated_unlock in isolated_unlocks.values()
+                if isolated_unlock.deadline is not None
+            ]
+
+            for connection in connection_wait(
+                list(isolated_unlocks),
+                timeout = (
+                    max(min(deadlines) - monotonic(), 0)
+                    if deadlines
+                    else None
+                )
+            ):
+                isolated_unlock = isolated_unlocks.pop(cast(Connection, connection))
+
+                try:
+                    unlock_result = cast(UnlockResult, isolated_unlock.worker.connection.recv())
+                except (EOFError, OSError):
+                    unlock_result = UnlockResult(
+                        error = str(ErrorMessage.WORKER_EXITED),
+                        file_path = isolated_unlock.file_path,
+                        file_state = FileState.ABORTED
+                    )
+
+                # <NOTE>
+                # A worker process that ran out of memory may be left in a broken state,
+                # so it is replaced like one that went over the timeout.
+                if unlock_result.file_state == FileState.ABORTED:
+                    _stop_isolated_worker(isolated_unlock.worker)
+                    _remove_temporary_files(isolated_unlock.file_path, output_dir)
+
+                    idle_workers.append(_start_isolated_worker(memory_limit, passwords))
+                else:
+                    idle_workers.append(isolated_unlock.worker)
+
+                done_results[isolated_unlock.index] = (isolated_unlock.fingerprint, unlock_result)
+
+            for connection, isolated_unlock in list(isolated_unlocks.items()):
+                if isolated_unlock.deadline is not None and isolated_unlock.deadline <= monotonic():
+                    del isolated_unlocks[connection]
+
+                    _stop_isolated_worker(isolated_unlock.worker)
+                    _remove_temporary_files(isolated_unlock.file_path, output_dir)
+
+                    idle_workers.append(_start_isolated_worker(memory_limit, passwords))
+                    done_results[isolated_unlock.index] = (
+                        isolated_unlock.fingerprint,
+                        UnlockResult(
+                            error = ErrorMessage.TIMED_OUT(cast(float, timeout)),
+                            file_path = isolated_unlock.file_path,
+                            file_state = FileState.ABORTED
+                        )
+                    )
+
+            while done_results and (not should_preserve_order or next_index in done_results):
+                fingerprint, unlock_result = done_results.pop(
+                    next_index
+                    if should_preserve_order
+                    else min(done_results)
+                )
+                next_index += 1
+                prioritized_passwords = _record_unlock_result(
+                    unlock_result,
+                    fingerprint,
+                    prioritized_passwords,
+                    fingerprint_passwords
+                )[:1]
+
+                yield unlock_result
+    finally:
+        for worker in chain(
+            idle_workers,
+            (isolated_unlock.worker for isolated_unlock in isolated_unlocks.values())
+        ):
+            _stop_isolated_worker(worker)
+
+@typechecked
+def _generate_mapped_input_batches(file_path: str, separator: InputSeparator) -> Iterator[list[str]]:
+    """
+    Lazily generate the non-empty inputs of a file in batches by memory-mapping it,
+    so that the file is never read whole into memory.
+
+    :param file_path: Path of the file.
+    :param separator: Separator between inputs.
+    :raises OSError: If the file cannot be read.
+    :raises TypeCheckError: If any argument or yielded value has an invalid type.
+    :raises UnicodeDecodeError: If the file is not encoded in UTF-8.
+    :returns: Iterator of batches of inputs, in the order they were read.
+    """
+
+    with open(file_path, "rb") as file:
+        if not fstat(file.fileno()).st_size:
+            return
+
+        with mmap(file.fileno(), 0, access = ACCESS_READ) as data:
+            encoded_separator = separator.encode()
+            start = 0
+
+            while start < len(data):
+                end = min(start + ByteCount.INPUT_BATCH, len(data))
+
+                if end < len(data):
+                    separator_index = data.rfind(encoded_separator, start, end)
+
+                    if separator_index < start:
+                        # <NOTE>
+                        # A single input spans the whole window.
+                        separator_index = data.find(encoded_separator, end)
+
+                    end = separator_index + 1 if separator_index >= 0 else len(data)
+
+                inputs = data[start:end] \
+                    .decode("utf-8") \
+                    .split(separator)
+                start = end
+
+                if separator == InputSeparator.NEWLINE:
+                    # <NOTE>
+                    # Windows line endings are tolerated when inputs are separated by newlines.
+                    inputs = [user_input.removesuffix("\r") for user_input in inputs]
+
+                yield [user_input for user_input in inputs if user_input]
+
+@typechecked
+def _generate_pdf_file_paths(
+        paths: Iterable[str],
+        directory_manifest: DirectoryManifest | None = None
+    ) -> Iterator[str]:
+    """
+    Lazily generate the paths of all PDF files to unlock from every given
+
+    - directory path where some PDF files are, and/or
+    - file path of a PDF file.
+
+    :param paths: Unique directory paths and/or file paths, which may be read lazily.
+    :param directory_manifest: Manifest of the PDF files and subdirectories of directories
+                               to serve unchanged directories from and to update, if any.
+    :raises TypeCheckError: If any argument or yielded value has an invalid type.
+    :returns: Iterator of unique paths of all PDF files to unlock, in discovery order.
+    """
+
+    pdf_file_paths = UniquePaths()
+
+    for path in paths:
+        subpaths = _get_pdf_file_subpaths(
+            _sanitize_path(path),
+            directory_manifest
+        )
+
+        for subpath, identity in subpaths:
+            if pdf_file_paths.add(subpath, identity):
+                yield subpath
+
+@typechecked
+def _generate_ready_pdf_file_paths(
+        directory_paths: Paths,
+        unlocked_file_signatures: UnlockedFileSignatures,
+        should_sniff: bool = False
+    ) -> Iterator[Paths]:
+    """
+    Endlessly generate batches of the paths of PDF files in watched directory trees
+    once their signatures have settled and differ from those they had when last unlocked.
+
+    :param directory_paths: Paths of the directories to watch.
+    :param unlocked_file_signatures: Dictionary that maps file paths of PDF files
+                                     with their signatures as of when they were last unlocked,
+                                     which is updated with every ready PDF file as being unlocked.
+    :param should_sniff: Whether to skip PDF files that do not start with the PDF file signature or not.
+    :raises TypeCheckError: If any argument or yielded value has an invalid type.
+    :returns: Iterator of batches of the paths of ready PDF files, which may be empty.
+    """
+
+    inotify = _open_inotify()
+    observed_file_signatures: dict[str, tuple[FileSignature, float]] = {}
+    candidate_paths: Paths = [
+        pdf_file_path
+        for directory_path in directory_paths
+        for pdf_file_path, _ in _walk_directory(directory_path)
+    ]
+
+    if inotify is not None:
+        for directory_path in directory_paths:
+            _watch_directory_tree(inotify, directory_path)
+
+    try:
+        while True:
+            ready_paths: Paths = []
+
+            for candidate_path in dict.fromkeys([*candidate_paths, *observed_file_signatures]):
+                file_signature = _get_file_signature(candidate_path)
+
+                if (
+                    candidate_path in unlocked_file_signatures
+                    and unlocked_file_signatures[candidate_path] is None
+                ):
+                    continue
+
+                if file_signature is None or file_signature == unlocked_file_signatures.get(candidate_path):
+                    observed_file_signatures.pop(candidate_path, None)
+
+                    continue
+
+                observation = observed_file_signatures.get(candidate_path)
+
+                if observation is None or observation[0] != file_signature:
+                    observed_file_signatures[candidate_path] = (file_signature, monotonic())
+                elif monotonic() - observation[1] >= WatchDelay.DEBOUNCE:
+                    del observed_file_signatures[candidate_path]
+
+                    if _is_pdf_file(candidate_path) and (
+                        not should_sniff
+                        or _has_pdf_file_signature(candidate_path)
+                    ):
+                        ready_paths.append(candidate_path)
+                        unlocked_file_signatures[candidate_path] = None
+                    else:
+                        unlocked_file_signatures[candidate_path] = file_signature
+
+            yield ready_paths
+
+            timeout = WatchDelay.DEBOUNCE if observed_file_signatures else WatchDelay.POLL
+
+            if inotify is None:
+                sleep(timeout)
+
+                inotify_paths = None
+            else:
+                inotify_paths = _read_inotify_events(inotify, timeout)
+
+            candidate_paths = (
+                inotify_paths
+                if inotify_paths is not None
+                else [
+                    pdf_file_path
+                    for directory_path in directory_paths
+                    for pdf_file_path, _ in _walk_directory(directory_path)
+                ]
+            )
+    finally:
+        if inotify is not None:
+            close(inotify.file_descriptor)
+
+@typechecked
+def _generate_sharded_unlock_results(
+        pdf_file_paths: Iterable[str],
+        passwords: Passwords,
+        job_count: int,
+        fingerprint_passwords: FingerprintPasswords,
+        save_profile: SaveProfile,
+        output_dir: str | None
+    ) -> Iterator[UnlockResult]:
+    """
+    Lazily unlock PDF files one at a time,
+    sharding the passwords to attempt unlocking each PDF file with across worker processes.
+
+    :param pdf_file_paths: Sanitized file paths of the PDF files to unlock, in order.
+    :param passwords: Passwords to attempt unlocking each PDF file with.
+    :param job_count: Number of worker processes.
+    :param fingerprint_passwords: Passwords that unlocked PDF files keyed on their encryption fingerprints,
+                                  which is updated with every PDF file that gets unlocked.
+    :param save_profile: Profile to save unlocked PDF files with.
+    :param output_dir: Output directory to write unlocked PDF files in,
+                       or `None` to overwrite PDF files.
+    :raises TypeCheckError: If any argument or yielded value has an invalid type.
+    :returns: Iterator of the results of unlocking each PDF file, in order.
+    """
+
+    shared_password_index = Value("q", len(passwords))
+    shard_length = max(
+        ceil(len(passwords) / (job_count * ShardCount.PER_WORKER)),
+        1
+    )
+
+    prioritized_passwords: Passwords = []
+
+    with ProcessPoolExecutor(
+        initargs = (shared_password_index, passwords),
+        initializer = _initialize_shard_worker,
+        max_workers = job_count
+    ) as executor:
+        for pdf_file_path in pdf_file_paths:
+            shard_results: list[Future[int | None]] = []
+
+            try:
+                encryption_parameters = _read_encryption_parameters(pdf_file_path)
+                is_locked = not (
+                    _classify_pdf_file(pdf_file_path) == FileState.NOT_LOCKED
+                    or _check_password(pdf_file_path, encryption_parameters, "")
+                )
+                fingerprint, file_passwords = _prioritize_fingerprint_password(
+                    pdf_file_path,
+                    prioritized_passwords,
+                    fingerprint_passwords
+                )
+                password_indices: list[int] = []
+
+                if is_locked:
+                    shared_password_index.value = len(passwords)
+
+                    shard_results = [
+                        executor.submit(
+                            _find_password_index,
+                            pdf_file_path,
+                            encryption_parameters,
+                            file_passwords,
+                            start_index,
+                            start_index + shard_length
+                        )
+                        for start_index in range(0, len(passwords), shard_length)
+                    ]
+                    password_indices = [
+                        password_index
+                        for shard_result in shard_results
+                        if (password_index := shard_result.result()) is not None
+                    ]
+            except PdfError as exception:
+                # <NOTE>
+                # Every other shard is made to give up,
+                # so that none of them is still running for the next PDF file.
+                shared_password_index.value = 0
+                wait(shard_results)
+
+                yield UnlockResult(
+                    error = _get_error_description(exception),
+                    file_path = pdf_file_path,
+                    file_state = FileState.FAILED
+                )
+
+                continue
+
+            if not password_indices:
+                yield _get_unlock_result(pdf_file_path, [], save_profile, output_dir)
+
+                continue
+
+            password_index = min(password_indices)
+            unlock_result = _get_unlock_result(
+                pdf_file_path,
+                [_prioritize_passwords(passwords, file_passwords)[password_index]],
+                save_profile,
+                output_dir
+            )
+            prioritized_passwords = _record_unlock_result(
+                unlock_result,
+                fingerprint,
+                prioritized_passwords,
+                fingerprint_passwords
+            )[:1]
+
+            yield unlock_result._replace(attempt_count = password_index + 1)
+
+@typechecked
+def _generate_source_input_batches(source: str, separator: InputSeparator) -> Iterator[list[str]]:
+    """
+    Lazily generate the non-empty inputs of a file path, `-` for standard input,
+    `env:NAME` for an environment variable, or `fd:N` for a file descriptor in batches.
+
+    :param source: Input source to read inputs from.
+    :param separator: Separator between inputs.
+    :raises OSError: If the input source cannot be read.
+    :raises TypeCheckError: If any argument or yielded value has an invalid type.
+    :raises ValueError: If the file descriptor is not an integer
+                        or if the input source is not encoded in UTF-8.
+    :returns: Iterator of batches of inputs, in the order they were read.
+    """
+
+    if source.startswith(InputSource.ENVIRONMENT_VARIABLE_PREFIX):
+        yield [
+            user_input
+            for user_input in environ
+                .get(source.removeprefix(InputSource.ENVIRONMENT_VARIABLE_PREFIX), "")
+                .split(separator)
+            if user_input
+        ]
+
+        return
+
+    if source != InputSource.STANDARD_INPUT and not source.startswith(InputSource.FILE_DESCRIPTOR_PREFIX):
+        yield from _generate_mapped_input_batches(source, separator)
+
+        return
+
+    with (
+        nullcontext(stdin)
+        if source == InputSource.STANDARD_INPUT
+        else open(
+            int(source.removeprefix(InputSource.FILE_DESCRIPTOR_PREFIX)),
+            encoding = "utf-8",
+            # <NOTE>
+            # Newlines are only translated if they separate inputs.
+            newline = None if separator == InputSeparator.NEWLINE else ""
+        )
+    ) as file:
+        remainder = ""
+
+        while chunk := file.read(CharacterCount.INPUT_CHUNK):
+            *inputs, remainder = (remainder + chunk).split(separator)
+
+            yield [user_input for user_input in inputs if user_input]
+
+        if remainder:
+            yield [remainder]
+
+@typechecked
+def _generate_unique_inputs(inputs: Iterable[str]) -> Iterator[str]:
+    """
+    Lazily generate unique inputs in linear time.
+
+    :param inputs: Inputs, which may be duplicated.
+    :raises TypeCheckError: If any argument or yielded value has an invalid type.
+    :returns: Iterator of unique inputs, in the order they were first given.
+    """
+
+    seen_inputs: set[str] = set()
+
+    for user_input in inputs:
+        if user_input not in seen_inputs:
+            seen_inputs.add(user_input)
+
+            yield user_input
+
+@typechecked
+def _generate_unlock_results(
+        pdf_file_paths: Iterable[str],
+        passwords: Passwords,
+        job_count: int,
+        fingerprint_passwords: FingerprintPasswords,
+        save_profile: SaveProfile,
+        output_dir: str | None,
+        should_preserve_order: bool = True
+    ) -> Iterator[UnlockResult]:
+    """
+    Lazily unlock PDF files, either in this process or across worker processes,
+    generating their results in the same order as their file paths if asked for, or else as they are done with.
+
+    :param pdf_file_paths: Sanitized file paths of the PDF files to unlock, in order.
+    :param passwords: Passwords to attempt unlocking each PDF file with.
+    :param job_count: Number of worker processes, where 1 means unlocking in this process.
+    :param fingerprint_passwords: Passwords that unlocked PDF files keyed on their encryption fingerprints,
+                                  which is updated with every PDF file that gets unlocked.
+    :param save_profile: Profile to save unlocked PDF files with.
+    :param output_dir: Output directory to write unlocked PDF files in,
+                       or `None` to overwrite PDF files.
+    :param should_preserve_order: Whether to generate results in the same order as their file paths or not,
+                                  which only matters across worker processes.
+    :raises TypeCheckError: If any argument or yielded value has an invalid type.
+    :returns: Iterator of the results of unlocking each PDF file.
+    """
+
+    if job_count == 1:
+        for pdf_file_path in pdf_file_paths:
+            fingerprint, file_passwords = _prioritize_fingerprint_password(
+                pdf_file_path,
+                passwords,
+                fingerprint_passwords
+            )
+            unlock_result = _get_unlock_result(
+                pdf_file_path,
+                file_passwords,
+                save_profile,
+                output_dir
+            )
+            passwords = _record_unlock_result(
+                unlock_result,
+                fingerprint,
+                passwords,
+                fingerprint_passwords
+            )
+
+            yield unlock_result
+
+        return
+
+    prioritized_passwords: Passwords = []
+
+    with ProcessPoolExecutor(
+        initargs = (passwords,),
+        initializer = _initialize_worker,
+        max_workers = job_count
+    ) as executor:
+        pending_results: deque[tuple[str | None, Future[UnlockResult]]] = deque()
+
+        for pdf_file_path in pdf_file_paths:
+            fingerprint, file_passwords = _prioritize_fingerprint_password(
+                pdf_file_path,
+                prioritized_passwords,
+                fingerprint_passwords
+            )
+
+            pending_results.append(
+                (
+                    fingerprint,
+                    executor.submit(
+                        _get_worker_unlock_result,
+                        pdf_file_path,
+                        file_passwords,
+                        save_profile,
+                        output_dir
+                    )
+                )
+            )
+
+            if len(pending_results) >= job_count * PendingTaskCount.PER_WORKER:
+                fingerprint, pending_result = _pop_pending_result(pending_results, should_preserve_order)
+                unlock_result = pending_result.result()
+                prioritized_passwords = _record_unlock_result(
+                    unlock_result,
+                    fingerprint,
+                    prioritized_passwords,
+                    fingerprint_passwords
+                )[:1]
+
+                yield unlock_result
+
+        while pending_results:
+            fingerprint, pending_result = _pop_pending_result(pending_results, should_preserve_order)
+            unlock_result = pending_result.result()
+            prioritized_passwords = _record_unlock_result(
+                unlock_result,
+                fingerprint,
+                prioritized_passwords,
+                fingerprint_passwords
+            )[:1]
+
+            yield unlock_result
+
+@typechecked
+def _generate_watched_unlock_results(
+        directory_paths: Paths,
+        passwords: Passwords,
+        job_count: int,
+        fingerprint_passwords: FingerprintPasswords,
+        save_profile: SaveProfile,
+        output_dir: str | None,
+        should_sniff: bool = False
+    ) -> Iterator[UnlockResult]:
+    """
+    Endlessly unlock PDF files in watched directory trees as soon as they are ready,
+    across a pool of worker processes that is kept warm in between.
+
+    :param directory_paths: Paths of the directories to watch.
+    :param passwords: Passwords to attempt unlocking each PDF file with.
+    :param job_count: Number of worker processes.
+    :param fingerprint_passwords: Passwords that unlocked PDF files keyed on their encryption fingerprints,
+                                  which is updated with every PDF file that gets unlocked.
+    :param save_profile: Profile to save unlocked PDF files with.
+    :param output_dir: Output directory to write unlocked PDF files in,
+                       or `None` to overwrite PDF files.
+    :param should_sniff: Whether to skip PDF files that do not start with the PDF file signature or not.
+    :raises TypeCheckError: If any argument or yielded value has an invalid type.
+    :returns: Iterator of the results of unlocking each PDF file, in the order they became ready.
+    """
+
+    unlocked_file_signatures: UnlockedFileSignatures = {}
+    queued_paths: deque[str] = deque()
+    prioritized_passwords: Passwords = []
+
+    with ProcessPoolExecutor(
+        initargs = (passwords,),
+        initializer = _initialize_watch_worker,
+        max_workers = job_count
+    ) as executor:
+        pending_results: deque[tuple[str | None, Future[UnlockResult]]] = deque()
+
+        for ready_paths in _generate_ready_pdf_file_paths(
+            directory_paths,
+            unlocked_file_signatures,
+            should_sniff
+        ):
+            queued_paths.extend(ready_paths)
+
+            while queued_paths or (pending_results and pending_results[0][1].done()):
+                if pending_results and (
+                    pending_results[0][1].done()
+                    or len(pending_results) >= job_count * PendingTaskCount.PER_WORKER
+                ):
+                    fingerprint, pending_result = pending_results.popleft()
+                    unlock_result = pending_result.result()
+                    file_signature = _get_file_signature(unlock_result.file_path)
+
+                    if file_signature is not None:
+                        unlocked_file_signatures[unlock_result.file_path] = file_signature
+                    else:
+                        unlocked_file_signatures.pop(unlock_result.file_path, None)
+
+                    prioritized_passwords = _record_unlock_result(
+                        unlock_result,
+                        fingerprint,
+                        prioritized_passwords,
+                        fingerprint_passwords
+                    )[:1]
+
+                    yield unlock_result
+
+                    continue
+
+                pdf_file_path = queued_paths.popleft()
+                fingerprint, file_passwords = _prioritize_fingerprint_password(
+                    pdf_file_path,
+                    prioritized_passwords,
+                    fingerprint_passwords
+                )
+
+                pending_results.append(
+                    (
+                        fingerprint,
+                        executor.submit(
+                            _get_worker_unlock_result,
+                            pdf_file_path,
+                            file_passwords,
+                            save_profile,
+                            output_dir
+                        )
+                    )
+                )
+
+@typechecked
+def _get_directory_paths(paths: Iterable[str] | None = None) -> Paths:
+    """
+    Get the paths of every given or inputted directory to watch for PDF files to unlock.
+
+    :param paths: Unique paths of directories, or `None` to have them inputted.
+    :raises FileNotFoundError: If every path does not point to a directory.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Ordered list of unique sanitized paths of directories.
+    """
+
+    directory_paths = [
+        directory_path
+        for path in (
+            paths
+            if paths is not None
+            else _get_unique_inputs(InputPrompt.DIRECTORY_PATHS)
+        )
+        if isdir(directory_path := _sanitize_path(path))
+    ]
+
+    if not directory_paths:
+        raise FileNotFoundError(ErrorMessage.NO_VALID_DIRECTORY_PATH)
+
+    return directory_paths
+
+@typechecked
+def _get_error_description(exception: BaseException) -> str:
+    """
+    Get a description of the root cause of an exception.
+
+    :param exception: Exception to describe.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Name and message of the earliest exception that the exception was raised from.
+    """
+
+    exception = _get_root_cause(exception)
+
+    return f"{type(exception).__name__}: {exception}"
+
+@typechecked
+def _get_file_signature(file_path: str) -> FileSignature | None:
+    """
+    Get the signature of a file, which changes whenever said file is modified or replaced.
+
+    :param file_path: Path of the file.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Device number, inode number, size, and modification time in nanoseconds of the file,
+              or `None` if the file cannot be queried.
+    """
+
+    try:
+        file_stat = stat(file_path)
+    except OSError:
+        return None
+
+    return (
+        file_stat.st_dev,
+        file_stat.st_ino,
+        file_stat.st_size,
+        file_stat.st_mtime_ns
+    )
+
+@typechecked
+def _get_file_size(file_path: str) -> int:
+    """
+    Get the size of a file.
+
+    :param file_path: Path of the file.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Size of the file in bytes, or 0 if it cannot be queried.
+    """
+
+    try:
+        return stat(file_path).st_size
+    except OSError:
+        return 0
+
+@typechecked
+def _get_input_paths(options: Options, separator: InputSeparator) -> Iterator[str] | None:
+    """
+    Get the unique paths given as command-line arguments and/or streamed from an input source.
+
+    :param options: Command-line options.
+    :param separator: Separator of the inputs of the input source.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Iterator of unique paths, or `None` if they are left to be inputted.
+    """
+
+    if not options.paths and options.paths_from is None:
+        return None
+
+    return _generate_unique_inputs(
+        chain(
+            options.paths,
+            chain.from_iterable(
+                _generate_source_input_batches(options.paths_from, separator)
+            )
+            if options.paths_from is not None
+            else []
+        )
+    )
+
+@typechecked
+def _get_measured_unlock_result(
+        file_path: str,
+        prioritized_passwords: Passwords,
+        save_profile: SaveProfile = SaveProfile.FAST,
+        output_dir: str | None = None
+    ) -> tuple[UnlockResult, int | None]:
+    """
+    Attempt unlocking a PDF file as by `_get_worker_unlock_result`
+    while measuring the peak memory that this process takes on top of what it took beforehand.
+
+    :param file_path: Sanitized file path of the PDF file to unlock.
+    :param prioritized_passwords: Passwords to attempt first, in order,
+                                  before the other passwords of this worker process.
+    :param save_profile: Profile to save the unlocked PDF file with.
+    :param output_dir: Output directory to write the unlocked PDF file in,
+                       or `None` to overwrite the PDF file.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Result of attempting to unlock the PDF file,
+              along with the peak memory usage it took in bytes, or `None` if it cannot be measured.
+    """
+
+    passwords = _get_worker_passwords(prioritized_passwords)
+    memory_usage = (
+        _read_memory_usage(MemoryField.CURRENT)
+        if _reset_peak_memory_usage()
+        else None
+    )
+    unlock_result = _get_unlock_result(
+        file_path,
+        passwords,
+        save_profile,
+        output_dir
+    )
+    peak_memory_usage = _read_memory_usage(MemoryField.PEAK)
+
+    return unlock_result, (
+        max(peak_memory_usage - memory_usage, 0)
+        if memory_usage is not None and peak_memory_usage is not None
+        else None
+    )
+
+@typechecked
+def _get_options(arguments: list[str] | None) -> Options:
+    """
+    Get the command-line options.
+
+    :param arguments: Command-line arguments,
+                      or `None` to use those that the script was executed with.
+    :raises SystemExit: If any argument is invalid or if help is asked for.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Command-line options.
+    """
+
+    parser = ArgumentParser(
+        description = Program.DESCRIPTION,
+        prog = Program.NAME
+    )
+
+    parser.add_argument(
+        "paths",
+        help = OptionHelp.PATHS,
+        metavar = "PATH",
+        nargs = "*"
+    )
+    parser.add_argument(
+        "--paths-from",
+        help = OptionHelp.PATHS_FROM,
+        metavar = "SOURCE"
+    )
+    parser.add_argument(
+        "--passwords-from",
+        help = OptionHelp.PASSWORDS_FROM,
+        metavar = "SOURCE"
+    )
+    parser.add_argument(
+        "--null",
+        action = "store_true",
+        help = OptionHelp.NULL
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help = OptionHelp.CACHE_DIR,
+        metavar = "DIRECTORY"
+    )
+    parser.add_argument(
+        "--classify-only",
+        action = "store_true",
+        help = OptionHelp.CLASSIFY_ONLY
+    )
+    parser.add_argument(
+        "--shard-passwords",
+        action = "store_true",
+        help = OptionHelp.SHARD_PASSWORDS
+    )
+    parser.add_argument(
+        "--output-dir",
+        help = OptionHelp.OUTPUT_DIR,
+        metavar = "DIRECTORY"
+    )
+    parser.add_argument(
+        "--journal",
+        help = OptionHelp.JOURNAL,
+        metavar = "FILE"
+    )
+    parser.add_argument(
+        "--resume",
+        action = "store_true",
+        help = OptionHelp.RESUME
+    )
+    parser.add_argument(
+        "--save-profile",
+        choices = list(SaveProfile),
+        default = SaveProfile.FAST,
+        help = OptionHelp.SAVE_PROFILE,
+        type = SaveProfile
+    )
+    parser.add_argument(
+        "--jobs",
+        default = process_cpu_count() or 1,
+        help = OptionHelp.JOBS,
+        metavar = "N",
+        type = int
+    )
+    parser.add_argument(
+        "--memory-budget",
+        help = OptionHelp.MEMORY_BUDGET,
+        metavar = "MIB",
+        type = int
+    )
+    parser.add_argument(
+        "--memory-limit",
+        help = OptionHelp.MEMORY_LIMIT,
+        metavar = "MIB",
+        type = int
+    )
+    parser.add_argument(
+        "--timeout",
+        help = OptionHelp.TIMEOUT,
+        metavar = "SECONDS",
+        type = float
+    )
+    parser.add_argument(
+        "--schedule",
+        choices = list(Schedule),
+        default = Schedule.DISCOVERY,
+        help = OptionHelp.SCHEDULE,
+        type = Schedule
+    )
+    parser.add_argument(
+        "--sniff",
+        action = "store_true",
+        help = OptionHelp.SNIFF
+    )
+    parser.add_argument(
+        "--watch",
+        action = "store_true",
+        help = OptionHelp.WATCH
+    )
+
+    options = parser.parse_args(
+        args = arguments,
+        namespace = Options()
+    )
+
+    if options.jobs < 1:
+        parser.error(ErrorMessage.NON_POSITIVE_JOB_COUNT)
+
+    if options.resume and options.journal is None:
+        parser.error(ErrorMessage.NO_JOURNAL_TO_RESUME)
+
+    if options.watch and options.classify_only:
+        parser.error(ErrorMessage.WATCH_WITH_CLASSIFY_ONLY)
+
+    if options.shard_passwords and options.jobs == 1:
+        parser.error(ErrorMessage.SHARD_PASSWORDS_WITH_SINGLE_JOB)
+
+    if options.memory_budget is not None:
+        if options.memory_budget < 1:
+            parser.error(ErrorMessage.NON_POSITIVE_MEMORY_BUDGET)
+
+        if options.shard_passwords:
+            parser.error(ErrorMessage.MEMORY_BUDGET_WITH_SHARD_PASSWORDS)
+
+        if options.watch:
+            parser.error(ErrorMessage.MEMORY_BUDGET_WITH_WATCH)
+
+        if options.jobs == 1:
+            parser.error(ErrorMessage.MEMORY_BUDGET_WITH_SINGLE_JOB)
+
+    if options.memory_limit is not None and options.memory_limit < 1:
+        parser.error(ErrorMessage.NON_POSITIVE_MEMORY_LIMIT)
+
+    if options.timeout is not None and not options.timeout > 0:
+        parser.error(ErrorMessage.NON_POSITIVE_TIMEOUT)
+
+    if (
+        (options.memory_limit is not None or options.timeout is not None)
+        and (options.shard_passwords or options.watch or options.memory_budget is not None)
+    ):
+        parser.error(ErrorMessage.ISOLATION_CONFLICT)
+
+    if (
+        options.paths_from == InputSource.STANDARD_INPUT
+        and not options.classify_only
+        and options.passwords_from in [None, InputSource.STANDARD_INPUT]
+    ):
+        parser.error(ErrorMessage.STANDARD_INPUT_CONFLICT)
+
+    return options
+
+@typechecked
+def _get_output_file_path(file_path: str, output_dir: str) -> str:
+    """
+    Get the file path in an output directory that mirrors the absolute file path of a file,
+    so that files from different input directories never collide.
+
+    :param file_path: Sanitized file path of the file.
+    :param output_dir: Output directory.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: File path of the file in the output directory.
+    """
+
+    drive, path = splitdrive(abspath(file_path))
+
+    return join(
+        output_dir,
+        drive.replace(":", "").lstrip("\\/"),
+        path.lstrip("\\/")
+    )
+
+@typechecked
+def _get_passwords(
+        source: str | None = None,
+        separator: InputSeparator = InputSeparator.NEWLINE
+    ) -> Passwords:
+    """
+    Get the passwords to attempt unlocking each PDF file with,
+    either from an input source or inputted.
+
+    :param source: Input source to read passwords from, or `None` to have them inputted.
+    :param separator: Separator between passwords in the input source.
+    :raises OSError: If the input source cannot be read.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :raises ValueError: If no password was given or if the input source is invalid.
+    :returns: Ordered list of unique passwords to attempt unlocking each PDF file with.
+    """
+
+    # <NOTE>
+    # Passwords are read a batch at a time, as reading them one at a time would dominate the time to read large lists,
+    # and are then deduplicated in order into a list that is held whole in memory,
+    # so only duplicates and the input source itself are kept out of memory.
+    passwords = (
+        list(
+            dict.fromkeys(
+                chain.from_iterable(
+                    _generate_source_input_batches(source, separator)
+                )
+            )
+        )
+        if source is not None
+        else _get_unique_inputs(InputPrompt.PASSWORDS)
+    )
+
+    if not passwords:
+        raise ValueError(ErrorMessage.NO_VALID_PASSWORD)
+
+    return passwords
+
+@typechecked
+def _get_pdf_file_paths(
+        directory_manifest: DirectoryManifest | None = None,
+        paths: Iterable[str] | None = None,
+        should_sniff: bool = False
+    ) -> Iterator[str]:
+    """
+    Lazily get the paths of all PDF files to unlock from every given or inputted
+
+    - directory path where some PDF files are, and/or
+    - file path of a PDF file.
+
+    :param directory_manifest: Manifest of the PDF files and subdirectories of directories
+                               to serve unchanged directories from and to update, if any.
+    :param paths: Unique directory paths and/or file paths, which may be read lazily,
+                  or `None` to have them inputted.
+    :param should_sniff: Whether to skip PDF files that do not start with the PDF file signature or not.
+    :raises FileNotFoundError: If every path does not ultimately point to a PDF file.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Iterator of unique paths of all PDF files to unlock, in discovery order.
+    """
+
+    if paths is None:
+        paths = _get_unique_inputs(InputPrompt.PATHS)
+
+    pdf_file_paths = _generate_pdf_file_paths(paths, directory_manifest)
+
+    if should_sniff:
+        pdf_file_paths = filter(_has_pdf_file_signature, pdf_file_paths)
+
+    first_pdf_file_path = next(pdf_file_paths, None)
+
+    if first_pdf_file_path is None:
+        raise FileNotFoundError(ErrorMessage.NO_VALID_PATH)
+
+    return chain([first_pdf_file_path], pdf_file_paths)
+
+@typechecked
+def _get_pdf_file_subpaths(
+        path: str,
+        directory_manifest: DirectoryManifest | None = None
+    ) -> Iterator[tuple[str, FileIdentity | None]]:
+    """
+    Lazily get the paths of some PDF files to unlock from either
+
+    - a directory path where some PDF files are, or
+    - a file path of a PDF file.
+
+    :param path: Directory path or file path of some PDF files to unlock.
+    :param directory_manifest: Manifest of the PDF files and subdirectories of directories
+                               to serve unchanged directories from and to update, if any.
+    :raises TypeCheckError: If any argument or yielded value has an invalid type.
+    :returns: Iterator of unique paths of some PDF files to unlock,
+              along with the identities of said PDF files if already known.
+    """
+
+    if isdir(path):
+        yield from _walk_directory(path, directory_manifest)
+    elif _is_pdf_file(path):
+        yield path, None
+
+@typechecked
+def _get_root_cause(exception: BaseException) -> BaseException:
+    """
+    Get the earliest exception that an exception was raised from.
+
+    :param exception: Exception to get the root cause of.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Earliest exception that the exception was raised from, which may be itself.
+    """
+
+    while exception.__cause__ is not None:
+        exception = exception.__cause__
+
+    return exception
+
+@typechecked
+def _get_save_arguments(save_profile: SaveProfile) -> dict[str, Any]:
+    """
+    Get the keyword arguments of `pikepdf.Pdf.save` for a profile to save unlocked PDF files with.
+
+    :param save_profile: Profile to save unlocked PDF files with.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Keyword arguments of `pikepdf.Pdf.save`.
+    """
+
+    if save_profile == SaveProfile.COMPACT:
+        return {
+            "compress_streams": True,
+            "object_stream_mode": ObjectStreamMode.generate,
+            "recompress_flate": True,
+            "stream_decode_level": StreamDecodeLevel.generalized
+        }
+
+    return {
+        "compress_streams": False,
+        "object_stream_mode": ObjectStreamMode.preserve,
+        "recompress_flate": False,
+        "stream_decode_level": StreamDecodeLevel.none
+    }
+
+@typechecked
+def _get_serve_options(arguments: list[str]) -> ServeOptions:
+    """
+    Get the command-line options of the unlock server.
+
+    :param arguments: Command-line arguments following the subcommand.
+    :raises SystemExit: If any argument is invalid or if help is asked for.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Command-line options of the unlock server.
+    """
+
+    parser = ArgumentParser(
+        description = Program.SERVE_DESCRIPTION,
+        prog = f"{Program.NAME} {Command.SERVE}"
+    )
+
+    parser.add_argument(
+        "--host",
+        default = Host.LOCALHOST,
+        help = OptionHelp.HOST
+    )
+    parser.add_argument(
+        "--port",
+        default = Port.SERVE,
+        help = OptionHelp.PORT,
+        type = int
+    )
+    parser.add_argument(
+        "--passwords-from",
+        help = OptionHelp.SERVE_PASSWORDS_FROM,
+        metavar = "SOURCE"
+    )
+    parser.add_argument(
+        "--null",
+        action = "store_true",
+        help = OptionHelp.NULL
+    )
+    parser.add_argument(
+        "--save-profile",
+        choices = list(SaveProfile),
+        default = SaveProfile.FAST,
+        help = OptionHelp.SAVE_PROFILE,
+        type = SaveProfile
+    )
+    parser.add_argument(
+        "--jobs",
+        default = process_cpu_count() or 1,
+        help = OptionHelp.JOBS,
+        metavar = "N",
+        type = int
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        help = OptionHelp.MAX_CONCURRENCY,
+        metavar = "N",
+        type = int
+    )
+    parser.add_argument(
+        "--max-request-size",
+        default = ByteCount.HTTP_REQUEST_BODY,
+        help = OptionHelp.MAX_REQUEST_SIZE,
+        metavar = "BYTES",
+        type = int
+    )
+
+    options = parser.parse_args(
+        args = arguments,
+        namespace = ServeOptions()
+    )
+
+    if options.jobs < 1:
+        parser.error(ErrorMessage.NON_POSITIVE_JOB_COUNT)
+
+    if options.max_concurrency is not None and options.max_concurrency < 1:
+        parser.error(ErrorMessage.NON_POSITIVE_CONCURRENCY)
+
+    if options.max_request_size < 1:
+        parser.error(ErrorMessage.NON_POSITIVE_REQUEST_SIZE)
+
+    return options
+
+@typechecked
+def _get_temporary_file_prefix(file_path: str) -> str:
+    """
+    Get the prefix of the hidden temporary files that replace a file,
+    which is derived from the name of the file so that those left behind for it can be told apart
+    from those of other files in the same directory, whatever the length of said name.
+
+    :param file_path: Path of the file to replace.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Prefix of the names of the temporary files.
+    """
+
+    return f"{Path.HIDDEN_FILE_PREFIX}{md5(fsencode(basename(file_path))).hexdigest()}."
+
+@typechecked
+def _get_unique_inputs(prompt: MainInputPrompt) -> Inputs:
+    """
+    Get unique inputs until an empty string is given.
+    
+    :param prompt: Prompt detailing what inputs are being asked of the user.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Ordered list of unique inputs.
+    """
+
+    print(prompt)
+    print(InputPrompt.END)
+    print(InputPrompt.MARKER)
+
+    # <NOTE>
+    # Dictionary keys are used as an insertion-ordered set for linear-time deduplication.
+    user_inputs: dict[str, None] = {}
+
+    user_input = input()
+    while user_input != "":
+        user_inputs.setdefault(user_input)
+
+        user_input = input()
+
+    return list(user_inputs)
+
+@typechecked
+def _get_unlock_result(
+        file_path: str,
+        passwords: Passwords,
+        save_profile: SaveProfile = SaveProfile.FAST,
+        output_dir: str | None = None
+    ) -> UnlockResult:
+    """
+    Attempt unlocking a PDF file and get a result small enough to send back from a worker process,
+    recording any failure in the result instead of raising it.
+
+    :param file_path: Sanitized file path of the PDF file to unlock.
+    :param passwords: Passwords to attempt unlocking the PDF file with.
+    :param save_profile: Profile to save the unlocked PDF file with.
+    :param output_dir: Output directory to write the unlocked PDF file in,
+                       or `None` to overwrite the PDF file.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Result of attempting to unlock the PDF file.
+    """
+
+    try:
+        file_state, unlocking_password = _retry_transient_errors(
+            lambda: _unlock_pdf_file(
+                file_path = file_path,
+                output_dir = output_dir,
+                passwords = passwords,
+                save_profile = save_profile
+            )
+        )
+    except PdfError as exception:
+        return UnlockResult(
+            error = _get_error_description(exception),
+            file_path = file_path,
+            file_state = (
+                FileState.ABORTED
+                if isinstance(_get_root_cause(exception), MemoryError)
+                else FileState.FAILED
+            )
+        )
+
+    return UnlockResult(
+        attempt_count = (
+            passwords.index(unlocking_password) + 1
+            if unlocking_password is not None
+            else 0
+        ),
+        file_path = file_path,
+        file_state = file_state,
+        password = unlocking_password
+    )
+
+@typechecked
+def _get_worker_passwords(prioritized_passwords: Passwords) -> Passwords:
+    """
+    Move passwords to the front of the passwords of this worker process, in order,
+    so that only the passwords to attempt first need to be sent along with each PDF file.
+
+    :param prioritized_passwords: Passwords to attempt first, in order.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Passwords of this worker process in their new order.
+    """
+
+    global _worker_passwords
+
+    # <NOTE>
+    # The passwords are replaced rather than reordered in place,
+    # so that passwords already handed out stay as they were in worker threads.
+    _worker_passwords = _prioritize_passwords(_worker_passwords, prioritized_passwords)
+
+    return _worker_passwords
+
+@typechecked
+def _get_worker_unlock_result(
+        file_path: str,
+        prioritized_passwords: Passwords,
+        save_profile: SaveProfile = SaveProfile.FAST,
+        output_dir: str | None = None
+    ) -> UnlockResult:
+    """
+    Attempt unlocking a PDF file as by `_get_unlock_result`
+    with the passwords of this worker process, after moving the passwords to attempt first to their front.
+
+    :param file_path: Sanitized file path of the PDF file to unlock.
+    :param prioritized_passwords: Passwords to attempt first, in order,
+                                  before the other passwords of this worker process.
+    :param save_profile: Profile to save the unlocked PDF file with.
+    :param output_dir: Output directory to write the unlocked PDF file in,
+                       or `None` to overwrite the PDF file.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Result of attempting to unlock the PDF file.
+    """
+
+    return _get_unlock_result(
+        file_path,
+        _get_worker_passwords(prioritized_passwords),
+        save_profile,
+        output_dir
+    )
+
+@typechecked
+def _has_pdf_file_signature(file_path: str) -> bool:
+    """
+    Sniff if a file has the PDF file signature within its header
+    by reading only a bounded number of its first bytes.
+
+    This rejects misnamed files with a single small read
+    instead of a failed parse attempt via `pikepdf`.
+
+    :param file_path: Path of a file.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Whether the file has the PDF file signature or not.
+    """
+
+    try:
+        with open(file_path, "rb") as file:
+            header = file.read(ByteCount.PDF_FILE_HEADER)
+    except OSError:
+        return False
+
+    return PdfToken.SIGNATURE in header
+
+@typechecked
+def _initialize_shard_worker(
+        shared_password_index: Synchronized, # pyright: ignore[reportMissingTypeArgument]
+        passwords: Passwords
+    ) -> None:
+    """
+    Initialize a worker process for password shards
+    by sharing with it the index of the earliest password found so far.
+
+    :param shared_password_index: Shared index of the earliest password that opens the PDF file
+                                  being unlocked, or the password count if none is found yet.
+    :param passwords: Passwords to attempt unlocking each PDF file with.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    global _shared_password_index
+
+    _initialize_worker(passwords)
+
+    _shared_password_index = shared_password_index
+
+@typechecked
+def _initialize_watch_worker(passwords: Passwords | None = None) -> None:
+    """
+    Initialize a worker process of a watch by having it ignore interrupts,
+    so that interrupting the watch lets pending PDF files finish instead of breaking the pool,
+    and by warming it up like any other worker process.
+
+    :param passwords: Passwords to attempt unlocking each PDF file with,
+                      or `None` to keep those of the worker process as is.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    signal(SIGINT, SIG_IGN)
+
+    _initialize_worker(passwords)
+
+@typechecked
+def _initialize_worker(passwords: Passwords | None = None) -> None:
+    """
+    Initialize a worker process by having `pikepdf` imported along with this module and
+    by warming it up via creating an empty PDF file in memory,
+    so that the first PDF file of said process is not slowed down,
+    and by keeping the passwords to attempt unlocking each PDF file with, if any.
+
+    :param passwords: Passwords to attempt unlocking each PDF file with,
+                      or `None` to keep those of the worker process as is.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    global _worker_passwords
+
+    if passwords is not None:
+        _worker_passwords = list(passwords)
+
+    with Pdf.new():
+        pass
+
+@typechecked
+def _is_pdf_file(file_path: str | DirEntry[str]) -> bool:
+    """
+    Validate if a file path or directory entry
+
+    - has the PDF file extension regardless of its case, and
+    - points to a file.
+
+    :param file_path: Path of a file or directory entry of said file.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Whether the file path directly points to a PDF file or not.
+    """
+
+    if isinstance(file_path, DirEntry):
+        return (
+            file_path.name.lower().endswith(Path.PDF_FILE_EXTENSION)
+            and file_path.is_file()
+        )
+
+    return file_path.lower().endswith(Path.PDF_FILE_EXTENSION) and isfile(file_path)
+
+@typechecked
+def _is_transient_error(exception: BaseException) -> bool:
+    """
+    Check if an exception was ultimately caused by an I/O error that may go away if retried,
+    such as a busy file or a file locked by another process.
+
+    :param exception: Exception to check.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Whether the exception or any exception it was raised from is a transient I/O error.
+    """
+
+    cause: BaseException | None = exception
+
+    while cause is not None:
+        if isinstance(cause, OSError) and (
+            cause.errno in TransientErrorNumber
+            or getattr(cause, "winerror", None) in TransientWindowsErrorNumber
+        ):
+            return True
+
+        cause = cause.__cause__
+
+    return False
+
+@typechecked
+def _locate_pdf_object(data: PdfData, object_number: int) -> int | None:
+    """
+    Locate an uncompressed indirect object in raw PDF data
+    via its cross-reference sections, from the last to the first.
+
+    :param data: Raw PDF data.
+    :param object_number: Object number of the indirect object.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :raises ValueError: If any cross-reference section is malformed or
+                        if the indirect object is either free or compressed.
+    :returns: Offset of the indirect object, or `None` if it cannot be located.
+    """
+
+    xref_offset = _find_start_xref(data)
+    visited_xref_offsets: set[int] = set()
+
+    while isinstance(xref_offset, int) and xref_offset not in visited_xref_offsets:
+        visited_xref_offsets.add(xref_offset)
+        xref_section = _read_xref_section(data, xref_offset)
+
+        if xref_section is None:
+            return None
+
+        trailer, offset = xref_section
+        object_offset = _find_xref_entry(data, trailer, offset, object_number)
+
+        if object_offset is not None:
+            return object_offset
+
+        xref_offset = trailer.get(PdfName.PREV)
+
+    return None
+
+@typechecked
+def _log_average_attempt_count(attempt_counts: list[int]) -> None:
+    """
+    Log how many passwords were attempted on average until each unlocked PDF file was unlocked,
+    if any PDF file was unlocked.
+
+    :param attempt_counts: Number of passwords attempted until each unlocked PDF file was unlocked.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    if not attempt_counts:
+        return
+
+    print(
+        LogMessage.AVERAGE_ATTEMPT_COUNT(sum(attempt_counts) / len(attempt_counts))
+    )
+    print()
+
+@typechecked
+def _log_file_errors(file_errors: FileErrors) -> None:
+    """
+    Log for every PDF file that failed to be unlocked the error that made it fail,
+    if any PDF file failed.
+
+    :param file_errors: Dictionary that maps file paths of PDF files with the errors that made unlocking them fail.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    if not file_errors:
+        return
+
+    for file_path, error in file_errors.items():
+        print(
+            LogMessage.FILE_ERROR(
+                error = error,
+                file_path = file_path
+            )
+        )
+
+    print()
+
+@typechecked
+def _log_file_state_counts(file_state_counts: FileStateCounts) -> None:
+    """
+    Log for every file state how many PDF files are in such file state,
+    skipping failed PDF files if there are none.
+
+    :param file_state_counts: Dictionary that maps file states with how many PDF files are in them.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    for file_state, file_state_count in file_state_counts.items():
+        if not file_state_count and file_state == FileState.FAILED:
+            continue
+
+        print(
+            LogMessage.FILE_STATE_TOTAL(
+                file_state = file_state,
+                file_state_count = file_state_count
+            )
+        )
+
+    print()
+
+@typechecked
+def _log_unlock_attempt(grouped_pdf_file_paths: GroupedPaths) -> None:
+    """
+    Log for every file state
+
+    - how many PDF files are in such file state, and
+    - what are the file paths of those PDF files,
+
+    skipping aborted and failed PDF files if there are none.
+
+    :param grouped_pdf_file_paths: Dictionary that maps file states with file paths of PDF files.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    for file_state in [
+        FileState.LOCKED,
+        FileState.NOT_LOCKED,
+        FileState.UNLOCKED,
+        FileState.ABORTED,
+        FileState.FAILED
+    ]:
+        pdf_file_paths = grouped_pdf_file_paths[file_state]
+        file_state_count = len(pdf_file_paths)
+
+        if not file_state_count and file_state in [FileState.ABORTED, FileState.FAILED]:
+            continue
+
+        print(
+            LogMessage.FILE_STATE_COUNT(
+                file_state = file_state,
+                file_state_count = file_state_count
+            )
+        )
+
+        if file_state_count:
+            for pdf_file_path in pdf_file_paths:
+                print(pdf_file_path)
+        else:
+            print(LogMessage.NO_PDF_FILE_PATH)
+
+        print()
+
+@typechecked
+def _log_unlock_costs(unlock_costs: UnlockCosts) -> None:
+    """
+    Log the estimated cost of unlocking every scheduled PDF file
+    along with the costliest of those PDF files,
+    if any PDF file was scheduled.
+
+    :param unlock_costs: Estimated costs of unlocking the PDF files, from the costliest.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    if not unlock_costs:
+        return
+
+    print(
+        LogMessage.UNLOCK_COST_TOTAL(sum(unlock_costs.values()))
+    )
+
+    for pdf_file_path, unlock_cost in islice(unlock_costs.items(), LogCount.COSTLIEST_PDF_FILES):
+        print(
+            LogMessage.UNLOCK_COST(
+                file_path = pdf_file_path,
+                unlock_cost = unlock_cost
+            )
+        )
+
+    print()
+
+@typechecked
+def _move_password_to_front(passwords: Passwords, password: str | None) -> Passwords:
+    """
+    Move a password to the front of the passwords to attempt unlocking PDF files with,
+    so that the password that unlocked the latest PDF file is attempted first for the next ones.
+
+    :param passwords: Passwords to attempt unlocking PDF files with, in order.
+    :param password: Password that unlocked the latest PDF file, if any.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Passwords in their new order, as a new list if said order changed.
+    """
+
+    if password is None or passwords[:1] == [password]:
+        return passwords
+
+    return [password] + [
+        other_password
+        for other_password in passwords
+        if other_password != password
+    ]
+
+@typechecked
+def _open_inotify() -> Inotify | None:
+    """
+    Open an inotify instance to watch directories with via the C library.
+
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Inotify instance, or `None` if inotify is not supported.
+    """
+
+    library_path = find_library("c")
+
+    if library_path is None:
+        return None
+
+    try:
+        library = CDLL(library_path, use_errno = True)
+        file_descriptor = library.inotify_init1(InotifyFlag.CLOSE_ON_EXEC | InotifyFlag.NON_BLOCKING)
+    except (AttributeError, OSError):
+        return None
+
+    if file_descriptor < 0:
+        return None
+
+    return Inotify(
+        directory_paths = {},
+        file_descriptor = file_descriptor,
+        library = library
+    )
+
+@typechecked
+def _order_passwords(passwords: Passwords, password_hits: PasswordHits) -> Passwords:
+    """
+    Order passwords from the one that unlocked the most PDF files in previous runs to the least,
+    keeping the given order among passwords that unlocked as many PDF files.
+
+    :param passwords: Passwords to attempt unlocking PDF files with, in the given order.
+    :param password_hits: Counts of how many PDF files each password unlocked in previous runs.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Passwords in their new order.
+    """
+
+    return sorted(
+        passwords,
+        key = lambda password: -password_hits[password]
+    )
+
+@typechecked
+def _parse_encryption_dictionary(data: PdfData) -> tuple[PdfDictionary, PdfDictionary] | None:
+    """
+    Parse the encryption dictionary of raw PDF data without `pikepdf`
+    by following its trailer to said dictionary.
+
+    :param data: Raw PDF data.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Encryption dictionary and trailer of the PDF data,
+              or `None` if the PDF data is not encrypted or if it cannot be parsed unambiguously.
+    """
+
+    try:
+        trailer = _read_trailer(data)
+
+        if trailer is None:
+            return None
+
+        encryption_dictionary = trailer.get(PdfName.ENCRYPT)
+
+        if isinstance(encryption_dictionary, tuple):
+            object_offset = _locate_pdf_object(data, encryption_dictionary[0])
+
+            if object_offset is None:
+                return None
+
+            match = compile(PdfPattern.OBJECT_HEADER).match(data, object_offset)
+
+            if match is None:
+                return None
+
+            encryption_dictionary, _ = _parse_pdf_object(data, match.end())
+    except ValueError:
+        return None
+
+    if not isinstance(encryption_dictionary, dict):
+        return None
+
+    return encryption_dictionary, trailer
+
+@typechecked
+def _parse_encryption_fingerprint(data: PdfData) -> str | None:
+    """
+    Parse the encryption fingerprint of raw PDF data without `pikepdf`,
+    which is shared by PDF files encrypted by the same system with the same passwords.
+
+    :param data: Raw PDF data.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Hexadecimal encryption fingerprint,
+              or `None` if the PDF data is not encrypted or if it cannot be parsed unambiguously.
+    """
+
+    dictionaries = _parse_encryption_dictionary(data)
+
+    if dictionaries is None:
+        return None
+
+    encryption_dictionary, _ = dictionaries
+    owner_hash = encryption_dictionary.get(PdfName.O)
+    revision = encryption_dictionary.get(PdfName.R)
+
+    if not isinstance(owner_hash, bytes):
+        return None
+
+    return sha256(
+        repr(
+            (
+                encryption_dictionary.get(PdfName.FILTER),
+                revision,
+                encryption_dictionary.get(PdfName.V),
+                encryption_dictionary.get(PdfName.LENGTH),
+                (
+                    encryption_dictionary.get(PdfName.P)
+                    if isinstance(revision, int) and revision >= 5
+                    else owner_hash
+                )
+            )
+        ).encode()
+    ).hexdigest()
+
+@typechecked
+def _parse_encryption_parameters(data: PdfData) -> EncryptionParameters | None:
+    """
+    Parse the parameters of the standard security handler of raw PDF data without `pikepdf`
+    by following its trailer to its encryption dictionary.
+
+    :param data: Raw PDF data.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Parameters of the standard security handler,
+              or `None` if the PDF data is not encrypted via revisions 2 to 5 of said handler
+              or if it cannot be parsed unambiguously.
+    """
+
+    dictionaries = _parse_encryption_dictionary(data)
+
+    if dictionaries is None:
+        return None
+
+    encryption_dictionary, trailer = dictionaries
+
+    document_ids = trailer.get(PdfName.ID, [b""])
+
+    if not isinstance(document_ids, list):
+        return None
+
+    revision = encryption_dictionary.get(PdfName.R)
+    owner_hash = encryption_dictionary.get(PdfName.O)
+    user_hash = encryption_dictionary.get(PdfName.U)
+    permissions = encryption_dictionary.get(PdfName.P)
+    key_length = encryption_dictionary.get(PdfName.LENGTH, 40 if revision in [2, 3] else 128)
+    should_encrypt_metadata = encryption_dictionary.get(PdfName.ENCRYPT_METADATA, True)
+    document_id = document_ids[0] if document_ids else b""
+
+    if (
+        encryption_dictionary.get(PdfName.FILTER) != PdfName.STANDARD
+        or revision not in [2, 3, 4, 5]
+        or not isinstance(owner_hash, bytes)
+        or not isinstance(user_hash, bytes)
+        or not isinstance(permissions, int)
+        or not isinstance(key_length, int)
+        or not isinstance(should_encrypt_metadata, bool)
+        or not isinstance(document_id, bytes)
+    ):
+        return None
+
+    if min(len(owner_hash), len(user_hash)) < (48 if revision == 5 else 32):
+        return None
+
+    return EncryptionParameters(
+        document_id = document_id,
+        key_length = 5 if revision == 2 else min(key_length // 8, 16),
+        owner_hash = owner_hash[:48] if revision == 5 else owner_hash[:32],
+        permissions = permissions,
+        revision = cast(int, revision),
+        should_encrypt_metadata = should_encrypt_metadata,
+        user_hash = user_hash[:48] if revision == 5 else user_hash[:32]
+    )
+
+@typechecked
+def _parse_encryption_revision(data: PdfData) -> int | None:
+    """
+    Parse the revision of the standard security handler of raw PDF data without `pikepdf`
+    by following its trailer to its encryption dictionary.
+
+    :param data: Raw PDF data.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Revision of the standard security handler,
+              or `None` if the PDF data is not encrypted or if it cannot be parsed unambiguously.
+    """
+
+    dictionaries = _parse_encryption_dictionary(data)
+
+    if dictionaries is None:
+        return None
+
+    encryption_dictionary, _ = dictionaries
+    revision = encryption_dictionary.get(PdfName.R)
+
+    return revision if type(revision) is int else None
+
+@typechecked
+def _parse_pdf_literal_string(data: PdfData, offset: int) -> tuple[bytes, int]:
+    """
+    Parse a literal string from raw PDF data,
+    resolving its escape sequences, nested parentheses, and line breaks.
+
+    :param data: Raw PDF data.
+    :param offset: Offset of the opening parenthesis of the literal string.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :raises ValueError: If the literal string is not closed.
+    :returns: Value of the literal string and the offset right after it.
+    """
+
+    depth = 0
+    escape_sequences = {
+        b"(": b"(",
+        b")": b")",
+        b"\\": b"\\",
+        b"b": b"\b",
+        b"f": b"\f",
+        b"n": b"\n",
+        b"r": b"\r",
+        b"t": b"\t"
+    }
+    value = bytearray()
+
+    while True:
+        character = data[offset:offset + 1]
+        offset += 1
+
+        if not character:
+            raise ValueError(ErrorMessage.MALFORMED_PDF_OBJECT)
+
+        if character == PdfToken.ESCAPE:
+            escaped_character = data[offset:offset + 1]
+            offset += 1
+
+            if escaped_character and escaped_character in PdfToken.OCTAL_DIGITS:
+                octal_digits = escaped_character
+
+                while (
+                    len(octal_digits) < 3
+                    and data[offset:offset + 1]
+                    and data[offset:offset + 1] in PdfToken.OCTAL_DIGITS
+                ):
+                    octal_digits += data[offset:offset + 1]
+                    offset += 1
+
+                value.append(int(octal_digits, 8) & 0xFF)
+            elif escaped_character == PdfToken.CARRIAGE_RETURN:
+                if data[offset:offset + 1] == PdfToken.LINE_FEED:
+                    offset += 1
+            elif escaped_character != PdfToken.LINE_FEED:
+                value += escape_sequences.get(escaped_character, escaped_character)
+        elif character == PdfToken.CARRIAGE_RETURN:
+            # <NOTE>
+            # Unescaped line breaks are read as line feeds regardless of their form.
+            if data[offset:offset + 1] == PdfToken.LINE_FEED:
+                offset += 1
+
+            value += PdfToken.LINE_FEED
+        else:
+            if character == PdfToken.LITERAL_STRING_START:
+                depth += 1
+
+                if depth == 1:
+                    continue
+            elif character == PdfToken.LITERAL_STRING_END:
+                depth -= 1
+
+                if depth == 0:
+                    return bytes(value), offset
+
+            value += character
+
+@typechecked
+def _parse_pdf_object(data: PdfData, offset: int) -> tuple[PdfObject, int]:
+    """
+    Parse a PDF object found in a trailer or an encryption dictionary from raw PDF data.
+
+    :param data: Raw PDF data.
+    :param offset: Offset of the object or of the whitespace before it.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :raises ValueError: If no supported PDF object is at the offset.
+    :returns: Parsed PDF object and the offset right after it.
+    """
+
+    offset = _skip_pdf_whitespace(data, offset)
+    token = data[offset:offset + 2]
+
+    if token == PdfToken.DICTIONARY_START:
+        dictionary: PdfDictionary = {}
+        offset = _skip_pdf_whitespace(data, offset + 2)
+
+        while data[offset:offset + 2] != PdfToken.DICTIONARY_END:
+            key, offset = _parse_pdf_object(data, offset)
+
+            if not isinstance(key, str):
+                raise ValueError(ErrorMessage.MALFORMED_PDF_OBJECT)
+
+            value, offset = _parse_pdf_object(data, offset)
+            dictionary[key] = value
+            offset = _skip_pdf_whitespace(data, offset)
+
+        return dictionary, offset + 2
+
+    if token[:1] == PdfToken.ARRAY_START:
+        array: list[PdfObject] = []
+        offset = _skip_pdf_whitespace(data, offset + 1)
+
+        while data[offset:offset + 1] != PdfToken.ARRAY_END:
+            item, offset = _parse_pdf_object(data, offset)
+            array.append(item)
+            offset = _skip_pdf_whitespace(data, offset)
+
+        return array, offset + 1
+
+    if token[:1] == PdfToken.LITERAL_STRING_START:
+        return _parse_pdf_literal_string(data, offset)
+
+    if match := compile(PdfPattern.HEXADECIMAL_STRING).match(data, offset):
+        hexadecimal_digits = sub(PdfPattern.WHITESPACE_CHARACTER, b"", match[1])
+
+        # <NOTE>
+        # A missing final digit is assumed to be zero.
+        return bytes.fromhex(
+            hexadecimal_digits.decode() + "0" * (len(hexadecimal_digits) % 2)
+        ), match.end()
+
+    if match := compile(PdfPattern.NAME).match(data, offset):
+        return sub(
+            PdfPattern.NAME_ESCAPE,
+            lambda escape: bytes.fromhex(escape[1].decode()),
+            match[0]
+        ).decode("latin-1"), match.end()
+
+    if match := compile(PdfPattern.REFERENCE).match(data, offset):
+        return (int(match[1]), int(match[2])), match.end()
+
+    if match := compile(PdfPattern.NUMBER).match(data, offset):
+        number = match[0].decode()
+
+        return (
+            int(number)
+            if number.lstrip("+-").isdigit()
+            else float(number)
+        ), match.end()
+
+    if match := compile(PdfPattern.KEYWORD).match(data, offset):
+        keywords: dict[bytes, PdfObject] = {
+            b"false": False,
+            b"null": None,
+            b"true": True
+        }
+
+        return keywords[match[0]], match.end()
+
+    raise ValueError(ErrorMessage.MALFORMED_PDF_OBJECT)
+
+@typechecked
+def _pop_pending_result[T](
+        pending_results: deque[tuple[str | None, Future[T]]],
+        should_preserve_order: bool
+    ) -> tuple[str | None, Future[T]]:
+    """
+    Pop either the oldest pending result, or the first one to be done.
+
+    :param pending_results: Encryption fingerprints of pending PDF files along with their pending results, in order.
+    :param should_preserve_order: Whether to pop the oldest pending result or the first one to be done.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Encryption fingerprint of the PDF file, if any, along with its pending result.
+    """
+
+    if should_preserve_order:
+        return pending_results.popleft()
+
+    wait(
+        [pending_result for _, pending_result in pending_results],
+        return_when = FIRST_COMPLETED
+    )
+
+    done_index = next(
+        index
+        for index, (_, pending_result) in enumerate(pending_results)
+        if pending_result.done()
+    )
+    done_result = pending_results[done_index]
+
+    del pending_results[done_index]
+
+    return done_result
+
+@typechecked
+def _prioritize_fingerprint_password(
+        file_path: str,
+        passwords: Passwords,
+        fingerprint_passwords: FingerprintPasswords
+    ) -> tuple[str | None, Passwords]:
+    """
+    Move the password that unlocked the latest PDF file with the same encryption fingerprint
+    as a PDF file to the front of the passwords to attempt unlocking said PDF file with.
+
+    :param file_path: Sanitized file path of the PDF file.
+    :param passwords: Passwords to attempt unlocking the PDF file with,
+                      or only those to attempt first when worker processes already have every password.
+    :param fingerprint_passwords: Passwords that unlocked PDF files keyed on their encryption fingerprints.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Encryption fingerprint of the PDF file, or `None` if it cannot be read,
+              and the passwords with the password for said fingerprint, if any, at the front.
+    """
+
+    fingerprint = _read_encryption_fingerprint(file_path)
+
+    if fingerprint is None:
+        return None, passwords
+
+    return fingerprint, _move_password_to_front(passwords, fingerprint_passwords[fingerprint])
+
+@typechecked
+def _prioritize_passwords(passwords: Passwords, prioritized_passwords: Passwords) -> Passwords:
+    """
+    Move passwords to the front of the passwords to attempt unlocking PDF files with, in order.
+
+    :param passwords: Passwords to attempt unlocking PDF files with, in order.
+    :param prioritized_passwords: Passwords to attempt first, in order.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Passwords in their new order, as a new list if said order changed.
+    """
+
+    for password in reversed(prioritized_passwords):
+        passwords = _move_password_to_front(passwords, password)
+
+    return passwords
+
+@typechecked
+def _read_directory_manifest(cache_dir: str | None) -> DirectoryManifest | None:
+    """
+    Read the manifest of the PDF files and subdirectories of walked directories from a cache directory.
+
+    :param cache_dir: Cache directory, if any.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Manifest of walked directories, or `None` if no cache directory is given.
+    """
+
+    if cache_dir is None:
+        return None
+
+    return DirectoryManifest.read(
+        join(cache_dir, Path.DIRECTORY_MANIFEST_FILE_NAME)
+    )
+
+@typechecked
+def _read_encryption_fingerprint(file_path: str) -> str | None:
+    """
+    Read the encryption fingerprint of a PDF file without `pikepdf` by memory-mapping it,
+    which is shared by PDF files encrypted by the same system with the same passwords.
+
+    :param file_path: Sanitized file path of the PDF file.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Hexadecimal encryption fingerprint,
+              or `None` if the PDF file is not encrypted or if it cannot be read unambiguously.
+    """
+
+    return _scan_pdf_file(file_path, _parse_encryption_fingerprint)
+
+@typechecked
+def _read_encryption_parameters(file_path: str) -> EncryptionParameters | None:
+    """
+    Read the parameters of the standard security handler of a PDF file without `pikepdf`
+    by memory-mapping it and following its trailer to its encryption dictionary.
+
+    :param file_path: Sanitized file path of the PDF file.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Parameters of the standard security handler,
+              or `None` if the PDF file is not encrypted via revisions 2 to 5 of said handler
+              or if it cannot be read unambiguously.
+    """
+
+    return _scan_pdf_file(file_path, _parse_encryption_parameters)
+
+@typechecked
+def _read_encryption_revision(file_path: str) -> int | None:
+    """
+    Read the revision of the standard security handler of a PDF file without `pikepdf`
+    by memory-mapping it and following its trailer to its encryption dictionary.
+
+    :param file_path: Sanitized file path of the PDF file.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Revision of the standard security handler,
+              or `None` if the PDF file is not encrypted or if it cannot be read unambiguously.
+    """
+
+    return _scan_pdf_file(file_path, _parse_encryption_revision)
+
+@typechecked
+def _read_inotify_events(inotify: Inotify, timeout: float) -> Paths | None:
+    """
+    Wait for PDF files in watched directories to be written or moved in,
+    watching every directory that is created or moved in along the way.
+
+    :param inotify: Inotify instance that watches directories.
+    :param timeout: Maximum number of seconds to wait for.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Paths of the files that were written or moved in, including those in new directories,
+              or `None` if some events were lost and every directory must be walked again.
+    """
+
+    readable_file_descriptors, _, _ = select([inotify.file_descriptor], [], [], timeout)
+
+    if not readable_file_descriptors:
+        return []
+
+    data = read(inotify.file_descriptor, ByteCount.INOTIFY_EVENT_BUFFER)
+    paths: Paths = []
+    offset = 0
+
+    while offset < len(data):
+        watch_descriptor, mask, _, name_length = unpack_from("iIII", data, offset)
+        name = fsdecode(
+            data[
+                offset + ByteCount.INOTIFY_EVENT_HEADER
+                :offset + ByteCount.INOTIFY_EVENT_HEADER + name_length
+            ].rstrip(b"\0")
+        )
+        offset += ByteCount.INOTIFY_EVENT_HEADER + name_length
+
+        if mask & InotifyMask.QUEUE_OVERFLOW:
+            return None
+
+        directory_path = inotify.directory_paths.get(watch_descriptor)
+
+        if directory_path is None or not name or name.startswith(Path.HIDDEN_FILE_PREFIX):
+            continue
+
+        path = join(directory_path, name)
+
+        if mask & InotifyMask.IS_DIRECTORY:
+            _watch_directory_tree(inotify, path)
+
+            paths.extend(
+                pdf_file_path
+                for pdf_file_path, _ in _walk_directory(path)
+            )
+        else:
+            paths.append(path)
+
+    return paths
+
+@typechecked
+def _read_journal(file_path: str) -> Journal:
+    """
+    Read the final file states of PDF files from a journal,
+    where later entries of the same version of a PDF file override earlier ones.
+
+    Malformed entries, such as one that was cut off by an interrupted run, are ignored.
+
+    :param file_path: Path of the journal, which is a JSON Lines file.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Dictionary that maps signatures of PDF files with the final file states they were journaled in,
+              which is empty if the journal is missing.
+    """
+
+    journal: Journal = {}
+
+    try:
+        with open(file_path, encoding = "utf-8") as file:
+            for line in file:
+                try:
+                    entry = loads(line)
+                    file_signature = (
+                        entry[JournalField.DEVICE],
+                        entry[JournalField.INODE],
+                        entry[JournalField.SIZE],
+                        entry[JournalField.MODIFIED_TIME]
+                    )
+                    file_state = FileState[entry[JournalField.FILE_STATE]]
+                except (KeyError, TypeError, ValueError):
+                    continue
+
+                if all(type(value) is int for value in file_signature):
+                    journal[file_signature] = file_state
+    except OSError:
+        pass
+
+    return journal
+
+@typechecked
+def _read_memory_usage(memory_field: MemoryField) -> int | None:
+    """
+    Read a memory usage field of this process.
+
+    :param memory_field: Memory usage field to read.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Memory usage in bytes,
+              or `None` if it cannot be read, e.g. on platforms other than Linux.
+    """
+
+    try:
+        with open(Path.STATUS_FILE, encoding = "utf-8") as status_file:
+            for line in status_file:
+                name, _, value = line.partition(":")
+
+                if name == memory_field:
+                    return int(value.split()[0]) * ByteCount.KIBIBYTE
+    except (OSError, ValueError, IndexError):
+        return None
+
+    return None
+
+@typechecked
+def _read_password_caches(
+        cache_dir: str | None,
+        passwords: Passwords
+    ) -> tuple[PasswordHits, FingerprintPasswords, FileOutcomes]:
+    """
+    Read the caches that depend on the passwords from a cache directory.
+
+    :param cache_dir: Cache directory, or `None` to start with empty caches.
+    :param passwords: Passwords to attempt unlocking each PDF file with.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: How many PDF files each password unlocked,
+              which password unlocked PDF files with each encryption fingerprint,
+              and the last outcome of each PDF file.
+    """
+
+    if cache_dir is None:
+        return PasswordHits(), FingerprintPasswords(passwords), FileOutcomes(passwords)
+
+    return (
+        PasswordHits.read(join(cache_dir, Path.PASSWORD_HITS_FILE_NAME)),
+        FingerprintPasswords.read(join(cache_dir, Path.FINGERPRINT_PASSWORDS_FILE_NAME), passwords),
+        FileOutcomes.read(join(cache_dir, Path.FILE_OUTCOMES_FILE_NAME), passwords)
+    )
+
+@typechecked
+def _read_pdf_data(file_path: str) -> bytes:
+    """
+    Read the raw data of a PDF file.
+
+    :param file_path: Sanitized file path of the PDF file.
+    :raises PdfError: If reading the PDF file failed.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Raw PDF data.
+    """
+
+    try:
+        with open(file_path, "rb") as file:
+            return file.read()
+    except OSError as exception:
+        raise PdfError(
+            ErrorMessage.FAILED_OVERWRITE(file_path)
+        ) from exception
+
+@typechecked
+def _read_trailer(data: PdfData) -> PdfDictionary | None:
+    """
+    Read the trailer dictionary of the last cross-reference section of raw PDF data,
+    whether said section is a cross-reference table or a cross-reference stream.
+
+    :param data: Raw PDF data.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Trailer dictionary, or `None` if it cannot be found unambiguously.
+    """
+
+    xref_offset = _find_start_xref(data)
+
+    if xref_offset is None:
+        return None
+
+    xref_section = _read_xref_section(data, xref_offset)
+
+    return (
+        xref_section[0]
+        if xref_section is not None
+        else None
+    )
+
+@typechecked
+def _read_xref_section(data: PdfData, xref_offset: int) -> tuple[PdfDictionary, int] | None:
+    """
+    Read a cross-reference section of raw PDF data,
+    whether it is a cross-reference table or a cross-reference stream.
+
+    :param data: Raw PDF data.
+    :param xref_offset: Offset of the cross-reference section.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Trailer dictionary of the cross-reference section and the offset right after
+              either the `xref` keyword of the cross-reference table or
+              the dictionary of the cross-reference stream,
+              or `None` if the cross-reference section cannot be read unambiguously.
+    """
+
+    try:
+        if match := compile(PdfPattern.XREF_TABLE).match(data, xref_offset):
+            trailer_offset = data.find(PdfToken.TRAILER, match.end())
+
+            if trailer_offset == -1:
+                return None
+
+            trailer, _ = _parse_pdf_object(data, trailer_offset + len(PdfToken.TRAILER))
+            offset = match.end()
+        elif match := compile(PdfPattern.OBJECT_HEADER).match(data, xref_offset):
+            trailer, offset = _parse_pdf_object(data, match.end())
+
+            if (
+                not isinstance(trailer, dict)
+                or trailer.get(PdfName.TYPE) != PdfName.XREF
+            ):
+                return None
+        else:
+            return None
+    except ValueError:
+        return None
+
+    return (
+        (trailer, offset)
+        if isinstance(trailer, dict)
+        else None
+    )
+
+@typechecked
+def _record_file_outcome(
+        file_outcomes: FileOutcomes,
+        unlock_result: UnlockResult,
+        output_dir: str | None
+    ) -> None:
+    """
+    Remember the outcome of attempting to unlock a PDF file by its signature after said attempt.
+
+    A PDF file that was overwritten as its unlocked version is remembered as not locked,
+    whereas one that was written to an output directory or that failed or was aborted is not remembered at all,
+    so that it is attempted again next time.
+
+    :param file_outcomes: Last outcomes of attempting to unlock PDF files keyed on their signatures.
+    :param unlock_result: Result of attempting to unlock the PDF file.
+    :param output_dir: Output directory that unlocked PDF files were written in,
+                       or `None` if PDF files were overwritten.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    if (
+        unlock_result.file_state in [FileState.ABORTED, FileState.FAILED]
+        or (unlock_result.file_state == FileState.UNLOCKED and output_dir is not None)
+    ):
+        return
+
+    file_signature = _get_file_signature(unlock_result.file_path)
+
+    if file_signature is not None:
+        file_outcomes.add(file_signature, unlock_result.file_state == FileState.LOCKED)
+
+@typechecked
+def _record_unlock_result(
+        unlock_result: UnlockResult,
+        fingerprint: str | None,
+        passwords: Passwords,
+        fingerprint_passwords: FingerprintPasswords
+    ) -> Passwords:
+    """
+    Record the password that unlocked a PDF file, if any,
+    so that it is attempted first for the next PDF files and for those with the same encryption fingerprint.
+
+    :param unlock_result: Result of attempting to unlock the PDF file.
+    :param fingerprint: Encryption fingerprint of the PDF file, or `None` if it cannot be read.
+    :param passwords: Passwords to attempt unlocking the next PDF files with, in order.
+    :param fingerprint_passwords: Passwords that unlocked PDF files keyed on their encryption fingerprints,
+                                  which is updated if the PDF file got unlocked.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Passwords with the one that unlocked the PDF file, if any, at the front.
+    """
+
+    if fingerprint is not None and unlock_result.password is not None:
+        fingerprint_passwords.add(fingerprint, unlock_result.password)
+
+    return _move_password_to_front(passwords, unlock_result.password)
+
+@typechecked
+def _record_unlock_results(
+        unlock_results: Iterable[UnlockResult],
+        options: Options,
+        grouped_pdf_file_paths: GroupedPaths,
+        file_errors: FileErrors,
+        attempt_counts: list[int],
+        password_hits: PasswordHits,
+        file_outcomes: FileOutcomes
+    ) -> None:
+    """
+    Record the result of unlocking each PDF file as soon as it is done with.
+
+    :param unlock_results: Results of unlocking each PDF file, which may be generated lazily.
+    :param options: Command-line options.
+    :param grouped_pdf_file_paths: Dictionary that maps file states with file paths of PDF files.
+    :param file_errors: Dictionary that maps file paths of PDF files with their errors.
+    :param attempt_counts: Attempt counts of unlocked PDF files.
+    :param password_hits: How many PDF files each password unlocked.
+    :param file_outcomes: Last outcome of each PDF file.
+    :raises OSError: If the journal cannot be written.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    if options.journal is not None:
+        makedirs(
+            exist_ok = True,
+            name = dirname(abspath(options.journal))
+        )
+
+    with (
+        open(options.journal, "a", encoding = "utf-8")
+        if options.journal is not None
+        else nullcontext()
+    ) as journal_file, (
+        suppress(KeyboardInterrupt)
+        if options.watch
+        else nullcontext()
+    ):
+        for unlock_result in unlock_results:
+            if options.watch:
+                print(LogMessage.FILE_RESULT(unlock_result.file_path, unlock_result.file_state))
+
+            grouped_pdf_file_paths[unlock_result.file_state].append(unlock_result.file_path)
+
+            if unlock_result.error is not None:
+                file_errors[unlock_result.file_path] = unlock_result.error
+
+            if unlock_result.password is not None:
+                attempt_counts.append(unlock_result.attempt_count)
+                password_hits.add(unlock_result.password)
+
+            if journal_file is not None:
+                _write_journal_entry(journal_file, unlock_result)
+
+            if options.cache_dir is not None:
+                _record_file_outcome(file_outcomes, unlock_result, options.output_dir)
+
+@typechecked
+def _recover_user_password(encryption_parameters: EncryptionParameters, password: bytes) -> bytes:
+    """
+    Recover the padded user password from an owner password
+    of revisions 2 to 4 of the standard security handler.
+
+    :param encryption_parameters: Parameters of the standard security handler.
+    :param password: Owner password, encoded.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Padded user password if the owner password is correct. Otherwise, arbitrary bytes.
+    """
+
+    digest = md5((password + PdfToken.PASSWORD_PADDING)[:32]).digest()
+
+    if encryption_parameters.revision >= 3:
+        for _ in range(50):
+            digest = md5(digest).digest()
+
+    key = digest[:encryption_parameters.key_length]
+
+    if encryption_parameters.revision == 2:
+        return _crypt_rc4(key, encryption_parameters.owner_hash)
+
+    user_password = encryption_parameters.owner_hash
+
+    for round_number in range(19, -1, -1):
+        user_password = _crypt_rc4(
+            bytes(byte ^ round_number for byte in key),
+            user_password
+        )
+
+    return user_password
+
+@typechecked
+def _remove_temporary_files(file_path: str, output_dir: str | None = None) -> None:
+    """
+    Remove the hidden temporary files left behind by a worker process
+    that was killed while replacing the unlocked version of a PDF file,
+    which are in the directory of the PDF file or of its mirror in the output directory.
+
+    :param file_path: Sanitized file path of the PDF file.
+    :param output_dir: Output directory that the unlocked PDF file was written in,
+                       or `None` if the PDF file was overwritten.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    output_file_path = (
+        _get_output_file_path(file_path, output_dir)
+        if output_dir is not None
+        else file_path
+    )
+    prefix = _get_temporary_file_prefix(output_file_path)
+
+    try:
+        with scandir(dirname(abspath(output_file_path))) as entries:
+            temporary_file_paths = [
+                entry.path
+                for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(Path.TEMPORARY_FILE_EXTENSION)
+            ]
+    except OSError:
+        return
+
+    for temporary_file_path in temporary_file_paths:
+        with suppress(OSError):
+            remove(temporary_file_path)
+
+@typechecked
+def _replace_file_atomically(
+        file_path: str,
+        write: Callable[[str], object],
+        source_file_path: str | None = None
+    ) -> None:
+    """
+    Replace a file at once via a temporary file in the same directory so that it is never left half-written,
+    keeping its permission bits.
+
+    :param file_path: Path of the file to replace.
+    :param write: Function that writes the new contents of the file to a given file path.
+    :param source_file_path: Path of the file that the new contents are derived from, if any.
+    :raises Exception: If writing the temporary file or replacing the file failed,
+                       in which case the temporary file is removed.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    directory_path = dirname(abspath(file_path))
+
+    makedirs(
+        exist_ok = True,
+        name = directory_path
+    )
+
+    file_descriptor, temporary_file_path = mkstemp(
+        dir = directory_path,
+        prefix = _get_temporary_file_prefix(file_path),
+        suffix = Path.TEMPORARY_FILE_EXTENSION
+    )
+
+    close(file_descriptor)
+
+    try:
+        write(temporary_file_path)
+
+        with open(temporary_file_path, "rb+") as temporary_file:
+            fsync(temporary_file.fileno())
+
+        if isfile(file_path):
+            copymode(file_path, temporary_file_path)
+        elif source_file_path is not None and isfile(source_file_path):
+            copymode(source_file_path, temporary_file_path)
+
+        replace(temporary_file_path, file_path)
+    except BaseException:
+        with suppress(OSError):
+            remove(temporary_file_path)
+
+        raise
+
+    _sync_directory(directory_path)
+
+@typechecked
+def _reset_peak_memory_usage() -> bool:
+    """
+    Reset the peak memory usage of this process to its current memory usage.
+
+    :raises TypeCheckError: If any return value has an invalid type.
+    :returns: Whether the peak memory usage was reset or not,
+              e.g. not on platforms other than Linux.
+    """
+
+    try:
+        with open(Path.CLEAR_REFS_FILE, "wb") as clear_refs_file:
+            clear_refs_file.write(ClearRefsCommand.RESET_PEAK_MEMORY_USAGE)
+    except OSError:
+        return False
+
+    return True
+
+@typechecked
+def _retry_transient_errors[T](operation: Callable[[], T]) -> T:
+    """
+    Call an operation, retrying it with exponential backoff
+    for as long as it fails due to a transient I/O error, up to a bounded number of retries.
+
+    :param operation: Operation to call.
+    :raises Exception: If the operation failed due to a non-transient error,
+                       or due to a transient I/O error too many times.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Return value of the operation.
+    """
+
+    retry_count = 0
+
+    while True:
+        try:
+            return operation()
+        except Exception as exception:
+            if retry_count >= RetryCount.TRANSIENT_ERROR or not _is_transient_error(exception):
+                raise
+
+            sleep(min(RetryDelay.INITIAL * 2 ** retry_count, RetryDelay.MAXIMUM))
+
+            retry_count += 1
+
+@typechecked
+def _run_isolated_worker(
+        connection: Connection,
+        memory_limit: int | None,
+        passwords: Passwords
+    ) -> None:
+    """
+    Run an isolated worker process that unlocks one PDF file at a time as received from a connection
+    and sends back its result, until said connection is closed.
+
+    :param connection: Connection to receive PDF files to unlock from and to send their results to.
+    :param memory_limit: Maximum address space of the worker process in bytes, or `None` for no limit.
+    :param passwords: Passwords to attempt unlocking each PDF file with.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    signal(SIGINT, SIG_IGN)
+
+    _initialize_worker(passwords)
+
+    if memory_limit is not None and RLIMIT_AS is not None:
+        setrlimit(RLIMIT_AS, (memory_limit, memory_limit))
+
+    while True:
+        try:
+            file_path, prioritized_passwords, save_profile, output_dir = connection.recv()
+        except EOFError:
+            return
+
+        connection.send(
+            _get_worker_unlock_result(
+                file_path,
+                prioritized_passwords,
+                save_profile,
+                output_dir
+            )
+        )
+
+@typechecked
+def _sanitize_path(path: str) -> str:
+    """
+    Remove quotation marks from a pasted path.
+
+    :param path: Directory path or file path of some PDF files to unlock.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Sanitized aforementioned path.
+    """
+
+    return path \
+        .removeprefix(Path.QUOTATION_MARK) \
+        .removesuffix(Path.QUOTATION_MARK)
+
+@typechecked
+def _scan_pdf_file[T](file_path: str, scan: Callable[[PdfData], T | None]) -> T | None:
+    """
+    Scan a PDF file without `pikepdf` by memory-mapping it,
+    so that only the pages that the scan reads are ever read.
+
+    :param file_path: Sanitized file path of the PDF file to scan.
+    :param scan: Function that scans raw PDF data and returns `None` if the scan is ambiguous.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Result of the scan, or `None` if the PDF file cannot be read or if it is empty.
+    """
+
+    try:
+        with (
+            open(file_path, "rb") as file,
+            mmap(file.fileno(), 0, access = ACCESS_READ) as data
+        ):
+            return scan(data)
+    except (OSError, ValueError):
+        return None
+
+@typechecked
+def _skip_journaled_pdf_file_paths(
+        pdf_file_paths: Iterable[str],
+        journal: Journal,
+        grouped_pdf_file_paths: GroupedPaths
+    ) -> Iterator[str]:
+    """
+    Lazily skip PDF files whose final file state was journaled
+    and which have not changed since, grouping them by said file state instead.
+
+    PDF files that were journaled as failed or aborted are not skipped so that they are attempted again.
+
+    :param pdf_file_paths: Sanitized file paths of the PDF files to unlock, in order.
+    :param journal: Dictionary that maps signatures of PDF files with the final file states they were journaled in.
+    :param grouped_pdf_file_paths: Dictionary that maps file states with file paths of PDF files.
+    :raises TypeCheckError: If any argument or yielded value has an invalid type.
+    :returns: Iterator of the file paths of the PDF files that are not skipped, in order.
+    """
+
+    for pdf_file_path in pdf_file_paths:
+        file_signature = _get_file_signature(pdf_file_path)
+        file_state = (
+            journal.get(file_signature)
+            if file_signature is not None
+            else None
+        )
+
+        if file_state is not None and file_state not in [FileState.ABORTED, FileState.FAILED]:
+            grouped_pdf_file_paths[file_state].append(pdf_file_path)
+
+            continue
+
+        yield pdf_file_path
+
+@typechecked
+def _skip_known_pdf_file_paths(
+        pdf_file_paths: Iterable[str],
+        file_outcomes: FileOutcomes,
+        grouped_pdf_file_paths: GroupedPaths,
+        output_dir: str | None
+    ) -> Iterator[str]:
+    """
+    Lazily skip PDF files whose last outcome is known and which have not changed since,
+    grouping them by said outcome instead without opening them at all.
+
+    PDF files that are not locked are not skipped if an output directory is given,
+    so that they are still cloned into it.
+
+    :param pdf_file_paths: Sanitized file paths of the PDF files to unlock, in order.
+    :param file_outcomes: Last outcomes of attempting to unlock PDF files keyed on their signatures.
+    :param grouped_pdf_file_paths: Dictionary that maps file states with file paths of PDF files.
+    :param output_dir: Output directory to write unlocked PDF files in,
+                       or `None` to overwrite PDF files.
+    :raises TypeCheckError: If any argument or yielded value has an invalid type.
+    :returns: Iterator of the file paths of the PDF files that are not skipped, in order.
+    """
+
+    for pdf_file_path in pdf_file_paths:
+        file_signature = _get_file_signature(pdf_file_path)
+        is_locked = (
+            file_outcomes.is_locked(file_signature)
+            if file_signature is not None
+            else None
+        )
+
+        if is_locked or (is_locked is False and output_dir is None):
+            grouped_pdf_file_paths[FileState.LOCKED if is_locked else FileState.NOT_LOCKED].append(pdf_file_path)
+
+            continue
+
+        yield pdf_file_path
+
+@typechecked
+def _skip_pdf_whitespace(data: PdfData, offset: int) -> int:
+    """
+    Skip the whitespace and comments in raw PDF data.
+
+    :param data: Raw PDF data.
+    :param offset: Offset where the whitespace or comments may start.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Offset right after the whitespace and comments.
+    """
+
+    match = compile(PdfPattern.WHITESPACE).match(data, offset)
+
+    return (
+        match.end()
+        if match
+        else offset
+    )
+
+@typechecked
+def _start_isolated_worker(memory_limit: int | None, passwords: Passwords) -> IsolatedWorker:
+    """
+    Start an isolated worker process.
+
+    :param memory_limit: Maximum address space of the worker process in bytes, or `None` for no limit.
+    :param passwords: Passwords to attempt unlocking each PDF file with.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Isolated worker process along with the connection to it.
+    """
+
+    connection, worker_connection = Pipe()
+    process = Process(
+        args = (worker_connection, memory_limit, passwords),
+        daemon = True,
+        target = _run_isolated_worker
+    )
+
+    process.start()
+    worker_connection.close()
+
+    return IsolatedWorker(connection = connection, process = process)
+
+@typechecked
+def _stop_isolated_worker(worker: IsolatedWorker) -> None:
+    """
+    Stop an isolated worker process right away, whatever it is doing.
+
+    :param worker: Isolated worker process to stop.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    worker.process.kill()
+    worker.process.join()
+    worker.connection.close()
+
+@typechecked
+def _sync_directory(directory_path: str) -> None:
+    """
+    Flush the entries of a directory to disk, so that files renamed into it survive a crash,
+    where directories can be opened as such, i.e. not on Windows.
+
+    :param directory_path: Path of the directory.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    try:
+        file_descriptor = open_file_descriptor(directory_path, O_RDONLY)
+    except OSError:
+        return
+
+    # <NOTE>
+    # Some file systems do not support flushing directories, in which case the rename is as durable as it gets.
+    with suppress(OSError):
+        fsync(file_descriptor)
+
+    close(file_descriptor)
+
+@typechecked
+def _unlock_pdf_data(
+        data: bytes,
+        passwords: Passwords,
+        save: Callable[[Pdf], None]
+    ) -> tuple[FileState, str | None]:
+    """
+    Unlock raw PDF data, saving its unlocked version via a callback.
+
+    :param data: Raw PDF data.
+    :param passwords: Passwords to attempt unlocking the PDF file with.
+    :param save: Function that saves the opened unlocked PDF file.
+    :raises Exception: If reading, unlocking, or saving the PDF file failed.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: File state of the PDF file after attempting to unlock it,
+              along with the password that unlocked it, if any.
+    """
+
+    if _classify_pdf_data(data) == FileState.NOT_LOCKED:
+        return FileState.NOT_LOCKED, None
+
+    encryption_parameters = _parse_encryption_parameters(data)
+
+    if encryption_parameters is not None:
+        if _verify_password(encryption_parameters, ""):
+            return FileState.NOT_LOCKED, None
+
+        # <NOTE>
+        # Only the first password that is verified without `pikepdf` is attempted,
+        # so that the PDF file is opened via `pikepdf` at most once.
+        # As `pikepdf` may encode non-ASCII passwords differently,
+        # those are still attempted via `pikepdf` if no password is verified.
+        verified_password = next(
+            (
+                password
+                for password in passwords
+                if _verify_password(encryption_parameters, password)
+            ),
+            None
+        )
+        passwords = (
+            [verified_password]
+            if verified_password is not None
+            else [password for password in passwords if not password.isascii()]
+        )
+    else:
+        try:
+            # <NOTE>
+            # `BytesIO` shares the buffer of the bytes it is given until it is written to,
+            # so that no attempt copies the PDF data.
+            with Pdf.open(BytesIO(data)):
+                return FileState.NOT_LOCKED, None
+        except PasswordError:
+            pass
+
+    for password in passwords:
+        try:
+            with Pdf.open(BytesIO(data), password = password) as pdf:
+                save(pdf)
+
+            return FileState.UNLOCKED, password
+        except PasswordError:
+            continue
+
+    return FileState.LOCKED, None
+
+@typechecked
+def _unlock_pdf_file(
+        file_path: str,
+        passwords: Passwords,
+        save_profile: SaveProfile = SaveProfile.FAST,
+        output_dir: str | None = None
+    ) -> tuple[FileState, str | None]:
+    """
+    Overwrite a PDF file as its unlocked version,
+    or write said version to an output directory that mirrors the file path of the PDF file.
+
+    :param file_path: Sanitized file path of the PDF file to unlock.
+    :param passwords: Passwords to attempt unlocking the PDF file with.
+    :param save_profile: Profile to save the unlocked PDF file with.
+    :param output_dir: Output directory to write the unlocked PDF file in,
+                       or `None` to overwrite the PDF file.
+    :raises PdfError: If reading, unlocking, or writing the PDF file failed.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: File state of the PDF file and the password that unlocked it, if any.
+    """
+
+    data = _read_pdf_data(file_path)
+    output_file_path = (
+        _get_output_file_path(file_path, output_dir)
+        if output_dir is not None
+        else file_path
+    )
+
+    try:
+        file_state, unlocking_password = _unlock_pdf_data(
+            data,
+            passwords,
+            lambda pdf: _replace_file_atomically(
+                output_file_path,
+                lambda temporary_file_path: pdf.save(
+                    temporary_file_path,
+                    **_get_save_arguments(save_profile)
+                ),
+                file_path
+            )
+        )
+
+        if file_state == FileState.NOT_LOCKED and output_file_path != file_path:
+            _replace_file_atomically(
+                output_file_path,
+                lambda temporary_file_path: _clone_file(file_path, temporary_file_path),
+                file_path
+            )
+    except Exception as exception:
+        raise PdfError(
+            ErrorMessage.FAILED_OVERWRITE(file_path)
+        ) from exception
+
+    return file_state, unlocking_password
+
+@typechecked
+def _verify_password(encryption_parameters: EncryptionParameters, password: str) -> bool:
+    """
+    Verify if a password is either the user password or the owner password of a PDF file
+    via the key derivation of its standard security handler, without `pikepdf`.
+
+    As the text encoding of passwords is unspecified before revision 5,
+    passwords are tried in both Latin-1, if applicable, and UTF-8.
+
+    :param encryption_parameters: Parameters of the standard security handler.
+    :param password: Password to verify.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Whether the password opens the PDF file or not.
+    """
+
+    if encryption_parameters.revision == 5:
+        encoded_password = password.encode()[:127]
+        owner_hash = encryption_parameters.owner_hash
+        user_hash = encryption_parameters.user_hash
+
+        return (
+            sha256(encoded_password + user_hash[32:40]).digest() == user_hash[:32]
+            or sha256(
+                encoded_password + owner_hash[32:40] + user_hash
+            ).digest() == owner_hash[:32]
+        )
+
+    encoded_passwords = [password.encode()]
+
+    with suppress(UnicodeEncodeError):
+        encoded_passwords.insert(0, password.encode("latin-1"))
+
+    return any(
+        _verify_user_password(encryption_parameters, encoded_password)
+        or _verify_user_password(
+            encryption_parameters,
+            _recover_user_password(encryption_parameters, encoded_password)
+        )
+        for encoded_password in dict.fromkeys(encoded_passwords)
+    )
+
+@typechecked
+def _verify_user_password(encryption_parameters: EncryptionParameters, password: bytes) -> bool:
+    """
+    Verify if a password is the user password of a PDF file
+    of revisions 2 to 4 of the standard security handler.
+
+    :param encryption_parameters: Parameters of the standard security handler.
+    :param password: Password, encoded.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Whether the password is the user password or not.
+    """
+
+    key = _compute_rc4_key(encryption_parameters, password)
+
+    if encryption_parameters.revision == 2:
+        return _crypt_rc4(key, PdfToken.PASSWORD_PADDING) == encryption_parameters.user_hash
+
+    user_hash = _crypt_rc4(
+        key,
+        md5(PdfToken.PASSWORD_PADDING + encryption_parameters.document_id).digest()
+    )
+
+    for round_number in range(1, 20):
+        user_hash = _crypt_rc4(
+            bytes(byte ^ round_number for byte in key),
+            user_hash
+        )
+
+    return user_hash == encryption_parameters.user_hash[:16]
+
+@typechecked
+def _walk_directory(
+        directory_path: str,
+        directory_manifest: DirectoryManifest | None = None
+    ) -> Iterator[tuple[str, FileIdentity | None]]:
+    """
+    Lazily walk a directory tree via `os.scandir` for the paths of the PDF files in it like a recursive `glob`,
+    visiting every directory at most once and serving unchanged directories from a manifest if given.
+
+    :param directory_path: Path of a directory where some PDF files are.
+    :param directory_manifest: Manifest of the PDF files and subdirectories of directories
+                               to serve unchanged directories from and to update, if any.
+    :raises TypeCheckError: If any argument or yielded value has an invalid type.
+    :returns: Iterator of paths of the PDF files in the directory tree, in discovery order,
+              along with the identities of said PDF files unless they are symbolic links.
+    """
+
+    pending_directory_paths = [directory_path]
+    visited_directory_identities: set[FileIdentity] = set()
+
+    while pending_directory_paths:
+        current_directory_path = pending_directory_paths.pop()
+        subdirectory_paths: Paths = []
+
+        try:
+            directory_stat = stat(current_directory_path)
+            directory_identity = (directory_stat.st_dev, directory_stat.st_ino)
+
+            if directory_identity in visited_directory_identities:
+                continue
+
+            visited_directory_identities.add(directory_identity)
+
+            directory = (
+                directory_manifest.get(current_directory_path, directory_stat.st_mtime_ns)
+                if directory_manifest is not None
+                else None
+            )
+
+            if directory is not None:
+                pdf_file_inodes, subdirectory_names = directory
+
+                for pdf_file_name, pdf_file_inode in pdf_file_inodes.items():
+                    yield (
+                        join(current_directory_path, pdf_file_name),
+                        (directory_stat.st_dev, pdf_file_inode) if pdf_file_inode is not None else None
+                    )
+
+                subdirectory_paths = [
+                    join(current_directory_path, subdirectory_name)
+                    for subdirectory_name in subdirectory_names
+                ]
+            else:
+                pdf_file_inodes: dict[str, int | None] = {}
+                subdirectory_names: list[str] = []
+
+                with scandir(current_directory_path) as entries:
+                    for entry in entries:
+                        if entry.name.startswith(Path.HIDDEN_FILE_PREFIX):
+                            continue
+
+                        if entry.is_dir():
+                            subdirectory_names.append(entry.name)
+                            subdirectory_paths.append(entry.path)
+                        elif _is_pdf_file(entry):
+                            # <NOTE>
+                            # The inode number of a directory entry is known without querying it,
+                            # unlike that of the file a symbolic link points to.
+                            pdf_file_inode = None if entry.is_symlink() else entry.inode()
+                            pdf_file_inodes[entry.name] = pdf_file_inode
+
+                            yield (
+                                entry.path,
+                                (directory_stat.st_dev, pdf_file_inode) if pdf_file_inode is not None else None
+                            )
+
+                # <NOTE>
+                # A directory modified within the same tick as it was scanned
+                # may change again without its modification time changing,
+                # so it is only added once its modification time is old enough.
+                if (
+                    directory_manifest is not None
+                    and time_ns() - directory_stat.st_mtime_ns >= ModificationTime.RACY_THRESHOLD
+                ):
+                    directory_manifest.add(
+                        current_directory_path,
+                        directory_stat.st_mtime_ns,
+                        pdf_file_inodes,
+                        subdirectory_names
+                    )
+        except OSError:
+            continue
+
+        # <NOTE>
+        # Reverse the subdirectories so that they are popped in the order they were found.
+        pending_directory_paths.extend(
+            reversed(subdirectory_paths)
+        )
+
+@typechecked
+def _watch_directory_tree(inotify: Inotify, directory_path: str) -> None:
+    """
+    Watch every directory of a directory tree, except hidden ones,
+    for files that are written or moved in and for directories that are created or moved in.
+
+    Directories that cannot be watched are skipped.
+
+    :param inotify: Inotify instance to watch directories with.
+    :param directory_path: Path of the root directory of the directory tree.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    for current_directory_path, subdirectory_names, _ in walk(directory_path):
+        subdirectory_names[:] = [
+            subdirectory_name
+            for subdirectory_name in subdirectory_names
+            if not subdirectory_name.startswith(Path.HIDDEN_FILE_PREFIX)
+        ]
+        watch_descriptor = inotify.library.inotify_add_watch(
+            inotify.file_descriptor,
+            fsencode(current_directory_path),
+            InotifyMask.CLOSE_WRITE | InotifyMask.CREATE | InotifyMask.MOVED_TO
+        )
+
+        if watch_descriptor >= 0:
+            inotify.directory_paths[watch_descriptor] = current_directory_path
+
+@typechecked
+def _write_caches(cache_dir: str, json_caches: dict[str, JsonCache]) -> None:
+    """
+    Write caches to a cache directory.
+
+    :param cache_dir: Cache directory.
+    :param json_caches: Caches keyed on their file names.
+    :raises OSError: If any cache cannot be written.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    for file_name, json_cache in json_caches.items():
+        _replace_file_atomically(join(cache_dir, file_name), json_cache.dump)
+
+@typechecked
+def _write_data(file_path: str, data: bytes) -> None:
+    """
+    Write raw data to a file.
+
+    :param file_path: Path of the file.
+    :param data: Raw data.
+    :raises OSError: If writing the file failed.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    with open(file_path, "wb") as file:
+        file.write(data)
+
+@typechecked
+def _write_decrypted_pdf_file(decrypted_pdf_file: DecryptedPdfFile, output_dir: str | None) -> None:
+    """
+    Overwrite a PDF file that got unlocked in memory as its unlocked version,
+    or write said version to an output directory that mirrors the file path of the PDF file,
+    cloning a PDF file that is not locked into the output directory, if any.
+
+    :param decrypted_pdf_file: PDF file that was attempted to be unlocked in memory.
+    :param output_dir: Output directory to write the unlocked PDF file in,
+                       or `None` to overwrite the PDF file.
+    :raises PdfError: If writing the PDF file failed.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    file_path = decrypted_pdf_file.file_path
+    data = decrypted_pdf_file.data
+    output_file_path = (
+        _get_output_file_path(file_path, output_dir)
+        if output_dir is not None
+        else file_path
+    )
+
+    try:
+        if data is not None:
+            _replace_file_atomically(
+                output_file_path,
+                lambda temporary_file_path: _write_data(temporary_file_path, data),
+                file_path
+            )
+        elif decrypted_pdf_file.file_state == FileState.NOT_LOCKED and output_file_path != file_path:
+            _replace_file_atomically(
+                output_file_path,
+                lambda temporary_file_path: _clone_file(file_path, temporary_file_path),
+                file_path
+            )
+    except OSError as exception:
+        raise PdfError(
+            ErrorMessage.FAILED_OVERWRITE(file_path)
+        ) from exception
+
+@typechecked
+def _write_journal_entry(journal_file: TextIO, unlock_result: UnlockResult) -> None:
+    """
+    Append the final file state of a PDF file to a journal along with the signature of said PDF file,
+    flushing it so that the entry survives the run being interrupted.
+
+    :param journal_file: Journal opened for appending, which is a JSON Lines file.
+    :param unlock_result: Result of attempting to unlock the PDF file.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    file_signature = _get_file_signature(unlock_result.file_path)
+
+    if file_signature is None:
+        return
+
+    device, inode, size, modified_time = file_signature
+
+    journal_file.write(
+        dumps(
+            {
+                JournalField.DEVICE: device,
+                JournalField.FILE_PATH: unlock_result.file_path,
+                JournalField.FILE_STATE: unlock_result.file_state.name,
+                JournalField.INODE: inode,
+                JournalField.MODIFIED_TIME: modified_time,
+                JournalField.SIZE: size
+            }
+        ) + "\n"
+    )
+    journal_file.flush()
+
+@typechecked
+def unlock_bytes(
+        data: bytes,
+        passwords: Iterable[str],
+        save_profile: SaveProfile = SaveProfile.FAST
+    ) -> bytes:
+    """
+    Unlock an in-memory PDF file without reading from or writing to any file,
+    standard input, or standard output.
+
+    :param data: Raw PDF data.
+    :param passwords: Passwords to attempt unlocking the PDF file with, in order.
+    :param save_profile: Profile to save the unlocked PDF file with.
+    :raises PasswordError: If no password unlocks the PDF file.
+    :raises PdfError: If reading or unlocking the PDF file failed.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :raises ValueError: If no password was given.
+    :returns: Raw data of the unlocked PDF file, or the given data as is if it is not locked.
+    """
+
+    unique_passwords = list(dict.fromkeys(passwords))
+
+    if not unique_passwords:
+        raise ValueError(ErrorMessage.NO_VALID_PASSWORD)
+
+    output = BytesIO()
+
+    try:
+        file_state, _ = _unlock_pdf_data(
+            data,
+            unique_passwords,
+            lambda pdf: pdf.save(
+                output,
+                **_get_save_arguments(save_profile)
+            )
+        )
+    except Exception as exception:
+        raise PdfError(ErrorMessage.FAILED_DATA_UNLOCK) from exception
+
+    if file_state == FileState.LOCKED:
+        raise PasswordError(ErrorMessage.NO_UNLOCKING_PASSWORD)
+
+    return output.getvalue() if file_state == FileState.UNLOCKED else data
+
+@typechecked
+def unlock_many(
+        paths: Iterable[str],
+        passwords: Iterable[str],
+        *,
+        jobs: int | None = None,
+        output_dir: str | None = None,
+        save_profile: SaveProfile = SaveProfile.FAST
+    ) -> Iterator[UnlockResult]:
+    """
+    Unlock password-protected PDF files for every given
+
+    - directory path where some PDF files are, and/or
+    - file path of a PDF file
+
+    without reading from standard input or writing to standard output.
+
+    :param paths: Directory paths and/or file paths of the PDF files to unlock.
+    :param passwords: Passwords to attempt unlocking each PDF file with, in order.
+    :param jobs: Number of worker processes, where 1 means unlocking in this process,
+                 or `None` to use the CPU count.
+    :param output_dir: Output directory to write unlocked PDF files in,
+                       or `None` to overwrite PDF files.
+    :param save_profile: Profile to save unlocked PDF files with.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :raises ValueError: If no password was given or if the job count is not positive.
+    :returns: Iterator of the results of unlocking each PDF file, in discovery order.
+    """
+
+    unique_passwords = list(dict.fromkeys(passwords))
+    job_count = jobs if jobs is not None else process_cpu_count() or 1
+
+    if not unique_passwords:
+        raise ValueError(ErrorMessage.NO_VALID_PASSWORD)
+
+    if job_count < 1:
+        raise ValueError(ErrorMessage.NON_POSITIVE_JOB_COUNT)
+
+    return _generate_unlock_results(
+        fingerprint_passwords = FingerprintPasswords(unique_passwords),
+        job_count = job_count,
+        output_dir = output_dir,
+        passwords = unique_passwords,
+        pdf_file_paths = _generate_pdf_file_paths(_generate_unique_inputs(paths)),
+        save_profile = save_profile
+    )
+
+@typechecked
+def unlock_pdf(arguments: list[str] | None = None) -> None:
+    """
+    Unlock password-protected PDF files for every given or inputted
+
+    - directory path where some PDF files are, and/or
+    - file path of a PDF file
+
+    using given or inputted passwords to attempt unlocking each PDF file with, as the command-line options ask for,
+    or serve unlock requests over HTTP if the `serve` subcommand is given.
+
+    :param arguments: Command-line arguments,
+                      or `None` to use those that the script was executed with.
+    :raises FileNotFoundError: If every path does not ultimately point to a PDF file,
+                               or if every path to watch does not point to a directory.
+    :raises OSError: If any input source cannot be read, or if the unlock server cannot be bound.
+    :raises SystemExit: If any argument is invalid or if help is asked for.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :raises ValueError: If no password was given or if any input source is invalid.
+    """
+
+    arguments = arguments if arguments is not None else argv[1:]
+
+    if arguments[:1] == [Command.SERVE]:
+        # <NOTE>
+        # The unlock server is only imported when serving,
+        # as it builds on this module and would otherwise be imported circularly.
+        from unlock_pdf.server import serve_unlock_requests
+
+        serve_unlock_requests(
+            _get_serve_options(arguments[1:])
+        )
+
+        return
+
+    options = _get_options(arguments)
+    separator = InputSeparator.NULL if options.null else InputSeparator.NEWLINE
+    directory_manifest = _read_directory_manifest(options.cache_dir)
+    paths = _get_input_paths(options, separator)
+
+    # <NOTE>
+    # Enforce input order via order of variable declaration.
+    directory_paths = _get_directory_paths(paths) if options.watch else []
+    pdf_file_paths = (
+        _get_pdf_file_paths(directory_manifest, paths, options.sniff)
+        if not options.watch
+        else iter(())
+    )
+
+    if options.classify_only:
+        _log_file_state_counts(
+            _count_file_states(pdf_file_paths)
+        )
+
+        if options.cache_dir is not None and directory_manifest is not None:
+            _write_caches(options.cache_dir, {Path.DIRECTORY_MANIFEST_FILE_NAME: directory_manifest})
+
+        return
+
+    passwords = _get_passwords(options.passwords_from, separator)
+    password_hits, fingerprint_passwords, file_outcomes = _read_password_caches(options.cache_dir, passwords)
+
+    grouped_pdf_file_paths: GroupedPaths = {
+        key: []
+        for key in [
+            file_state for file_state in FileState
+        ]
+    }
+    attempt_counts: list[int] = []
+    file_errors: FileErrors = {}
+
+    if options.resume and options.journal is not None:
+        pdf_file_paths = _skip_journaled_pdf_file_paths(
+            grouped_pdf_file_paths = grouped_pdf_file_paths,
+            journal = _read_journal(options.journal),
+            pdf_file_paths = pdf_file_paths
+        )
+
+    if options.cache_dir is not None:
+        pdf_file_paths = _skip_known_pdf_file_paths(
+            file_outcomes = file_outcomes,
+            grouped_pdf_file_paths = grouped_pdf_file_paths,
+            output_dir = options.output_dir,
+            pdf_file_paths = pdf_file_paths
+        )
+
+    # <NOTE>
+    # Scheduling from the costliest PDF file needs every file path to be discovered beforehand.
+    unlock_costs = (
+        _estimate_unlock_costs(pdf_file_paths, len(passwords))
+        if options.schedule == Schedule.LONGEST_FIRST
+        else {}
+    )
+
+    if unlock_costs:
+        pdf_file_paths = iter(unlock_costs)
+
+    _record_unlock_results(
+        attempt_counts = attempt_counts,
+        file_errors = file_errors,
+        file_outcomes = file_outcomes,
+        grouped_pdf_file_paths = grouped_pdf_file_paths,
+        options = options,
+        password_hits = password_hits,
+        unlock_results = _dispatch_unlock_results(
+            directory_paths = directory_paths,
+            fingerprint_passwords = fingerprint_passwords,
+            options = options,
+            passwords = _order_passwords(passwords, password_hits),
+            pdf_file_paths = pdf_file_paths
+        )
+    )
+
+    _log_unlock_attempt(grouped_pdf_file_paths)
+    _log_file_errors(file_errors)
+    _log_average_attempt_count(attempt_counts)
+    _log_unlock_costs(unlock_costs)
+
+    if options.cache_dir is not None and directory_manifest is not None:
+        _write_caches(
+            options.cache_dir,
+            {
+                Path.DIRECTORY_MANIFEST_FILE_NAME: directory_manifest,
+                Path.FILE_OUTCOMES_FILE_NAME: file_outcomes,
+                Path.FINGERPRINT_PASSWORDS_FILE_NAME: fingerprint_passwords,
+                Path.PASSWORD_HITS_FILE_NAME: password_hits
+            }
+        )
@@ -0,0 +1,388 @@
+"""`unlock-pdf` pipeline functions."""
+
+# pyright: reportPrivateUsage=false
+
+from asyncio import (
+    Queue,
+    TaskGroup,
+    create_task,
+    current_task,
+    gather,
+    get_running_loop,
+    to_thread
+)
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator
+)
+from concurrent.futures import Executor, ProcessPoolExecutor
+from os import process_cpu_count
+from pikepdf import PdfError
+from typeguard import typechecked
+from unlock_pdf.classes import FingerprintPasswords
+from unlock_pdf.enumerations import (
+    ErrorMessage,
+    FileState,
+    PendingTaskCount,
+    SaveProfile,
+    StageConcurrency
+)
+from unlock_pdf.functions import (
+    _decrypt_worker_pdf_data,
+    _generate_pdf_file_paths,
+    _generate_unique_inputs,
+    _get_error_description,
+    _initialize_worker,
+    _move_password_to_front,
+    _parse_encryption_fingerprint,
+    _read_pdf_data,
+    _retry_transient_errors,
+    _write_decrypted_pdf_file
+)
+from unlock_pdf.types import (
+    DecryptedPdfFile,
+    Passwords,
+    PdfFileData,
+    UnlockResult
+)
+
+@typechecked
+async def _decrypt_pdf_file_data(
+        pdf_file_data: PdfFileData | UnlockResult,
+        prioritized_passwords: Passwords,
+        fingerprint_passwords: FingerprintPasswords,
+        executor: Executor,
+        save_profile: SaveProfile
+    ) -> DecryptedPdfFile | UnlockResult:
+    """
+    Unlock the raw data of a PDF file in memory via an executor, without blocking the event loop.
+
+    The password that unlocked the latest PDF file with the same encryption fingerprint
+    is attempted first, followed by the one that unlocked the latest PDF file.
+
+    :param pdf_file_data: Raw data of the PDF file, or its result if it already failed.
+    :param prioritized_passwords: Passwords to attempt first before the other passwords of the worker processes,
+                                  which get replaced in place with every PDF file that gets unlocked.
+    :param fingerprint_passwords: Passwords that unlocked PDF files keyed on their encryption fingerprints,
+                                  which is updated with every PDF file that gets unlocked.
+    :param executor: Executor to unlock the raw data in, whose worker processes have every password.
+    :param save_profile: Profile to save the unlocked PDF file with.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: PDF file that was attempted to be unlocked, or its result if it failed.
+    """
+
+    if isinstance(pdf_file_data, UnlockResult):
+        return pdf_file_data
+
+    # <NOTE>
+    # Scanning the trailer of a large PDF file takes long enough to stall other PDF files,
+    # so it is done in a thread instead of on the event loop.
+    fingerprint = await to_thread(_parse_encryption_fingerprint, pdf_file_data.data)
+    # <NOTE>
+    # The passwords are copied as they may get replaced in place
+    # by other PDF files that get unlocked in the meantime.
+    file_passwords = _move_password_to_front(
+        list(prioritized_passwords),
+        fingerprint_passwords[fingerprint] if fingerprint is not None else None
+    )
+
+    try:
+        file_state, unlocking_password, data, attempt_count = await get_running_loop().run_in_executor(
+            executor,
+            _decrypt_worker_pdf_data,
+            pdf_file_data.data,
+            file_passwords,
+            save_profile
+        )
+    except PdfError as exception:
+        return UnlockResult(
+            error = str(exception),
+            file_path = pdf_file_data.file_path,
+            file_state = FileState.FAILED
+        )
+
+    if unlocking_password is not None:
+        prioritized_passwords[:] = [unlocking_password]
+
+        if fingerprint is not None:
+            fingerprint_passwords.add(fingerprint, unlocking_password)
+
+    return DecryptedPdfFile(
+        attempt_count = attempt_count,
+        data = data,
+        file_path = pdf_file_data.file_path,
+        file_state = file_state,
+        password = unlocking_password
+    )
+
+@typechecked
+async def _enqueue_pdf_file_paths(
+        pdf_file_paths: Iterator[str],
+        path_queue: Queue[str | None],
+        consumer_count: int
+    ) -> None:
+    """
+    Enqueue the paths of PDF files as they are discovered, without blocking the event loop,
+    followed by one end marker per consumer of the queue.
+
+    :param pdf_file_paths: Iterator of the paths of PDF files, which may block while discovering them.
+    :param path_queue: Bounded queue to enqueue the paths in.
+    :param consumer_count: Number of consumers of the queue.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    try:
+        while (pdf_file_path := await to_thread(next, pdf_file_paths, None)) is not None:
+            await path_queue.put(pdf_file_path)
+    finally:
+        if not _is_cancelling():
+            for _ in range(consumer_count):
+                await path_queue.put(None)
+
+@typechecked
+def _is_cancelling() -> bool:
+    """
+    Check if the current task is being cancelled.
+
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Whether the current task is being cancelled or not.
+    """
+
+    task = current_task()
+
+    return task is not None and task.cancelling() > 0
+
+@typechecked
+async def _read_pdf_file_data(file_path: str) -> PdfFileData | UnlockResult:
+    """
+    Read the raw data of a PDF file in a thread, without blocking the event loop.
+
+    Transient I/O errors are retried with bounded backoff.
+
+    :param file_path: Sanitized file path of the PDF file.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Raw data of the PDF file, or its result if reading it failed.
+    """
+
+    try:
+        data = await to_thread(
+            _retry_transient_errors,
+            lambda: _read_pdf_data(file_path)
+        )
+    except PdfError as exception:
+        return UnlockResult(
+            error = _get_error_description(exception),
+            file_path = file_path,
+            file_state = FileState.FAILED
+        )
+
+    return PdfFileData(file_path, data)
+
+@typechecked
+async def _run_pipeline_stage[T, U](
+        input_queue: Queue[T | None],
+        output_queue: Queue[U | None],
+        process: Callable[[T], Awaitable[U]],
+        concurrency: int,
+        consumer_count: int
+    ) -> None:
+    """
+    Run a stage of an asynchronous pipeline,
+    processing items of a bounded input queue with at most a given number of items at once.
+
+    :param input_queue: Bounded queue to dequeue items from, with one end marker per worker.
+    :param output_queue: Bounded queue to enqueue processed items in.
+    :param process: Function that processes an item.
+    :param concurrency: Number of workers of the stage.
+    :param consumer_count: Number of consumers of the output queue.
+    :raises ExceptionGroup: If processing any item failed.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    try:
+        async with TaskGroup() as task_group:
+            for _ in range(concurrency):
+                task_group.create_task(
+                    _run_pipeline_worker(input_queue, output_queue, process)
+                )
+    finally:
+        if not _is_cancelling():
+            for _ in range(consumer_count):
+                await output_queue.put(None)
+
+@typechecked
+async def _run_pipeline_worker[T, U](
+        input_queue: Queue[T | None],
+        output_queue: Queue[U | None],
+        process: Callable[[T], Awaitable[U]]
+    ) -> None:
+    """
+    Run a worker of a stage of an asynchronous pipeline until it reaches an end marker.
+
+    :param input_queue: Bounded queue to dequeue items from.
+    :param output_queue: Bounded queue to enqueue processed items in.
+    :param process: Function that processes an item.
+    :raises Exception: If processing any item failed.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    while (item := await input_queue.get()) is not None:
+        await output_queue.put(await process(item))
+
+@typechecked
+async def _write_decrypted_pdf_file_data(
+        decrypted_pdf_file: DecryptedPdfFile | UnlockResult,
+        output_dir: str | None
+    ) -> UnlockResult:
+    """
+    Write a PDF file that got unlocked in memory in a thread, without blocking the event loop.
+
+    Transient I/O errors are retried with bounded backoff.
+
+    :param decrypted_pdf_file: PDF file that was attempted to be unlocked in memory,
+                               or its result if it already failed.
+    :param output_dir: Output directory to write the unlocked PDF file in,
+                       or `None` to overwrite the PDF file.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Result of attempting to unlock the PDF file.
+    """
+
+    if isinstance(decrypted_pdf_file, UnlockResult):
+        return decrypted_pdf_file
+
+    try:
+        await to_thread(
+            _retry_transient_errors,
+            lambda: _write_decrypted_pdf_file(decrypted_pdf_file, output_dir)
+        )
+    except PdfError as exception:
+        return UnlockResult(
+            error = _get_error_description(exception),
+            file_path = decrypted_pdf_file.file_path,
+            file_state = FileState.FAILED
+        )
+
+    return UnlockResult(
+        attempt_count = decrypted_pdf_file.attempt_count,
+        file_path = decrypted_pdf_file.file_path,
+        file_state = decrypted_pdf_file.file_state,
+        password = decrypted_pdf_file.password
+    )
+
+@typechecked
+async def unlock_many_async(
+        paths: Iterable[str],
+        passwords: Iterable[str],
+        *,
+        jobs: int | None = None,
+        output_dir: str | None = None,
+        save_profile: SaveProfile = SaveProfile.FAST
+    ) -> AsyncIterator[UnlockResult]:
+    """
+    Unlock password-protected PDF files for every given
+
+    - directory path where some PDF files are, and/or
+    - file path of a PDF file
+
+    without blocking the event loop, reading from standard input, or writing to standard output.
+
+    :param paths: Directory paths and/or file paths of the PDF files to unlock.
+    :param passwords: Passwords to attempt unlocking each PDF file with, in order.
+    :param jobs: Number of worker processes, or `None` to use the CPU count.
+    :param output_dir: Output directory to write unlocked PDF files in,
+                       or `None` to overwrite PDF files.
+    :param save_profile: Profile to save unlocked PDF files with.
+    :raises Exception: If any stage of the pipeline failed as a whole.
+    :raises TypeCheckError: If any argument or yielded value has an invalid type.
+    :raises ValueError: If no password was given or if the job count is not positive.
+    :returns: Asynchronous iterator of the results of unlocking each PDF file, in completion order.
+    """
+
+    unique_passwords = list(dict.fromkeys(passwords))
+    job_count = jobs if jobs is not None else process_cpu_count() or 1
+
+    if not unique_passwords:
+        raise ValueError(ErrorMessage.NO_VALID_PASSWORD)
+
+    if job_count < 1:
+        raise ValueError(ErrorMessage.NON_POSITIVE_JOB_COUNT)
+
+    # <NOTE>
+    # Only the password that unlocked the latest PDF file is kept and sent along with each PDF file,
+    # as worker processes are sent every password once.
+    prioritized_passwords: Passwords = []
+    fingerprint_passwords = FingerprintPasswords(list(unique_passwords))
+    path_queue: Queue[str | None] = Queue(StageConcurrency.READ * PendingTaskCount.PER_WORKER)
+    pdf_file_data_queue: Queue[PdfFileData | UnlockResult | None] = Queue(
+        job_count * PendingTaskCount.PER_WORKER
+    )
+    decrypted_pdf_file_queue: Queue[DecryptedPdfFile | UnlockResult | None] = Queue(
+        StageConcurrency.WRITE * PendingTaskCount.PER_WORKER
+    )
+    unlock_result_queue: Queue[UnlockResult | None] = Queue(PendingTaskCount.PER_WORKER)
+    executor = ProcessPoolExecutor(
+        initargs = (unique_passwords,),
+        initializer = _initialize_worker,
+        max_workers = job_count
+    )
+    tasks = [
+        create_task(
+            _enqueue_pdf_file_paths(
+                _generate_pdf_file_paths(_generate_unique_inputs(paths)),
+                path_queue,
+                StageConcurrency.READ
+            )
+        ),
+        create_task(
+            _run_pipeline_stage(
+                path_queue,
+                pdf_file_data_queue,
+                _read_pdf_file_data,
+                StageConcurrency.READ,
+                job_count
+            )
+        ),
+        create_task(
+            _run_pipeline_stage(
+                pdf_file_data_queue,
+                decrypted_pdf_file_queue,
+                lambda pdf_file_data: _decrypt_pdf_file_data(
+                    pdf_file_data,
+                    prioritized_passwords,
+                    fingerprint_passwords,
+                    executor,
+                    save_profile
+                ),
+                job_count,
+                StageConcurrency.WRITE
+            )
+        ),
+        create_task(
+            _run_pipeline_stage(
+                decrypted_pdf_file_queue,
+                unlock_result_queue,
+                lambda decrypted_pdf_file: _write_decrypted_pdf_file_data(decrypted_pdf_file, output_dir),
+                StageConcurrency.WRITE,
+                1
+            )
+        )
+    ]
+
+    try:
+        while (unlock_result := await unlock_result_queue.get()) is not None:
+            yield unlock_result
+
+        await gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+        await gather(*tasks, return_exceptions = True)
+
+        executor.shutdown(
+            cancel_futures = True,
+            wait = False
+        )
@@ -0,0 +1,442 @@
+"""`unlock-pdf` server functions."""
+
+# pyright: reportPrivateUsage=false
+
+from asyncio import (
+    IncompleteReadError,
+    LimitOverrunError,
+    Semaphore,
+    Server,
+    StreamReader,
+    StreamWriter,
+    get_running_loop,
+    run,
+    start_server
+)
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, wait
+from contextlib import suppress
+from http import HTTPMethod, HTTPStatus
+from json import dumps, loads
+from math import ceil
+from time import monotonic
+from typing import cast
+from pikepdf import PdfError
+from typeguard import typechecked
+from unlock_pdf.classes import ServeOptions
+from unlock_pdf.enumerations import (
+    ByteCount,
+    ContentType,
+    ErrorMessage,
+    FileState,
+    HttpHeader,
+    HttpRoute,
+    InputSeparator,
+    LatencyPercentile,
+    LogMessage,
+    SampleCount,
+    SaveProfile
+)
+from unlock_pdf.functions import (
+    _decrypt_pdf_data,
+    _get_passwords,
+    _initialize_watch_worker,
+    _initialize_worker
+)
+from unlock_pdf.types import HttpRequest, HttpResponse, Passwords
+
+@typechecked
+def _get_latency_percentiles(latencies: Iterable[float]) -> dict[str, float]:
+    """
+    Get the latency percentiles of served unlock requests via the nearest-rank method.
+
+    :param latencies: Latencies of served unlock requests, in seconds.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Latency percentiles in milliseconds keyed on their names,
+              or no percentile if no unlock request was served.
+    """
+
+    sorted_latencies = sorted(latencies)
+
+    if not sorted_latencies:
+        return {}
+
+    return {
+        f"p{percentile}": sorted_latencies[
+            max(ceil(percentile / 100 * len(sorted_latencies)) - 1, 0)
+        ] * 1000
+        for percentile in LatencyPercentile
+    }
+
+@typechecked
+async def _handle_http_connection(
+        reader: StreamReader,
+        writer: StreamWriter,
+        executor: Executor,
+        latencies: deque[float],
+        max_request_size: int,
+        passwords: Passwords,
+        save_profile: SaveProfile,
+        semaphore: Semaphore
+    ) -> None:
+    """
+    Handle a connection to the unlock server by answering its only HTTP request, where
+
+    - `POST /unlock` unlocks the PDF file in its body, and
+    - `GET /stats` gets the latency percentiles of served unlock requests.
+
+    :param reader: Stream to read the HTTP request from.
+    :param writer: Stream to write the HTTP response to.
+    :param executor: Executor to unlock PDF files in.
+    :param latencies: Latencies of the latest served unlock requests, in seconds,
+                      which is appended to with every unlock request.
+    :param max_request_size: Maximum size of the body of an HTTP request, in bytes.
+    :param passwords: Passwords to attempt unlocking PDF files of unlock requests without any with.
+    :param save_profile: Profile to save unlocked PDF files with.
+    :param semaphore: Semaphore that limits how many unlock requests are unlocked at once.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    start_time = monotonic()
+
+    try:
+        request = await _read_http_request(reader, max_request_size)
+
+        if isinstance(request, HttpResponse):
+            response = request
+        elif request.path not in list(HttpRoute):
+            response = HttpResponse(
+                HTTPStatus.NOT_FOUND,
+                dumps({"error": str(ErrorMessage.NO_HTTP_ROUTE)}).encode()
+            )
+        elif request.path == HttpRoute.STATS and request.method == HTTPMethod.GET:
+            response = HttpResponse(
+                HTTPStatus.OK,
+                dumps(
+                    {"count": len(latencies)} | _get_latency_percentiles(latencies)
+                ).encode()
+            )
+        elif request.path == HttpRoute.UNLOCK and request.method == HTTPMethod.POST:
+            async with semaphore:
+                response = await _unlock_http_request(request, passwords, executor, save_profile)
+
+            latencies.append(monotonic() - start_time)
+        else:
+            response = HttpResponse(
+                HTTPStatus.METHOD_NOT_ALLOWED,
+                dumps({"error": str(ErrorMessage.NO_HTTP_METHOD)}).encode()
+            )
+
+        await _write_http_response(writer, response)
+    finally:
+        writer.close()
+
+        with suppress(ConnectionError):
+            await writer.wait_closed()
+
+@typechecked
+async def _read_http_request(reader: StreamReader, max_request_size: int) -> HttpRequest | HttpResponse:
+    """
+    Read an HTTP request along with its body, if it has a content length.
+
+    :param reader: Stream to read the HTTP request from,
+                   whose limit bounds the size of the head of the HTTP request.
+    :param max_request_size: Maximum size of the body of the HTTP request, in bytes.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: HTTP request, or the HTTP response to answer it with if it is malformed or too large.
+    """
+
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except (IncompleteReadError, LimitOverrunError):
+        return HttpResponse(
+            HTTPStatus.BAD_REQUEST,
+            dumps({"error": str(ErrorMessage.MALFORMED_HTTP_REQUEST)}).encode()
+        )
+
+    request_line, *header_lines = head \
+        .decode("latin-1") \
+        .removesuffix("\r\n\r\n") \
+        .split("\r\n")
+    request_line_parts = request_line.split(" ")
+    header_parts = [
+        header_line.partition(":")
+        for header_line in header_lines
+    ]
+
+    if (
+        len(request_line_parts) != 3
+        or not request_line_parts[2].startswith("HTTP/")
+        or not all(separator for _, separator, _ in header_parts)
+    ):
+        return HttpResponse(
+            HTTPStatus.BAD_REQUEST,
+            dumps({"error": str(ErrorMessage.MALFORMED_HTTP_REQUEST)}).encode()
+        )
+
+    headers = {
+        name.strip().lower(): value.strip()
+        for name, _, value in header_parts
+    }
+    content_length = headers.get(HttpHeader.CONTENT_LENGTH)
+
+    if content_length is None:
+        body = b""
+    elif not content_length.isdigit():
+        return HttpResponse(
+            HTTPStatus.BAD_REQUEST,
+            dumps({"error": str(ErrorMessage.MALFORMED_HTTP_REQUEST)}).encode()
+        )
+    elif int(content_length) > max_request_size:
+        return HttpResponse(
+            HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            dumps({"error": str(ErrorMessage.HTTP_REQUEST_TOO_LARGE)}).encode()
+        )
+    else:
+        try:
+            body = await reader.readexactly(int(content_length))
+        except IncompleteReadError:
+            return HttpResponse(
+                HTTPStatus.BAD_REQUEST,
+                dumps({"error": str(ErrorMessage.MALFORMED_HTTP_REQUEST)}).encode()
+            )
+
+    return HttpRequest(
+        body = body,
+        headers = headers,
+        method = request_line_parts[0],
+        path = request_line_parts[1].partition("?")[0]
+    )
+
+@typechecked
+async def _serve_forever(
+        options: ServeOptions,
+        executor: Executor,
+        latencies: deque[float],
+        passwords: Passwords
+    ) -> None:
+    """
+    Serve unlock requests until cancelled.
+
+    :param options: Command-line options of the unlock server.
+    :param executor: Executor to unlock PDF files in.
+    :param latencies: Latencies of the latest served unlock requests, in seconds,
+                      which is appended to with every unlock request.
+    :param passwords: Passwords to attempt unlocking PDF files of unlock requests without any with.
+    :raises OSError: If the unlock server cannot be bound to its host and port.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    server = await _start_unlock_server(
+        executor = executor,
+        host = options.host,
+        latencies = latencies,
+        max_concurrency = options.max_concurrency or options.jobs,
+        max_request_size = options.max_request_size,
+        passwords = passwords,
+        port = options.port,
+        save_profile = SaveProfile(options.save_profile)
+    )
+
+    async with server:
+        host, port = server.sockets[0].getsockname()[:2]
+
+        print(LogMessage.SERVING(host, port))
+        print()
+
+        await server.serve_forever()
+
+@typechecked
+async def _start_unlock_server(
+        executor: Executor,
+        host: str,
+        latencies: deque[float],
+        max_concurrency: int,
+        max_request_size: int,
+        passwords: Passwords,
+        port: int,
+        save_profile: SaveProfile
+    ) -> Server:
+    """
+    Start an HTTP server that unlocks PDF files of unlock requests in an executor,
+    unlocking at most a given number of them at once while the others wait.
+
+    :param executor: Executor to unlock PDF files in.
+    :param host: Host to serve unlock requests on.
+    :param latencies: Latencies of the latest served unlock requests, in seconds,
+                      which is appended to with every unlock request.
+    :param max_concurrency: Number of unlock requests to unlock at once.
+    :param max_request_size: Maximum size of the body of an unlock request, in bytes.
+    :param passwords: Passwords to attempt unlocking PDF files of unlock requests without any with.
+    :param port: Port to serve unlock requests on, or `0` to pick a free one.
+    :param save_profile: Profile to save unlocked PDF files with.
+    :raises OSError: If the unlock server cannot be bound to its host and port.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: Started HTTP server.
+    """
+
+    semaphore = Semaphore(max_concurrency)
+
+    return await start_server(
+        lambda reader, writer: _handle_http_connection(
+            executor = executor,
+            latencies = latencies,
+            max_request_size = max_request_size,
+            passwords = passwords,
+            reader = reader,
+            save_profile = save_profile,
+            semaphore = semaphore,
+            writer = writer
+        ),
+        host = host,
+        limit = ByteCount.HTTP_REQUEST_HEAD,
+        port = port
+    )
+
+@typechecked
+async def _unlock_http_request(
+        request: HttpRequest,
+        passwords: Passwords,
+        executor: Executor,
+        save_profile: SaveProfile
+    ) -> HttpResponse:
+    """
+    Unlock the PDF file in the body of an unlock request in an executor, without blocking the event loop,
+    using the passwords in its passwords header as a JSON array, if any.
+
+    :param request: Unlock request.
+    :param passwords: Passwords to attempt unlocking the PDF file with if the unlock request has none.
+    :param executor: Executor to unlock the PDF file in.
+    :param save_profile: Profile to save the unlocked PDF file with.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :returns: HTTP response with the unlocked PDF file if it got unlocked, or with its file state otherwise.
+    """
+
+    if HttpHeader.CONTENT_LENGTH not in request.headers:
+        return HttpResponse(
+            HTTPStatus.LENGTH_REQUIRED,
+            dumps({"error": str(ErrorMessage.NO_CONTENT_LENGTH)}).encode()
+        )
+
+    try:
+        request_passwords = loads(request.headers.get(HttpHeader.PASSWORDS, "[]"))
+    except ValueError:
+        request_passwords = None
+
+    if (
+        not isinstance(request_passwords, list)
+        or not all(
+            isinstance(password, str)
+            for password in request_passwords # pyright: ignore[reportUnknownVariableType]
+        )
+    ):
+        return HttpResponse(
+            HTTPStatus.BAD_REQUEST,
+            dumps({"error": str(ErrorMessage.MALFORMED_PASSWORDS_HEADER)}).encode()
+        )
+
+    unique_passwords = list(dict.fromkeys(cast(list[str], request_passwords) or passwords))
+
+    if not unique_passwords:
+        return HttpResponse(
+            HTTPStatus.BAD_REQUEST,
+            dumps({"error": str(ErrorMessage.NO_VALID_PASSWORD)}).encode()
+        )
+
+    try:
+        file_state, unlocking_password, data = await get_running_loop().run_in_executor(
+            executor,
+            _decrypt_pdf_data,
+            request.body,
+            unique_passwords,
+            save_profile
+        )
+    except PdfError as exception:
+        return HttpResponse(
+            HTTPStatus.UNPROCESSABLE_ENTITY,
+            dumps({"error": str(exception), "file_state": FileState.FAILED}).encode()
+        )
+
+    if data is not None and unlocking_password is not None:
+        return HttpResponse(
+            HTTPStatus.OK,
+            data,
+            ContentType.PDF,
+            {
+                HttpHeader.ATTEMPT_COUNT: str(unique_passwords.index(unlocking_password) + 1),
+                HttpHeader.FILE_STATE: file_state
+            }
+        )
+
+    return HttpResponse(
+        HTTPStatus.OK if file_state == FileState.NOT_LOCKED else HTTPStatus.UNPROCESSABLE_ENTITY,
+        dumps({"file_state": file_state}).encode()
+    )
+
+@typechecked
+async def _write_http_response(writer: StreamWriter, response: HttpResponse) -> None:
+    """
+    Write an HTTP response, after which the connection is closed.
+
+    :param writer: Stream to write the HTTP response to.
+    :param response: HTTP response.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    """
+
+    head_lines = [
+        f"HTTP/1.1 {response.status.value} {response.status.phrase}",
+        f"Content-Type: {response.content_type}",
+        f"Content-Length: {len(response.body)}",
+        "Connection: close",
+        *[
+            f"{name.title()}: {value}"
+            for name, value in (response.headers or {}).items()
+        ]
+    ]
+
+    writer.write(
+        ("\r\n".join(head_lines) + "\r\n\r\n").encode("latin-1") + response.body
+    )
+
+    with suppress(ConnectionError):
+        await writer.drain()
+
+@typechecked
+def serve_unlock_requests(options: ServeOptions) -> None:
+    """
+    Serve unlock requests over HTTP across a pool of worker processes that are warmed up beforehand
+    until interrupted, after which the latency percentiles of served unlock requests are logged.
+
+    :param options: Command-line options of the unlock server.
+    :raises OSError: If the input source cannot be read,
+                     or if the unlock server cannot be bound to its host and port.
+    :raises TypeCheckError: If any argument or return value has an invalid type.
+    :raises ValueError: If the input source is invalid.
+    """
+
+    passwords = (
+        _get_passwords(
+            options.passwords_from,
+            InputSeparator.NULL if options.null else InputSeparator.NEWLINE
+        )
+        if options.passwords_from is not None
+        else []
+    )
+    latencies: deque[float] = deque(maxlen = SampleCount.LATENCY)
+
+    with ProcessPoolExecutor(
+        initializer = _initialize_watch_worker,
+        max_workers = options.jobs
+    ) as executor:
+        wait([
+            executor.submit(_initialize_worker)
+            for _ in range(options.jobs)
+        ])
+
+        with suppress(KeyboardInterrupt):
+            run(_serve_forever(options, executor, latencies, passwords))
+
+    print(
+        LogMessage.LATENCY_PERCENTILES(_get_latency_percentiles(latencies))
+    )
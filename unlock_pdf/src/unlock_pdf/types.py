@@ -1,16 +1,174 @@
 """`unlock-pdf` types."""
 
-from typing import Literal
-from unlock_pdf.enumerations import FileState, InputPrompt
+from ctypes import CDLL
+from http import HTTPStatus
+from mmap import mmap
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Literal, NamedTuple
+from unlock_pdf.enumerations import ContentType, FileState, InputPrompt
 
-type MainInputPrompt = Literal[InputPrompt.PASSWORDS, InputPrompt.PATHS]
+type FileErrors = dict[str, str]
+"""Dictionary that maps file paths of PDF files with the errors that made unlocking them fail."""
+type FileIdentity = tuple[int, int]
+"""Device number and inode number that identify a file regardless of its path."""
+type FileSignature = tuple[int, int, int, int]
+"""Device number, inode number, size, and modification time in nanoseconds that identify a version of a file."""
+type FileStateCounts = dict[FileState, int]
+"""Dictionary that maps file states with how many PDF files are in them."""
+type MainInputPrompt = Literal[InputPrompt.DIRECTORY_PATHS, InputPrompt.PASSWORDS, InputPrompt.PATHS]
 """Prompt detailing what inputs are being asked of the user."""
 type Passwords = list[str]
 """Ordered list of unique passwords."""
 type Paths = list[str]
 """Ordered list of unique paths."""
+type PdfData = bytes | mmap
+"""Raw PDF data, either read or memory-mapped."""
+type PdfObject = (
+    bool
+    | bytes
+    | dict[str, PdfObject]
+    | float
+    | int
+    | list[PdfObject]
+    | str
+    | tuple[int, int]
+    | None
+)
+"""
+Parsed PDF object, where
+
+- names are strings,
+- strings are bytes, and
+- indirect references are pairs of object number and generation number.
+"""
 
 type GroupedPaths = dict[FileState, Paths]
 """Dictionary that maps file states with file paths of PDF files."""
 type Inputs = Passwords | Paths
 """Ordered list of either unique passwords or unique paths."""
+type Journal = dict[FileSignature, FileState]
+"""Dictionary that maps signatures of PDF files with the final file states they were journaled in."""
+type PdfDictionary = dict[str, PdfObject]
+"""Parsed PDF dictionary that maps names with PDF objects."""
+type UnlockCosts = dict[str, float]
+"""Dictionary that maps file paths of PDF files with their estimated unlock costs in seconds, from the costliest."""
+type UnlockedFileSignatures = dict[str, FileSignature | None]
+"""
+Dictionary that maps file paths of PDF files with their signatures as of when they were last unlocked,
+or `None` while they are being unlocked.
+"""
+
+class DecryptedPdfFile(NamedTuple):
+    """PDF file that was attempted to be unlocked in memory, on its way to being written."""
+
+    file_path: str
+    """Sanitized file path of the PDF file."""
+
+    file_state: FileState
+    """File state of the PDF file after attempting to unlock it."""
+
+    password: str | None = None
+    """Password that unlocked the PDF file, if any."""
+
+    attempt_count: int = 0
+    """Number of passwords in order up to and including the one that unlocked the PDF file."""
+
+    data: bytes | None = None
+    """Raw data of the unlocked PDF file, if it got unlocked."""
+
+class HttpRequest(NamedTuple):
+    """HTTP request that was read by the unlock server."""
+
+    method: str
+    """Method of the HTTP request."""
+
+    path: str
+    """Path of the HTTP request, without its query string."""
+
+    headers: dict[str, str]
+    """Headers of the HTTP request keyed on their lowercase names."""
+
+    body: bytes = b""
+    """Body of the HTTP request."""
+
+class HttpResponse(NamedTuple):
+    """HTTP response to be written by the unlock server."""
+
+    status: HTTPStatus
+    """Status of the HTTP response."""
+
+    body: bytes = b""
+    """Body of the HTTP response."""
+
+    content_type: ContentType = ContentType.JSON
+    """Content type of the body of the HTTP response."""
+
+    headers: dict[str, str] | None = None
+    """Additional headers of the HTTP response, if any."""
+
+class Inotify(NamedTuple):
+    """Inotify instance to watch directories with."""
+
+    directory_paths: dict[int, str]
+    """Paths of the watched directories keyed on their watch descriptors."""
+
+    file_descriptor: int
+    """File descriptor of the inotify instance."""
+
+    library: CDLL
+    """C library that the inotify instance was initialized via."""
+
+class IsolatedUnlock(NamedTuple):
+    """PDF file being unlocked by an isolated worker process, which may be aborted at any point."""
+
+    worker: "IsolatedWorker"
+    """Isolated worker process unlocking the PDF file."""
+
+    index: int
+    """Index of the PDF file in the order of the file paths."""
+
+    file_path: str
+    """Sanitized file path of the PDF file."""
+
+    fingerprint: str | None
+    """Encryption fingerprint of the PDF file, if any."""
+
+    deadline: float | None
+    """Monotonic time by which the PDF file must be unlocked, if any."""
+
+class IsolatedWorker(NamedTuple):
+    """Worker process that unlocks one PDF file at a time and that can be killed and replaced at any point."""
+
+    process: BaseProcess
+    """Worker process."""
+
+    connection: Connection
+    """Connection to send PDF files to unlock to the worker process and to receive their results from."""
+
+class PdfFileData(NamedTuple):
+    """Raw data of a PDF file that was read, on its way to being unlocked."""
+
+    file_path: str
+    """Sanitized file path of the PDF file."""
+
+    data: bytes
+    """Raw PDF data."""
+
+class UnlockResult(NamedTuple):
+    """Result of attempting to unlock a PDF file, small enough to send back from a worker process."""
+
+    file_path: str
+    """Sanitized file path of the PDF file."""
+
+    file_state: FileState
+    """File state of the PDF file after attempting to unlock it."""
+
+    password: str | None = None
+    """Password that unlocked the PDF file, if any."""
+
+    attempt_count: int = 0
+    """Number of passwords in order up to and including the one that unlocked the PDF file."""
+
+    error: str | None = None
+    """Description of the error that made attempting to unlock the PDF file fail, if any."""
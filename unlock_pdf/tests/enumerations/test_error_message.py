@@ -28,3 +28,55 @@ def test_generate_failed_overwrite_error_message_raises_exception() -> None:
         match = "File path must be a non-empty string"
     ):
         ErrorMessage.FAILED_OVERWRITE("")
+
+def test_generate_failed_classification_error_message_generates_error_message() -> None:
+    """
+    Assert that `_generate_failed_classification_error_message`
+    generates an error message for failed classification that
+
+    - has the correct format, and
+    - includes the given file path
+
+    when given a valid file path.
+    """
+
+    assert ErrorMessage.FAILED_CLASSIFICATION("test.pdf") == "Classifying test.pdf failed."
+
+def test_generate_failed_classification_error_message_raises_exception() -> None:
+    """
+    Assert that `_generate_failed_classification_error_message`
+    raises an appropriate exception
+    when given an empty string as file path.
+    """
+
+    with raises(
+        expected_exception = ValueError,
+        match = "File path must be a non-empty string"
+    ):
+        ErrorMessage.FAILED_CLASSIFICATION("")
+
+def test_generate_timed_out_error_message_generates_error_message() -> None:
+    """
+    Assert that `_generate_timed_out_error_message`
+    generates an error message for a timed out unlock attempt that
+
+    - is described like an exception, and
+    - includes the given timeout
+
+    when given a valid timeout.
+    """
+
+    assert ErrorMessage.TIMED_OUT(2.5) == "TimeoutError: Unlocking took longer than 2.5 s."
+
+def test_generate_timed_out_error_message_raises_exception() -> None:
+    """
+    Assert that `_generate_timed_out_error_message`
+    raises an appropriate exception
+    when given a timeout that is not positive.
+    """
+
+    with raises(
+        expected_exception = ValueError,
+        match = "Timeout must be a positive number"
+    ):
+        ErrorMessage.TIMED_OUT(0.0)
@@ -64,3 +64,212 @@ def test_generate_file_state_count_log_message_raises_exception() -> None:
             file_state = FileState.LOCKED,
             file_state_count = -1
         )
+
+@mark.parametrize(
+    "test_file_state, test_file_state_count," \
+    "test_log_message",
+    [
+        (
+            FileState.LOCKED, 1,
+            "1 PDF file is still locked."
+        ),
+        (
+            FileState.NOT_LOCKED, 2,
+            "2 PDF files are not locked."
+        )
+    ]
+)
+def test_generate_file_state_total_log_message_generates_log_message(
+    test_file_state: FileState,
+    test_file_state_count: int,
+    test_log_message: str
+) -> None:
+    """
+    Assert that `_generate_file_state_total_log_message`
+    generates a standalone log message that
+
+    - has the correct format, and
+    - includes
+      - the given file state, and
+      - the given file state count
+
+    when given valid arguments.
+
+    :param test_file_state: State of a PDF file after an unlock attempt.
+    :param test_file_state_count: Number of PDF files that are in said file state.
+    :param test_log_message: Log message detailing the number of PDF files
+                             that are in said file state.
+    """
+
+    assert LogMessage.FILE_STATE_TOTAL(
+        file_state = test_file_state,
+        file_state_count = test_file_state_count
+    ) == test_log_message
+
+@mark.parametrize(
+    "test_average_attempt_count, test_log_message",
+    [
+        (1.0, "Each unlocked PDF file took 1.00 attempts on average."),
+        (2.345, "Each unlocked PDF file took 2.35 attempts on average.")
+    ]
+)
+def test_generate_average_attempt_count_log_message_generates_log_message(
+    test_average_attempt_count: float,
+    test_log_message: str
+) -> None:
+    """
+    Assert that `_generate_average_attempt_count_log_message`
+    generates a log message that includes the average attempt count rounded to 2 decimal places
+    when given a valid argument.
+
+    :param test_average_attempt_count: Average number of passwords attempted
+                                       per unlocked PDF file.
+    :param test_log_message: Log message detailing the average number of attempts
+                             per unlocked PDF file.
+    """
+
+    assert LogMessage.AVERAGE_ATTEMPT_COUNT(test_average_attempt_count) == test_log_message
+
+def test_generate_average_attempt_count_log_message_raises_exception() -> None:
+    """
+    Assert that `_generate_average_attempt_count_log_message`
+    raises an appropriate exception
+    when given an average attempt count less than 1.
+    """
+
+    with raises(
+        expected_exception = ValueError,
+        match = "Average attempt count must be at least 1."
+    ):
+        LogMessage.AVERAGE_ATTEMPT_COUNT(0.5)
+
+def test_generate_file_error_log_message_generates_log_message() -> None:
+    """
+    Assert that `_generate_file_error_log_message`
+    generates a log message that includes both the given file path and the given error
+    when given valid arguments.
+    """
+
+    assert LogMessage.FILE_ERROR(
+        error = "OSError: [Errno 16] Device or resource busy",
+        file_path = "test.pdf"
+    ) == "Unlocking test.pdf failed due to OSError: [Errno 16] Device or resource busy"
+
+def test_generate_file_error_log_message_raises_exception() -> None:
+    """
+    Assert that `_generate_file_error_log_message`
+    raises an appropriate exception
+    when given an empty file path.
+    """
+
+    with raises(
+        expected_exception = ValueError,
+        match = "File path must be a non-empty string."
+    ):
+        LogMessage.FILE_ERROR(
+            error = "OSError",
+            file_path = ""
+        )
+
+def test_generate_file_result_log_message() -> None:
+    """
+    Assert that `_generate_file_result_log_message`
+    generates a log message that includes both the given file path and the given file state
+    when given valid arguments.
+    """
+
+    assert LogMessage.FILE_RESULT(
+        file_path = "test.pdf",
+        file_state = FileState.UNLOCKED
+    ) == "test.pdf is unlocked."
+
+def test_generate_file_result_log_message_raises_exception() -> None:
+    """
+    Assert that `_generate_file_result_log_message`
+    raises an appropriate exception
+    when given an empty file path.
+    """
+
+    with raises(
+        expected_exception = ValueError,
+        match = "File path must be a non-empty string."
+    ):
+        LogMessage.FILE_RESULT(
+            file_path = "",
+            file_state = FileState.UNLOCKED
+        )
+
+@mark.parametrize(
+    "test_latency_percentiles, test_log_message",
+    [
+        (
+            {},
+            "No unlock request was served."
+        ),
+        (
+            {"p50": 1.0, "p99": 12.345},
+            "Unlock requests took 1.00 ms at p50, 12.35 ms at p99."
+        )
+    ]
+)
+def test_generate_latency_percentiles_log_message(
+    test_latency_percentiles: dict[str, float],
+    test_log_message: str
+) -> None:
+    """
+    Assert that `_generate_latency_percentiles_log_message`
+    generates a log message that includes every given latency percentile,
+    or that no unlock request was served if none is given.
+
+    :param test_latency_percentiles: Mock latency percentiles, in milliseconds.
+    :param test_log_message: Expected log message.
+    """
+
+    assert LogMessage.LATENCY_PERCENTILES(test_latency_percentiles) == test_log_message
+
+def test_generate_serving_log_message() -> None:
+    """
+    Assert that `_generate_serving_log_message`
+    generates a log message that includes both the given host and the given port.
+    """
+
+    assert LogMessage.SERVING(
+        host = "127.0.0.1",
+        port = 8765
+    ) == "Serving unlock requests on http://127.0.0.1:8765 until interrupted."
+
+def test_generate_unlock_cost_log_message() -> None:
+    """
+    Assert that `_generate_unlock_cost_log_message`
+    generates a log message that includes both the given file path and the given estimated cost.
+    """
+
+    assert LogMessage.UNLOCK_COST(
+        file_path = "test.pdf",
+        unlock_cost = 1.234
+    ) == "test.pdf (~1.23 s)"
+
+def test_generate_unlock_cost_log_message_raises_exception() -> None:
+    """
+    Assert that `_generate_unlock_cost_log_message`
+    raises an appropriate exception
+    when given an empty file path.
+    """
+
+    with raises(
+        expected_exception = ValueError,
+        match = "File path must be a non-empty string."
+    ):
+        LogMessage.UNLOCK_COST(
+            file_path = "",
+            unlock_cost = 1.0
+        )
+
+def test_generate_unlock_cost_total_log_message() -> None:
+    """
+    Assert that `_generate_unlock_cost_total_log_message`
+    generates a log message that includes the given total estimated cost.
+    """
+
+    assert LogMessage.UNLOCK_COST_TOTAL(12.345) == \
+        "Unlocking was estimated to take ~12.35 s of work, costliest first:"
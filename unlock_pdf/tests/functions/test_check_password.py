@@ -0,0 +1,71 @@
+"""Tests for `_check_password`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pikepdf import PdfError
+from pytest import mark, raises
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.functions import _check_password, _read_encryption_parameters
+
+@mark.parametrize("test_revision", [4, 6])
+@mark.parametrize(
+    "test_password, test_is_correct",
+    [
+        ("password", True),
+        ("owner-password", True),
+        ("password-0", False),
+        ("pässword", False)
+    ]
+)
+def test_check_password_returns_whether_password_opens_pdf_file(
+    tmp_path: Path,
+    test_is_correct: bool,
+    test_password: str,
+    test_revision: int
+) -> None:
+    """
+    Assert that `_check_password`
+    returns whether a password opens a PDF file
+    whether its encryption dictionary can be verified against or not.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_is_correct: Whether the password should open the PDF file or not.
+    :param test_password: Password to check.
+    :param test_revision: Revision of the standard security handler.
+    """
+
+    test_file_path = str(
+        generate_test_pdf_file(
+            file_path = tmp_path / "test.pdf",
+            test_password = "password",
+            test_revision = test_revision
+        )
+    )
+
+    assert _check_password(
+        encryption_parameters = _read_encryption_parameters(test_file_path),
+        file_path = test_file_path,
+        password = test_password
+    ) == test_is_correct
+
+def test_check_password_raises_exception(tmp_path: Path) -> None:
+    """
+    Assert that `_check_password`
+    raises an appropriate exception
+    when `pikepdf` fails.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(b"%PDF-1.7\n")
+
+    with raises(
+        expected_exception = PdfError,
+        match = "Unlocking .*test.pdf failed."
+    ):
+        _check_password(
+            encryption_parameters = None,
+            file_path = str(tmp_path / "test.pdf"),
+            password = "password"
+        )
@@ -0,0 +1,40 @@
+"""Tests for `_classify_pdf_data`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import mark
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.functions import _classify_pdf_data
+
+@mark.parametrize(
+    "test_data, test_file_state",
+    [
+        (
+            b"%PDF-1.7\nxref\ntrailer\n<< /Size 1 >>\nstartxref\n9\n%%EOF\n",
+            FileState.NOT_LOCKED
+        ),
+        (
+            b"%PDF-1.7\nxref\ntrailer\n<< /Encrypt 1 0 R >>\nstartxref\n9\n%%EOF\n",
+            FileState.LOCKED
+        ),
+        (
+            b"%PDF-1.7\n%%EOF\n",
+            None
+        )
+    ]
+)
+def test_classify_pdf_data_returns_file_state(
+    test_data: bytes,
+    test_file_state: FileState | None
+) -> None:
+    """
+    Assert that `_classify_pdf_data`
+    returns whether PDF data is locked or not
+    based on whether its trailer has an encryption dictionary or not,
+    or `None` when said trailer cannot be found unambiguously.
+
+    :param test_data: Mock raw PDF data.
+    :param test_file_state: Expected file state, if any.
+    """
+
+    assert _classify_pdf_data(test_data) == test_file_state
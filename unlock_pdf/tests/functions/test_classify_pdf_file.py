@@ -0,0 +1,105 @@
+"""Tests for `_classify_pdf_file`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import mark
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.functions import _classify_pdf_file
+
+@mark.parametrize(
+    "test_password, test_revision, test_should_generate_object_streams," \
+    "test_file_state",
+    [
+        (
+            None, 6, False,
+            FileState.NOT_LOCKED
+        ),
+        (
+            None, 6, True,
+            FileState.NOT_LOCKED
+        ),
+        (
+            "password", 4, False,
+            FileState.LOCKED
+        ),
+        (
+            "password", 6, True,
+            FileState.LOCKED
+        ),
+        (
+            "", 6, False,
+            FileState.LOCKED
+        )
+    ]
+)
+def test_classify_pdf_file_returns_file_state(
+    tmp_path: Path,
+    test_file_state: FileState,
+    test_password: str | None,
+    test_revision: int,
+    test_should_generate_object_streams: bool
+) -> None:
+    """
+    Assert that `_classify_pdf_file`
+    returns whether a PDF file is locked or not
+    based on whether its trailer has an encryption dictionary or not
+    for both cross-reference tables and cross-reference streams.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_file_state: Expected file state.
+    :param test_password: User password to encrypt the PDF file with, if any.
+    :param test_revision: Revision of the standard security handler.
+    :param test_should_generate_object_streams: Whether to use a cross-reference stream or not.
+    """
+
+    assert _classify_pdf_file(
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / "test.pdf",
+                test_password = test_password,
+                test_revision = test_revision,
+                test_should_generate_object_streams = test_should_generate_object_streams
+            )
+        )
+    ) == test_file_state
+
+@mark.parametrize(
+    "test_content",
+    [
+        b"",
+        b"%PDF-1.7\n",
+        b"%PDF-1.7\nstartxref\n0\n%%EOF\n",
+        b"%PDF-1.7\nstartxref\n999\n%%EOF\n",
+        b"%PDF-1.7\nxref\n0 1\n0000000000 65535 f \nstartxref\n9\n%%EOF\n",
+        b"%PDF-1.7\nxref\ntrailer\n<< /Size 1\nstartxref\n9\n%%EOF\n",
+        b"%PDF-1.7\nxref\ntrailer\n[/Size 1]\nstartxref\n9\n%%EOF\n",
+        b"%PDF-1.7\n1 0 obj\n<< /Size 1 >>\nendobj\nstartxref\n9\n%%EOF\n",
+        b"%PDF-1.7\n1 0 obj\n[/Type /XRef]\nendobj\nstartxref\n9\n%%EOF\n"
+    ]
+)
+def test_classify_pdf_file_returns_none(tmp_path: Path, test_content: bytes) -> None:
+    """
+    Assert that `_classify_pdf_file`
+    returns `None`
+    when the trailer of a PDF file cannot be found unambiguously.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_content: Mock content of the PDF file.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(test_content)
+
+    assert _classify_pdf_file(str(tmp_path / "test.pdf")) is None
+
+def test_classify_pdf_file_returns_none_for_unreadable_file(tmp_path: Path) -> None:
+    """
+    Assert that `_classify_pdf_file`
+    returns `None`
+    when the PDF file cannot be read.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    assert _classify_pdf_file(str(tmp_path / "missing-test.pdf")) is None
@@ -0,0 +1,82 @@
+"""Tests for `_clone_file`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import MonkeyPatch, mark
+from unlock_pdf.functions import _clone_file
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+@mark.parametrize("test_clone_flag", [None, -1])
+def test_clone_file_copies_file(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    test_clone_flag: int | None
+) -> None:
+    """
+    Assert that `_clone_file`
+    copies the contents of a file
+    whether reflinks are unsupported by the platform or by the file system.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_clone_flag: Mock reflink request code, or `None` if the platform has none.
+    """
+
+    (tmp_path / "source.pdf").write_bytes(b"%PDF-1.7\n")
+    (tmp_path / "destination.pdf").write_bytes(b"old contents")
+
+    monkeypatch.setattr(
+        name = "FICLONE",
+        target = target,
+        value = test_clone_flag
+    )
+
+    _clone_file(str(tmp_path / "source.pdf"), str(tmp_path / "destination.pdf"))
+
+    assert (tmp_path / "destination.pdf").read_bytes() == b"%PDF-1.7\n"
+
+def test_clone_file_clones_file(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Assert that `_clone_file`
+    clones a file via a reflink without copying its contents
+    when the file system supports it.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_reflinks: list[tuple[int, int, int]] = []
+
+    (tmp_path / "source.pdf").write_bytes(b"%PDF-1.7\n")
+
+    monkeypatch.setattr(
+        name = "FICLONE",
+        target = target,
+        value = 1
+    )
+    monkeypatch.setattr(
+        name = "ioctl",
+        raising = False,
+        target = target,
+        value = lambda file_descriptor, request, argument: test_reflinks.append(
+            (file_descriptor, request, argument)
+        )
+    )
+    monkeypatch.setattr(
+        name = "copyfileobj",
+        target = target,
+        value = lambda source_file, destination_file: None
+    )
+
+    _clone_file(str(tmp_path / "source.pdf"), str(tmp_path / "destination.pdf"))
+
+    assert len(test_reflinks) == 1
+    assert test_reflinks[0][1] == 1
@@ -0,0 +1,81 @@
+"""Tests for `_compute_rc4_key`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import mark
+from unlock_pdf.classes import EncryptionParameters
+from unlock_pdf.functions import _compute_rc4_key
+
+BASE_ENCRYPTION_PARAMETERS = EncryptionParameters(
+    document_id = b"\x0a" * 16,
+    key_length = 16,
+    owner_hash = b"\x0b" * 32,
+    permissions = -4,
+    revision = 4,
+    should_encrypt_metadata = True,
+    user_hash = b"\x0c" * 32
+)
+
+@mark.parametrize(
+    "test_encryption_parameters",
+    [
+        BASE_ENCRYPTION_PARAMETERS._replace(key_length = 5, revision = 2),
+        BASE_ENCRYPTION_PARAMETERS._replace(key_length = 5, revision = 3),
+        BASE_ENCRYPTION_PARAMETERS._replace(revision = 3),
+        BASE_ENCRYPTION_PARAMETERS
+    ]
+)
+def test_compute_rc4_key_returns_key_of_key_length(
+    test_encryption_parameters: EncryptionParameters
+) -> None:
+    """
+    Assert that `_compute_rc4_key`
+    returns a file encryption key as long as the key length.
+
+    :param test_encryption_parameters: Parameters of the standard security handler.
+    """
+
+    assert len(
+        _compute_rc4_key(test_encryption_parameters, b"password")
+    ) == test_encryption_parameters.key_length
+
+@mark.parametrize(
+    "test_other_encryption_parameters",
+    [
+        BASE_ENCRYPTION_PARAMETERS._replace(document_id = b"\x0d" * 16),
+        BASE_ENCRYPTION_PARAMETERS._replace(owner_hash = b"\x0d" * 32),
+        BASE_ENCRYPTION_PARAMETERS._replace(permissions = 4294967292 - 4),
+        BASE_ENCRYPTION_PARAMETERS._replace(revision = 2),
+        BASE_ENCRYPTION_PARAMETERS._replace(should_encrypt_metadata = False)
+    ]
+)
+def test_compute_rc4_key_depends_on_encryption_parameters(
+    test_other_encryption_parameters: EncryptionParameters
+) -> None:
+    """
+    Assert that `_compute_rc4_key`
+    returns a different file encryption key
+    when the parameters of the standard security handler differ.
+
+    :param test_other_encryption_parameters: Other parameters of the standard security handler.
+    """
+
+    assert _compute_rc4_key(
+        BASE_ENCRYPTION_PARAMETERS,
+        b"password"
+    ) != _compute_rc4_key(test_other_encryption_parameters, b"password")
+
+def test_compute_rc4_key_accepts_unsigned_permissions() -> None:
+    """
+    Assert that `_compute_rc4_key`
+    returns the same file encryption key
+    whether the permission flags are stored as a signed integer or an unsigned integer.
+    """
+
+    assert _compute_rc4_key(
+        BASE_ENCRYPTION_PARAMETERS,
+        b"password"
+    ) == _compute_rc4_key(
+        BASE_ENCRYPTION_PARAMETERS._replace(permissions = 4294967292),
+        b"password"
+    )
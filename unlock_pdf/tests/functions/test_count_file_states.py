@@ -0,0 +1,78 @@
+"""Tests for `_count_file_states`."""
+
+# pyright: reportPrivateUsage=false
+
+from pikepdf import PdfError
+from pytest import MonkeyPatch
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.functions import _count_file_states
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+def test_count_file_states_returns_file_state_counts(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_count_file_states`
+    returns how many PDF files are locked or not
+    when given paths of PDF files.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    monkeypatch.setattr(
+        name = "_detect_file_state",
+        target = target,
+        value = lambda file_path: (
+            FileState.NOT_LOCKED
+            if file_path == "test-0.pdf"
+            else FileState.LOCKED
+        )
+    )
+
+    assert _count_file_states(["test-0.pdf", "test-1.pdf", "test-2.pdf"]) == {
+        FileState.FAILED: 0,
+        FileState.LOCKED: 2,
+        FileState.NOT_LOCKED: 1
+    }
+
+def test_count_file_states_counts_failed_pdf_files(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_count_file_states`
+    counts PDF files that fail to be classified as failed
+    and keeps classifying the others
+    when classifying some PDF files fails.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    def _mock_detect_file_state(file_path: str) -> FileState:
+        """
+        Mock function of `unlock_pdf.functions._detect_file_state` that
+        mocks failing to classify the first PDF file.
+
+        :param file_path: Sanitized file path of the PDF file to classify.
+        :raises PdfError: If the PDF file is the first one.
+        :returns: `FileState.LOCKED` for every other PDF file.
+        """
+
+        if file_path == "test-0.pdf":
+            raise PdfError
+
+        return FileState.LOCKED
+
+    monkeypatch.setattr(
+        name = "_detect_file_state",
+        target = target,
+        value = _mock_detect_file_state
+    )
+
+    assert _count_file_states(["test-0.pdf", "test-1.pdf"]) == {
+        FileState.FAILED: 1,
+        FileState.LOCKED: 1,
+        FileState.NOT_LOCKED: 0
+    }
@@ -0,0 +1,42 @@
+"""Tests for `_crypt_rc4`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import mark
+from unlock_pdf.functions import _crypt_rc4
+
+@mark.parametrize(
+    "test_key, test_data," \
+    "test_crypted_data",
+    [
+        (
+            b"Key", b"Plaintext",
+            bytes.fromhex("BBF316E8D940AF0AD3")
+        ),
+        (
+            b"Wiki", b"pedia",
+            bytes.fromhex("1021BF0420")
+        ),
+        (
+            b"Secret", b"Attack at dawn",
+            bytes.fromhex("45A01F645FC35B383552544B9BF5")
+        )
+    ]
+)
+def test_crypt_rc4_returns_crypted_data(
+    test_crypted_data: bytes,
+    test_data: bytes,
+    test_key: bytes
+) -> None:
+    """
+    Assert that `_crypt_rc4`
+    returns the data encrypted or decrypted via RC4
+    symmetrically.
+
+    :param test_crypted_data: Expected encrypted data.
+    :param test_data: Data to encrypt.
+    :param test_key: Encryption key.
+    """
+
+    assert _crypt_rc4(test_key, test_data) == test_crypted_data
+    assert _crypt_rc4(test_key, test_crypted_data) == test_data
@@ -0,0 +1,133 @@
+"""Tests for `_decode_xref_stream`."""
+
+# pyright: reportPrivateUsage=false
+
+from zlib import compress
+from pytest import mark, raises
+from unlock_pdf.functions import _decode_xref_stream
+from unlock_pdf.types import PdfDictionary
+
+@mark.parametrize(
+    "test_stream_data, test_trailer," \
+    "test_decoded_data",
+    [
+        (
+            b"\x01\x02\x03\x05",
+            {"/Length": 4},
+            b"\x01\x02\x03\x05"
+        ),
+        (
+            compress(b"\x01\x02\x03\x05"),
+            {"/Filter": "/FlateDecode", "/Length": 12},
+            b"\x01\x02\x03\x05"
+        ),
+        (
+            compress(b"\x00\x01\x02\x01\x03\x02"),
+            {
+                "/Filter": ["/FlateDecode"],
+                "/DecodeParms": {"/Predictor": 12, "/Columns": 2},
+                "/Length": 14
+            },
+            b"\x01\x02\x03\x05"
+        ),
+        (
+            b"\x00\x01\x02\x02\x02\x03",
+            {"/DecodeParms": {"/Predictor": 12, "/Columns": 2}, "/Length": 6},
+            b"\x01\x02\x03\x05"
+        ),
+        (
+            b"\x00\x01\x02\x03\x03\x03",
+            {"/DecodeParms": {"/Predictor": 12, "/Columns": 2}, "/Length": 6},
+            b"\x01\x02\x03\x05"
+        ),
+        (
+            b"\x00\x01\x02\x04\x02\x02",
+            {"/DecodeParms": {"/Predictor": 12, "/Columns": 2}, "/Length": 6},
+            b"\x01\x02\x03\x05"
+        ),
+        (
+            b"\x01\x01\x01\x04\x02\x02",
+            {"/DecodeParms": {"/Predictor": 12, "/Columns": 2}, "/Length": 6},
+            b"\x01\x02\x03\x05"
+        )
+    ]
+)
+def test_decode_xref_stream_returns_decoded_data(
+    test_decoded_data: bytes,
+    test_stream_data: bytes,
+    test_trailer: PdfDictionary
+) -> None:
+    """
+    Assert that `_decode_xref_stream`
+    returns the data of a cross-reference stream
+    after undoing its Flate compression and PNG predictor if any.
+
+    :param test_decoded_data: Expected decoded data.
+    :param test_stream_data: Raw data of the cross-reference stream.
+    :param test_trailer: Dictionary of the cross-reference stream.
+    """
+
+    test_trailer["/Length"] = len(test_stream_data)
+
+    assert _decode_xref_stream(
+        data = b" stream\r\n" + test_stream_data + b"\nendstream",
+        offset = 0,
+        trailer = test_trailer
+    ) == test_decoded_data
+
+@mark.parametrize(
+    "test_data, test_trailer",
+    [
+        (
+            b" endstream",
+            {"/Length": 0}
+        ),
+        (
+            b" stream\n",
+            {}
+        ),
+        (
+            b" stream\n",
+            {"/Filter": "/LZWDecode", "/Length": 0}
+        ),
+        (
+            b" stream\n",
+            {"/DecodeParms": [], "/Length": 0}
+        ),
+        (
+            b" stream\nnot-flate",
+            {"/Filter": "/FlateDecode", "/Length": 9}
+        ),
+        (
+            b" stream\n\x01\x02",
+            {"/DecodeParms": {"/Predictor": 2}, "/Length": 2}
+        ),
+        (
+            b" stream\n\x01\x02",
+            {"/DecodeParms": {"/Predictor": 12, "/Columns": 0}, "/Length": 2}
+        ),
+        (
+            b" stream\n\x05\x02",
+            {"/DecodeParms": {"/Predictor": 12}, "/Length": 2}
+        )
+    ]
+)
+def test_decode_xref_stream_raises_exception(test_data: bytes, test_trailer: PdfDictionary) -> None:
+    """
+    Assert that `_decode_xref_stream`
+    raises an appropriate exception
+    when the cross-reference stream is malformed or uses unsupported filters.
+
+    :param test_data: Raw PDF data.
+    :param test_trailer: Dictionary of the cross-reference stream.
+    """
+
+    with raises(
+        expected_exception = ValueError,
+        match = "PDF object must be well-formed."
+    ):
+        _decode_xref_stream(
+            data = test_data,
+            offset = 0,
+            trailer = test_trailer
+        )
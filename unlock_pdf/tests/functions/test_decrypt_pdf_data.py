@@ -0,0 +1,75 @@
+"""Tests for `_decrypt_pdf_data`."""
+
+# pyright: reportPrivateUsage=false
+
+from io import BytesIO
+from pathlib import Path
+from pikepdf import Pdf, PdfError
+from pytest import mark, raises
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.enumerations import FileState, SaveProfile
+from unlock_pdf.functions import _decrypt_pdf_data
+
+@mark.parametrize(
+    "test_password, test_passwords," \
+    "test_file_state, test_unlocking_password",
+    [
+        (
+            None, ["password"],
+            FileState.NOT_LOCKED, None
+        ),
+        (
+            "password", ["password-0", "password"],
+            FileState.UNLOCKED, "password"
+        ),
+        (
+            "password", ["password-0"],
+            FileState.LOCKED, None
+        )
+    ]
+)
+def test_decrypt_pdf_data_returns_unlocked_data(
+    tmp_path: Path,
+    test_file_state: FileState,
+    test_password: str | None,
+    test_passwords: list[str],
+    test_unlocking_password: str | None
+) -> None:
+    """
+    Assert that `_decrypt_pdf_data`
+    returns the file state of raw PDF data after attempting to unlock it
+    along with the password that unlocked it and its unlocked version only if it got unlocked.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_file_state: Expected file state.
+    :param test_password: User password to encrypt the PDF file with, if any.
+    :param test_passwords: Passwords to attempt unlocking the PDF file with.
+    :param test_unlocking_password: Expected password that unlocked the PDF file, if any.
+    """
+
+    test_data = generate_test_pdf_file(tmp_path / "test.pdf", test_password = test_password).read_bytes()
+
+    file_state, unlocking_password, data = _decrypt_pdf_data(test_data, test_passwords, SaveProfile.FAST)
+
+    assert (file_state, unlocking_password) == (test_file_state, test_unlocking_password)
+
+    if test_file_state == FileState.UNLOCKED:
+        assert data is not None
+
+        with Pdf.open(BytesIO(data)) as test_pdf:
+            assert not test_pdf.is_encrypted
+    else:
+        assert data is None
+
+def test_decrypt_pdf_data_raises_exception() -> None:
+    """
+    Assert that `_decrypt_pdf_data`
+    raises an exception described after its root cause
+    when the raw PDF data is malformed.
+    """
+
+    with raises(
+        expected_exception = PdfError,
+        match = "^PdfError: "
+    ):
+        _decrypt_pdf_data(b"%PDF-1.7", ["password"], SaveProfile.FAST)
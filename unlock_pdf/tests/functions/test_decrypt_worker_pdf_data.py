@@ -0,0 +1,79 @@
+"""Tests for `_decrypt_worker_pdf_data`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import MonkeyPatch, mark
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.enumerations import FileState, SaveProfile
+from unlock_pdf.functions import _decrypt_worker_pdf_data
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+@mark.parametrize(
+    "test_password, test_prioritized_passwords," \
+    "test_file_state, test_unlocking_password, test_attempt_count",
+    [
+        (
+            "password", [],
+            FileState.UNLOCKED, "password", 3
+        ),
+        (
+            "password", ["password"],
+            FileState.UNLOCKED, "password", 1
+        ),
+        (
+            None, [],
+            FileState.NOT_LOCKED, None, 0
+        )
+    ]
+)
+def test_decrypt_worker_pdf_data_counts_attempts(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    test_attempt_count: int,
+    test_file_state: FileState,
+    test_password: str | None,
+    test_prioritized_passwords: list[str],
+    test_unlocking_password: str | None
+) -> None:
+    """
+    Assert that `_decrypt_worker_pdf_data`
+    unlocks raw PDF data with the passwords of the worker process, attempting the given passwords first,
+    and counts how many passwords were attempted.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_attempt_count: Expected number of attempted passwords.
+    :param test_file_state: Expected file state.
+    :param test_password: Password to lock the PDF file with, if any.
+    :param test_prioritized_passwords: Passwords to attempt first.
+    :param test_unlocking_password: Expected password that unlocked the PDF data, if any.
+    """
+
+    test_data = generate_test_pdf_file(tmp_path / "test.pdf", test_password = test_password).read_bytes()
+
+    monkeypatch.setattr(
+        name = "_worker_passwords",
+        target = target,
+        value = ["wrong-0", "wrong-1", "password"]
+    )
+
+    file_state, unlocking_password, data, attempt_count = _decrypt_worker_pdf_data(
+        test_data,
+        test_prioritized_passwords,
+        SaveProfile.FAST
+    )
+
+    assert (file_state, unlocking_password, attempt_count) == (
+        test_file_state,
+        test_unlocking_password,
+        test_attempt_count
+    )
+    assert (data is not None) == (test_file_state == FileState.UNLOCKED)
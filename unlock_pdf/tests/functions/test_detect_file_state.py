@@ -0,0 +1,193 @@
+"""Tests for `_detect_file_state`."""
+
+# pyright: reportPrivateUsage=false
+
+from pikepdf import PasswordError, PdfError
+from pytest import (
+    MonkeyPatch,
+    mark,
+    raises
+)
+from unlock_pdf.classes import EncryptionParameters
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.functions import _detect_file_state
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+class _MockPDF:
+    """Mock class of `pikepdf.Pdf`."""
+
+    def __init__(self, test_exception: Exception | None) -> None:
+        """
+        Initialize a mock instance of `pikepdf.Pdf`.
+
+        :param test_exception: Exception to raise on attempt to open the PDF file, if any.
+        """
+
+        self.open_count = 0
+        self.test_exception = test_exception
+
+    def __enter__(self) -> "_MockPDF":
+        """
+        Mock entering the context of an opened PDF file.
+
+        :returns: Mock instance of `pikepdf.Pdf`.
+        """
+
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Mock closing an opened PDF file."""
+
+    def open(self, filename_or_stream: str) -> "_MockPDF":
+        """
+        Mock function of `pikepdf.Pdf.open` that
+        mocks opening a PDF file without a password.
+
+        :param filename_or_stream: Sanitized file path of the PDF file to classify.
+        :raises Exception: If opening the PDF file should fail.
+        :returns: Mock instance of `pikepdf.Pdf`.
+        """
+
+        assert filename_or_stream == "test.pdf"
+
+        self.open_count += 1
+
+        if self.test_exception is not None:
+            raise self.test_exception
+
+        return self
+
+TEST_ENCRYPTION_PARAMETERS = EncryptionParameters(
+    document_id = b"",
+    key_length = 5,
+    owner_hash = b"",
+    permissions = -1,
+    revision = 2,
+    should_encrypt_metadata = True,
+    user_hash = b""
+)
+
+@mark.parametrize(
+    "test_classified_file_state, test_encryption_parameters," \
+    "test_verified, test_exception," \
+    "test_file_state, test_open_count",
+    [
+        (
+            FileState.LOCKED, TEST_ENCRYPTION_PARAMETERS,
+            False, None,
+            FileState.LOCKED, 0
+        ),
+        (
+            FileState.LOCKED, TEST_ENCRYPTION_PARAMETERS,
+            True, None,
+            FileState.NOT_LOCKED, 0
+        ),
+        (
+            FileState.LOCKED, None,
+            False, None,
+            FileState.NOT_LOCKED, 1
+        ),
+        (
+            FileState.LOCKED, None,
+            False, PasswordError(),
+            FileState.LOCKED, 1
+        ),
+        (
+            FileState.NOT_LOCKED, None,
+            False, None,
+            FileState.NOT_LOCKED, 0
+        ),
+        (
+            None, None,
+            False, None,
+            FileState.NOT_LOCKED, 1
+        ),
+        (
+            None, None,
+            False, PasswordError(),
+            FileState.LOCKED, 1
+        )
+    ]
+)
+def test_detect_file_state_returns_file_state(
+    monkeypatch: MonkeyPatch,
+    test_classified_file_state: FileState | None,
+    test_encryption_parameters: EncryptionParameters | None,
+    test_verified: bool,
+    test_exception: Exception | None,
+    test_file_state: FileState,
+    test_open_count: int
+) -> None:
+    """
+    Assert that `_detect_file_state`
+    returns whether a PDF file is locked or not,
+    checking whether it can be opened with an empty password,
+    and opening it via `pikepdf` only if that cannot be checked otherwise.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param test_classified_file_state: Mock file state from scanning the trailer, if unambiguous.
+    :param test_encryption_parameters: Mock parameters of the standard security handler, if any.
+    :param test_verified: Whether the empty password should be verified.
+    :param test_exception: Exception to raise on attempt to open the PDF file, if any.
+    :param test_file_state: Expected file state.
+    :param test_open_count: Expected number of attempts to open the PDF file via `pikepdf`.
+    """
+
+    test_pikepdf_pdf = _MockPDF(test_exception)
+
+    monkeypatch.setattr(
+        name = "_classify_pdf_file",
+        target = target,
+        value = lambda file_path: test_classified_file_state
+    )
+    monkeypatch.setattr(
+        name = "_read_encryption_parameters",
+        target = target,
+        value = lambda file_path: test_encryption_parameters
+    )
+    monkeypatch.setattr(
+        name = "_verify_password",
+        target = target,
+        value = lambda encryption_parameters, password: test_verified
+    )
+    monkeypatch.setattr(
+        name = "Pdf",
+        target = target,
+        value = test_pikepdf_pdf
+    )
+
+    assert _detect_file_state("test.pdf") == test_file_state
+    assert test_pikepdf_pdf.open_count == test_open_count
+
+def test_detect_file_state_raises_exception(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_detect_file_state`
+    raises an appropriate exception
+    when `pikepdf` fails.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    monkeypatch.setattr(
+        name = "_classify_pdf_file",
+        target = target,
+        value = lambda file_path: None
+    )
+    monkeypatch.setattr(
+        name = "Pdf",
+        target = target,
+        value = _MockPDF(PdfError())
+    )
+
+    with raises(
+        expected_exception = PdfError,
+        match = "Classifying test.pdf failed."
+    ):
+        _detect_file_state("test.pdf")
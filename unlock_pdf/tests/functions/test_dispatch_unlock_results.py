@@ -0,0 +1,74 @@
+"""Tests for `_dispatch_unlock_results`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import MonkeyPatch, mark
+from unlock_pdf.classes import FingerprintPasswords
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.functions import _dispatch_unlock_results, _get_options
+from unlock_pdf.types import UnlockResult
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+@mark.parametrize(
+    "test_arguments, test_generator, test_keyword_arguments",
+    [
+        (["--watch"], "_generate_watched_unlock_results", {"should_sniff": False}),
+        (["--timeout", "1"], "_generate_isolated_unlock_results", {"memory_limit": None, "timeout": 1.0}),
+        (["--memory-limit", "2"], "_generate_isolated_unlock_results", {"memory_limit": 2 << 20, "timeout": None}),
+        (["--shard-passwords"], "_generate_sharded_unlock_results", {}),
+        (["--memory-budget", "2"], "_generate_budgeted_unlock_results", {"memory_budget": 2 << 20}),
+        (["--schedule", "longest-first"], "_generate_unlock_results", {"should_preserve_order": False}),
+        ([], "_generate_unlock_results", {"should_preserve_order": True})
+    ]
+)
+def test_dispatch_unlock_results_dispatches_per_options(
+    monkeypatch: MonkeyPatch,
+    test_arguments: list[str],
+    test_generator: str,
+    test_keyword_arguments: dict[str, object]
+) -> None:
+    """
+    Assert that `_dispatch_unlock_results`
+    unlocks PDF files the way that the command-line options ask for.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param test_arguments: Mock command-line arguments.
+    :param test_generator: Name of the function expected to unlock the PDF files.
+    :param test_keyword_arguments: Keyword arguments expected to be passed to said function, among others.
+    """
+
+    called_keyword_arguments: dict[str, object] = {}
+
+    for generator in [
+        "_generate_budgeted_unlock_results",
+        "_generate_isolated_unlock_results",
+        "_generate_sharded_unlock_results",
+        "_generate_unlock_results",
+        "_generate_watched_unlock_results"
+    ]:
+        monkeypatch.setattr(
+            name = generator,
+            target = target,
+            value = lambda generator = generator, **keyword_arguments: (
+                called_keyword_arguments.update(keyword_arguments)
+                or [UnlockResult(generator, FileState.UNLOCKED)]
+            )
+        )
+
+    assert list(
+        _dispatch_unlock_results(
+            directory_paths = [],
+            fingerprint_passwords = FingerprintPasswords(["password"]),
+            options = _get_options(["--jobs", "2", *test_arguments, "test.pdf"]),
+            passwords = ["password"],
+            pdf_file_paths = ["test.pdf"]
+        )
+    ) == [UnlockResult(test_generator, FileState.UNLOCKED)]
+    assert test_keyword_arguments.items() <= called_keyword_arguments.items()
@@ -0,0 +1,91 @@
+"""Tests for `_estimate_unlock_cost`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import MonkeyPatch, approx, mark
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.functions import _estimate_unlock_cost
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+@mark.parametrize(
+    "test_revision, test_password_cost",
+    [
+        (2, 0.0004),
+        (3, 0.005),
+        (4, 0.005),
+        (5, 0.0001),
+        (6, 0.01)
+    ]
+)
+def test_estimate_unlock_cost_returns_cost(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    test_password_cost: float,
+    test_revision: int
+) -> None:
+    """
+    Assert that `_estimate_unlock_cost`
+    estimates the cost of unlocking an encrypted PDF file
+    from its size and the cost of attempting each password on its revision.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_password_cost: Expected cost of attempting a password, in seconds.
+    :param test_revision: Mock revision of the standard security handler of the PDF file.
+    """
+
+    test_file_path = str(generate_test_pdf_file(tmp_path / "test.pdf"))
+
+    monkeypatch.setattr(
+        name = "_read_encryption_revision",
+        target = target,
+        value = lambda file_path: test_revision
+    )
+
+    assert _estimate_unlock_cost(test_file_path, 10) == approx(
+        Path(test_file_path).stat().st_size * 1.5e-7 + 10 * test_password_cost
+    )
+
+def test_estimate_unlock_cost_prefers_r6_over_r4(tmp_path: Path) -> None:
+    """
+    Assert that `_estimate_unlock_cost`
+    estimates a PDF file encrypted via revision 6 to be costlier than one encrypted via revision 4.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    assert _estimate_unlock_cost(
+        str(generate_test_pdf_file(tmp_path / "test-0.pdf", test_password = "password")),
+        10
+    ) > _estimate_unlock_cost(
+        str(generate_test_pdf_file(tmp_path / "test-1.pdf", test_password = "password", test_revision = 4)),
+        10
+    )
+
+def test_estimate_unlock_cost_returns_no_cost(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Assert that `_estimate_unlock_cost`
+    estimates no cost
+    when a PDF file is not encrypted or when it cannot be queried.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    assert _estimate_unlock_cost(str(generate_test_pdf_file(tmp_path / "test.pdf")), 10) == 0.0
+
+    monkeypatch.setattr(
+        name = "_read_encryption_revision",
+        target = target,
+        value = lambda file_path: 6
+    )
+
+    assert _estimate_unlock_cost(str(tmp_path / "missing.pdf"), 10) == 0.0
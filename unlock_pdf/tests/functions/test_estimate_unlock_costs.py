@@ -0,0 +1,55 @@
+"""Tests for `_estimate_unlock_costs`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import MonkeyPatch
+from unlock_pdf.functions import _estimate_unlock_costs
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+def test_estimate_unlock_costs_orders_from_costliest(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_estimate_unlock_costs`
+    estimates the cost of unlocking every PDF file from the costliest
+    while keeping PDF files with the same cost in order.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    test_unlock_costs = {
+        "test-0.pdf": 0.0,
+        "test-1.pdf": 2.0,
+        "test-2.pdf": 1.0,
+        "test-3.pdf": 2.0
+    }
+
+    def _mock_estimate_unlock_cost(file_path: str, password_count: int) -> float:
+        """
+        Mock function of `unlock_pdf.functions._estimate_unlock_cost` that
+        returns a mock cost.
+
+        :param file_path: Sanitized file path of the PDF file.
+        :param password_count: Number of passwords that may be attempted on the PDF file.
+        :returns: Mock cost of unlocking the PDF file.
+        """
+
+        assert password_count == 3
+
+        return test_unlock_costs[file_path]
+
+    monkeypatch.setattr(
+        name = "_estimate_unlock_cost",
+        target = target,
+        value = _mock_estimate_unlock_cost
+    )
+
+    unlock_costs = _estimate_unlock_costs(iter(test_unlock_costs), 3)
+
+    assert unlock_costs == test_unlock_costs
+    assert list(unlock_costs) == ["test-1.pdf", "test-3.pdf", "test-2.pdf", "test-0.pdf"]
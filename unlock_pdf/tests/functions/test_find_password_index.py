@@ -0,0 +1,175 @@
+"""Tests for `_find_password_index`."""
+
+# pyright: reportPrivateUsage=false
+
+from multiprocessing import Value
+from pytest import MonkeyPatch, mark
+from unlock_pdf.classes import EncryptionParameters
+from unlock_pdf.functions import _find_password_index
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+@mark.parametrize(
+    "test_shared_password_index, test_start_index," \
+    "test_password_index, test_final_shared_password_index",
+    [
+        (
+            None, 0,
+            1, None
+        ),
+        (
+            10, 4,
+            5, 5
+        ),
+        (
+            3, 4,
+            None, 3
+        ),
+        (
+            5, 4,
+            None, 5
+        )
+    ]
+)
+def test_find_password_index_returns_password_index(
+    monkeypatch: MonkeyPatch,
+    test_final_shared_password_index: int | None,
+    test_password_index: int | None,
+    test_shared_password_index: int | None,
+    test_start_index: int
+) -> None:
+    """
+    Assert that `_find_password_index`
+    returns the index of the first password of a shard that opens a PDF file
+    and shares it, unless an earlier password has already been found by another shard.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param test_final_shared_password_index: Expected shared index of the earliest password.
+    :param test_password_index: Expected index of the first password of the shard.
+    :param test_shared_password_index: Shared index of the earliest password found so far.
+    :param test_start_index: Index of the first password of the shard among every password.
+    """
+
+    def _mock_check_password(
+        file_path: str,
+        encryption_parameters: EncryptionParameters | None,
+        password: str
+    ) -> bool:
+        """
+        Mock function of `unlock_pdf.functions._check_password` that
+        mocks checking if a password opens a PDF file.
+
+        :param file_path: Sanitized file path of the PDF file.
+        :param encryption_parameters: Parameters of the standard security handler.
+        :param password: Password to check.
+        :returns: Whether the password opens the PDF file or not.
+        """
+
+        assert file_path == "test.pdf"
+        assert encryption_parameters is None
+
+        return password.startswith("password")
+
+    test_shared_value = (
+        Value("q", test_shared_password_index)
+        if test_shared_password_index is not None
+        else None
+    )
+
+    monkeypatch.setattr(
+        name = "_check_password",
+        target = target,
+        value = _mock_check_password
+    )
+    monkeypatch.setattr(
+        name = "_shared_password_index",
+        target = target,
+        value = test_shared_value
+    )
+
+    monkeypatch.setattr(
+        name = "_worker_passwords",
+        target = target,
+        value = ["wrong-0", "password-0", "password-1", "wrong-1", "wrong-2", "password-2", "wrong-3"]
+    )
+
+    assert _find_password_index(
+        encryption_parameters = None,
+        end_index = test_start_index + 3,
+        file_path = "test.pdf",
+        prioritized_passwords = [],
+        start_index = test_start_index
+    ) == test_password_index
+
+    if test_shared_value is not None:
+        assert test_shared_value.value == test_final_shared_password_index
+
+def test_find_password_index_returns_none(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_find_password_index`
+    returns `None`
+    when no password of the shard opens the PDF file.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    monkeypatch.setattr(
+        name = "_check_password",
+        target = target,
+        value = lambda file_path, encryption_parameters, password: False
+    )
+    monkeypatch.setattr(
+        name = "_worker_passwords",
+        target = target,
+        value = ["wrong-0", "wrong-1"]
+    )
+
+    assert _find_password_index(
+        encryption_parameters = None,
+        end_index = 2,
+        file_path = "test.pdf",
+        prioritized_passwords = [],
+        start_index = 0
+    ) is None
+
+def test_find_password_index_attempts_prioritized_passwords_first(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_find_password_index`
+    slices its shard out of the passwords of the worker process
+    after moving the passwords to attempt first to their front.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    test_worker_passwords = ["wrong-0", "wrong-1", "password"]
+
+    monkeypatch.setattr(
+        name = "_check_password",
+        target = target,
+        value = lambda file_path, encryption_parameters, password: password == "password"
+    )
+    monkeypatch.setattr(
+        name = "_shared_password_index",
+        target = target,
+        value = None
+    )
+    monkeypatch.setattr(
+        name = "_worker_passwords",
+        target = target,
+        value = test_worker_passwords
+    )
+
+    assert _find_password_index(
+        encryption_parameters = None,
+        end_index = 1,
+        file_path = "test.pdf",
+        prioritized_passwords = ["password"],
+        start_index = 0
+    ) == 0
+    assert test_worker_passwords == ["wrong-0", "wrong-1", "password"]
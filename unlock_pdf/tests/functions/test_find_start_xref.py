@@ -0,0 +1,44 @@
+"""Tests for `_find_start_xref`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import mark
+from unlock_pdf.functions import _find_start_xref
+
+@mark.parametrize(
+    "test_data," \
+    "test_xref_offset",
+    [
+        (
+            b"%PDF-1.7\nxref\nstartxref\n9\n%%EOF\n",
+            9
+        ),
+        (
+            b"%PDF-1.7\nstartxref\n1\nstartxref \r\n 9\n%%EOF\n",
+            9
+        ),
+        (
+            b"%PDF-1.7\n%%EOF\n",
+            None
+        ),
+        (
+            b"%PDF-1.7\nstartxref\n%%EOF\n",
+            None
+        ),
+        (
+            b"%PDF-1.7\nstartxref\n9\n%%EOF\n",
+            None
+        )
+    ]
+)
+def test_find_start_xref_returns_xref_offset(test_data: bytes, test_xref_offset: int | None) -> None:
+    """
+    Assert that `_find_start_xref`
+    returns the offset of the last cross-reference section
+    only if it precedes the last `startxref` keyword.
+
+    :param test_data: Raw PDF data.
+    :param test_xref_offset: Expected offset of the last cross-reference section, if any.
+    """
+
+    assert _find_start_xref(test_data) == test_xref_offset
@@ -0,0 +1,141 @@
+"""Tests for `_find_xref_entry`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import mark, raises
+from unlock_pdf.functions import _find_xref_entry
+from unlock_pdf.types import PdfDictionary
+
+XREF_TABLE_DATA = b"xref\n" \
+    b"0 1\n" \
+    b"0000000000 65535 f \n" \
+    b"3 2\r\n" \
+    b"0000000010 00000 n\r\n" \
+    b"0000000020 00000 n \n" \
+    b"trailer\n"
+
+XREF_STREAM_DATA = b" stream\n" \
+    b"\x01\x00\x0a\x00" \
+    b"\x02\x00\x05\x01"
+
+XREF_STREAM_TRAILER: PdfDictionary = {
+    "/Type": "/XRef",
+    "/Index": [3, 2],
+    "/Length": 8,
+    "/W": [1, 2, 1]
+}
+
+@mark.parametrize(
+    "test_data, test_trailer, test_object_number," \
+    "test_object_offset",
+    [
+        (
+            XREF_TABLE_DATA, {}, 3,
+            10
+        ),
+        (
+            XREF_TABLE_DATA, {}, 4,
+            20
+        ),
+        (
+            XREF_TABLE_DATA, {}, 5,
+            None
+        ),
+        (
+            XREF_STREAM_DATA, XREF_STREAM_TRAILER, 3,
+            10
+        ),
+        (
+            XREF_STREAM_DATA, XREF_STREAM_TRAILER, 1,
+            None
+        ),
+        (
+            XREF_STREAM_DATA, {**XREF_STREAM_TRAILER, "/W": [0, 2, 1], "/Length": 3}, 3,
+            256
+        ),
+        (
+            XREF_STREAM_DATA, {**XREF_STREAM_TRAILER, "/Index": [0, 5], "/Size": 5}, 0,
+            10
+        )
+    ]
+)
+def test_find_xref_entry_returns_object_offset(
+    test_data: bytes,
+    test_object_number: int,
+    test_object_offset: int | None,
+    test_trailer: PdfDictionary
+) -> None:
+    """
+    Assert that `_find_xref_entry`
+    returns the offset of an uncompressed indirect object
+    for both cross-reference tables and cross-reference streams,
+    or `None` if it is not in the cross-reference section.
+
+    :param test_data: Raw PDF data.
+    :param test_object_number: Object number of the indirect object.
+    :param test_object_offset: Expected offset of the indirect object, if any.
+    :param test_trailer: Trailer dictionary of the cross-reference section.
+    """
+
+    assert _find_xref_entry(
+        data = test_data,
+        object_number = test_object_number,
+        offset = 4 if test_data == XREF_TABLE_DATA else 0,
+        trailer = test_trailer
+    ) == test_object_offset
+
+@mark.parametrize(
+    "test_data, test_trailer, test_object_number",
+    [
+        (
+            XREF_TABLE_DATA, {}, 0
+        ),
+        (
+            b"xref\n0 1\n0000000000 65535", {}, 0
+        ),
+        (
+            XREF_STREAM_DATA, XREF_STREAM_TRAILER, 4
+        ),
+        (
+            XREF_STREAM_DATA, {**XREF_STREAM_TRAILER, "/Index": [3, 3]}, 5
+        ),
+        (
+            XREF_STREAM_DATA, {**XREF_STREAM_TRAILER, "/W": [1, 2]}, 3
+        ),
+        (
+            XREF_STREAM_DATA, {**XREF_STREAM_TRAILER, "/W": [1, 2, 1.0]}, 3
+        ),
+        (
+            XREF_STREAM_DATA, {**XREF_STREAM_TRAILER, "/Index": None}, 3
+        ),
+        (
+            XREF_STREAM_DATA, {"/Type": "/XRef", "/Length": 8, "/W": [1, 2, 1]}, 3
+        )
+    ]
+)
+def test_find_xref_entry_raises_exception(
+    test_data: bytes,
+    test_object_number: int,
+    test_trailer: PdfDictionary
+) -> None:
+    """
+    Assert that `_find_xref_entry`
+    raises an appropriate exception
+    when the cross-reference section is malformed
+    or when the indirect object is either free or compressed.
+
+    :param test_data: Raw PDF data.
+    :param test_object_number: Object number of the indirect object.
+    :param test_trailer: Trailer dictionary of the cross-reference section.
+    """
+
+    with raises(
+        expected_exception = ValueError,
+        match = "PDF object must be well-formed."
+    ):
+        _find_xref_entry(
+            data = test_data,
+            object_number = test_object_number,
+            offset = 4 if test_data.startswith(b"xref") else 0,
+            trailer = test_trailer
+        )
@@ -0,0 +1,220 @@
+"""Tests for `_generate_budgeted_unlock_results`."""
+
+# pyright: reportPrivateUsage=false
+
+from collections.abc import Callable
+from concurrent.futures import Future
+from pathlib import Path
+from pytest import MonkeyPatch, mark
+from tests.utilities import generate_test_pdf_file
+from types import TracebackType
+from unlock_pdf.classes import FingerprintPasswords, MemoryFootprints
+from unlock_pdf.enumerations import FileState, SaveProfile
+from unlock_pdf.functions import _generate_budgeted_unlock_results
+from unlock_pdf.types import UnlockResult
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+def test_generate_budgeted_unlock_results_keeps_order(tmp_path: Path) -> None:
+    """
+    Assert that `_generate_budgeted_unlock_results`
+    unlocks PDF files across worker processes
+    and generates their results in the same order as their file paths.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_passwords = [None, "password", "password-0", "password"]
+    test_file_paths = [
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / f"test-{index}.pdf",
+                test_password = test_password
+            )
+        )
+        for index, test_password in enumerate(test_passwords)
+    ]
+    test_fingerprint_passwords = FingerprintPasswords(["password"])
+
+    assert list(
+        _generate_budgeted_unlock_results(
+            fingerprint_passwords = test_fingerprint_passwords,
+            job_count = 2,
+            memory_budget = 1 << 30,
+            output_dir = None,
+            passwords = ["password"],
+            pdf_file_paths = iter(test_file_paths),
+            save_profile = SaveProfile.FAST
+        )
+    ) == [
+        UnlockResult(test_file_paths[0], FileState.NOT_LOCKED),
+        UnlockResult(test_file_paths[1], FileState.UNLOCKED, "password", 1),
+        UnlockResult(test_file_paths[2], FileState.LOCKED),
+        UnlockResult(test_file_paths[3], FileState.UNLOCKED, "password", 1)
+    ]
+
+@mark.parametrize("test_should_preserve_order", [True, False])
+def test_generate_budgeted_unlock_results_admits_pdf_files_within_budget(
+    monkeypatch: MonkeyPatch,
+    test_should_preserve_order: bool
+) -> None:
+    """
+    Assert that `_generate_budgeted_unlock_results`
+    only admits a PDF file while the estimated memory footprints of the pending ones fit in the budget,
+    unlocks a PDF file estimated to take more than the whole budget alone,
+    and feeds the measured peak memory usage back into the estimates.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param test_should_preserve_order: Whether to generate results in the same order as their file paths or not.
+    """
+
+    # <NOTE>
+    # With the initial ratio of 4, `test-3.pdf` and `test-4.pdf` would take 16 MiB together,
+    # whereas they only take 8 MiB together once the ratio of 2 measured so far is fed back.
+    test_file_sizes = {
+        "test-0.pdf": 1 << 20,
+        "test-1.pdf": 1 << 20,
+        "test-2.pdf": 5 << 20,
+        "test-3.pdf": 1 << 20,
+        "test-4.pdf": 3 << 20
+    }
+    events: list[tuple[str, str]] = []
+    measured_file_sizes: list[int] = []
+    test_measure = MemoryFootprints.measure
+
+    def _mock_measure(self: MemoryFootprints, size: int, peak_memory_usage: int) -> None:
+        """
+        Mock method of `unlock_pdf.classes.MemoryFootprints.measure` that
+        records the size of every measured PDF file before measuring it.
+
+        :param self: Estimates of the memory footprints of PDF files.
+        :param size: Size of the PDF file in bytes.
+        :param peak_memory_usage: Peak memory usage that unlocking the PDF file took in bytes.
+        """
+
+        measured_file_sizes.append(size)
+        test_measure(self, size, peak_memory_usage)
+
+    class _TestExecutor:
+        """Mock class of `concurrent.futures.ProcessPoolExecutor` that runs every task as soon as it is submitted."""
+
+        def __init__(
+            self,
+            initargs: tuple[list[str]],
+            initializer: Callable[[list[str]], None],
+            max_workers: int
+        ) -> None:
+            """
+            Initialize a mock executor.
+
+            :param initargs: Arguments to initialize each worker process with.
+            :param initializer: Function to initialize each worker process with.
+            :param max_workers: Number of worker processes.
+            """
+
+            assert initargs == (["password"],)
+            assert max_workers == 3
+
+        def __enter__(self) -> "_TestExecutor":
+            """
+            Enter the mock executor.
+
+            :returns: Mock executor.
+            """
+
+            return self
+
+        def __exit__(
+            self,
+            exception_type: type[BaseException] | None,
+            exception: BaseException | None,
+            traceback: TracebackType | None
+        ) -> None:
+            """
+            Exit the mock executor.
+
+            :param exception_type: Type of the exception raised, if any.
+            :param exception: Exception raised, if any.
+            :param traceback: Traceback of the exception raised, if any.
+            """
+
+        def submit(
+            self,
+            function: Callable[..., tuple[UnlockResult, int | None]],
+            file_path: str,
+            *arguments: object
+        ) -> Future[tuple[UnlockResult, int | None]]:
+            """
+            Run a task as soon as it is submitted.
+
+            :param function: Function to run.
+            :param file_path: Sanitized file path of the PDF file to unlock.
+            :param arguments: Other arguments to run the function with.
+            :returns: Result of the task.
+            """
+
+            events.append(("submit", file_path))
+
+            future: Future[tuple[UnlockResult, int | None]] = Future()
+            future.set_result(function(file_path, *arguments))
+
+            return future
+
+    monkeypatch.setattr(
+        name = "ProcessPoolExecutor",
+        target = target,
+        value = _TestExecutor
+    )
+    monkeypatch.setattr(
+        name = "_get_file_size",
+        target = target,
+        value = lambda file_path: test_file_sizes[file_path]
+    )
+    monkeypatch.setattr(
+        name = "measure",
+        target = MemoryFootprints,
+        value = _mock_measure
+    )
+    monkeypatch.setattr(
+        name = "_get_measured_unlock_result",
+        target = target,
+        value = lambda file_path, passwords, save_profile, output_dir: (
+            UnlockResult(file_path, FileState.NOT_LOCKED),
+            test_file_sizes[file_path] * 2
+        )
+    )
+
+    for unlock_result in _generate_budgeted_unlock_results(
+        fingerprint_passwords = FingerprintPasswords(["password"]),
+        job_count = 3,
+        memory_budget = 10 << 20,
+        output_dir = None,
+        passwords = ["password"],
+        pdf_file_paths = iter(test_file_sizes),
+        save_profile = SaveProfile.FAST,
+        should_preserve_order = test_should_preserve_order
+    ):
+        events.append(("yield", unlock_result.file_path))
+
+    assert events == [
+        ("submit", "test-0.pdf"),
+        ("submit", "test-1.pdf"),
+        ("yield", "test-0.pdf"),
+        ("yield", "test-1.pdf"),
+        ("submit", "test-2.pdf"),
+        ("yield", "test-2.pdf"),
+        ("submit", "test-3.pdf"),
+        ("submit", "test-4.pdf"),
+        ("yield", "test-3.pdf"),
+        ("yield", "test-4.pdf")
+    ]
+
+    # <NOTE>
+    # PDF files whose results are only generated once every PDF file was admitted are measured too.
+    assert sorted(measured_file_sizes) == sorted(test_file_sizes.values())
@@ -0,0 +1,224 @@
+"""Tests for `_generate_isolated_unlock_results`."""
+
+# pyright: reportPrivateUsage=false
+
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+from pathlib import Path
+from pytest import MonkeyPatch, mark
+from tests.utilities import generate_test_pdf_file
+from threading import Event, Thread
+from typing import override
+from unlock_pdf.classes import FingerprintPasswords
+from unlock_pdf.enumerations import FileState, SaveProfile
+from unlock_pdf.functions import _generate_isolated_unlock_results
+from unlock_pdf.types import IsolatedWorker, UnlockResult
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+class _TestProcess(Process):
+    """
+    Mock class of an isolated worker process that runs in a thread instead,
+    which hangs on `hang.pdf`, exits on `exit.pdf`, runs out of memory on `balloon.pdf`,
+    and finds any other PDF file not locked.
+    """
+
+    def __init__(self, connection: Connection) -> None:
+        """
+        Initialize and start a mock isolated worker process.
+
+        :param connection: Connection to receive PDF files to unlock from and to send their results to.
+        """
+
+        super().__init__()
+
+        self._connection = connection
+        self._is_killed = Event()
+        self._thread = Thread(
+            daemon = True,
+            target = self._serve
+        )
+
+        self._thread.start()
+
+    def _serve(self) -> None:
+        """Unlock every received PDF file until killed or until its connection is closed."""
+
+        try:
+            while not self._is_killed.is_set():
+                # <NOTE>
+                # Polling instead of blocking on receiving lets the thread notice being killed.
+                if not self._connection.poll(0.01):
+                    continue
+
+                try:
+                    file_path, _, _, _ = self._connection.recv()
+                except EOFError:
+                    return
+
+                if file_path == "hang.pdf":
+                    self._is_killed.wait()
+                elif file_path == "exit.pdf":
+                    return
+                elif file_path == "balloon.pdf":
+                    self._connection.send(UnlockResult(file_path, FileState.ABORTED, error = "MemoryError"))
+                else:
+                    self._connection.send(UnlockResult(file_path, FileState.NOT_LOCKED))
+        finally:
+            self._connection.close()
+
+    @override
+    def join(self, timeout: float | None = None) -> None:
+        """
+        Join the thread of the mock isolated worker process.
+
+        :param timeout: Maximum seconds to wait for the mock isolated worker process to end, if any.
+        """
+
+        self._thread.join(timeout)
+
+    @override
+    def kill(self) -> None:
+        """Kill the mock isolated worker process."""
+
+        self._is_killed.set()
+
+def test_generate_isolated_unlock_results_keeps_order(tmp_path: Path) -> None:
+    """
+    Assert that `_generate_isolated_unlock_results`
+    unlocks PDF files across isolated worker processes within the limits
+    and generates their results in the same order as their file paths.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_passwords = [None, "password", "password-0", "password"]
+    test_file_paths = [
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / f"test-{index}.pdf",
+                test_password = test_password
+            )
+        )
+        for index, test_password in enumerate(test_passwords)
+    ]
+
+    assert list(
+        _generate_isolated_unlock_results(
+            fingerprint_passwords = FingerprintPasswords(["password"]),
+            job_count = 2,
+            memory_limit = 1 << 40,
+            output_dir = None,
+            passwords = ["password"],
+            pdf_file_paths = iter(test_file_paths),
+            save_profile = SaveProfile.FAST,
+            timeout = 60.0
+        )
+    ) == [
+        UnlockResult(test_file_paths[0], FileState.NOT_LOCKED),
+        UnlockResult(test_file_paths[1], FileState.UNLOCKED, "password", 1),
+        UnlockResult(test_file_paths[2], FileState.LOCKED),
+        UnlockResult(test_file_paths[3], FileState.UNLOCKED, "password", 1)
+    ]
+
+@mark.parametrize("test_should_preserve_order", [True, False])
+def test_generate_isolated_unlock_results_aborts_pathological_pdf_files(
+    monkeypatch: MonkeyPatch,
+    test_should_preserve_order: bool
+) -> None:
+    """
+    Assert that `_generate_isolated_unlock_results`
+    aborts a PDF file that goes over the timeout, that runs out of memory,
+    or whose worker process exits while unlocking it,
+    and replaces its worker process while still unlocking the other PDF files.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param test_should_preserve_order: Whether to generate results in the same order as their file paths or not.
+    """
+
+    test_file_paths = ["test-0.pdf", "hang.pdf", "exit.pdf", "balloon.pdf", "test-1.pdf"]
+    test_workers: list[IsolatedWorker] = []
+
+    def _mock_start_isolated_worker(memory_limit: int | None, passwords: list[str]) -> IsolatedWorker:
+        """
+        Mock function of `unlock_pdf.functions._start_isolated_worker` that
+        starts a mock isolated worker process in a thread.
+
+        :param memory_limit: Maximum address space of the worker process in bytes, if any.
+        :param passwords: Passwords to attempt unlocking each PDF file with.
+        :returns: Mock isolated worker process along with the connection to it.
+        """
+
+        assert memory_limit is None
+        assert passwords == ["password"]
+
+        connection, worker_connection = Pipe()
+        test_worker = IsolatedWorker(
+            connection = connection,
+            process = _TestProcess(worker_connection)
+        )
+
+        test_workers.append(test_worker)
+
+        return test_worker
+
+    removed_file_paths: list[str] = []
+
+    monkeypatch.setattr(
+        name = "_start_isolated_worker",
+        target = target,
+        value = _mock_start_isolated_worker
+    )
+    monkeypatch.setattr(
+        name = "_remove_temporary_files",
+        target = target,
+        value = lambda file_path, output_dir: removed_file_paths.append(file_path)
+    )
+
+    unlock_results = list(
+        _generate_isolated_unlock_results(
+            fingerprint_passwords = FingerprintPasswords(["password"]),
+            job_count = 2,
+            memory_limit = None,
+            output_dir = None,
+            passwords = ["password"],
+            pdf_file_paths = iter(test_file_paths),
+            save_profile = SaveProfile.FAST,
+            should_preserve_order = test_should_preserve_order,
+            timeout = 0.2
+        )
+    )
+    test_unlock_results = [
+        UnlockResult("test-0.pdf", FileState.NOT_LOCKED),
+        UnlockResult(
+            "hang.pdf",
+            FileState.ABORTED,
+            error = "TimeoutError: Unlocking took longer than 0.2 s."
+        ),
+        UnlockResult(
+            "exit.pdf",
+            FileState.ABORTED,
+            error = "ChildProcessError: Worker process exited while unlocking."
+        ),
+        UnlockResult("balloon.pdf", FileState.ABORTED, error = "MemoryError"),
+        UnlockResult("test-1.pdf", FileState.NOT_LOCKED)
+    ]
+
+    if test_should_preserve_order:
+        assert unlock_results == test_unlock_results
+    else:
+        assert sorted(unlock_results) == sorted(test_unlock_results)
+
+    # <NOTE>
+    # Every aborted PDF file has its worker process replaced,
+    # and every worker process is stopped once done.
+    assert len(test_workers) == 2 + 3
+    assert all(test_worker.connection.closed for test_worker in test_workers)
+    assert not any(test_worker.process._thread.is_alive() for test_worker in test_workers) # type: ignore
+    assert sorted(removed_file_paths) == ["balloon.pdf", "exit.pdf", "hang.pdf"]
@@ -0,0 +1,82 @@
+"""Tests for `_generate_mapped_input_batches`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import MonkeyPatch, mark
+from unlock_pdf.enumerations import InputSeparator
+from unlock_pdf.functions import _generate_mapped_input_batches
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+class _MockByteCount:
+    """Mock enumeration of byte count constants with tiny batches."""
+
+    INPUT_BATCH = 8
+
+@mark.parametrize(
+    "test_content, test_separator," \
+    "test_batches",
+    [
+        (
+            b"", InputSeparator.NEWLINE,
+            []
+        ),
+        (
+            b"in-0\nin-1\n\nin-2", InputSeparator.NEWLINE,
+            [["in-0"], ["in-1"], ["in-2"]]
+        ),
+        (
+            b"in-0\r\n\r\nin-1\r\n", InputSeparator.NEWLINE,
+            [["in-0"], ["in-1"]]
+        ),
+        (
+            b"long-input-0\nin-1\nin-2", InputSeparator.NEWLINE,
+            [["long-input-0"], ["in-1"], ["in-2"]]
+        ),
+        (
+            b"long-input-0", InputSeparator.NEWLINE,
+            [["long-input-0"]]
+        ),
+        (
+            b"in\n0\0in\r1\0", InputSeparator.NULL,
+            [["in\n0"], ["in\r1"]]
+        )
+    ]
+)
+def test_generate_mapped_input_batches_generates_batches(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    test_batches: list[list[str]],
+    test_content: bytes,
+    test_separator: InputSeparator
+) -> None:
+    """
+    Assert that `_generate_mapped_input_batches`
+    generates the non-empty inputs of a file in batches
+    without ever splitting an input between batches.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_batches: Expected batches of inputs.
+    :param test_content: Mock content of the file.
+    :param test_separator: Separator between inputs.
+    """
+
+    monkeypatch.setattr(
+        name = "ByteCount",
+        target = target,
+        value = _MockByteCount
+    )
+
+    (tmp_path / "inputs.txt").write_bytes(test_content)
+
+    assert list(
+        _generate_mapped_input_batches(str(tmp_path / "inputs.txt"), test_separator)
+    ) == test_batches
@@ -0,0 +1,73 @@
+"""Tests for `_generate_pdf_file_paths`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import MonkeyPatch, mark
+from unlock_pdf.functions import _generate_pdf_file_paths
+from unlock_pdf.types import FileIdentity, Paths
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+@mark.parametrize(
+    "test_paths, test_pdf_file_subpaths," \
+    "test_pdf_file_paths",
+    [
+        (
+            [], {},
+            []
+        ),
+        (
+            ['"test-directory"'], {"test-directory": []},
+            []
+        ),
+        (
+            ["test-directory", "test-directory/test-0.pdf"],
+            {
+                "test-directory": [("test-directory/test-0.pdf", None), ("test-directory/test-1.pdf", None)],
+                "test-directory/test-0.pdf": [("test-directory/test-0.pdf", None)]
+            },
+            ["test-directory/test-0.pdf", "test-directory/test-1.pdf"]
+        ),
+        (
+            ["test-directory"],
+            {
+                "test-directory": [("test-directory/test-0.pdf", (1, 2)), ("test-directory/test-1.pdf", (1, 2))]
+            },
+            ["test-directory/test-0.pdf"]
+        )
+    ]
+)
+def test_generate_pdf_file_paths_yields_unique_pdf_file_paths(
+    monkeypatch: MonkeyPatch,
+    test_paths: Paths,
+    test_pdf_file_paths: Paths,
+    test_pdf_file_subpaths: dict[str, list[tuple[str, FileIdentity | None]]]
+) -> None:
+    """
+    Assert that `_generate_pdf_file_paths`
+    yields every unique path of the PDF files to unlock
+    in discovery order
+    when given valid paths.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param test_paths: Mock ordered list of unique paths.
+    :param test_pdf_file_paths: Ordered list of unique paths of all PDF files to unlock.
+    :param test_pdf_file_subpaths: Mock paths of some PDF files to unlock,
+                                   along with their identities if known, per sanitized path.
+    """
+
+    monkeypatch.setattr(
+        name = "_get_pdf_file_subpaths",
+        target = target,
+        value = lambda path, directory_manifest: iter(test_pdf_file_subpaths[path])
+    )
+
+    assert list(
+        _generate_pdf_file_paths(test_paths)
+    ) == test_pdf_file_paths
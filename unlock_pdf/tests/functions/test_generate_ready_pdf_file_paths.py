@@ -0,0 +1,183 @@
+"""Tests for `_generate_ready_pdf_file_paths`."""
+
+# pyright: reportPrivateUsage=false
+
+from os import utime
+from pathlib import Path
+from pytest import MonkeyPatch, mark
+from sys import platform
+from unlock_pdf.functions import _generate_ready_pdf_file_paths, _get_file_signature
+from unlock_pdf.types import UnlockedFileSignatures
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+def test_generate_ready_pdf_file_paths_debounces_pdf_files(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path
+) -> None:
+    """
+    Assert that `_generate_ready_pdf_file_paths`
+    only generates the path of a PDF file once its signature has not changed for a while
+    and differs from the one it had when it was last unlocked,
+    while skipping PDF files that are being unlocked or vanished,
+    by walking directories periodically when inotify is not supported.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_time = 0.0
+    test_unlocked_file_signatures: UnlockedFileSignatures = {}
+
+    monkeypatch.setattr(
+        name = "_open_inotify",
+        target = target,
+        value = lambda: None
+    )
+    monkeypatch.setattr(
+        name = "monotonic",
+        target = target,
+        value = lambda: test_time
+    )
+    monkeypatch.setattr(
+        name = "sleep",
+        target = target,
+        value = lambda seconds: None
+    )
+
+    (tmp_path / "test-0.pdf").write_bytes(b"%PDF-1.7")
+    (tmp_path / "test-1.pdf").write_bytes(b"%PDF-1.7")
+
+    test_ready_pdf_file_paths = _generate_ready_pdf_file_paths(
+        [str(tmp_path)],
+        test_unlocked_file_signatures
+    )
+
+    assert next(test_ready_pdf_file_paths) == []
+
+    (tmp_path / "test-1.pdf").unlink()
+    test_time = 1.0
+
+    assert next(test_ready_pdf_file_paths) == [str(tmp_path / "test-0.pdf")]
+    assert test_unlocked_file_signatures[str(tmp_path / "test-0.pdf")] is None
+
+    test_time = 2.0
+
+    assert next(test_ready_pdf_file_paths) == []
+
+    test_unlocked_file_signatures[str(tmp_path / "test-0.pdf")] = _get_file_signature(
+        str(tmp_path / "test-0.pdf")
+    )
+
+    assert next(test_ready_pdf_file_paths) == []
+
+    utime(tmp_path / "test-0.pdf", ns = (0, 0))
+
+    assert next(test_ready_pdf_file_paths) == []
+
+    test_time = 3.0
+
+    assert next(test_ready_pdf_file_paths) == [str(tmp_path / "test-0.pdf")]
+
+    test_ready_pdf_file_paths.close()
+
+@mark.skipif(
+    platform != "linux",
+    reason = "inotify is only supported on Linux."
+)
+def test_generate_ready_pdf_file_paths_watches_directories(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path
+) -> None:
+    """
+    Assert that `_generate_ready_pdf_file_paths`
+    generates the paths of PDF files that are written in watched directories via inotify,
+    while skipping files of other types for as long as they do not change.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_time = 0.0
+    test_unlocked_file_signatures: UnlockedFileSignatures = {}
+
+    monkeypatch.setattr(
+        name = "monotonic",
+        target = target,
+        value = lambda: test_time
+    )
+
+    test_ready_pdf_file_paths = _generate_ready_pdf_file_paths(
+        [str(tmp_path)],
+        test_unlocked_file_signatures
+    )
+
+    assert next(test_ready_pdf_file_paths) == []
+
+    (tmp_path / "test.pdf").write_bytes(b"%PDF-1.7")
+    (tmp_path / "test.txt").write_bytes(b"%PDF-1.7")
+
+    assert next(test_ready_pdf_file_paths) == []
+
+    test_time = 1.0
+
+    assert next(test_ready_pdf_file_paths) == [str(tmp_path / "test.pdf")]
+    assert test_unlocked_file_signatures[str(tmp_path / "test.txt")] == _get_file_signature(
+        str(tmp_path / "test.txt")
+    )
+
+    test_ready_pdf_file_paths.close()
+
+def test_generate_ready_pdf_file_paths_sniffs_pdf_file_signatures(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path
+) -> None:
+    """
+    Assert that `_generate_ready_pdf_file_paths`
+    skips PDF files that do not start with the PDF file signature
+    when asked to sniff them.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_time = 0.0
+
+    monkeypatch.setattr(
+        name = "_open_inotify",
+        target = target,
+        value = lambda: None
+    )
+    monkeypatch.setattr(
+        name = "monotonic",
+        target = target,
+        value = lambda: test_time
+    )
+    monkeypatch.setattr(
+        name = "sleep",
+        target = target,
+        value = lambda seconds: None
+    )
+
+    (tmp_path / "misnamed-test.pdf").write_bytes(b"test")
+    (tmp_path / "test.pdf").write_bytes(b"%PDF-1.7")
+
+    test_ready_pdf_file_paths = _generate_ready_pdf_file_paths(
+        [str(tmp_path)],
+        {},
+        True
+    )
+
+    assert next(test_ready_pdf_file_paths) == []
+
+    test_time = 1.0
+
+    assert next(test_ready_pdf_file_paths) == [str(tmp_path / "test.pdf")]
+
+    test_ready_pdf_file_paths.close()
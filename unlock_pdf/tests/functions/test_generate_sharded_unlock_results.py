@@ -0,0 +1,131 @@
+"""Tests for `_generate_sharded_unlock_results`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pikepdf import Pdf
+from pytest import mark
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.classes import FingerprintPasswords
+from unlock_pdf.enumerations import FileState, SaveProfile
+from unlock_pdf.functions import _generate_sharded_unlock_results
+from unlock_pdf.types import UnlockResult
+
+@mark.parametrize("test_revision", [4, 6])
+def test_generate_sharded_unlock_results_keeps_order(tmp_path: Path, test_revision: int) -> None:
+    """
+    Assert that `_generate_sharded_unlock_results`
+    unlocks PDF files one at a time with their passwords sharded across worker processes,
+    attempting the password that unlocked the latest PDF file first,
+    and generates their results in the same order as their file paths.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_revision: Revision of the standard security handler.
+    """
+
+    test_pdf_passwords = [None, "", "password-9", "password-2", "unknown"]
+    test_file_paths = [
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / f"test-{index}.pdf",
+                test_password = test_pdf_password,
+                test_revision = test_revision
+            )
+        )
+        for index, test_pdf_password in enumerate(test_pdf_passwords)
+    ]
+
+    test_attempted_passwords = [f"password-{index}" for index in range(10)]
+
+    assert list(
+        _generate_sharded_unlock_results(
+            fingerprint_passwords = FingerprintPasswords(test_attempted_passwords),
+            output_dir = None,
+            job_count = 2,
+            passwords = test_attempted_passwords,
+            pdf_file_paths = iter(test_file_paths),
+            save_profile = SaveProfile.FAST
+        )
+    ) == [
+        UnlockResult(test_file_paths[0], FileState.NOT_LOCKED),
+        UnlockResult(test_file_paths[1], FileState.NOT_LOCKED),
+        UnlockResult(test_file_paths[2], FileState.UNLOCKED, "password-9", 10),
+        UnlockResult(test_file_paths[3], FileState.UNLOCKED, "password-2", 4),
+        UnlockResult(test_file_paths[4], FileState.LOCKED)
+    ]
+
+    with Pdf.open(test_file_paths[2]) as test_pdf:
+        assert not test_pdf.is_encrypted
+
+def test_generate_sharded_unlock_results_uses_first_password_in_order(tmp_path: Path) -> None:
+    """
+    Assert that `_generate_sharded_unlock_results`
+    unlocks a PDF file with the first password in order that opens it
+    even if a later shard also finds one.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_path = str(
+        generate_test_pdf_file(
+            file_path = tmp_path / "test.pdf",
+            test_owner_password = "password-7",
+            test_password = "password-1"
+        )
+    )
+
+    test_attempted_passwords = [f"password-{index}" for index in range(10)]
+
+    assert list(
+        _generate_sharded_unlock_results(
+            fingerprint_passwords = FingerprintPasswords(test_attempted_passwords),
+            output_dir = None,
+            job_count = 2,
+            passwords = test_attempted_passwords,
+            pdf_file_paths = [test_file_path],
+            save_profile = SaveProfile.FAST
+        )
+    ) == [UnlockResult(test_file_path, FileState.UNLOCKED, "password-1", 2)]
+
+def test_generate_sharded_unlock_results_isolates_failures(tmp_path: Path) -> None:
+    """
+    Assert that `_generate_sharded_unlock_results`
+    generates a PDF file that fails to be checked as failed along with its error
+    and keeps unlocking the others.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "test-0.pdf").write_bytes(b"%PDF-1.7\n")
+
+    test_file_paths = [
+        str(tmp_path / "test-0.pdf"),
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / "test-1.pdf",
+                test_password = "password-1"
+            )
+        )
+    ]
+
+    test_attempted_passwords = [f"password-{index}" for index in range(2)]
+    test_unlock_results = list(
+        _generate_sharded_unlock_results(
+            fingerprint_passwords = FingerprintPasswords(test_attempted_passwords),
+            output_dir = None,
+            job_count = 2,
+            passwords = test_attempted_passwords,
+            pdf_file_paths = test_file_paths,
+            save_profile = SaveProfile.FAST
+        )
+    )
+
+    assert test_unlock_results[0].file_state == FileState.FAILED
+    assert test_unlock_results[0].error is not None
+    assert test_unlock_results[0].error.startswith("PdfError: ")
+    assert test_unlock_results[1] == UnlockResult(
+        test_file_paths[1],
+        FileState.UNLOCKED,
+        "password-1",
+        2
+    )
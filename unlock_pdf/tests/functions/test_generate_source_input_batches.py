@@ -0,0 +1,183 @@
+"""Tests for `_generate_source_input_batches`."""
+
+# pyright: reportPrivateUsage=false
+
+from io import StringIO
+from itertools import chain
+from os import O_RDONLY
+from os import open as open_file
+from pathlib import Path
+from pytest import (
+    MonkeyPatch,
+    mark,
+    raises
+)
+from unlock_pdf.enumerations import InputSeparator
+from unlock_pdf.functions import _generate_source_input_batches
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+@mark.parametrize(
+    "test_content, test_separator, test_inputs",
+    [
+        ("", InputSeparator.NEWLINE, []),
+        ("input-0\n\ninput-1\n", InputSeparator.NEWLINE, ["input-0", "input-1"]),
+        ("input-0\r\ninput-1", InputSeparator.NEWLINE, ["input-0", "input-1"]),
+        ("input\n0\0input-1\0", InputSeparator.NULL, ["input\n0", "input-1"])
+    ]
+)
+def test_generate_source_input_batches_reads_file(
+    tmp_path: Path,
+    test_content: str,
+    test_inputs: list[str],
+    test_separator: InputSeparator
+) -> None:
+    """
+    Assert that `_generate_source_input_batches`
+    generates the non-empty inputs of a file in batches
+    separated by either newlines or NUL characters.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_content: Mock content of the file.
+    :param test_inputs: Expected inputs.
+    :param test_separator: Separator between inputs.
+    """
+
+    (tmp_path / "inputs.txt").write_bytes(test_content.encode())
+
+    assert list(
+        chain.from_iterable(
+            _generate_source_input_batches(str(tmp_path / "inputs.txt"), test_separator)
+        )
+    ) == test_inputs
+
+def test_generate_source_input_batches_reads_in_chunks(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Assert that `_generate_source_input_batches`
+    generates inputs that straddle chunks whole.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    class _MockCharacterCount:
+        """Mock enumeration of character count constants with tiny chunks."""
+
+        INPUT_CHUNK = 3
+
+    monkeypatch.setattr(
+        name = "CharacterCount",
+        target = target,
+        value = _MockCharacterCount
+    )
+
+    (tmp_path / "inputs.txt").write_text("input-0\ninput-1", encoding = "utf-8")
+
+    test_file_descriptor = open_file(tmp_path / "inputs.txt", O_RDONLY)
+
+    assert list(
+        chain.from_iterable(
+            _generate_source_input_batches(f"fd:{test_file_descriptor}", InputSeparator.NEWLINE)
+        )
+    ) == ["input-0", "input-1"]
+
+def test_generate_source_input_batches_reads_standard_input(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_generate_source_input_batches`
+    generates the inputs of standard input.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    monkeypatch.setattr(
+        name = "stdin",
+        target = target,
+        value = StringIO("input-0\ninput-1\n")
+    )
+
+    assert list(
+        chain.from_iterable(
+            _generate_source_input_batches("-", InputSeparator.NEWLINE)
+        )
+    ) == ["input-0", "input-1"]
+
+@mark.parametrize(
+    "test_value, test_inputs",
+    [
+        (None, []),
+        ("input-0\n\ninput-1", ["input-0", "input-1"])
+    ]
+)
+def test_generate_source_input_batches_reads_environment_variable(
+    monkeypatch: MonkeyPatch,
+    test_inputs: list[str],
+    test_value: str | None
+) -> None:
+    """
+    Assert that `_generate_source_input_batches`
+    generates the inputs of an environment variable, if it is set.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param test_inputs: Expected inputs.
+    :param test_value: Mock value of the environment variable, if any.
+    """
+
+    if test_value is None:
+        monkeypatch.delenv("TEST_INPUTS", raising = False)
+    else:
+        monkeypatch.setenv("TEST_INPUTS", test_value)
+
+    assert list(
+        chain.from_iterable(
+            _generate_source_input_batches("env:TEST_INPUTS", InputSeparator.NEWLINE)
+        )
+    ) == test_inputs
+
+def test_generate_source_input_batches_reads_file_descriptor(tmp_path: Path) -> None:
+    """
+    Assert that `_generate_source_input_batches`
+    generates the inputs of a file descriptor.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "inputs.txt").write_text("input-0\ninput-1\n", encoding = "utf-8")
+
+    test_file_descriptor = open_file(tmp_path / "inputs.txt", O_RDONLY)
+
+    assert list(
+        chain.from_iterable(
+            _generate_source_input_batches(f"fd:{test_file_descriptor}", InputSeparator.NEWLINE)
+        )
+    ) == ["input-0", "input-1"]
+
+@mark.parametrize(
+    "test_source, test_exception",
+    [
+        ("missing-inputs.txt", OSError),
+        ("fd:zero", ValueError)
+    ]
+)
+def test_generate_source_input_batches_raises_exception(
+    test_exception: type[Exception],
+    test_source: str
+) -> None:
+    """
+    Assert that `_generate_source_input_batches`
+    raises an appropriate exception
+    when the input source cannot be read or is invalid.
+
+    :param test_exception: Expected exception.
+    :param test_source: Mock input source.
+    """
+
+    with raises(test_exception):
+        list(
+            _generate_source_input_batches(test_source, InputSeparator.NEWLINE)
+        )
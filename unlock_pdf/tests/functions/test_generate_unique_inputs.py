@@ -0,0 +1,30 @@
+"""Tests for `_generate_unique_inputs`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import mark
+from unlock_pdf.functions import _generate_unique_inputs
+
+@mark.parametrize(
+    "test_inputs, test_unique_inputs",
+    [
+        ([], []),
+        (["input"], ["input"]),
+        (["input-1", "input-0", "input-1", "input-0"], ["input-1", "input-0"])
+    ]
+)
+def test_generate_unique_inputs_ignores_duplicates(
+    test_inputs: list[str],
+    test_unique_inputs: list[str]
+) -> None:
+    """
+    Assert that `_generate_unique_inputs`
+    generates unique inputs in the order they were first given.
+
+    :param test_inputs: Mock inputs, which may be duplicated.
+    :param test_unique_inputs: Expected unique inputs.
+    """
+
+    assert list(
+        _generate_unique_inputs(iter(test_inputs))
+    ) == test_unique_inputs
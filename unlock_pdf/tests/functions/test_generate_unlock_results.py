@@ -0,0 +1,198 @@
+"""Tests for `_generate_unlock_results`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pikepdf import Pdf
+from pytest import mark
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.classes import FingerprintPasswords
+from unlock_pdf.enumerations import FileState, SaveProfile
+from unlock_pdf.functions import _generate_unlock_results, _read_encryption_fingerprint
+from unlock_pdf.types import UnlockResult
+
+@mark.parametrize("test_job_count", [1, 2])
+def test_generate_unlock_results_keeps_order(tmp_path: Path, test_job_count: int) -> None:
+    """
+    Assert that `_generate_unlock_results`
+    unlocks PDF files either in this process or across worker processes
+    and generates their results in the same order as their file paths.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_job_count: Number of worker processes.
+    """
+
+    test_passwords = [None, "password", "password-0", None, "password", "password"] * 2
+    test_file_paths = [
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / f"test-{index}.pdf",
+                test_password = test_password
+            )
+        )
+        for index, test_password in enumerate(test_passwords)
+    ]
+
+    assert list(
+        _generate_unlock_results(
+            fingerprint_passwords = FingerprintPasswords(["password"]),
+            output_dir = None,
+            job_count = test_job_count,
+            passwords = ["password"],
+            pdf_file_paths = iter(test_file_paths),
+            save_profile = SaveProfile.FAST
+        )
+    ) == [
+        UnlockResult(test_file_path, FileState.NOT_LOCKED)
+        if test_password is None
+        else UnlockResult(test_file_path, FileState.UNLOCKED, "password", 1)
+        if test_password == "password"
+        else UnlockResult(test_file_path, FileState.LOCKED)
+        for test_file_path, test_password in zip(test_file_paths, test_passwords)
+    ]
+
+    with Pdf.open(test_file_paths[1]) as test_pdf:
+        assert not test_pdf.is_encrypted
+
+@mark.parametrize("test_job_count", [1, 2])
+def test_generate_unlock_results_generates_results_as_done(tmp_path: Path, test_job_count: int) -> None:
+    """
+    Assert that `_generate_unlock_results`
+    generates the result of every PDF file exactly once
+    when not asked to preserve the order of their file paths.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_job_count: Number of worker processes.
+    """
+
+    test_file_paths = [
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / f"test-{index}.pdf",
+                test_password = "password"
+            )
+        )
+        for index in range(12)
+    ]
+
+    assert sorted(
+        _generate_unlock_results(
+            fingerprint_passwords = FingerprintPasswords(["password"]),
+            output_dir = None,
+            job_count = test_job_count,
+            passwords = ["password"],
+            pdf_file_paths = iter(test_file_paths),
+            save_profile = SaveProfile.FAST,
+            should_preserve_order = False
+        )
+    ) == sorted(
+        UnlockResult(test_file_path, FileState.UNLOCKED, "password", 1)
+        for test_file_path in test_file_paths
+    )
+
+@mark.parametrize(
+    "test_job_count, test_attempt_counts",
+    [
+        (1, [3, 1, 1, 1, 1, 1]),
+        # <NOTE>
+        # The first PDF files are already pending before any of them is unlocked.
+        (2, [3, 3, 3, 3, 1, 1])
+    ]
+)
+def test_generate_unlock_results_moves_unlocking_password_to_front(
+    tmp_path: Path,
+    test_attempt_counts: list[int],
+    test_job_count: int
+) -> None:
+    """
+    Assert that `_generate_unlock_results`
+    attempts the password that unlocked the latest PDF file first for the next ones.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_attempt_counts: Expected number of passwords attempted for each PDF file.
+    :param test_job_count: Number of worker processes.
+    """
+
+    test_file_paths = [
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / f"test-{index}.pdf",
+                test_password = "password-2"
+            )
+        )
+        for index in range(len(test_attempt_counts))
+    ]
+
+    test_attempted_passwords = ["password-0", "password-1", "password-2"]
+
+    assert [
+        unlock_result.attempt_count
+        for unlock_result in _generate_unlock_results(
+            fingerprint_passwords = FingerprintPasswords(test_attempted_passwords),
+            output_dir = None,
+            job_count = test_job_count,
+            passwords = test_attempted_passwords,
+            pdf_file_paths = test_file_paths,
+            save_profile = SaveProfile.FAST
+        )
+    ] == test_attempt_counts
+
+@mark.parametrize(
+    "test_job_count, test_attempt_counts",
+    [
+        (1, [1, 3]),
+        # <NOTE>
+        # Both PDF files are already pending before either of them is unlocked.
+        (2, [1, 2])
+    ]
+)
+def test_generate_unlock_results_attempts_fingerprint_password_first(
+    tmp_path: Path,
+    test_attempt_counts: list[int],
+    test_job_count: int
+) -> None:
+    """
+    Assert that `_generate_unlock_results`
+    attempts the password that unlocked the latest PDF file with the same encryption fingerprint
+    first and remembers the password that unlocked each PDF file by its fingerprint.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_attempt_counts: Expected number of passwords attempted for each PDF file.
+    :param test_job_count: Number of worker processes.
+    """
+
+    test_file_paths = [
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / f"test-{index}.pdf",
+                test_password = test_password,
+                test_revision = 4
+            )
+        )
+        for index, test_password in enumerate(["password-2", "password-1"])
+    ]
+    test_fingerprints = [
+        _read_encryption_fingerprint(test_file_path)
+        for test_file_path in test_file_paths
+    ]
+    test_attempted_passwords = ["password-0", "password-1", "password-2"]
+    test_fingerprint_passwords = FingerprintPasswords(test_attempted_passwords)
+
+    assert test_fingerprints[0] is not None
+    assert test_fingerprints[1] is not None
+
+    test_fingerprint_passwords.add(test_fingerprints[0], "password-2")
+
+    assert [
+        unlock_result.attempt_count
+        for unlock_result in _generate_unlock_results(
+            fingerprint_passwords = test_fingerprint_passwords,
+            output_dir = None,
+            job_count = test_job_count,
+            passwords = test_attempted_passwords,
+            pdf_file_paths = test_file_paths,
+            save_profile = SaveProfile.FAST
+        )
+    ] == test_attempt_counts
+    assert test_fingerprint_passwords[test_fingerprints[0]] == "password-2"
+    assert test_fingerprint_passwords[test_fingerprints[1]] == "password-1"
@@ -0,0 +1,117 @@
+"""Tests for `_generate_watched_unlock_results`."""
+
+# pyright: reportPrivateUsage=false
+
+from collections.abc import Iterator
+from itertools import islice
+from pathlib import Path
+from pytest import MonkeyPatch
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.classes import FingerprintPasswords
+from unlock_pdf.enumerations import FileState, SaveProfile
+from unlock_pdf.functions import (
+    _generate_watched_unlock_results,
+    _get_file_signature,
+    _read_encryption_fingerprint
+)
+from unlock_pdf.types import Paths, UnlockResult, UnlockedFileSignatures
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+def test_generate_watched_unlock_results_keeps_order(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path
+) -> None:
+    """
+    Assert that `_generate_watched_unlock_results`
+    unlocks PDF files across worker processes as soon as they are ready,
+    generates their results in the same order as they became ready,
+    and records the signatures that unlocked PDF files have afterwards
+    along with the passwords per encryption fingerprint.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_passwords = ["password", None, "password", "password-0"]
+    test_file_paths = [
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / f"test-{index}.pdf",
+                test_password = test_password,
+                test_revision = 4
+            )
+        )
+        for index, test_password in enumerate(test_passwords)
+    ] + [str(tmp_path / "missing-test.pdf")]
+    test_fingerprint = _read_encryption_fingerprint(test_file_paths[0])
+    test_fingerprint_passwords = FingerprintPasswords(["password"])
+    test_unlocked_file_signatures: UnlockedFileSignatures = {}
+
+    def _mock_generate_ready_pdf_file_paths(
+        directory_paths: Paths,
+        unlocked_file_signatures: UnlockedFileSignatures,
+        should_sniff: bool
+    ) -> Iterator[Paths]:
+        """
+        Mock function of `unlock_pdf.functions._generate_ready_pdf_file_paths` that
+        makes every mock PDF file ready at once and then nothing else.
+
+        :param directory_paths: Paths of the directories to watch.
+        :param unlocked_file_signatures: Dictionary that maps file paths of PDF files
+                                         with their signatures as of when they were last unlocked.
+        :param should_sniff: Whether to skip PDF files that do not start with the PDF file signature or not.
+        :returns: Iterator of batches of the paths of ready PDF files.
+        """
+
+        nonlocal test_unlocked_file_signatures
+
+        assert directory_paths == [str(tmp_path)]
+
+        test_unlocked_file_signatures = unlocked_file_signatures
+
+        yield test_file_paths
+
+        while True:
+            yield []
+
+    monkeypatch.setattr(
+        name = "_generate_ready_pdf_file_paths",
+        target = target,
+        value = _mock_generate_ready_pdf_file_paths
+    )
+
+    test_unlock_results = _generate_watched_unlock_results(
+        directory_paths = [str(tmp_path)],
+        fingerprint_passwords = test_fingerprint_passwords,
+        job_count = 1,
+        output_dir = None,
+        passwords = ["password"],
+        save_profile = SaveProfile.FAST
+    )
+
+    assert [
+        unlock_result.file_state
+        for unlock_result in islice(test_unlock_results, len(test_file_paths))
+    ] == [
+        FileState.UNLOCKED,
+        FileState.NOT_LOCKED,
+        FileState.UNLOCKED,
+        FileState.LOCKED,
+        FileState.FAILED
+    ]
+
+    test_unlock_results.close()
+
+    assert test_fingerprint is not None
+    assert test_fingerprint_passwords[test_fingerprint] == "password"
+    assert test_unlocked_file_signatures == {
+        test_file_path: _get_file_signature(test_file_path)
+        for test_file_path in test_file_paths[:-1]
+    }
@@ -0,0 +1,81 @@
+"""Tests for `_get_directory_paths`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import MonkeyPatch, raises
+from tests.utilities import generate_mock_get_unique_inputs
+from unlock_pdf.functions import _get_directory_paths
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+def test_get_directory_paths_raises_exception(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Assert that `_get_directory_paths`
+    raises an appropriate exception
+    when every path does not point to a directory.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(b"%PDF-1.7")
+
+    monkeypatch.setattr(
+        name = "_get_unique_inputs",
+        target = target,
+        value = generate_mock_get_unique_inputs(
+            test_inputs = [str(tmp_path / "test.pdf"), str(tmp_path / "missing-directory")],
+            test_prompt = "Enter every directory path to watch for PDF files to unlock."
+        )
+    )
+
+    with raises(
+        expected_exception = FileNotFoundError,
+        match = "At least one path must point to a directory."
+    ):
+        _get_directory_paths()
+
+def test_get_directory_paths_returns_directory_paths(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path
+) -> None:
+    """
+    Assert that `_get_directory_paths`
+    returns the sanitized paths of every inputted directory
+    while ignoring paths that do not point to a directory.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(b"%PDF-1.7")
+
+    monkeypatch.setattr(
+        name = "_get_unique_inputs",
+        target = target,
+        value = generate_mock_get_unique_inputs(
+            test_inputs = [f'"{tmp_path}"', str(tmp_path / "test.pdf")],
+            test_prompt = "Enter every directory path to watch for PDF files to unlock."
+        )
+    )
+
+    assert _get_directory_paths() == [str(tmp_path)]
+
+def test_get_directory_paths_returns_given_directory_paths(tmp_path: Path) -> None:
+    """
+    Assert that `_get_directory_paths`
+    returns the sanitized paths of every given directory without asking for any.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    assert _get_directory_paths(iter([str(tmp_path), str(tmp_path / "missing-directory")])) == [
+        str(tmp_path)
+    ]
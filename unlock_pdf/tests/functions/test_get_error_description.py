@@ -0,0 +1,28 @@
+"""Tests for `_get_error_description`."""
+
+# pyright: reportPrivateUsage=false
+
+from pikepdf import PdfError
+from unlock_pdf.functions import _get_error_description
+
+def test_get_error_description_describes_exception() -> None:
+    """
+    Assert that `_get_error_description`
+    returns the name and message of an exception
+    when it was not raised from any other exception.
+    """
+
+    assert _get_error_description(PdfError("damaged")) == "PdfError: damaged"
+
+def test_get_error_description_describes_root_cause() -> None:
+    """
+    Assert that `_get_error_description`
+    returns the name and message of the earliest exception that an exception was raised from
+    when it was raised from other exceptions.
+    """
+
+    test_exception = PdfError("Unlocking test.pdf failed.")
+    test_exception.__cause__ = ValueError("wrapped")
+    test_exception.__cause__.__cause__ = FileNotFoundError("missing")
+
+    assert _get_error_description(test_exception) == "FileNotFoundError: missing"
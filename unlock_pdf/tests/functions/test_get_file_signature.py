@@ -0,0 +1,42 @@
+"""Tests for `_get_file_signature`."""
+
+# pyright: reportPrivateUsage=false
+
+from os import utime
+from pathlib import Path
+from unlock_pdf.functions import _get_file_signature
+
+def test_get_file_signature_changes_with_file(tmp_path: Path) -> None:
+    """
+    Assert that `_get_file_signature`
+    returns the same signature for the same version of a file
+    and a different one once said file is modified.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(b"%PDF-1.7\n")
+
+    test_file_signature = _get_file_signature(str(tmp_path / "test.pdf"))
+
+    assert test_file_signature is not None
+    assert test_file_signature[2] == 9
+    assert _get_file_signature(str(tmp_path / "test.pdf")) == test_file_signature
+
+    utime(
+        ns = (0, 0),
+        path = tmp_path / "test.pdf"
+    )
+
+    assert _get_file_signature(str(tmp_path / "test.pdf")) != test_file_signature
+
+def test_get_file_signature_returns_none_for_missing_file(tmp_path: Path) -> None:
+    """
+    Assert that `_get_file_signature`
+    returns `None`
+    when the file cannot be queried.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    assert _get_file_signature(str(tmp_path / "missing-test.pdf")) is None
@@ -0,0 +1,20 @@
+"""Tests for `_get_file_size`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from unlock_pdf.functions import _get_file_size
+
+def test_get_file_size_returns_size(tmp_path: Path) -> None:
+    """
+    Assert that `_get_file_size`
+    returns the size of a file,
+    or 0 if it cannot be queried.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(b"%PDF-1.7")
+
+    assert _get_file_size(str(tmp_path / "test.pdf")) == 8
+    assert _get_file_size(str(tmp_path / "missing.pdf")) == 0
@@ -0,0 +1,34 @@
+"""Tests for `_get_input_paths`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from unlock_pdf.enumerations import InputSeparator
+from unlock_pdf.functions import _get_input_paths, _get_options
+
+def test_get_input_paths_returns_none_without_paths() -> None:
+    """
+    Assert that `_get_input_paths`
+    leaves paths to be inputted
+    when no path is given.
+    """
+
+    assert _get_input_paths(_get_options([]), InputSeparator.NEWLINE) is None
+
+def test_get_input_paths_returns_unique_paths(tmp_path: Path) -> None:
+    """
+    Assert that `_get_input_paths`
+    returns the unique paths given as command-line arguments followed by those of an input source.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "paths.txt").write_text("test-1.pdf\ntest-0.pdf\n")
+
+    input_paths = _get_input_paths(
+        _get_options(["--paths-from", str(tmp_path / "paths.txt"), "test-0.pdf"]),
+        InputSeparator.NEWLINE
+    )
+
+    assert input_paths is not None
+    assert list(input_paths) == ["test-0.pdf", "test-1.pdf"]
@@ -0,0 +1,87 @@
+"""Tests for `_get_measured_unlock_result`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import MonkeyPatch
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.enumerations import FileState, MemoryField
+from unlock_pdf.functions import _get_measured_unlock_result
+from unlock_pdf.types import UnlockResult
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+def test_get_measured_unlock_result_measures_peak_memory_usage(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path
+) -> None:
+    """
+    Assert that `_get_measured_unlock_result`
+    unlocks a PDF file with the passwords of this worker process, starting from the given ones,
+    and measures the peak memory usage it took on top of what this process took beforehand.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_path = str(
+        generate_test_pdf_file(
+            file_path = tmp_path / "test.pdf",
+            test_password = "password"
+        )
+    )
+
+    monkeypatch.setattr(
+        name = "_reset_peak_memory_usage",
+        target = target,
+        value = lambda: True
+    )
+    monkeypatch.setattr(
+        name = "_read_memory_usage",
+        target = target,
+        value = lambda memory_field: 3000 if memory_field == MemoryField.PEAK else 1000
+    )
+    monkeypatch.setattr(
+        name = "_worker_passwords",
+        target = target,
+        value = ["wrong", "password"]
+    )
+
+    assert _get_measured_unlock_result(test_file_path, ["password"]) == (
+        UnlockResult(test_file_path, FileState.UNLOCKED, "password", 1),
+        2000
+    )
+
+def test_get_measured_unlock_result_measures_nothing(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Assert that `_get_measured_unlock_result`
+    still unlocks a PDF file without measuring any peak memory usage
+    when the peak memory usage of this process cannot be reset.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_path = str(generate_test_pdf_file(tmp_path / "test.pdf"))
+
+    monkeypatch.setattr(
+        name = "_reset_peak_memory_usage",
+        target = target,
+        value = lambda: False
+    )
+    monkeypatch.setattr(
+        name = "_worker_passwords",
+        target = target,
+        value = ["wrong", "password"]
+    )
+
+    assert _get_measured_unlock_result(test_file_path, ["password"]) == (
+        UnlockResult(test_file_path, FileState.NOT_LOCKED),
+        None
+    )
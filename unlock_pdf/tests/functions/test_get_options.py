@@ -0,0 +1,249 @@
+"""Tests for `_get_options`."""
+
+# pyright: reportPrivateUsage=false
+
+from os import process_cpu_count
+from pytest import mark, raises
+from unlock_pdf.enumerations import SaveProfile, Schedule
+from unlock_pdf.functions import _get_options
+
+@mark.parametrize(
+    "test_arguments," \
+    "test_should_classify_only, test_job_count, test_output_dir, test_save_profile," \
+    "test_should_shard_passwords, test_journal, test_should_resume, test_should_watch",
+    [
+        (
+            [],
+            False, process_cpu_count() or 1, None, SaveProfile.FAST,
+            False, None, False, False
+        ),
+        (
+            ["--classify-only"],
+            True, process_cpu_count() or 1, None, SaveProfile.FAST,
+            False, None, False, False
+        ),
+        (
+            ["--jobs", "4", "--shard-passwords", "--save-profile", "compact", "--output-dir", "out"],
+            False, 4, "out", SaveProfile.COMPACT,
+            True, None, False, False
+        ),
+        (
+            ["--journal", "journal.jsonl", "--resume"],
+            False, process_cpu_count() or 1, None, SaveProfile.FAST,
+            False, "journal.jsonl", True, False
+        ),
+        (
+            ["--watch"],
+            False, process_cpu_count() or 1, None, SaveProfile.FAST,
+            False, None, False, True
+        )
+    ]
+)
+def test_get_options_returns_options(
+    test_arguments: list[str],
+    test_job_count: int,
+    test_journal: str | None,
+    test_output_dir: str | None,
+    test_save_profile: SaveProfile,
+    test_should_classify_only: bool,
+    test_should_resume: bool,
+    test_should_shard_passwords: bool,
+    test_should_watch: bool
+) -> None:
+    """
+    Assert that `_get_options`
+    returns the command-line options
+    when given valid command-line arguments.
+
+    :param test_arguments: Mock command-line arguments.
+    :param test_job_count: Expected number of worker processes.
+    :param test_journal: Expected journal, if any.
+    :param test_output_dir: Expected output directory, if any.
+    :param test_save_profile: Expected profile to save unlocked PDF files with.
+    :param test_should_classify_only: Whether to only classify PDF files or not.
+    :param test_should_resume: Whether to skip PDF files whose final file state is in the journal or not.
+    :param test_should_shard_passwords: Whether to shard passwords across workers or not.
+    :param test_should_watch: Whether to keep watching directories or not.
+    """
+
+    test_options = _get_options(test_arguments)
+
+    assert test_options.classify_only == test_should_classify_only
+    assert test_options.jobs == test_job_count
+    assert test_options.journal == test_journal
+    assert test_options.output_dir == test_output_dir
+    assert test_options.resume == test_should_resume
+    assert test_options.save_profile == test_save_profile
+    assert test_options.shard_passwords == test_should_shard_passwords
+    assert test_options.watch == test_should_watch
+
+@mark.parametrize(
+    "test_arguments, test_schedule",
+    [
+        ([], Schedule.DISCOVERY),
+        (["--schedule", "discovery"], Schedule.DISCOVERY),
+        (["--schedule", "longest-first"], Schedule.LONGEST_FIRST)
+    ]
+)
+def test_get_options_returns_schedule(test_arguments: list[str], test_schedule: Schedule) -> None:
+    """
+    Assert that `_get_options`
+    returns the order to unlock PDF files in
+    when given valid command-line arguments.
+
+    :param test_arguments: Mock command-line arguments.
+    :param test_schedule: Expected order to unlock PDF files in.
+    """
+
+    assert _get_options(test_arguments).schedule == test_schedule
+
+@mark.parametrize(
+    "test_arguments, test_should_sniff",
+    [
+        ([], False),
+        (["--sniff"], True)
+    ]
+)
+def test_get_options_returns_sniff(test_arguments: list[str], test_should_sniff: bool) -> None:
+    """
+    Assert that `_get_options`
+    returns whether to skip PDF files that do not start with the PDF file signature or not
+    when given valid command-line arguments.
+
+    :param test_arguments: Mock command-line arguments.
+    :param test_should_sniff: Whether to skip PDF files that do not start with the PDF file signature or not.
+    """
+
+    assert _get_options(test_arguments).sniff == test_should_sniff
+
+@mark.parametrize(
+    "test_arguments",
+    [
+        ["--unknown-option"],
+        ["--jobs", "zero"],
+        ["--jobs", "0"],
+        ["--save-profile", "smallest"],
+        ["--schedule", "shortest-first"],
+        ["--memory-budget", "0"],
+        ["--memory-budget", "512", "--shard-passwords", "--jobs", "2"],
+        ["--memory-budget", "512", "--watch"],
+        ["--memory-budget", "512", "--jobs", "1"],
+        ["--memory-limit", "0"],
+        ["--timeout", "0"],
+        ["--timeout", "nan"],
+        ["--timeout", "30", "--shard-passwords", "--jobs", "2"],
+        ["--memory-limit", "512", "--watch"],
+        ["--timeout", "30", "--memory-budget", "512"],
+        ["--resume"],
+        ["--watch", "--classify-only"],
+        ["--shard-passwords", "--jobs", "1"],
+        ["--paths-from", "-"],
+        ["--paths-from", "-", "--passwords-from", "-"]
+    ]
+)
+def test_get_options_raises_exception(test_arguments: list[str]) -> None:
+    """
+    Assert that `_get_options`
+    raises an appropriate exception
+    when given an unknown or invalid command-line argument.
+
+    :param test_arguments: Mock command-line arguments.
+    """
+
+    with raises(SystemExit):
+        _get_options(test_arguments)
+
+@mark.parametrize(
+    "test_arguments," \
+    "test_paths, test_paths_from, test_passwords_from, test_should_separate_by_null",
+    [
+        (
+            [],
+            [], None, None, False
+        ),
+        (
+            ["test-0.pdf", "test-directory", "--passwords-from", "env:PASSWORDS"],
+            ["test-0.pdf", "test-directory"], None, "env:PASSWORDS", False
+        ),
+        (
+            ["--paths-from", "-", "--passwords-from", "fd:3", "--null"],
+            [], "-", "fd:3", True
+        ),
+        (
+            ["--paths-from", "-", "--classify-only"],
+            [], "-", None, False
+        )
+    ]
+)
+def test_get_options_returns_input_sources(
+    test_arguments: list[str],
+    test_passwords_from: str | None,
+    test_paths: list[str],
+    test_paths_from: str | None,
+    test_should_separate_by_null: bool
+) -> None:
+    """
+    Assert that `_get_options`
+    returns the given paths and input sources
+    when given valid command-line arguments.
+
+    :param test_arguments: Mock command-line arguments.
+    :param test_passwords_from: Expected input source of passwords, if any.
+    :param test_paths: Expected paths.
+    :param test_paths_from: Expected input source of paths, if any.
+    :param test_should_separate_by_null: Whether inputs are separated by NUL characters or not.
+    """
+
+    test_options = _get_options(test_arguments)
+
+    assert test_options.null == test_should_separate_by_null
+    assert test_options.passwords_from == test_passwords_from
+    assert test_options.paths == test_paths
+    assert test_options.paths_from == test_paths_from
+
+@mark.parametrize(
+    "test_arguments, test_memory_budget",
+    [
+        ([], None),
+        (["--memory-budget", "512", "--jobs", "2"], 512)
+    ]
+)
+def test_get_options_returns_memory_budget(test_arguments: list[str], test_memory_budget: int | None) -> None:
+    """
+    Assert that `_get_options`
+    returns the memory budget, if any,
+    when given valid command-line arguments.
+
+    :param test_arguments: Mock command-line arguments.
+    :param test_memory_budget: Expected memory budget in MiB, if any.
+    """
+
+    assert _get_options(test_arguments).memory_budget == test_memory_budget
+
+@mark.parametrize(
+    "test_arguments, test_timeout, test_memory_limit",
+    [
+        ([], None, None),
+        (["--timeout", "2.5"], 2.5, None),
+        (["--timeout", "30", "--memory-limit", "2048"], 30.0, 2048)
+    ]
+)
+def test_get_options_returns_limits(
+    test_arguments: list[str],
+    test_memory_limit: int | None,
+    test_timeout: float | None
+) -> None:
+    """
+    Assert that `_get_options`
+    returns the limits to unlock each PDF file within, if any,
+    when given valid command-line arguments.
+
+    :param test_arguments: Mock command-line arguments.
+    :param test_memory_limit: Expected memory limit in MiB, if any.
+    :param test_timeout: Expected timeout in seconds, if any.
+    """
+
+    test_options = _get_options(test_arguments)
+
+    assert test_options.memory_limit == test_memory_limit
+    assert test_options.timeout == test_timeout
@@ -0,0 +1,41 @@
+"""Tests for `_get_output_file_path`."""
+
+# pyright: reportPrivateUsage=false
+
+from os.path import abspath, join
+from pathlib import Path
+from unlock_pdf.functions import _get_output_file_path
+
+def test_get_output_file_path_mirrors_file_path(tmp_path: Path) -> None:
+    """
+    Assert that `_get_output_file_path`
+    mirrors the absolute file path of a file in the output directory.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_output_file_path = _get_output_file_path(
+        str(tmp_path / "input" / "test.pdf"),
+        str(tmp_path / "output")
+    )
+
+    assert test_output_file_path.startswith(str(tmp_path / "output"))
+    assert test_output_file_path.endswith(join(str(tmp_path).lstrip("\\/"), "input", "test.pdf"))
+
+def test_get_output_file_path_keeps_relative_paths_apart() -> None:
+    """
+    Assert that `_get_output_file_path`
+    gives different file paths to files with the same name in different directories.
+    """
+
+    assert _get_output_file_path(
+        join("input-0", "test.pdf"),
+        "output"
+    ) != _get_output_file_path(
+        join("input-1", "test.pdf"),
+        "output"
+    )
+    assert _get_output_file_path("test.pdf", "output") == join(
+        "output",
+        abspath("test.pdf").lstrip("\\/")
+    )
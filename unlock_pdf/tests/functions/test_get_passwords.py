@@ -2,12 +2,14 @@
 
 # pyright: reportPrivateUsage=false
 
+from pathlib import Path
 from pytest import (
     MonkeyPatch,
     mark,
     raises
 )
 from tests.utilities import generate_mock_get_unique_inputs
+from unlock_pdf.enumerations import InputSeparator
 from unlock_pdf.functions import _get_passwords
 from unlock_pdf.types import Passwords
 
@@ -74,3 +76,19 @@ def test_get_passwords_returns_passwords(
     )
 
     assert _get_passwords() == test_passwords
+
+def test_get_passwords_reads_passwords_from_input_source(tmp_path: Path) -> None:
+    """
+    Assert that `_get_passwords`
+    returns an ordered list of unique passwords from an input source
+    without asking for any.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "passwords.txt").write_bytes(b"password-0\0password-1\0password-0")
+
+    assert _get_passwords(
+        str(tmp_path / "passwords.txt"),
+        InputSeparator.NULL
+    ) == ["password-0", "password-1"]
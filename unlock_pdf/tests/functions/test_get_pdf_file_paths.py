@@ -2,14 +2,16 @@
 
 # pyright: reportPrivateUsage=false
 
+from pathlib import Path
 from pytest import (
     MonkeyPatch,
     mark,
     raises
 )
 from tests.utilities import generate_mock_get_unique_inputs
+from unlock_pdf.classes import DirectoryManifest
 from unlock_pdf.functions import _get_pdf_file_paths
-from unlock_pdf.types import Paths
+from unlock_pdf.types import FileIdentity, Paths
 
 # <NOTE>
 # As the source code prefers named imports over default imports,
@@ -71,7 +73,7 @@ def test_get_pdf_file_paths_returns_pdf_file_paths(
 ) -> None:
     """
     Assert that `_get_pdf_file_paths`
-    returns a set of paths of all PDF files to unlock
+    returns an iterator of paths of all PDF files to unlock
     from inputted paths.
 
     :param monkeypatch: `pytest` fixture for mocking functions.
@@ -82,14 +84,19 @@ def test_get_pdf_file_paths_returns_pdf_file_paths(
 
     call_count = -1
 
-    def _mock_get_pdf_file_subpaths(path: str) -> Paths:
+    def _mock_get_pdf_file_subpaths(
+        path: str,
+        directory_manifest: DirectoryManifest | None
+    ) -> list[tuple[str, FileIdentity | None]]:
         """
         Mock function of `unlock-pdf.functions._get_pdf_file_subpaths` that
         returns mock paths of some PDF files to unlock
         based on how many times the mock function has been called.
 
         :param path: Directory path or file path of some PDF files to unlock.
-        :returns Mock ordered list of unique paths of some PDF files to unlock.
+        :param directory_manifest: Manifest of the PDF files and subdirectories of directories, if any.
+        :returns Mock ordered list of unique paths of some PDF files to unlock,
+                 along with their unknown identities.
         """
 
         nonlocal call_count
@@ -97,8 +104,12 @@ def test_get_pdf_file_paths_returns_pdf_file_paths(
         call_count += 1
 
         assert path in test_paths
+        assert directory_manifest is None
 
-        return test_pdf_file_subpaths[call_count]
+        return [
+            (pdf_file_subpath, None)
+            for pdf_file_subpath in test_pdf_file_subpaths[call_count]
+        ]
 
     monkeypatch.setattr(
         name = "_get_pdf_file_subpaths",
@@ -114,4 +125,47 @@ def test_get_pdf_file_paths_returns_pdf_file_paths(
         )
     )
 
-    assert _get_pdf_file_paths() == test_pdf_file_paths
+    assert list(
+        _get_pdf_file_paths()
+    ) == test_pdf_file_paths
+
+def test_get_pdf_file_paths_reads_given_paths_lazily(tmp_path: Path) -> None:
+    """
+    Assert that `_get_pdf_file_paths`
+    returns an iterator of paths of all PDF files to unlock
+    from given paths without asking for any
+    and without reading them past the first PDF file found.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "test-0.pdf").write_bytes(b"%PDF-1.7")
+    (tmp_path / "test-1.pdf").write_bytes(b"%PDF-1.7")
+
+    test_paths = iter([str(tmp_path / "test-0.pdf"), str(tmp_path / "test-1.pdf")])
+    test_pdf_file_paths = _get_pdf_file_paths(paths = test_paths)
+
+    assert next(test_paths) == str(tmp_path / "test-1.pdf")
+    assert list(test_pdf_file_paths) == [str(tmp_path / "test-0.pdf")]
+
+def test_get_pdf_file_paths_sniffs_pdf_file_signatures(tmp_path: Path) -> None:
+    """
+    Assert that `_get_pdf_file_paths`
+    only skips PDF files that do not start with the PDF file signature
+    when asked to sniff them.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "misnamed-test.pdf").write_bytes(b"test")
+    (tmp_path / "test.pdf").write_bytes(b"%PDF-1.7")
+
+    test_paths = [str(tmp_path / "misnamed-test.pdf"), str(tmp_path / "test.pdf")]
+
+    assert list(_get_pdf_file_paths(paths = test_paths)) == test_paths
+    assert list(
+        _get_pdf_file_paths(
+            paths = test_paths,
+            should_sniff = True
+        )
+    ) == [str(tmp_path / "test.pdf")]
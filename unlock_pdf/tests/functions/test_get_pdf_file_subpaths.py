@@ -2,10 +2,12 @@
 
 # pyright: reportPrivateUsage=false
 
+from collections.abc import Iterator
 from pytest import MonkeyPatch, mark
 from tests.utilities import generate_mock_boolean
+from unlock_pdf.classes import DirectoryManifest
 from unlock_pdf.functions import _get_pdf_file_subpaths
-from unlock_pdf.types import Paths
+from unlock_pdf.types import FileIdentity
 
 # <NOTE>
 # As the source code prefers named imports over default imports,
@@ -17,33 +19,33 @@ import unlock_pdf.functions as target
 
 @mark.parametrize(
     "test_path," \
-    "test_glob_paths, test_is_directory, test_is_pdf_file," \
+    "test_is_directory, test_is_pdf_file, test_walked_paths," \
     "test_pdf_file_subpaths",
     [
         (
             "test-directory/",
-            ["test-directory/test-0.pdf", "test-directory/test-1.pdf"], True, False,
-            ["test-directory/test-0.pdf", "test-directory/test-1.pdf"]
+            True, False, [("test-directory/test-0.pdf", (1, 2)), ("test-directory/test-1.pdf", None)],
+            [("test-directory/test-0.pdf", (1, 2)), ("test-directory/test-1.pdf", None)]
         ),
         (
             "test.pdf",
-            [], False, True,
-            ["test.pdf"]
+            False, True, [],
+            [("test.pdf", None)]
         ),
         (
             "",
-            [], False, False,
+            False, False, [],
             []
         )
     ]
 )
 def test_get_pdf_file_subpaths_returns_pdf_file_subpaths(
     monkeypatch: MonkeyPatch,
-    test_glob_paths: Paths,
     test_is_directory: bool,
     test_is_pdf_file: bool,
     test_path: str,
-    test_pdf_file_subpaths: Paths
+    test_pdf_file_subpaths: list[tuple[str, FileIdentity | None]],
+    test_walked_paths: list[tuple[str, FileIdentity | None]]
 ) -> None:
     """
     Asserts that `_get_pdf_file_subpaths`
@@ -51,29 +53,35 @@ def test_get_pdf_file_subpaths_returns_pdf_file_subpaths(
     when given a valid path.
     
     :param monkeypatch: `pytest` fixture for mocking functions.
-    :param test_glob_paths: Mock list of paths that match the determined file path pattern.
     :param test_is_directory: Mock boolean that
                               tells whether the file path directly points to a directory or not.
     :param test_is_pdf_file: Mock boolean that
                              tells whether the file path directly points to a PDF file or not.
     :param test_path: Mock directory path or mock file path of some PDF files to unlock.
-    :param test_pdf_file_subpaths: Ordered list of unique paths of some PDF files to unlock.
+    :param test_pdf_file_subpaths: Ordered list of unique paths of some PDF files to unlock,
+                                   along with their identities if known.
+    :param test_walked_paths: Mock paths of the PDF files in the directory tree,
+                              along with their identities if known.
     """
 
-    def _mock_glob(pathname: str, recursive: bool) -> Paths:
+    def _mock_walk_directory(
+        directory_path: str,
+        directory_manifest: DirectoryManifest | None
+    ) -> Iterator[tuple[str, FileIdentity | None]]:
         """
-        Mock function of `glob.glob` that
-        returns a list of paths that match the determined file path pattern.
-        
-        :param pathname: File path pattern.
-        :param recursive: Whether to recursively look for matches in directories or not.
-        :returns List of paths that match the determined file path pattern.
+        Mock function of `unlock_pdf.functions._walk_directory` that
+        yields the paths of the PDF files in the directory tree.
+
+        :param directory_path: Path of a directory where some PDF files are.
+        :param directory_manifest: Manifest of the PDF files and subdirectories of directories, if any.
+        :returns: Iterator of mock paths of the PDF files in the directory tree,
+                  along with their identities if known.
         """
 
-        assert pathname == test_path + "/**/*.pdf"
-        assert recursive is True
+        assert directory_path == test_path
+        assert directory_manifest is None
 
-        return test_glob_paths
+        yield from test_walked_paths
 
     monkeypatch.setattr(
         name = "_is_pdf_file",
@@ -84,9 +92,9 @@ def test_get_pdf_file_subpaths_returns_pdf_file_subpaths(
         )
     )
     monkeypatch.setattr(
-        name = "glob",
+        name = "_walk_directory",
         target = target,
-        value = _mock_glob
+        value = _mock_walk_directory
     )
     monkeypatch.setattr(
         name = "isdir",
@@ -97,4 +105,6 @@ def test_get_pdf_file_subpaths_returns_pdf_file_subpaths(
         )
     )
 
-    assert _get_pdf_file_subpaths(test_path) == test_pdf_file_subpaths
+    assert list(
+        _get_pdf_file_subpaths(test_path)
+    ) == test_pdf_file_subpaths
@@ -0,0 +1,21 @@
+"""Tests for `_get_root_cause`."""
+
+# pyright: reportPrivateUsage=false
+
+from pikepdf import PdfError
+from unlock_pdf.functions import _get_root_cause
+
+def test_get_root_cause_returns_earliest_exception() -> None:
+    """
+    Assert that `_get_root_cause`
+    returns the earliest exception that an exception was raised from,
+    or the exception itself if it was not raised from any other exception.
+    """
+
+    test_exception = PdfError("Unlocking test.pdf failed.")
+    test_root_cause = MemoryError("std::bad_alloc")
+    test_exception.__cause__ = ValueError("wrapped")
+    test_exception.__cause__.__cause__ = test_root_cause
+
+    assert _get_root_cause(test_exception) is test_root_cause
+    assert _get_root_cause(test_root_cause) is test_root_cause
@@ -0,0 +1,44 @@
+"""Tests for `_get_save_arguments`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pikepdf import Pdf
+from pytest import mark
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.enumerations import SaveProfile
+from unlock_pdf.functions import _get_save_arguments
+
+@mark.parametrize("test_save_profile", list(SaveProfile))
+def test_get_save_arguments_saves_pdf_file(tmp_path: Path, test_save_profile: SaveProfile) -> None:
+    """
+    Assert that `_get_save_arguments`
+    returns keyword arguments that `pikepdf.Pdf.save` saves an unlocked PDF file with.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_save_profile: Profile to save the unlocked PDF file with.
+    """
+
+    test_file_path = generate_test_pdf_file(
+        file_path = tmp_path / "test.pdf",
+        test_password = "password"
+    )
+
+    with Pdf.open(test_file_path, password = "password") as test_pdf:
+        test_pdf.save(tmp_path / "unlocked-test.pdf", **_get_save_arguments(test_save_profile))
+
+    with Pdf.open(tmp_path / "unlocked-test.pdf") as test_pdf:
+        assert not test_pdf.is_encrypted
+
+def test_get_save_arguments_differs_by_save_profile() -> None:
+    """
+    Assert that `_get_save_arguments`
+    only generates object streams and recompresses streams for the compact profile.
+    """
+
+    test_fast_arguments = _get_save_arguments(SaveProfile.FAST)
+    test_compact_arguments = _get_save_arguments(SaveProfile.COMPACT)
+
+    assert test_fast_arguments["recompress_flate"] is False
+    assert test_compact_arguments["recompress_flate"] is True
+    assert test_fast_arguments["object_stream_mode"] != test_compact_arguments["object_stream_mode"]
@@ -0,0 +1,94 @@
+"""Tests for `_get_serve_options`."""
+
+# pyright: reportPrivateUsage=false
+
+from os import process_cpu_count
+from pytest import mark, raises
+from unlock_pdf.enumerations import SaveProfile
+from unlock_pdf.functions import _get_serve_options
+
+@mark.parametrize(
+    "test_arguments," \
+    "test_host, test_port, test_job_count, test_max_concurrency, test_max_request_size," \
+    "test_passwords_from, test_should_separate_by_null, test_save_profile",
+    [
+        (
+            [],
+            "127.0.0.1", 8765, process_cpu_count() or 1, None, 64 << 20,
+            None, False, SaveProfile.FAST
+        ),
+        (
+            [
+                "--host", "0.0.0.0",
+                "--port", "0",
+                "--jobs", "2",
+                "--max-concurrency", "4",
+                "--max-request-size", "1024",
+                "--passwords-from", "env:PASSWORDS",
+                "--null",
+                "--save-profile", "compact"
+            ],
+            "0.0.0.0", 0, 2, 4, 1024,
+            "env:PASSWORDS", True, SaveProfile.COMPACT
+        )
+    ]
+)
+def test_get_serve_options_returns_options(
+    test_arguments: list[str],
+    test_host: str,
+    test_job_count: int,
+    test_max_concurrency: int | None,
+    test_max_request_size: int,
+    test_passwords_from: str | None,
+    test_port: int,
+    test_save_profile: SaveProfile,
+    test_should_separate_by_null: bool
+) -> None:
+    """
+    Assert that `_get_serve_options`
+    returns the command-line options of the unlock server
+    when given valid command-line arguments.
+
+    :param test_arguments: Mock command-line arguments.
+    :param test_host: Expected host.
+    :param test_job_count: Expected number of worker processes.
+    :param test_max_concurrency: Expected number of unlock requests to unlock at once, if any.
+    :param test_max_request_size: Expected maximum size of the body of an unlock request.
+    :param test_passwords_from: Expected input source to read passwords from, if any.
+    :param test_port: Expected port.
+    :param test_save_profile: Expected profile to save unlocked PDF files with.
+    :param test_should_separate_by_null: Whether passwords are separated by NUL characters or not.
+    """
+
+    test_options = _get_serve_options(test_arguments)
+
+    assert test_options.host == test_host
+    assert test_options.jobs == test_job_count
+    assert test_options.max_concurrency == test_max_concurrency
+    assert test_options.max_request_size == test_max_request_size
+    assert test_options.null == test_should_separate_by_null
+    assert test_options.passwords_from == test_passwords_from
+    assert test_options.port == test_port
+    assert test_options.save_profile == test_save_profile
+
+@mark.parametrize(
+    "test_arguments",
+    [
+        ["--unknown-option"],
+        ["--port", "http"],
+        ["--jobs", "0"],
+        ["--max-concurrency", "0"],
+        ["--max-request-size", "0"]
+    ]
+)
+def test_get_serve_options_raises_exception(test_arguments: list[str]) -> None:
+    """
+    Assert that `_get_serve_options`
+    raises an appropriate exception
+    when given an unknown or invalid command-line argument.
+
+    :param test_arguments: Mock command-line arguments.
+    """
+
+    with raises(SystemExit):
+        _get_serve_options(test_arguments)
@@ -0,0 +1,19 @@
+"""Tests for `_get_temporary_file_prefix`."""
+
+# pyright: reportPrivateUsage=false
+
+from unlock_pdf.functions import _get_temporary_file_prefix
+
+def test_get_temporary_file_prefix_returns_hidden_prefix() -> None:
+    """
+    Assert that `_get_temporary_file_prefix`
+    returns a hidden prefix of a fixed length that only depends on the name of the file.
+    """
+
+    test_prefix = _get_temporary_file_prefix("directory/test.pdf")
+
+    assert test_prefix.startswith(".")
+    assert test_prefix.endswith(".")
+    assert test_prefix == _get_temporary_file_prefix("other-directory/test.pdf")
+    assert test_prefix != _get_temporary_file_prefix("directory/test-1.pdf")
+    assert len(test_prefix) == len(_get_temporary_file_prefix(f"directory/{"a" * 255}.pdf"))
@@ -0,0 +1,203 @@
+"""Tests for `_get_unlock_result`."""
+
+# pyright: reportPrivateUsage=false
+
+from errno import EBUSY
+from pathlib import Path
+from pikepdf import PdfError
+from pytest import MonkeyPatch, mark
+from unlock_pdf.enumerations import FileState, SaveProfile
+from unlock_pdf.functions import _get_unlock_result
+from unlock_pdf.types import Passwords, UnlockResult
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+@mark.parametrize(
+    "test_file_state, test_unlocking_password," \
+    "test_unlock_result",
+    [
+        (
+            FileState.LOCKED, None,
+            UnlockResult("test.pdf", FileState.LOCKED)
+        ),
+        (
+            FileState.NOT_LOCKED, None,
+            UnlockResult("test.pdf", FileState.NOT_LOCKED)
+        ),
+        (
+            FileState.UNLOCKED, "password-1",
+            UnlockResult("test.pdf", FileState.UNLOCKED, "password-1", 2)
+        )
+    ]
+)
+def test_get_unlock_result_returns_unlock_result(
+    monkeypatch: MonkeyPatch,
+    test_file_state: FileState,
+    test_unlock_result: UnlockResult,
+    test_unlocking_password: str | None
+) -> None:
+    """
+    Assert that `_get_unlock_result`
+    returns the file path of a PDF file, the file state it was unlocked into,
+    and the password that unlocked it along with how many passwords were attempted.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param test_file_state: File state to unlock the PDF file into.
+    :param test_unlock_result: Expected result of attempting to unlock the PDF file.
+    :param test_unlocking_password: Password that unlocked the PDF file, if any.
+    """
+
+    def _mock_unlock_pdf_file(
+        file_path: str,
+        passwords: Passwords,
+        save_profile: SaveProfile,
+        output_dir: str | None
+    ) -> tuple[FileState, str | None]:
+        """
+        Mock function of `unlock_pdf.functions._unlock_pdf_file` that
+        mocks unlocking a PDF file into a file state.
+
+        :param file_path: Sanitized file path of the PDF file to unlock.
+        :param passwords: Passwords to attempt unlocking the PDF file with.
+        :param save_profile: Profile to save the unlocked PDF file with.
+        :param output_dir: Output directory to write the unlocked PDF file in, if any.
+        :returns: File state of the PDF file and the password that unlocked it, if any.
+        """
+
+        assert passwords == ["password-0", "password-1"]
+        assert save_profile == SaveProfile.FAST
+        assert output_dir is None
+
+        return test_file_state, test_unlocking_password
+
+    monkeypatch.setattr(
+        name = "_unlock_pdf_file",
+        target = target,
+        value = _mock_unlock_pdf_file
+    )
+
+    assert _get_unlock_result(
+        "test.pdf",
+        ["password-0", "password-1"]
+    ) == test_unlock_result
+
+def test_get_unlock_result_retries_transient_errors(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_get_unlock_result`
+    attempts unlocking a PDF file again
+    when it failed due to a transient I/O error.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    call_count = 0
+
+    def _mock_unlock_pdf_file(
+        file_path: str,
+        passwords: Passwords,
+        save_profile: SaveProfile,
+        output_dir: str | None
+    ) -> tuple[FileState, str | None]:
+        """
+        Mock function of `unlock_pdf.functions._unlock_pdf_file` that
+        mocks failing due to a busy PDF file once before unlocking it.
+
+        :param file_path: Sanitized file path of the PDF file to unlock.
+        :param passwords: Passwords to attempt unlocking the PDF file with.
+        :param save_profile: Profile to save the unlocked PDF file with.
+        :param output_dir: Output directory to write the unlocked PDF file in, if any.
+        :raises PdfError: If the PDF file is unlocked for the first time.
+        :returns: File state of the PDF file and the password that unlocked it.
+        """
+
+        nonlocal call_count
+
+        call_count += 1
+
+        if call_count == 1:
+            raise PdfError("Unlocking test.pdf failed.") from OSError(EBUSY, "busy")
+
+        return FileState.UNLOCKED, passwords[0]
+
+    monkeypatch.setattr(
+        name = "sleep",
+        target = target,
+        value = lambda seconds: None
+    )
+    monkeypatch.setattr(
+        name = "_unlock_pdf_file",
+        target = target,
+        value = _mock_unlock_pdf_file
+    )
+
+    assert _get_unlock_result("test.pdf", ["password"]) == UnlockResult(
+        "test.pdf",
+        FileState.UNLOCKED,
+        "password",
+        1
+    )
+    assert call_count == 2
+
+def test_get_unlock_result_records_failure(tmp_path: Path) -> None:
+    """
+    Assert that `_get_unlock_result`
+    returns the PDF file as failed along with the error that made it fail
+    instead of raising it
+    when unlocking the PDF file failed.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_path = str(tmp_path / "missing-test.pdf")
+
+    assert _get_unlock_result(test_file_path, ["password"]) == UnlockResult(
+        error = f"FileNotFoundError: [Errno 2] No such file or directory: {test_file_path!r}",
+        file_path = test_file_path,
+        file_state = FileState.FAILED
+    )
+
+def test_get_unlock_result_records_abort(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_get_unlock_result`
+    returns the PDF file as aborted along with the error that made it abort
+    when unlocking the PDF file ran out of memory.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    def _mock_unlock_pdf_file(
+        file_path: str,
+        passwords: Passwords,
+        save_profile: SaveProfile,
+        output_dir: str | None
+    ) -> tuple[FileState, str | None]:
+        """
+        Mock function of `unlock_pdf.functions._unlock_pdf_file` that
+        mocks running out of memory.
+
+        :param file_path: Sanitized file path of the PDF file to unlock.
+        :param passwords: Passwords to attempt unlocking the PDF file with.
+        :param save_profile: Profile to save the unlocked PDF file with.
+        :param output_dir: Output directory to write the unlocked PDF file in, if any.
+        :raises PdfError: Always.
+        """
+
+        raise PdfError("Unlocking test.pdf failed.") from MemoryError("std::bad_alloc")
+
+    monkeypatch.setattr(
+        name = "_unlock_pdf_file",
+        target = target,
+        value = _mock_unlock_pdf_file
+    )
+
+    assert _get_unlock_result("test.pdf", ["password"]) == UnlockResult(
+        error = "MemoryError: std::bad_alloc",
+        file_path = "test.pdf",
+        file_state = FileState.ABORTED
+    )
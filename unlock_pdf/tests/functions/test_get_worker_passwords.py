@@ -0,0 +1,36 @@
+"""Tests for `_get_worker_passwords`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import MonkeyPatch
+from unlock_pdf.functions import _get_worker_passwords
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+def test_get_worker_passwords_keeps_new_order(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_get_worker_passwords`
+    moves the passwords to attempt first to the front of the passwords of the worker process
+    and keeps them in that order for the next PDF files,
+    without changing passwords that were already handed out.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    test_worker_passwords = ["password-0", "password-1", "password-2"]
+
+    monkeypatch.setattr(
+        name = "_worker_passwords",
+        target = target,
+        value = test_worker_passwords
+    )
+
+    assert _get_worker_passwords(["password-2"]) == ["password-2", "password-0", "password-1"]
+    assert _get_worker_passwords([]) == ["password-2", "password-0", "password-1"]
+    assert test_worker_passwords == ["password-0", "password-1", "password-2"]
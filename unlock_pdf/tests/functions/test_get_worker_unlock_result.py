@@ -0,0 +1,57 @@
+"""Tests for `_get_worker_unlock_result`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import MonkeyPatch
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.functions import _get_worker_unlock_result
+from unlock_pdf.types import UnlockResult
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+def test_get_worker_unlock_result_prioritizes_passwords(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Assert that `_get_worker_unlock_result`
+    unlocks a PDF file with the passwords of the worker process,
+    attempting the given passwords first.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_paths = [
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / f"test-{index}.pdf",
+                test_password = "password"
+            )
+        )
+        for index in range(2)
+    ]
+
+    monkeypatch.setattr(
+        name = "_worker_passwords",
+        target = target,
+        value = ["wrong-0", "wrong-1", "password"]
+    )
+
+    assert _get_worker_unlock_result(test_file_paths[0], []) == UnlockResult(
+        test_file_paths[0],
+        FileState.UNLOCKED,
+        "password",
+        3
+    )
+    assert _get_worker_unlock_result(test_file_paths[1], ["password"]) == UnlockResult(
+        test_file_paths[1],
+        FileState.UNLOCKED,
+        "password",
+        1
+    )
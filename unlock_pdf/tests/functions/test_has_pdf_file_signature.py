@@ -0,0 +1,47 @@
+"""Tests for `_has_pdf_file_signature`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import mark
+from unlock_pdf.functions import _has_pdf_file_signature
+
+@mark.parametrize(
+    "test_content," \
+    "test_boolean",
+    [
+        (b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n", True),
+        (b"\x00" * 1000 + b"%PDF-1.4", True),
+        (b"\x00" * 1024 + b"%PDF-1.4", False),
+        (b"PK\x03\x04", False),
+        (b"", False)
+    ]
+)
+def test_has_pdf_file_signature_returns_boolean(
+    tmp_path: Path,
+    test_boolean: bool,
+    test_content: bytes
+) -> None:
+    """
+    Assert that `_has_pdf_file_signature`
+    returns whether the PDF file signature is within the first kibibyte of a file or not.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_boolean: Whether the file has the PDF file signature or not.
+    :param test_content: Mock content of the file.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(test_content)
+
+    assert _has_pdf_file_signature(str(tmp_path / "test.pdf")) == test_boolean
+
+def test_has_pdf_file_signature_returns_false_for_unreadable_file(tmp_path: Path) -> None:
+    """
+    Assert that `_has_pdf_file_signature`
+    returns `False`
+    when the file cannot be read.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    assert not _has_pdf_file_signature(str(tmp_path / "missing-test.pdf"))
@@ -0,0 +1,40 @@
+"""Tests for `_initialize_shard_worker`."""
+
+# pyright: reportPrivateUsage=false
+
+from multiprocessing import Value
+from pytest import MonkeyPatch
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+def test_initialize_shard_worker_shares_password_index(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_initialize_shard_worker`
+    shares the index of the earliest password found so far with the worker process.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    test_shared_password_index = Value("q", 3)
+
+    monkeypatch.setattr(
+        name = "_shared_password_index",
+        target = target,
+        value = None
+    )
+    monkeypatch.setattr(
+        name = "_worker_passwords",
+        target = target,
+        value = []
+    )
+
+    target._initialize_shard_worker(test_shared_password_index, ["password"])
+
+    assert target._shared_password_index is test_shared_password_index
+    assert target._worker_passwords == ["password"]
@@ -0,0 +1,41 @@
+"""Tests for `_initialize_watch_worker`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import MonkeyPatch
+from signal import SIG_IGN, SIGINT
+from unlock_pdf.functions import _initialize_watch_worker
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+def test_initialize_watch_worker_ignores_interrupts(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_initialize_watch_worker`
+    has the worker process ignore interrupts
+    before warming it up like any other worker process.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    test_calls: list[object] = []
+
+    monkeypatch.setattr(
+        name = "signal",
+        target = target,
+        value = lambda signal_number, handler: test_calls.append((signal_number, handler))
+    )
+    monkeypatch.setattr(
+        name = "_initialize_worker",
+        target = target,
+        value = lambda passwords: test_calls.append(("_initialize_worker", passwords))
+    )
+
+    _initialize_watch_worker(["password"])
+
+    assert test_calls == [(SIGINT, SIG_IGN), ("_initialize_worker", ["password"])]
@@ -0,0 +1,48 @@
+"""Tests for `_initialize_worker`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import MonkeyPatch
+from unlock_pdf.functions import _initialize_worker
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+def test_initialize_worker_returns_none() -> None:
+    """
+    Assert that `_initialize_worker`
+    warms up `pikepdf` without failing.
+    """
+
+    assert _initialize_worker() is None
+
+def test_initialize_worker_keeps_passwords(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_initialize_worker`
+    keeps a copy of the passwords to attempt unlocking each PDF file with, if any,
+    and keeps those of the worker process as is otherwise.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    test_passwords = ["password-0", "password-1"]
+
+    monkeypatch.setattr(
+        name = "_worker_passwords",
+        target = target,
+        value = []
+    )
+
+    _initialize_worker(test_passwords)
+
+    assert target._worker_passwords == test_passwords
+    assert target._worker_passwords is not test_passwords
+
+    _initialize_worker()
+
+    assert target._worker_passwords == test_passwords
@@ -2,6 +2,8 @@
 
 # pyright: reportPrivateUsage=false
 
+from os import scandir
+from pathlib import Path
 from pytest import MonkeyPatch, mark
 from tests.utilities import generate_mock_boolean
 from unlock_pdf.functions import _is_pdf_file
@@ -26,6 +28,10 @@ import unlock_pdf.functions as target
             "test.pdf", True,
             True
         ),
+        (
+            "test.PDF", True,
+            True
+        ),
         (
             "test.txt", False,
             False
@@ -63,3 +69,29 @@ def test_is_pdf_file_returns_boolean(
     )
 
     assert _is_pdf_file(test_file_path) == test_boolean
+
+def test_is_pdf_file_returns_boolean_for_directory_entry(tmp_path: Path) -> None:
+    """
+    Assert that `_is_pdf_file`
+    returns whether a directory entry is a PDF file or not
+    without reading it
+    when given directory entries.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "misnamed-test.pdf").write_bytes(b"test")
+    (tmp_path / "test.pdf").write_bytes(b"%PDF-1.7")
+    (tmp_path / "test.txt").write_bytes(b"%PDF-1.7")
+    (tmp_path / "test-directory.pdf").mkdir()
+
+    with scandir(tmp_path) as entries:
+        assert {
+            entry.name: _is_pdf_file(entry)
+            for entry in entries
+        } == {
+            "misnamed-test.pdf": True,
+            "test-directory.pdf": False,
+            "test.pdf": True,
+            "test.txt": False
+        }
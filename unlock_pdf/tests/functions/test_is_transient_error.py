@@ -0,0 +1,70 @@
+"""Tests for `_is_transient_error`."""
+
+# pyright: reportPrivateUsage=false
+
+from errno import EACCES, EAGAIN, EBUSY, ENOENT
+from pikepdf import PdfError
+from pytest import mark
+from unlock_pdf.functions import _is_transient_error
+
+@mark.parametrize(
+    "test_exception, test_is_transient_error",
+    [
+        (OSError(EBUSY, "busy"), True),
+        (OSError(EAGAIN, "try again"), True),
+        (OSError(ENOENT, "missing"), False),
+        (OSError("no error number"), False),
+        (PdfError("damaged"), False)
+    ]
+)
+def test_is_transient_error_checks_exception(
+    test_exception: BaseException,
+    test_is_transient_error: bool
+) -> None:
+    """
+    Assert that `_is_transient_error`
+    returns whether an exception is an I/O error that may go away if retried.
+
+    :param test_exception: Exception to check.
+    :param test_is_transient_error: Whether the exception is a transient I/O error or not.
+    """
+
+    assert _is_transient_error(test_exception) == test_is_transient_error
+
+def test_is_transient_error_checks_root_cause() -> None:
+    """
+    Assert that `_is_transient_error`
+    returns `True`
+    when an exception was raised from a transient I/O error.
+    """
+
+    test_exception = PdfError("Unlocking test.pdf failed.")
+    test_exception.__cause__ = OSError(EBUSY, "busy")
+
+    assert _is_transient_error(test_exception)
+
+@mark.parametrize(
+    "test_windows_error_number, test_is_transient_error",
+    [
+        (32, True),
+        (33, True),
+        (5, False)
+    ]
+)
+def test_is_transient_error_checks_windows_error_number(
+    test_is_transient_error: bool,
+    test_windows_error_number: int
+) -> None:
+    """
+    Assert that `_is_transient_error`
+    returns whether an I/O error is a sharing violation or a lock violation on Windows,
+    whose error number is not specific enough.
+
+    :param test_is_transient_error: Whether the exception is a transient I/O error or not.
+    :param test_windows_error_number: Windows error number of the I/O error.
+    """
+
+    test_exception = OSError(EACCES, "access denied")
+    test_exception.winerror = test_windows_error_number # pyright: ignore[reportAttributeAccessIssue]
+
+    assert _is_transient_error(test_exception) == test_is_transient_error
@@ -0,0 +1,87 @@
+"""Tests for `_locate_pdf_object`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import mark
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.functions import _locate_pdf_object
+
+@mark.parametrize("test_should_generate_object_streams", [False, True])
+def test_locate_pdf_object_returns_object_offset(
+    tmp_path: Path,
+    test_should_generate_object_streams: bool
+) -> None:
+    """
+    Assert that `_locate_pdf_object`
+    returns the offset of an uncompressed indirect object
+    for both cross-reference tables and cross-reference streams.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_should_generate_object_streams: Whether to use a cross-reference stream or not.
+    """
+
+    test_data = generate_test_pdf_file(
+        file_path = tmp_path / "test.pdf",
+        test_password = "password",
+        test_should_generate_object_streams = test_should_generate_object_streams
+    ).read_bytes()
+    test_encrypt_reference = test_data[test_data.rindex(b"/Encrypt"):].split()[1]
+    test_object_offset = _locate_pdf_object(test_data, int(test_encrypt_reference))
+
+    assert test_object_offset is not None
+    assert test_data[test_object_offset:].startswith(test_encrypt_reference + b" 0 obj")
+
+@mark.parametrize(
+    "test_data, test_object_number," \
+    "test_object_offset",
+    [
+        (
+            b"xref\n1 1\n0000000099 00000 n \ntrailer\n<< /Size 2 >>\n" \
+            b"xref\n0 1\n0000000000 65535 f \ntrailer\n<< /Size 2 /Prev 0 >>\n" \
+            b"startxref\n51\n%%EOF\n",
+            1,
+            99
+        ),
+        (
+            b"xref\n0 1\n0000000000 65535 f \ntrailer\n<< /Size 2 /Prev 0 >>\n" \
+            b"startxref\n0\n%%EOF\n",
+            1,
+            None
+        ),
+        (
+            b"xref\n0 1\n0000000000 65535 f \ntrailer\n<< /Size 2 /Prev 9 >>\n" \
+            b"startxref\n0\n%%EOF\n",
+            1,
+            None
+        ),
+        (
+            b"xref\n0 1\n0000000000 65535 f \ntrailer\n<< /Size 2 >>\n" \
+            b"startxref\n0\n%%EOF\n",
+            1,
+            None
+        ),
+        (
+            b"%PDF-1.7\n%%EOF\n",
+            1,
+            None
+        )
+    ]
+)
+def test_locate_pdf_object_follows_previous_xref_sections(
+    test_data: bytes,
+    test_object_number: int,
+    test_object_offset: int | None
+) -> None:
+    """
+    Assert that `_locate_pdf_object`
+    follows previous cross-reference sections from the last to the first
+    without looping forever,
+    or returns `None` if the indirect object cannot be located.
+
+    :param test_data: Raw PDF data.
+    :param test_object_number: Object number of the indirect object.
+    :param test_object_offset: Expected offset of the indirect object, if any.
+    """
+
+    assert _locate_pdf_object(test_data, test_object_number) == test_object_offset
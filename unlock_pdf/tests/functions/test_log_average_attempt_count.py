@@ -0,0 +1,44 @@
+"""Tests for `_log_average_attempt_count`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import CaptureFixture, mark
+from unlock_pdf.functions import _log_average_attempt_count
+
+@mark.parametrize(
+    "test_attempt_counts, test_output",
+    [
+        (
+            [],
+            ""
+        ),
+        (
+            [1, 2],
+            "Each unlocked PDF file took 1.50 attempts on average." + "\n"
+            + "\n"
+        )
+    ]
+)
+def test_log_average_attempt_count_prints_log(
+    capsys: CaptureFixture[str],
+    test_attempt_counts: list[int],
+    test_output: str
+) -> None:
+    """
+    Assert that `_log_average_attempt_count`
+    prints how many passwords were attempted on average per unlocked PDF file
+    only if any PDF file was unlocked.
+
+    :param capsys: `pytest` fixture for capturing outputs.
+    :param test_attempt_counts: Number of passwords attempted until each unlocked PDF file
+                                was unlocked.
+    :param test_output: Expected output.
+    """
+
+    _log_average_attempt_count(test_attempt_counts)
+
+    assert (
+        capsys \
+            .readouterr() \
+            .out
+    ) == test_output
@@ -0,0 +1,49 @@
+"""Tests for `_log_file_errors`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import CaptureFixture, mark
+from unlock_pdf.functions import _log_file_errors
+from unlock_pdf.types import FileErrors
+
+@mark.parametrize(
+    "test_file_errors, test_output",
+    [
+        (
+            {},
+            ""
+        ),
+        (
+            {
+                "test-0.pdf": "PdfError: damaged",
+                "test-1.pdf": "FileNotFoundError: missing"
+            },
+            "Unlocking test-0.pdf failed due to PdfError: damaged" + "\n"
+            + "Unlocking test-1.pdf failed due to FileNotFoundError: missing" + "\n"
+            + "\n"
+        )
+    ]
+)
+def test_log_file_errors_prints_log(
+    capsys: CaptureFixture[str],
+    test_file_errors: FileErrors,
+    test_output: str
+) -> None:
+    """
+    Assert that `_log_file_errors`
+    prints the error that made unlocking each failed PDF file fail
+    only if any PDF file failed.
+
+    :param capsys: `pytest` fixture for capturing outputs.
+    :param test_file_errors: Dictionary that maps file paths of PDF files
+                             with the errors that made unlocking them fail.
+    :param test_output: Expected output.
+    """
+
+    _log_file_errors(test_file_errors)
+
+    assert (
+        capsys \
+            .readouterr() \
+            .out
+    ) == test_output
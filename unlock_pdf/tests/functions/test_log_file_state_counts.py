@@ -0,0 +1,32 @@
+"""Tests for `_log_file_state_counts`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import CaptureFixture
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.functions import _log_file_state_counts
+
+def test_log_file_state_counts_prints_per_file_state(capsys: CaptureFixture[str]) -> None:
+    """
+    Assert that `_log_file_state_counts`
+    prints per file state how many PDF files are in such file state
+    when given valid file state counts.
+
+    :param capsys: `pytest` fixture for capturing outputs.
+    """
+
+    _log_file_state_counts({
+        FileState.LOCKED: 0,
+        FileState.NOT_LOCKED: 1,
+        FileState.FAILED: 0
+    })
+
+    assert (
+        capsys \
+            .readouterr() \
+            .out
+    ) == (
+        "0 PDF files are still locked." + "\n"
+        + "1 PDF file is not locked." + "\n"
+        + "\n"
+    )
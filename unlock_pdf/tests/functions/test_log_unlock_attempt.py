@@ -26,6 +26,7 @@ def test_log_unlock_attempt_prints_per_file_state(capsys: CaptureFixture[str]) -
             file_state for file_state in FileState
         ]
     }
+    grouped_pdf_file_paths[FileState.ABORTED] = ["test-3.pdf"]
     grouped_pdf_file_paths[FileState.NOT_LOCKED] = ["test-0.pdf"]
     grouped_pdf_file_paths[FileState.UNLOCKED] = ["test-1.pdf", "test-2.pdf"]
 
@@ -46,4 +47,7 @@ def test_log_unlock_attempt_prints_per_file_state(capsys: CaptureFixture[str]) -
         + "test-1.pdf" + "\n"
         + "test-2.pdf" + "\n"
         + "\n"
+        + "1 PDF file is aborted:" + "\n"
+        + "test-3.pdf" + "\n"
+        + "\n"
     )
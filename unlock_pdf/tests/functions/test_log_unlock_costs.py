@@ -0,0 +1,53 @@
+"""Tests for `_log_unlock_costs`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import CaptureFixture, mark
+from unlock_pdf.functions import _log_unlock_costs
+
+@mark.parametrize(
+    "test_unlock_costs, test_output",
+    [
+        (
+            {},
+            ""
+        ),
+        (
+            {"test-0.pdf": 2.0, "test-1.pdf": 0.5},
+            "Unlocking was estimated to take ~2.50 s of work, costliest first:\n" \
+            "test-0.pdf (~2.00 s)\n" \
+            "test-1.pdf (~0.50 s)\n" \
+            "\n"
+        ),
+        (
+            {f"test-{index}.pdf": 6.0 - index for index in range(6)},
+            "Unlocking was estimated to take ~21.00 s of work, costliest first:\n" \
+            "test-0.pdf (~6.00 s)\n" \
+            "test-1.pdf (~5.00 s)\n" \
+            "test-2.pdf (~4.00 s)\n" \
+            "test-3.pdf (~3.00 s)\n" \
+            "test-4.pdf (~2.00 s)\n" \
+            "\n"
+        )
+    ]
+)
+def test_log_unlock_costs_logs_costliest_pdf_files(
+    capsys: CaptureFixture[str],
+    test_output: str,
+    test_unlock_costs: dict[str, float]
+) -> None:
+    """
+    Assert that `_log_unlock_costs`
+    logs the total estimated cost along with at most the 5 costliest PDF files,
+    or nothing if no PDF file was scheduled.
+
+    :param capsys: `pytest` fixture for capturing outputs.
+    :param test_output: Expected output.
+    :param test_unlock_costs: Mock estimated costs of unlocking the PDF files, from the costliest.
+    """
+
+    _log_unlock_costs(test_unlock_costs)
+
+    assert capsys \
+        .readouterr() \
+        .out == test_output
@@ -0,0 +1,33 @@
+"""Tests for `_move_password_to_front`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import mark
+from unlock_pdf.functions import _move_password_to_front
+from unlock_pdf.types import Passwords
+
+@mark.parametrize(
+    "test_password, test_final_passwords",
+    [
+        (None, ["password-0", "password-1", "password-2"]),
+        ("password-0", ["password-0", "password-1", "password-2"]),
+        ("password-2", ["password-2", "password-0", "password-1"])
+    ]
+)
+def test_move_password_to_front_returns_passwords(
+    test_final_passwords: Passwords,
+    test_password: str | None
+) -> None:
+    """
+    Assert that `_move_password_to_front`
+    returns the passwords with the one that unlocked the latest PDF file first
+    without changing the given passwords.
+
+    :param test_final_passwords: Expected passwords in their new order.
+    :param test_password: Password that unlocked the latest PDF file, if any.
+    """
+
+    test_passwords = ["password-0", "password-1", "password-2"]
+
+    assert _move_password_to_front(test_passwords, test_password) == test_final_passwords
+    assert test_passwords == ["password-0", "password-1", "password-2"]
@@ -0,0 +1,113 @@
+"""Tests for `_open_inotify`."""
+
+# pyright: reportPrivateUsage=false
+
+from os import close
+from pytest import MonkeyPatch, mark
+from sys import platform
+from unlock_pdf.functions import _open_inotify
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+@mark.skipif(
+    platform != "linux",
+    reason = "inotify is only supported on Linux."
+)
+def test_open_inotify_returns_inotify() -> None:
+    """
+    Assert that `_open_inotify`
+    returns an inotify instance that watches no directory yet
+    when inotify is supported.
+    """
+
+    test_inotify = _open_inotify()
+
+    assert test_inotify is not None
+    assert test_inotify.directory_paths == {}
+    assert test_inotify.file_descriptor >= 0
+
+    close(test_inotify.file_descriptor)
+
+def test_open_inotify_returns_none_without_c_library(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_open_inotify`
+    returns `None`
+    when the C library cannot be found.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    monkeypatch.setattr(
+        name = "find_library",
+        target = target,
+        value = lambda name: None
+    )
+
+    assert _open_inotify() is None
+
+class _MockLibrary:
+    """Mock C library whose inotify instances cannot be initialized."""
+
+    def inotify_init1(self, flags: int) -> int:
+        """
+        Mock function of `inotify_init1` that
+        fails to initialize an inotify instance.
+
+        :param flags: Flags of the inotify instance.
+        :returns: Mock error return value.
+        """
+
+        return -1
+
+def _raise_os_error(name: str, use_errno: bool) -> None:
+    """
+    Mock function of `ctypes.CDLL` that
+    fails to load the C library.
+
+    :param name: Path of the C library.
+    :param use_errno: Whether to preserve `errno` or not.
+    :raises OSError: Always.
+    """
+
+    raise OSError
+
+@mark.parametrize(
+    "test_cdll",
+    [
+        _raise_os_error,
+        lambda name, use_errno: object(),
+        lambda name, use_errno: _MockLibrary()
+    ]
+)
+def test_open_inotify_returns_none_without_inotify(
+    monkeypatch: MonkeyPatch,
+    test_cdll: object
+) -> None:
+    """
+    Assert that `_open_inotify`
+    returns `None`
+    when the C library cannot be loaded, does not support inotify,
+    or fails to initialize an inotify instance.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param test_cdll: Mock function of `ctypes.CDLL`.
+    """
+
+    monkeypatch.setattr(
+        name = "find_library",
+        target = target,
+        value = lambda name: "libc.so.6"
+    )
+    monkeypatch.setattr(
+        name = "CDLL",
+        target = target,
+        value = test_cdll
+    )
+
+    assert _open_inotify() is None
@@ -0,0 +1,23 @@
+"""Tests for `_order_passwords`."""
+
+# pyright: reportPrivateUsage=false
+
+from unlock_pdf.classes import PasswordHits
+from unlock_pdf.functions import _order_passwords
+
+def test_order_passwords_returns_passwords_by_hits() -> None:
+    """
+    Assert that `_order_passwords`
+    returns the passwords from the one that unlocked the most PDF files to the least
+    while keeping the given order among passwords that unlocked as many.
+    """
+
+    test_password_hits = PasswordHits()
+
+    for test_password in ["password-3", "password-1", "password-3"]:
+        test_password_hits.add(test_password)
+
+    assert _order_passwords(
+        ["password-0", "password-1", "password-2", "password-3"],
+        test_password_hits
+    ) == ["password-3", "password-1", "password-0", "password-2"]
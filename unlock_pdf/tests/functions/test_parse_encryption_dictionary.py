@@ -0,0 +1,66 @@
+"""Tests for `_parse_encryption_dictionary`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import mark
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.functions import _parse_encryption_dictionary
+
+@mark.parametrize(
+    "test_revision, test_should_generate_object_streams",
+    [
+        (4, False),
+        (6, True)
+    ]
+)
+def test_parse_encryption_dictionary_returns_dictionaries(
+    tmp_path: Path,
+    test_revision: int,
+    test_should_generate_object_streams: bool
+) -> None:
+    """
+    Assert that `_parse_encryption_dictionary`
+    returns the encryption dictionary and the trailer of encrypted PDF data
+    for both cross-reference tables and cross-reference streams.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_revision: Revision of the standard security handler.
+    :param test_should_generate_object_streams: Whether to use a cross-reference stream or not.
+    """
+
+    test_dictionaries = _parse_encryption_dictionary(
+        generate_test_pdf_file(
+            file_path = tmp_path / "test.pdf",
+            test_password = "password",
+            test_revision = test_revision,
+            test_should_generate_object_streams = test_should_generate_object_streams
+        ).read_bytes()
+    )
+
+    assert test_dictionaries is not None
+
+    test_encryption_dictionary, test_trailer = test_dictionaries
+
+    assert test_encryption_dictionary["/R"] == test_revision
+    assert "/Encrypt" in test_trailer
+
+@mark.parametrize(
+    "test_data",
+    [
+        b"%PDF-1.7\n%%EOF\n",
+        b"%PDF-1.7\nxref\ntrailer\n<< /Size 1 >>\nstartxref\n9\n%%EOF\n",
+        b"%PDF-1.7\nxref\ntrailer\n<< /Encrypt [] >>\nstartxref\n9\n%%EOF\n",
+        b"%PDF-1.7\nxref\ntrailer\n<< /Encrypt <<\nstartxref\n9\n%%EOF\n"
+    ]
+)
+def test_parse_encryption_dictionary_returns_none(test_data: bytes) -> None:
+    """
+    Assert that `_parse_encryption_dictionary`
+    returns `None`
+    when the encryption dictionary of PDF data is missing, malformed, or is not a dictionary.
+
+    :param test_data: Mock raw PDF data.
+    """
+
+    assert _parse_encryption_dictionary(test_data) is None
@@ -0,0 +1,123 @@
+"""Tests for `_parse_encryption_fingerprint`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import mark
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.functions import _parse_encryption_fingerprint
+
+TEST_HASH = "<" + "00" * 32 + ">"
+TEST_SALTED_HASHES = [
+    "<" + "00" * 48 + ">",
+    "<" + "01" * 48 + ">"
+]
+
+@mark.parametrize(
+    "test_encryption_dictionaries, test_should_share_fingerprint",
+    [
+        (
+            [
+                f"<< /Filter /Standard /R 3 /O {TEST_HASH} /U <00> /P -4 >>",
+                f"<< /Filter /Standard /R 3 /O {TEST_HASH} /U <01> /P -3 >>"
+            ],
+            True
+        ),
+        (
+            [
+                f"<< /Filter /Standard /R 3 /O {TEST_HASH} >>",
+                f"<< /Filter /Standard /R 4 /O {TEST_HASH} >>"
+            ],
+            False
+        ),
+        (
+            [
+                f"<< /Filter /Standard /R 3 /O {TEST_HASH} >>",
+                f"<< /Filter /Standard /R 3 /O {TEST_HASH} /Length 128 >>"
+            ],
+            False
+        ),
+        (
+            [
+                f"<< /Filter /Standard /R 6 /V 5 /O {TEST_SALTED_HASHES[0]} /P -4 >>",
+                f"<< /Filter /Standard /R 6 /V 5 /O {TEST_SALTED_HASHES[1]} /P -4 >>"
+            ],
+            True
+        ),
+        (
+            [
+                f"<< /Filter /Standard /R 6 /V 5 /O {TEST_SALTED_HASHES[0]} /P -4 >>",
+                f"<< /Filter /Standard /R 6 /V 5 /O {TEST_SALTED_HASHES[0]} /P -3 >>"
+            ],
+            False
+        )
+    ]
+)
+def test_parse_encryption_fingerprint_returns_fingerprint(
+    test_encryption_dictionaries: list[str],
+    test_should_share_fingerprint: bool
+) -> None:
+    """
+    Assert that `_parse_encryption_fingerprint`
+    returns the same encryption fingerprint only for PDF data
+    whose security handler, revision, key length, and owner password hash are the same,
+    or whose permission flags are the same instead from revision 5 onwards.
+
+    :param test_encryption_dictionaries: Encryption dictionaries of each PDF data.
+    :param test_should_share_fingerprint: Whether both PDF data should share a fingerprint or not.
+    """
+
+    test_fingerprints = [
+        _parse_encryption_fingerprint(
+            b"%PDF-1.7\nxref\ntrailer\n<< /Encrypt " + test_encryption_dictionary.encode() \
+            + b" >>\nstartxref\n9\n%%EOF\n"
+        )
+        for test_encryption_dictionary in test_encryption_dictionaries
+    ]
+
+    assert None not in test_fingerprints
+    assert (test_fingerprints[0] == test_fingerprints[1]) == test_should_share_fingerprint
+
+@mark.parametrize("test_revision", [4, 6])
+def test_parse_encryption_fingerprint_shares_fingerprint(tmp_path: Path, test_revision: int) -> None:
+    """
+    Assert that `_parse_encryption_fingerprint`
+    returns the same encryption fingerprint for PDF files encrypted with the same passwords,
+    even from revision 5 onwards where their owner password hashes are salted at random.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_revision: Revision of the standard security handler.
+    """
+
+    test_fingerprints = [
+        _parse_encryption_fingerprint(
+            generate_test_pdf_file(
+                file_path = tmp_path / test_file_name,
+                test_password = "password",
+                test_revision = test_revision
+            ).read_bytes()
+        )
+        for test_file_name in ["test-0.pdf", "test-1.pdf"]
+    ]
+
+    assert test_fingerprints[0] is not None
+    assert test_fingerprints[0] == test_fingerprints[1]
+
+@mark.parametrize(
+    "test_data",
+    [
+        b"%PDF-1.7\nxref\ntrailer\n<< /Size 1 >>\nstartxref\n9\n%%EOF\n",
+        b"%PDF-1.7\nxref\ntrailer\n<< /Encrypt << /Filter /Standard /O 0 >> >>\n" \
+        b"startxref\n9\n%%EOF\n"
+    ]
+)
+def test_parse_encryption_fingerprint_returns_none(test_data: bytes) -> None:
+    """
+    Assert that `_parse_encryption_fingerprint`
+    returns `None`
+    when the encryption dictionary of PDF data is missing or has no owner password hash.
+
+    :param test_data: Mock raw PDF data.
+    """
+
+    assert _parse_encryption_fingerprint(test_data) is None
@@ -0,0 +1,43 @@
+"""Tests for `_parse_encryption_parameters`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import mark
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.functions import _parse_encryption_parameters
+
+@mark.parametrize(
+    "test_password, test_revision, test_should_have_parameters",
+    [
+        ("password", 4, True),
+        ("password", 6, False),
+        (None, 4, False)
+    ]
+)
+def test_parse_encryption_parameters_returns_encryption_parameters(
+    tmp_path: Path,
+    test_password: str | None,
+    test_revision: int,
+    test_should_have_parameters: bool
+) -> None:
+    """
+    Assert that `_parse_encryption_parameters`
+    returns the parameters of the standard security handler of PDF data
+    only if it is encrypted via revisions 2 to 5 of said handler.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_password: User password to encrypt the PDF data with, if any.
+    :param test_revision: Revision of the standard security handler.
+    :param test_should_have_parameters: Whether parameters should be returned or not.
+    """
+
+    test_encryption_parameters = _parse_encryption_parameters(
+        generate_test_pdf_file(
+            file_path = tmp_path / "test.pdf",
+            test_password = test_password,
+            test_revision = test_revision
+        ).read_bytes()
+    )
+
+    assert (test_encryption_parameters is not None) == test_should_have_parameters
@@ -0,0 +1,45 @@
+"""Tests for `_parse_encryption_revision`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import mark
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.functions import _parse_encryption_revision
+
+@mark.parametrize("test_revision", [2, 3, 4, 6])
+def test_parse_encryption_revision_returns_revision(tmp_path: Path, test_revision: int) -> None:
+    """
+    Assert that `_parse_encryption_revision`
+    returns the revision of the standard security handler of encrypted PDF data.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_revision: Revision of the standard security handler to encrypt the PDF file with.
+    """
+
+    test_data = generate_test_pdf_file(
+        file_path = tmp_path / "test.pdf",
+        test_password = "password",
+        test_revision = test_revision
+    ).read_bytes()
+
+    assert _parse_encryption_revision(test_data) == test_revision
+
+@mark.parametrize(
+    "test_data",
+    [
+        b"%PDF-1.7\nxref\ntrailer\n<< /Size 1 >>\nstartxref\n9\n%%EOF\n",
+        b"%PDF-1.7\nxref\ntrailer\n<< /Encrypt << /Filter /Standard /R /Six >> >>\n" \
+        b"startxref\n9\n%%EOF\n"
+    ]
+)
+def test_parse_encryption_revision_returns_none(test_data: bytes) -> None:
+    """
+    Assert that `_parse_encryption_revision`
+    returns `None`
+    when the PDF data is not encrypted or when its revision is not an integer.
+
+    :param test_data: Mock raw PDF data.
+    """
+
+    assert _parse_encryption_revision(test_data) is None
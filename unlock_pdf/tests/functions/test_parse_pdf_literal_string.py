@@ -0,0 +1,79 @@
+"""Tests for `_parse_pdf_literal_string`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import mark, raises
+from unlock_pdf.functions import _parse_pdf_literal_string
+
+@mark.parametrize(
+    "test_data," \
+    "test_value, test_end_offset",
+    [
+        (
+            b"(text)",
+            b"text", 6
+        ),
+        (
+            b"(a (nested) string)>>",
+            b"a (nested) string", 19
+        ),
+        (
+            b"(\\n\\r\\t\\b\\f\\(\\)\\\\\\q)",
+            b"\n\r\t\b\f()\\q", 20
+        ),
+        (
+            b"(\\101\\0612\\7)",
+            b"A12\x07", 13
+        ),
+        (
+            b"(line\\\r\nbreak\\\ncontinued)",
+            b"linebreakcontinued", 25
+        ),
+        (
+            b"(a\r\nb\rc\nd)",
+            b"a\nb\nc\nd", 10
+        )
+    ]
+)
+def test_parse_pdf_literal_string_returns_value(
+    test_data: bytes,
+    test_end_offset: int,
+    test_value: bytes
+) -> None:
+    """
+    Assert that `_parse_pdf_literal_string`
+    returns the value of the literal string and the offset right after it,
+    resolving
+
+    - escape sequences,
+    - line breaks, and
+    - nested parentheses.
+
+    :param test_data: Mock raw PDF data.
+    :param test_end_offset: Offset right after the literal string.
+    :param test_value: Value of the literal string.
+    """
+
+    assert _parse_pdf_literal_string(test_data, 0) == (test_value, test_end_offset)
+
+@mark.parametrize(
+    "test_data",
+    [
+        b"(unclosed",
+        b"(\\"
+    ]
+)
+def test_parse_pdf_literal_string_raises_exception(test_data: bytes) -> None:
+    """
+    Assert that `_parse_pdf_literal_string`
+    raises an appropriate exception
+    when the literal string is not closed.
+
+    :param test_data: Mock raw PDF data.
+    """
+
+    with raises(
+        expected_exception = ValueError,
+        match = "PDF object must be well-formed."
+    ):
+        _parse_pdf_literal_string(test_data, 0)
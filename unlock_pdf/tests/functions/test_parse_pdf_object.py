@@ -0,0 +1,104 @@
+"""Tests for `_parse_pdf_object`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import mark, raises
+from unlock_pdf.functions import _parse_pdf_object
+from unlock_pdf.types import PdfObject
+
+@mark.parametrize(
+    "test_data," \
+    "test_pdf_object, test_end_offset",
+    [
+        (
+            b" % comment\n<< /Type /XRef /Size 3 /Root 1 0 R >>stream",
+            {"/Type": "/XRef", "/Size": 3, "/Root": (1, 0)}, 48
+        ),
+        (
+            b"<<>>",
+            {}, 4
+        ),
+        (
+            b"[ <0a1B> <a 1> (text) ]",
+            [b"\x0a\x1b", b"\xa1", b"text"], 23
+        ),
+        (
+            b"[]",
+            [], 2
+        ),
+        (
+            b"/A#20B",
+            "/A B", 6
+        ),
+        (
+            b"-1.5 ",
+            -1.5, 4
+        ),
+        (
+            b"+12]",
+            12, 3
+        ),
+        (
+            b"true",
+            True, 4
+        ),
+        (
+            b"false>>",
+            False, 5
+        ),
+        (
+            b"null",
+            None, 4
+        ),
+        (
+            b"<>",
+            b"", 2
+        ),
+        (
+            b"(a\\(b)",
+            b"a(b", 6
+        )
+    ]
+)
+def test_parse_pdf_object_returns_pdf_object(
+    test_data: bytes,
+    test_end_offset: int,
+    test_pdf_object: PdfObject
+) -> None:
+    """
+    Assert that `_parse_pdf_object`
+    returns the parsed PDF object and the offset right after it
+    when given well-formed raw PDF data.
+
+    :param test_data: Mock raw PDF data.
+    :param test_end_offset: Offset right after the PDF object.
+    :param test_pdf_object: Parsed PDF object.
+    """
+
+    assert _parse_pdf_object(test_data, 0) == (test_pdf_object, test_end_offset)
+
+@mark.parametrize(
+    "test_data",
+    [
+        b"",
+        b"<< 1 2 >>",
+        b"<< /Size 1",
+        b"[1 2",
+        b"trueish",
+        b"{}"
+    ]
+)
+def test_parse_pdf_object_raises_exception(test_data: bytes) -> None:
+    """
+    Assert that `_parse_pdf_object`
+    raises an appropriate exception
+    when given malformed or unsupported raw PDF data.
+
+    :param test_data: Mock raw PDF data.
+    """
+
+    with raises(
+        expected_exception = ValueError,
+        match = "PDF object must be well-formed."
+    ):
+        _parse_pdf_object(test_data, 0)
@@ -0,0 +1,87 @@
+"""Tests for `_pop_pending_result`."""
+
+# pyright: reportPrivateUsage=false
+
+from collections import deque
+from concurrent.futures import Future
+from threading import Timer
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.functions import _pop_pending_result
+from unlock_pdf.types import UnlockResult
+
+def _generate_test_pending_results() -> deque[tuple[str | None, Future[UnlockResult]]]:
+    """
+    Generate pending results where only the last one is done.
+
+    :returns: Mock encryption fingerprints along with their pending results, in order.
+    """
+
+    test_pending_results: deque[tuple[str | None, Future[UnlockResult]]] = deque(
+        (f"fingerprint-{index}", Future())
+        for index in range(3)
+    )
+
+    test_pending_results[2][1].set_result(UnlockResult("test-2.pdf", FileState.UNLOCKED))
+
+    return test_pending_results
+
+def test_pop_pending_result_pops_oldest_pending_result() -> None:
+    """
+    Assert that `_pop_pending_result`
+    pops the oldest pending result
+    when asked to preserve order.
+    """
+
+    test_pending_results = _generate_test_pending_results()
+
+    test_pending_results[0][1].set_result(UnlockResult("test-0.pdf", FileState.LOCKED))
+
+    fingerprint, _ = _pop_pending_result(test_pending_results, True)
+
+    assert fingerprint == "fingerprint-0"
+    assert [
+        fingerprint for fingerprint, _ in test_pending_results
+    ] == ["fingerprint-1", "fingerprint-2"]
+
+def test_pop_pending_result_pops_first_done_result() -> None:
+    """
+    Assert that `_pop_pending_result`
+    pops the first pending result to be done while keeping the others in order
+    when not asked to preserve order.
+    """
+
+    test_pending_results = _generate_test_pending_results()
+
+    fingerprint, pending_result = _pop_pending_result(test_pending_results, False)
+
+    assert fingerprint == "fingerprint-2"
+    assert pending_result.result().file_path == "test-2.pdf"
+    assert [
+        fingerprint for fingerprint, _ in test_pending_results
+    ] == ["fingerprint-0", "fingerprint-1"]
+
+def test_pop_pending_result_waits_for_first_done_result() -> None:
+    """
+    Assert that `_pop_pending_result`
+    waits for a pending result to be done
+    when none is done yet and when not asked to preserve order.
+    """
+
+    test_pending_results: deque[tuple[str | None, Future[UnlockResult]]] = deque(
+        (None, Future())
+        for _ in range(2)
+    )
+    test_timer = Timer(
+        0.01,
+        test_pending_results[1][1].set_result,
+        [UnlockResult("test-1.pdf", FileState.NOT_LOCKED)]
+    )
+
+    test_timer.start()
+
+    _, pending_result = _pop_pending_result(test_pending_results, False)
+
+    test_timer.join()
+
+    assert pending_result.result().file_path == "test-1.pdf"
+    assert len(test_pending_results) == 1
@@ -0,0 +1,56 @@
+"""Tests for `_prioritize_fingerprint_password`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import MonkeyPatch, mark
+from unlock_pdf.classes import FingerprintPasswords
+from unlock_pdf.functions import _prioritize_fingerprint_password
+from unlock_pdf.types import Passwords
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+@mark.parametrize(
+    "test_fingerprint, test_final_passwords",
+    [
+        (None, ["password-0", "password-1", "password-2"]),
+        ("fingerprint-0", ["password-0", "password-1", "password-2"]),
+        ("fingerprint-2", ["password-2", "password-0", "password-1"])
+    ]
+)
+def test_prioritize_fingerprint_password_returns_passwords(
+    monkeypatch: MonkeyPatch,
+    test_final_passwords: Passwords,
+    test_fingerprint: str | None
+) -> None:
+    """
+    Assert that `_prioritize_fingerprint_password`
+    returns the encryption fingerprint of a PDF file along with the passwords
+    with the one that unlocked the latest PDF file with the same fingerprint first.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param test_final_passwords: Expected passwords in their new order.
+    :param test_fingerprint: Mock encryption fingerprint of the PDF file, if any.
+    """
+
+    test_passwords = ["password-0", "password-1", "password-2"]
+    test_fingerprint_passwords = FingerprintPasswords(test_passwords)
+
+    test_fingerprint_passwords.add("fingerprint-2", "password-2")
+
+    monkeypatch.setattr(
+        name = "_read_encryption_fingerprint",
+        target = target,
+        value = lambda file_path: test_fingerprint
+    )
+
+    assert _prioritize_fingerprint_password(
+        "test.pdf",
+        test_passwords,
+        test_fingerprint_passwords
+    ) == (test_fingerprint, test_final_passwords)
@@ -0,0 +1,34 @@
+"""Tests for `_prioritize_passwords`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import mark
+from unlock_pdf.functions import _prioritize_passwords
+from unlock_pdf.types import Passwords
+
+@mark.parametrize(
+    "test_prioritized_passwords, test_final_passwords",
+    [
+        ([], ["password-0", "password-1", "password-2"]),
+        (["password-2"], ["password-2", "password-0", "password-1"]),
+        (["password-2", "password-1"], ["password-2", "password-1", "password-0"]),
+        (["password-1", "password-1"], ["password-1", "password-0", "password-2"])
+    ]
+)
+def test_prioritize_passwords_returns_passwords(
+    test_final_passwords: Passwords,
+    test_prioritized_passwords: Passwords
+) -> None:
+    """
+    Assert that `_prioritize_passwords`
+    returns the passwords with the ones to attempt first at their front, in order,
+    without changing the given passwords.
+
+    :param test_final_passwords: Expected passwords in their new order.
+    :param test_prioritized_passwords: Passwords to attempt first, in order.
+    """
+
+    test_passwords = ["password-0", "password-1", "password-2"]
+
+    assert _prioritize_passwords(test_passwords, test_prioritized_passwords) == test_final_passwords
+    assert test_passwords == ["password-0", "password-1", "password-2"]
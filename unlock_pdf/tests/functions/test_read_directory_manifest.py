@@ -0,0 +1,27 @@
+"""Tests for `_read_directory_manifest`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from unlock_pdf.classes import DirectoryManifest
+from unlock_pdf.functions import _read_directory_manifest
+
+def test_read_directory_manifest_reads_from_cache_directory(tmp_path: Path) -> None:
+    """
+    Assert that `_read_directory_manifest`
+    reads the manifest of walked directories from a cache directory
+    and reads none without one.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_directory_manifest = DirectoryManifest()
+
+    test_directory_manifest.add("directory", 1, {"test.pdf": 2}, [])
+    test_directory_manifest.dump(str(tmp_path / "directory-manifest.json"))
+
+    directory_manifest = _read_directory_manifest(str(tmp_path))
+
+    assert directory_manifest is not None
+    assert directory_manifest.get("directory", 1) == ({"test.pdf": 2}, [])
+    assert _read_directory_manifest(None) is None
@@ -0,0 +1,67 @@
+"""Tests for `_read_encryption_fingerprint`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import mark
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.functions import _read_encryption_fingerprint
+
+@mark.parametrize(
+    "test_passwords, test_should_share_fingerprint",
+    [
+        (["password-0", "password-0"], True),
+        (["password-0", "password-1"], False)
+    ]
+)
+def test_read_encryption_fingerprint_returns_fingerprint(
+    tmp_path: Path,
+    test_passwords: list[str],
+    test_should_share_fingerprint: bool
+) -> None:
+    """
+    Assert that `_read_encryption_fingerprint`
+    returns the same encryption fingerprint only for PDF files encrypted with the same passwords.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_passwords: User passwords to encrypt each PDF file with.
+    :param test_should_share_fingerprint: Whether both PDF files should share a fingerprint or not.
+    """
+
+    test_fingerprints = [
+        _read_encryption_fingerprint(
+            str(
+                generate_test_pdf_file(
+                    file_path = tmp_path / f"test-{index}.pdf",
+                    test_password = test_password,
+                    test_revision = 4
+                )
+            )
+        )
+        for index, test_password in enumerate(test_passwords)
+    ]
+
+    assert None not in test_fingerprints
+    assert (test_fingerprints[0] == test_fingerprints[1]) == test_should_share_fingerprint
+
+@mark.parametrize(
+    "test_content",
+    [
+        b"%PDF-1.7\nxref\ntrailer\n<< /Size 1 >>\nstartxref\n9\n%%EOF\n",
+        b"%PDF-1.7\nxref\ntrailer\n<< /Encrypt << /Filter /Standard /O 0 >> >>\n" \
+        b"startxref\n9\n%%EOF\n"
+    ]
+)
+def test_read_encryption_fingerprint_returns_none(tmp_path: Path, test_content: bytes) -> None:
+    """
+    Assert that `_read_encryption_fingerprint`
+    returns `None`
+    when the encryption dictionary of a PDF file is missing or has no owner password hash.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_content: Mock content of the PDF file.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(test_content)
+
+    assert _read_encryption_fingerprint(str(tmp_path / "test.pdf")) is None
@@ -0,0 +1,209 @@
+"""Tests for `_read_encryption_parameters`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import mark
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.functions import _read_encryption_parameters
+
+@mark.parametrize(
+    "test_revision, test_should_generate_object_streams," \
+    "test_key_length, test_hash_length",
+    [
+        (
+            2, False,
+            5, 32
+        ),
+        (
+            3, True,
+            16, 32
+        ),
+        (
+            4, False,
+            16, 32
+        ),
+        (
+            5, True,
+            16, 48
+        )
+    ]
+)
+def test_read_encryption_parameters_returns_encryption_parameters(
+    tmp_path: Path,
+    test_hash_length: int,
+    test_key_length: int,
+    test_revision: int,
+    test_should_generate_object_streams: bool
+) -> None:
+    """
+    Assert that `_read_encryption_parameters`
+    returns the parameters of the standard security handler of a PDF file
+    for both cross-reference tables and cross-reference streams.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_hash_length: Expected length of the owner hash and the user hash.
+    :param test_key_length: Expected length of the file encryption key.
+    :param test_revision: Revision of the standard security handler.
+    :param test_should_generate_object_streams: Whether to use a cross-reference stream or not.
+    """
+
+    test_encryption_parameters = _read_encryption_parameters(
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / "test.pdf",
+                test_password = "password",
+                test_revision = test_revision,
+                test_should_generate_object_streams = test_should_generate_object_streams
+            )
+        )
+    )
+
+    assert test_encryption_parameters is not None
+    assert test_encryption_parameters.revision == test_revision
+    assert test_encryption_parameters.key_length == test_key_length
+    assert len(test_encryption_parameters.document_id) == 16
+    assert len(test_encryption_parameters.owner_hash) == test_hash_length
+    assert len(test_encryption_parameters.user_hash) == test_hash_length
+
+@mark.parametrize(
+    "test_password, test_revision",
+    [
+        (None, 6),
+        ("password", 6)
+    ]
+)
+def test_read_encryption_parameters_returns_none_for_unsupported_pdf_file(
+    tmp_path: Path,
+    test_password: str | None,
+    test_revision: int
+) -> None:
+    """
+    Assert that `_read_encryption_parameters`
+    returns `None`
+    when the PDF file is not encrypted via revisions 2 to 5 of the standard security handler.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_password: User password to encrypt the PDF file with, if any.
+    :param test_revision: Revision of the standard security handler.
+    """
+
+    assert _read_encryption_parameters(
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / "test.pdf",
+                test_password = test_password,
+                test_revision = test_revision
+            )
+        )
+    ) is None
+
+TEST_HASH = "<" + "00" * 32 + ">"
+
+@mark.parametrize(
+    "test_trailer",
+    [
+        f"/Encrypt << /Filter /Standard /R 3 /O {TEST_HASH} /U {TEST_HASH} /P -4 >>",
+        f"/Encrypt << /Filter /Standard /R 2 /O {TEST_HASH} /U {TEST_HASH} /P -4 >> " \
+        "/ID [<0A> <0B>]"
+    ]
+)
+def test_read_encryption_parameters_reads_direct_encryption_dictionary(
+    tmp_path: Path,
+    test_trailer: str
+) -> None:
+    """
+    Assert that `_read_encryption_parameters`
+    returns the parameters of the standard security handler
+    when the encryption dictionary is a direct object of the trailer.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_trailer: Entries of the trailer dictionary.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(
+        b"%PDF-1.7\nxref\ntrailer\n<< " + test_trailer.encode() + b" >>\nstartxref\n9\n%%EOF\n"
+    )
+
+    test_encryption_parameters = _read_encryption_parameters(str(tmp_path / "test.pdf"))
+
+    assert test_encryption_parameters is not None
+    assert test_encryption_parameters.key_length == 5
+    assert test_encryption_parameters.permissions == -4
+
+@mark.parametrize(
+    "test_trailer",
+    [
+        "/Size 1",
+        "/Encrypt 1 0 R",
+        "/Encrypt [] /ID []",
+        "/Encrypt << >> /ID <0A>",
+        f"/Encrypt << /Filter /Unknown /R 3 /O {TEST_HASH} /U {TEST_HASH} /P -4 >>",
+        f"/Encrypt << /Filter /Standard /R 7 /O {TEST_HASH} /U {TEST_HASH} /P -4 >>",
+        f"/Encrypt << /Filter /Standard /R 3 /O 0 /U {TEST_HASH} /P -4 >>",
+        f"/Encrypt << /Filter /Standard /R 3 /O {TEST_HASH} /U 0 /P -4 >>",
+        f"/Encrypt << /Filter /Standard /R 3 /O {TEST_HASH} /U {TEST_HASH} /P 0.5 >>",
+        f"/Encrypt << /Filter /Standard /R 3 /O {TEST_HASH} /U {TEST_HASH} /P -4 " \
+        "/Length /Name >>",
+        f"/Encrypt << /Filter /Standard /R 3 /O {TEST_HASH} /U {TEST_HASH} /P -4 " \
+        "/EncryptMetadata 0 >>",
+        f"/Encrypt << /Filter /Standard /R 3 /O {TEST_HASH} /U {TEST_HASH} /P -4 >> /ID [0]",
+        f"/Encrypt << /Filter /Standard /R 5 /O {TEST_HASH} /U {TEST_HASH} /P -4 >>",
+        "/Encrypt << /Filter /Standard /R 3 /O <00> /U <00> /P -4 >>"
+    ]
+)
+def test_read_encryption_parameters_returns_none(tmp_path: Path, test_trailer: str) -> None:
+    """
+    Assert that `_read_encryption_parameters`
+    returns `None`
+    when the encryption dictionary of a PDF file is missing, malformed, or unsupported.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_trailer: Entries of the trailer dictionary.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(
+        b"%PDF-1.7\nxref\ntrailer\n<< " + test_trailer.encode() + b" >>\nstartxref\n9\n%%EOF\n"
+    )
+
+    assert _read_encryption_parameters(str(tmp_path / "test.pdf")) is None
+
+@mark.parametrize(
+    "test_content",
+    [
+        b"%PDF-1.7\n%%EOF\n",
+        b"%PDF-1.7\nxref\n0 1\n0000000000 65535 f \ntrailer\n<< /Encrypt 0 0 R >>\n" \
+        b"startxref\n9\n%%EOF\n",
+        b"%PDF-1.7\nxref\n1 1\n0000000000 00000 n \ntrailer\n<< /Encrypt 1 0 R >>\n" \
+        b"startxref\n9\n%%EOF\n",
+        b"%PDF-1.7\nxref\n1 1\n0000000065 00000 n \ntrailer\n<< /Encrypt 1 0 R >>\n" \
+        b"1 0 obj\n<< /Filter\nendobj\nstartxref\n9\n%%EOF\n"
+    ]
+)
+def test_read_encryption_parameters_returns_none_for_unlocatable_encryption_dictionary(
+    tmp_path: Path,
+    test_content: bytes
+) -> None:
+    """
+    Assert that `_read_encryption_parameters`
+    returns `None`
+    when the encryption dictionary of a PDF file cannot be located or parsed.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_content: Mock content of the PDF file.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(test_content)
+
+    assert _read_encryption_parameters(str(tmp_path / "test.pdf")) is None
+
+def test_read_encryption_parameters_returns_none_for_unreadable_file(tmp_path: Path) -> None:
+    """
+    Assert that `_read_encryption_parameters`
+    returns `None`
+    when the PDF file cannot be read.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    assert _read_encryption_parameters(str(tmp_path / "missing-test.pdf")) is None
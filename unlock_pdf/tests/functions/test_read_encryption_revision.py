@@ -0,0 +1,27 @@
+"""Tests for `_read_encryption_revision`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.functions import _read_encryption_revision
+
+def test_read_encryption_revision_returns_revision(tmp_path: Path) -> None:
+    """
+    Assert that `_read_encryption_revision`
+    returns the revision of the standard security handler of an encrypted PDF file,
+    or `None` for a PDF file that is not encrypted or that cannot be read.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_paths = [
+        str(generate_test_pdf_file(tmp_path / "test-0.pdf", test_password = "password", test_revision = 3)),
+        str(generate_test_pdf_file(tmp_path / "test-1.pdf")),
+        str(tmp_path / "test-2.pdf")
+    ]
+
+    assert [
+        _read_encryption_revision(test_file_path)
+        for test_file_path in test_file_paths
+    ] == [3, None, None]
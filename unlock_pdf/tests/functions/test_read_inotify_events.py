@@ -0,0 +1,126 @@
+"""Tests for `_read_inotify_events`."""
+
+# pyright: reportPrivateUsage=false
+
+from collections.abc import Iterator
+from os import close
+from pathlib import Path
+from pytest import MonkeyPatch, fixture, mark
+from struct import pack
+from sys import platform
+from unlock_pdf.functions import (
+    _open_inotify,
+    _read_inotify_events,
+    _watch_directory_tree
+)
+from unlock_pdf.types import Inotify
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+pytestmark = mark.skipif(
+    platform != "linux",
+    reason = "inotify is only supported on Linux."
+)
+
+@fixture
+def test_inotify(tmp_path: Path) -> Iterator[Inotify]:
+    """
+    Open an inotify instance that watches a temporary directory.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :returns: Iterator of the inotify instance, which is closed afterwards.
+    """
+
+    inotify = _open_inotify()
+
+    assert inotify is not None
+
+    _watch_directory_tree(inotify, str(tmp_path))
+
+    yield inotify
+
+    close(inotify.file_descriptor)
+
+def test_read_inotify_events_returns_nothing_without_events(test_inotify: Inotify) -> None:
+    """
+    Assert that `_read_inotify_events`
+    returns no path
+    when no file is written before the timeout.
+
+    :param test_inotify: Inotify instance that watches a temporary directory.
+    """
+
+    assert _read_inotify_events(test_inotify, 0) == []
+
+def test_read_inotify_events_returns_written_file_paths(
+    test_inotify: Inotify,
+    tmp_path: Path
+) -> None:
+    """
+    Assert that `_read_inotify_events`
+    returns the paths of files that are written in watched directories
+    and of files in directories that are created there, which get watched as well,
+    while ignoring hidden files.
+
+    :param test_inotify: Inotify instance that watches a temporary directory.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "test-0.pdf").write_bytes(b"%PDF-1.7")
+    (tmp_path / ".hidden-test.pdf").write_bytes(b"%PDF-1.7")
+    (tmp_path / "subdirectory").mkdir()
+    (tmp_path / "subdirectory" / "test-1.pdf").write_bytes(b"%PDF-1.7")
+
+    test_paths = _read_inotify_events(test_inotify, 1)
+
+    assert test_paths is not None
+    assert list(dict.fromkeys(test_paths)) == [
+        str(tmp_path / "test-0.pdf"),
+        str(tmp_path / "subdirectory" / "test-1.pdf")
+    ]
+    assert str(tmp_path / "subdirectory") in test_inotify.directory_paths.values()
+
+@mark.parametrize(
+    "test_mask, test_paths",
+    [
+        (0x4000, None),
+        (0x8, [])
+    ]
+)
+def test_read_inotify_events_handles_unknown_events(
+    monkeypatch: MonkeyPatch,
+    test_inotify: Inotify,
+    test_mask: int,
+    test_paths: list[str] | None
+) -> None:
+    """
+    Assert that `_read_inotify_events`
+    returns `None` when some events were lost
+    and ignores events of directories that are not watched.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param test_inotify: Inotify instance that watches a temporary directory.
+    :param test_mask: Mask of the mock event.
+    :param test_paths: Expected paths.
+    """
+
+    monkeypatch.setattr(
+        name = "select",
+        target = target,
+        value = lambda readable, writable, exceptional, timeout: (readable, [], [])
+    )
+    monkeypatch.setattr(
+        name = "read",
+        target = target,
+        value = lambda file_descriptor, length: (
+            pack("iIII", -1, test_mask, 0, 16) + b"test.pdf".ljust(16, b"\0")
+        )
+    )
+
+    assert _read_inotify_events(test_inotify, 0) == test_paths
@@ -0,0 +1,45 @@
+"""Tests for `_read_journal`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.functions import _read_journal
+
+def test_read_journal_reads_entries(tmp_path: Path) -> None:
+    """
+    Assert that `_read_journal`
+    reads the final file state of every version of a PDF file,
+    where later entries override earlier ones,
+    while ignoring malformed entries such as a cut-off last line.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "journal.jsonl").write_text(
+        '{"device": 1, "inode": 2, "size": 3, "mtime_ns": 4, "file_state": "FAILED"}' + "\n"
+        + '{"device": 1, "inode": 5, "size": 6, "mtime_ns": 7, "file_state": "LOCKED"}' + "\n"
+        + '{"device": 1, "inode": 2, "size": 3, "mtime_ns": 4, "file_state": "UNLOCKED"}' + "\n"
+        + '{"device": 1, "inode": 8, "size": 9, "mtime_ns": 10, "file_state": "UNKNOWN"}' + "\n"
+        + '{"device": 1, "inode": 8, "size": "9", "mtime_ns": 10, "file_state": "LOCKED"}' + "\n"
+        + '{"device": 1, "inode": 8}' + "\n"
+        + "[]" + "\n"
+        + '{"device": 1, "inode": 8, "size": 9, "mt',
+        encoding = "utf-8"
+    )
+
+    assert _read_journal(str(tmp_path / "journal.jsonl")) == {
+        (1, 2, 3, 4): FileState.UNLOCKED,
+        (1, 5, 6, 7): FileState.LOCKED
+    }
+
+def test_read_journal_returns_empty_journal_for_missing_file(tmp_path: Path) -> None:
+    """
+    Assert that `_read_journal`
+    returns an empty journal
+    when the journal cannot be read.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    assert _read_journal(str(tmp_path / "missing-journal.jsonl")) == {}
@@ -0,0 +1,82 @@
+"""Tests for `_read_memory_usage`."""
+
+# pyright: reportPrivateUsage=false
+
+from io import StringIO
+from pytest import MonkeyPatch, mark
+from unlock_pdf.enumerations import MemoryField
+from unlock_pdf.functions import _read_memory_usage
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+@mark.parametrize(
+    "test_status, test_memory_field, test_memory_usage",
+    [
+        ("Name:\tpython\nVmHWM:\t    2048 kB\nVmRSS:\t    1024 kB\n", MemoryField.CURRENT, 1 << 20),
+        ("Name:\tpython\nVmHWM:\t    2048 kB\nVmRSS:\t    1024 kB\n", MemoryField.PEAK, 2 << 20),
+        ("Name:\tpython\n", MemoryField.PEAK, None),
+        ("VmHWM:\n", MemoryField.PEAK, None),
+        ("VmHWM:\tmany kB\n", MemoryField.PEAK, None)
+    ]
+)
+def test_read_memory_usage_parses_status(
+    monkeypatch: MonkeyPatch,
+    test_memory_field: MemoryField,
+    test_memory_usage: int | None,
+    test_status: str
+) -> None:
+    """
+    Assert that `_read_memory_usage`
+    returns a memory usage field of this process in bytes,
+    or `None` if said field is missing or malformed.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param test_memory_field: Memory usage field to read.
+    :param test_memory_usage: Expected memory usage, in bytes.
+    :param test_status: Mock status of this process.
+    """
+
+    monkeypatch.setattr(
+        name = "open",
+        raising = False,
+        target = target,
+        value = lambda file, encoding: StringIO(test_status)
+    )
+
+    assert _read_memory_usage(test_memory_field) == test_memory_usage
+
+def test_read_memory_usage_returns_none_for_unreadable_status(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_read_memory_usage`
+    returns `None`
+    when the status of this process cannot be read, e.g. on platforms other than Linux.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    def _mock_open(file: str, encoding: str) -> StringIO:
+        """
+        Mock function of `open` that
+        fails to open the status of this process.
+
+        :param file: Path of the file to open.
+        :param encoding: Encoding to open the file with.
+        :raises FileNotFoundError: Always.
+        """
+
+        raise FileNotFoundError(file)
+
+    monkeypatch.setattr(
+        name = "open",
+        raising = False,
+        target = target,
+        value = _mock_open
+    )
+
+    assert _read_memory_usage(MemoryField.CURRENT) is None
@@ -0,0 +1,40 @@
+"""Tests for `_read_password_caches`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from unlock_pdf.classes import FileOutcomes, FingerprintPasswords, PasswordHits
+from unlock_pdf.functions import _read_password_caches
+
+def test_read_password_caches_reads_from_cache_directory(tmp_path: Path) -> None:
+    """
+    Assert that `_read_password_caches`
+    reads the caches that depend on the passwords from a cache directory
+    and starts with empty caches without one.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_passwords = ["password-0", "password-1"]
+    test_password_hits = PasswordHits()
+    test_fingerprint_passwords = FingerprintPasswords(test_passwords)
+    test_file_outcomes = FileOutcomes(test_passwords)
+
+    test_password_hits.add("password-1")
+    test_fingerprint_passwords.add("fingerprint", "password-1")
+    test_file_outcomes.add((1, 2, 3, 4), True)
+    test_password_hits.dump(str(tmp_path / "password-hits.json"))
+    test_fingerprint_passwords.dump(str(tmp_path / "fingerprint-passwords.json"))
+    test_file_outcomes.dump(str(tmp_path / "file-outcomes.json"))
+
+    password_hits, fingerprint_passwords, file_outcomes = _read_password_caches(str(tmp_path), test_passwords)
+
+    assert password_hits["password-1"] == 1
+    assert fingerprint_passwords["fingerprint"] == "password-1"
+    assert file_outcomes.is_locked((1, 2, 3, 4))
+
+    password_hits, fingerprint_passwords, file_outcomes = _read_password_caches(None, test_passwords)
+
+    assert password_hits["password-1"] == 0
+    assert fingerprint_passwords["fingerprint"] is None
+    assert file_outcomes.is_locked((1, 2, 3, 4)) is None
@@ -0,0 +1,35 @@
+"""Tests for `_read_pdf_data`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pikepdf import PdfError
+from pytest import raises
+from unlock_pdf.functions import _read_pdf_data
+
+def test_read_pdf_data_returns_data(tmp_path: Path) -> None:
+    """
+    Assert that `_read_pdf_data`
+    returns the raw data of a PDF file.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(b"%PDF-1.7")
+
+    assert _read_pdf_data(str(tmp_path / "test.pdf")) == b"%PDF-1.7"
+
+def test_read_pdf_data_raises_exception(tmp_path: Path) -> None:
+    """
+    Assert that `_read_pdf_data`
+    raises an appropriate exception
+    when the PDF file cannot be read.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    with raises(
+        expected_exception = PdfError,
+        match = "Unlocking .+ failed."
+    ):
+        _read_pdf_data(str(tmp_path / "test.pdf"))
@@ -0,0 +1,62 @@
+"""Tests for `_read_xref_section`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import mark
+from unlock_pdf.functions import _read_xref_section
+from unlock_pdf.types import PdfDictionary
+
+@mark.parametrize(
+    "test_data," \
+    "test_xref_section",
+    [
+        (
+            b"\nxref\n0 1\n0000000000 65535 f \ntrailer\n<< /Size 1 >>\n",
+            ({"/Size": 1}, 5)
+        ),
+        (
+            b"\n1 0 obj\n<< /Type /XRef /Size 1 >>\nstream\n",
+            ({"/Type": "/XRef", "/Size": 1}, 34)
+        ),
+        (
+            b"\nxref\n0 1\n0000000000 65535 f \n",
+            None
+        ),
+        (
+            b"\nxref\ntrailer\n[/Size 1]\n",
+            None
+        ),
+        (
+            b"\nxref\ntrailer\n<< /Size 1\n",
+            None
+        ),
+        (
+            b"\n1 0 obj\n<< /Size 1 >>\nendobj\n",
+            None
+        ),
+        (
+            b"\n1 0 obj\n[/Type /XRef]\nendobj\n",
+            None
+        ),
+        (
+            b"\nendobj\n",
+            None
+        )
+    ]
+)
+def test_read_xref_section_returns_xref_section(
+    test_data: bytes,
+    test_xref_section: tuple[PdfDictionary, int] | None
+) -> None:
+    """
+    Assert that `_read_xref_section`
+    returns the trailer dictionary of a cross-reference section
+    and the offset right after its `xref` keyword or its dictionary
+    for both cross-reference tables and cross-reference streams,
+    or `None` if it cannot be read unambiguously.
+
+    :param test_data: Raw PDF data.
+    :param test_xref_section: Expected trailer dictionary and offset, if any.
+    """
+
+    assert _read_xref_section(test_data, 0) == test_xref_section
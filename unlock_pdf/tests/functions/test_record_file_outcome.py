@@ -0,0 +1,74 @@
+"""Tests for `_record_file_outcome`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import mark
+from unlock_pdf.classes import FileOutcomes
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.functions import _get_file_signature, _record_file_outcome
+from unlock_pdf.types import UnlockResult
+
+@mark.parametrize(
+    "test_file_state, test_output_dir, test_is_locked",
+    [
+        (FileState.ABORTED, None, None),
+        (FileState.FAILED, None, None),
+        (FileState.LOCKED, None, True),
+        (FileState.NOT_LOCKED, None, False),
+        (FileState.NOT_LOCKED, "output", False),
+        (FileState.UNLOCKED, None, False),
+        (FileState.UNLOCKED, "output", None)
+    ]
+)
+def test_record_file_outcome_remembers_outcome(
+    tmp_path: Path,
+    test_file_state: FileState,
+    test_is_locked: bool | None,
+    test_output_dir: str | None
+) -> None:
+    """
+    Assert that `_record_file_outcome`
+    remembers whether a PDF file is still locked or not locked by its signature,
+    remembering an overwritten unlocked PDF file as not locked,
+    and not remembering a failed or aborted PDF file or one written to an output directory.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_file_state: File state of the PDF file after attempting to unlock it.
+    :param test_is_locked: Expected remembered outcome, if any.
+    :param test_output_dir: Output directory that unlocked PDF files were written in, if any.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(b"%PDF-1.7\n")
+
+    test_file_signature = _get_file_signature(str(tmp_path / "test.pdf"))
+    test_file_outcomes = FileOutcomes(["password"])
+
+    assert test_file_signature is not None
+
+    _record_file_outcome(
+        test_file_outcomes,
+        UnlockResult(str(tmp_path / "test.pdf"), test_file_state),
+        test_output_dir
+    )
+
+    assert test_file_outcomes.is_locked(test_file_signature) is test_is_locked
+
+def test_record_file_outcome_skips_missing_file(tmp_path: Path) -> None:
+    """
+    Assert that `_record_file_outcome`
+    remembers nothing
+    when the PDF file cannot be queried.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_outcomes = FileOutcomes(["password"])
+
+    _record_file_outcome(
+        test_file_outcomes,
+        UnlockResult(str(tmp_path / "missing-test.pdf"), FileState.LOCKED),
+        None
+    )
+
+    assert test_file_outcomes.to_json()["outcomes"] == {}
@@ -0,0 +1,55 @@
+"""Tests for `_record_unlock_result`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import mark
+from unlock_pdf.classes import FingerprintPasswords
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.functions import _record_unlock_result
+from unlock_pdf.types import Passwords, UnlockResult
+
+@mark.parametrize(
+    "test_unlock_result, test_fingerprint," \
+    "test_final_passwords, test_fingerprint_password",
+    [
+        (
+            UnlockResult("test.pdf", FileState.UNLOCKED, "password-1", 2), "fingerprint",
+            ["password-1", "password-0"], "password-1"
+        ),
+        (
+            UnlockResult("test.pdf", FileState.UNLOCKED, "password-1", 2), None,
+            ["password-1", "password-0"], None
+        ),
+        (
+            UnlockResult("test.pdf", FileState.FAILED, error = "PdfError: test"), "fingerprint",
+            ["password-0", "password-1"], None
+        )
+    ]
+)
+def test_record_unlock_result_returns_passwords(
+    test_final_passwords: Passwords,
+    test_fingerprint: str | None,
+    test_fingerprint_password: str | None,
+    test_unlock_result: UnlockResult
+) -> None:
+    """
+    Assert that `_record_unlock_result`
+    records the password that unlocked a PDF file for its encryption fingerprint, if any,
+    and returns the passwords with said password at the front.
+
+    :param test_final_passwords: Expected passwords in their new order.
+    :param test_fingerprint: Encryption fingerprint of the PDF file, if any.
+    :param test_fingerprint_password: Expected password recorded for the encryption fingerprint, if any.
+    :param test_unlock_result: Result of attempting to unlock the PDF file.
+    """
+
+    test_passwords = ["password-0", "password-1"]
+    test_fingerprint_passwords = FingerprintPasswords(list(test_passwords))
+
+    assert _record_unlock_result(
+        test_unlock_result,
+        test_fingerprint,
+        test_passwords,
+        test_fingerprint_passwords
+    ) == test_final_passwords
+    assert test_fingerprint_passwords["fingerprint"] == test_fingerprint_password
@@ -0,0 +1,72 @@
+"""Tests for `_record_unlock_results`."""
+
+# pyright: reportPrivateUsage=false
+
+from collections.abc import Iterator
+from pathlib import Path
+from pytest import CaptureFixture
+from unlock_pdf.classes import FileOutcomes, PasswordHits
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.functions import _get_options, _record_unlock_results
+from unlock_pdf.types import FileErrors, GroupedPaths, UnlockResult
+
+def test_record_unlock_results_records_each_result(capsys: CaptureFixture[str], tmp_path: Path) -> None:
+    """
+    Assert that `_record_unlock_results`
+    groups, journals, and counts the result of unlocking each PDF file,
+    and stops without raising when watching is interrupted.
+
+    :param capsys: `pytest` fixture for capturing outputs.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "test-0.pdf").write_bytes(b"%PDF-1.7")
+    (tmp_path / "test-1.pdf").write_bytes(b"%PDF-1.7")
+
+    def _generate_unlock_results() -> Iterator[UnlockResult]:
+        """
+        Generate mock results of unlocking PDF files until interrupted.
+
+        :raises KeyboardInterrupt: After every mock result.
+        :returns: Iterator of mock results.
+        """
+
+        yield UnlockResult(str(tmp_path / "test-0.pdf"), FileState.UNLOCKED, "password", 2)
+        yield UnlockResult(str(tmp_path / "test-1.pdf"), FileState.FAILED, error = "PdfError: test")
+
+        raise KeyboardInterrupt
+
+    grouped_pdf_file_paths: GroupedPaths = {
+        key: []
+        for key in [
+            file_state for file_state in FileState
+        ]
+    }
+    file_errors: FileErrors = {}
+    attempt_counts: list[int] = []
+    password_hits = PasswordHits()
+
+    _record_unlock_results(
+        attempt_counts = attempt_counts,
+        file_errors = file_errors,
+        file_outcomes = FileOutcomes(["password"]),
+        grouped_pdf_file_paths = grouped_pdf_file_paths,
+        options = _get_options([
+            "--cache-dir", str(tmp_path / "cache"),
+            "--journal", str(tmp_path / "journal" / "journal.jsonl"),
+            "--watch",
+            str(tmp_path)
+        ]),
+        password_hits = password_hits,
+        unlock_results = _generate_unlock_results()
+    )
+
+    assert grouped_pdf_file_paths[FileState.UNLOCKED] == [str(tmp_path / "test-0.pdf")]
+    assert grouped_pdf_file_paths[FileState.FAILED] == [str(tmp_path / "test-1.pdf")]
+    assert file_errors == {str(tmp_path / "test-1.pdf"): "PdfError: test"}
+    assert attempt_counts == [2]
+    assert password_hits["password"] == 1
+    assert len(
+        (tmp_path / "journal" / "journal.jsonl").read_text().splitlines()
+    ) == 2
+    assert str(tmp_path / "test-0.pdf") in capsys.readouterr().out
@@ -0,0 +1,43 @@
+"""Tests for `_recover_user_password`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import mark
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.enumerations import PdfToken
+from unlock_pdf.functions import _read_encryption_parameters, _recover_user_password
+
+@mark.parametrize("test_revision", [2, 3, 4])
+def test_recover_user_password_returns_padded_user_password(
+    tmp_path: Path,
+    test_revision: int
+) -> None:
+    """
+    Assert that `_recover_user_password`
+    returns the padded user password of a PDF file
+    from its owner password.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_revision: Revision of the standard security handler.
+    """
+
+    test_encryption_parameters = _read_encryption_parameters(
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / "test.pdf",
+                test_password = "password",
+                test_revision = test_revision
+            )
+        )
+    )
+
+    assert test_encryption_parameters is not None
+    assert _recover_user_password(
+        test_encryption_parameters,
+        b"owner-password"
+    ) == (b"password" + PdfToken.PASSWORD_PADDING)[:32]
+    assert _recover_user_password(
+        test_encryption_parameters,
+        b"password"
+    ) != (b"password" + PdfToken.PASSWORD_PADDING)[:32]
@@ -0,0 +1,52 @@
+"""Tests for `_remove_temporary_files`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import mark
+from unlock_pdf.functions import _get_output_file_path, _get_temporary_file_prefix, _remove_temporary_files
+
+@mark.parametrize("test_should_use_output_dir", [False, True])
+def test_remove_temporary_files_removes_leftovers(tmp_path: Path, test_should_use_output_dir: bool) -> None:
+    """
+    Assert that `_remove_temporary_files`
+    removes the temporary files left behind for a PDF file
+    in the directory of the PDF file or of its mirror in the output directory,
+    without touching those of other files.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_should_use_output_dir: Whether the unlocked PDF file was written in an output directory or not.
+    """
+
+    test_file_path = str(tmp_path / "input" / "test.pdf")
+    test_output_dir = str(tmp_path / "output") if test_should_use_output_dir else None
+    test_directory_path = Path(
+        _get_output_file_path(test_file_path, test_output_dir)
+        if test_output_dir is not None
+        else test_file_path
+    ).parent
+    test_directory_path.mkdir(parents = True)
+    test_leftover_path = test_directory_path / f"{_get_temporary_file_prefix(test_file_path)}abcd1234.tmp"
+    test_other_paths = [
+        test_directory_path / f"{_get_temporary_file_prefix("test-1.pdf")}abcd1234.tmp",
+        test_directory_path / "test.pdf"
+    ]
+
+    for path in [test_leftover_path, *test_other_paths]:
+        path.write_bytes(b"")
+
+    _remove_temporary_files(test_file_path, test_output_dir)
+
+    assert not test_leftover_path.exists()
+    assert all(path.exists() for path in test_other_paths)
+
+def test_remove_temporary_files_skips_missing_directory(tmp_path: Path) -> None:
+    """
+    Assert that `_remove_temporary_files`
+    does nothing
+    when the directory of the PDF file does not exist.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    assert _remove_temporary_files(str(tmp_path / "missing" / "test.pdf")) is None
@@ -0,0 +1,126 @@
+"""Tests for `_replace_file_atomically`."""
+
+# pyright: reportPrivateUsage=false
+
+from os import utime
+from pathlib import Path
+from time import time
+from pytest import raises
+from unlock_pdf.functions import _replace_file_atomically
+
+def test_replace_file_atomically_replaces_file(tmp_path: Path) -> None:
+    """
+    Assert that `_replace_file_atomically`
+    replaces a file with what is written to a temporary file,
+    creating missing parent directories and leaving no temporary file behind.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_temporary_file_paths: list[Path] = []
+
+    def _mock_write(file_path: str) -> None:
+        """
+        Mock function that writes the new contents of a file.
+
+        :param file_path: Path of the temporary file to write to.
+        """
+
+        test_temporary_file_paths.append(Path(file_path))
+        Path(file_path).write_bytes(b"new contents")
+
+    _replace_file_atomically(str(tmp_path / "output" / "test.pdf"), _mock_write)
+
+    assert (tmp_path / "output" / "test.pdf").read_bytes() == b"new contents"
+    assert test_temporary_file_paths[0].parent == tmp_path / "output"
+    assert test_temporary_file_paths[0].name.startswith(".")
+    assert list((tmp_path / "output").iterdir()) == [tmp_path / "output" / "test.pdf"]
+
+def test_replace_file_atomically_keeps_file_on_failure(tmp_path: Path) -> None:
+    """
+    Assert that `_replace_file_atomically`
+    leaves a file as is and removes the temporary file
+    when writing the new contents fails.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    def _mock_write(file_path: str) -> None:
+        """
+        Mock function that fails halfway through writing the new contents of a file.
+
+        :param file_path: Path of the temporary file to write to.
+        :raises OSError: Always.
+        """
+
+        Path(file_path).write_bytes(b"half")
+
+        raise OSError
+
+    (tmp_path / "test.pdf").write_bytes(b"old contents")
+
+    with raises(OSError):
+        _replace_file_atomically(str(tmp_path / "test.pdf"), _mock_write)
+
+    assert (tmp_path / "test.pdf").read_bytes() == b"old contents"
+    assert list(tmp_path.iterdir()) == [tmp_path / "test.pdf"]
+
+def test_replace_file_atomically_keeps_permissions(tmp_path: Path) -> None:
+    """
+    Assert that `_replace_file_atomically`
+    keeps the permission bits of the file it replaces
+    instead of those of the temporary file.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(b"old contents")
+    (tmp_path / "test.pdf").chmod(0o644)
+
+    _replace_file_atomically(
+        str(tmp_path / "test.pdf"),
+        lambda file_path: Path(file_path).write_bytes(b"new contents")
+    )
+
+    assert (tmp_path / "test.pdf").read_bytes() == b"new contents"
+    assert (tmp_path / "test.pdf").stat().st_mode & 0o777 == 0o644
+
+def test_replace_file_atomically_keeps_source_permissions(tmp_path: Path) -> None:
+    """
+    Assert that `_replace_file_atomically`
+    gives a new file the permission bits of its source file
+    instead of those of the temporary file.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(b"old contents")
+    (tmp_path / "test.pdf").chmod(0o644)
+
+    _replace_file_atomically(
+        str(tmp_path / "output" / "test.pdf"),
+        lambda file_path: Path(file_path).write_bytes(b"new contents"),
+        str(tmp_path / "test.pdf")
+    )
+
+    assert (tmp_path / "output" / "test.pdf").read_bytes() == b"new contents"
+    assert (tmp_path / "output" / "test.pdf").stat().st_mode & 0o777 == 0o644
+
+def test_replace_file_atomically_updates_modification_time(tmp_path: Path) -> None:
+    """
+    Assert that `_replace_file_atomically`
+    does not keep the modification time of the file it replaces.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(b"old contents")
+    utime(tmp_path / "test.pdf", (978307200, 978307200))
+
+    _replace_file_atomically(
+        str(tmp_path / "test.pdf"),
+        lambda file_path: Path(file_path).write_bytes(b"new contents"),
+        str(tmp_path / "test.pdf")
+    )
+
+    assert (tmp_path / "test.pdf").stat().st_mtime > time() - 60
@@ -0,0 +1,65 @@
+"""Tests for `_reset_peak_memory_usage`."""
+
+# pyright: reportPrivateUsage=false
+
+from io import BytesIO
+from pathlib import Path
+from pytest import MonkeyPatch
+from unlock_pdf.functions import _reset_peak_memory_usage
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+def test_reset_peak_memory_usage_writes_command(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Assert that `_reset_peak_memory_usage`
+    writes the command to reset the peak memory usage of this process.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    monkeypatch.setattr(
+        name = "open",
+        raising = False,
+        target = target,
+        value = lambda file, mode: open(tmp_path / "clear_refs", mode)
+    )
+
+    assert _reset_peak_memory_usage()
+    assert (tmp_path / "clear_refs").read_bytes() == b"5"
+
+def test_reset_peak_memory_usage_returns_false_for_unwritable_file(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_reset_peak_memory_usage`
+    returns `False`
+    when the peak memory usage of this process cannot be reset, e.g. on platforms other than Linux.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    def _mock_open(file: str, mode: str) -> BytesIO:
+        """
+        Mock function of `open` that
+        fails to open the file to reset the peak memory usage with.
+
+        :param file: Path of the file to open.
+        :param mode: Mode to open the file in.
+        :raises PermissionError: Always.
+        """
+
+        raise PermissionError(file)
+
+    monkeypatch.setattr(
+        name = "open",
+        raising = False,
+        target = target,
+        value = _mock_open
+    )
+
+    assert not _reset_peak_memory_usage()
@@ -0,0 +1,118 @@
+"""Tests for `_retry_transient_errors`."""
+
+# pyright: reportPrivateUsage=false
+
+from errno import EBUSY, ENOENT
+from pytest import MonkeyPatch, raises
+from unlock_pdf.functions import _retry_transient_errors
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+def test_retry_transient_errors_retries_with_backoff(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_retry_transient_errors`
+    retries an operation with exponentially growing delays
+    until it stops failing due to a transient I/O error.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    test_delays: list[float] = []
+    call_count = 0
+
+    def _mock_operation() -> str:
+        """
+        Mock operation that fails due to a transient I/O error twice.
+
+        :raises OSError: If the operation is called for the first or second time.
+        :returns: Mock return value.
+        """
+
+        nonlocal call_count
+
+        call_count += 1
+
+        if call_count <= 2:
+            raise OSError(EBUSY, "busy")
+
+        return "result"
+
+    monkeypatch.setattr(
+        name = "sleep",
+        target = target,
+        value = test_delays.append
+    )
+
+    assert _retry_transient_errors(_mock_operation) == "result"
+    assert test_delays == [0.1, 0.2]
+
+def test_retry_transient_errors_gives_up(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_retry_transient_errors`
+    raises the transient I/O error of an operation
+    after retrying it a bounded number of times with bounded delays.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    test_delays: list[float] = []
+
+    def _mock_operation() -> None:
+        """
+        Mock operation that always fails due to a transient I/O error.
+
+        :raises OSError: Always.
+        """
+
+        raise OSError(EBUSY, "busy")
+
+    monkeypatch.setattr(
+        name = "sleep",
+        target = target,
+        value = test_delays.append
+    )
+
+    with raises(OSError, match = "busy"):
+        _retry_transient_errors(_mock_operation)
+
+    assert test_delays == [0.1, 0.2, 0.4, 0.8, 1.0]
+
+def test_retry_transient_errors_raises_other_errors(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_retry_transient_errors`
+    raises any other error of an operation without retrying it.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    call_count = 0
+
+    def _mock_operation() -> None:
+        """
+        Mock operation that fails due to a missing file.
+
+        :raises OSError: Always.
+        """
+
+        nonlocal call_count
+
+        call_count += 1
+
+        raise OSError(ENOENT, "missing")
+
+    monkeypatch.setattr(
+        name = "sleep",
+        target = target,
+        value = lambda seconds: None
+    )
+
+    with raises(OSError, match = "missing"):
+        _retry_transient_errors(_mock_operation)
+
+    assert call_count == 1
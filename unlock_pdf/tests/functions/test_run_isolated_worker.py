@@ -0,0 +1,92 @@
+"""Tests for `_run_isolated_worker`."""
+
+# pyright: reportPrivateUsage=false
+
+from multiprocessing import Pipe
+from pathlib import Path
+from pytest import MonkeyPatch, mark
+from signal import SIG_IGN, SIGINT
+from tests.utilities import generate_test_pdf_file
+from threading import Thread
+from unlock_pdf.enumerations import FileState, SaveProfile
+from unlock_pdf.functions import _run_isolated_worker
+from unlock_pdf.types import UnlockResult
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+@mark.parametrize(
+    "test_memory_limit, test_calls",
+    [
+        (None, [(SIGINT, SIG_IGN), ("_initialize_worker", ["password"])]),
+        (1 << 30, [(SIGINT, SIG_IGN), ("_initialize_worker", ["password"]), (target.RLIMIT_AS, (1 << 30, 1 << 30))])
+    ]
+)
+def test_run_isolated_worker_unlocks_until_closed(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    test_calls: list[object],
+    test_memory_limit: int | None
+) -> None:
+    """
+    Assert that `_run_isolated_worker`
+    ignores interrupts, warms up, and limits its address space if asked for,
+    then unlocks every received PDF file with the passwords to attempt first at the front
+    and sends back its result
+    until its connection is closed.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_calls: Expected calls to set the worker process up.
+    :param test_memory_limit: Maximum address space of the worker process in bytes, if any.
+    """
+
+    calls: list[object] = []
+    test_file_path = str(
+        generate_test_pdf_file(
+            file_path = tmp_path / "test.pdf",
+            test_password = "password"
+        )
+    )
+    test_connection, test_worker_connection = Pipe()
+
+    monkeypatch.setattr(
+        name = "signal",
+        target = target,
+        value = lambda signal_number, handler: calls.append((signal_number, handler))
+    )
+    monkeypatch.setattr(
+        name = "_initialize_worker",
+        target = target,
+        value = lambda passwords: calls.append(("_initialize_worker", passwords))
+    )
+    monkeypatch.setattr(
+        name = "_worker_passwords",
+        target = target,
+        value = ["password-0", "password-1", "password"]
+    )
+    monkeypatch.setattr(
+        name = "setrlimit",
+        target = target,
+        value = lambda resource, limits: calls.append((resource, limits))
+    )
+
+    test_thread = Thread(
+        args = (test_worker_connection, test_memory_limit, ["password"]),
+        target = _run_isolated_worker
+    )
+
+    test_thread.start()
+    test_connection.send((test_file_path, ["password-1"], SaveProfile.FAST, None))
+
+    assert test_connection.recv() == UnlockResult(test_file_path, FileState.UNLOCKED, "password", 3)
+
+    test_connection.close()
+    test_thread.join()
+
+    assert calls == test_calls
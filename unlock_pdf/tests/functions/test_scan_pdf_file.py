@@ -0,0 +1,46 @@
+"""Tests for `_scan_pdf_file`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import mark
+from unlock_pdf.functions import _scan_pdf_file
+from unlock_pdf.types import PdfData
+
+def test_scan_pdf_file_returns_scan_result(tmp_path: Path) -> None:
+    """
+    Assert that `_scan_pdf_file`
+    returns the result of scanning the memory-mapped data of a PDF file.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(b"%PDF-1.7\n")
+
+    def _mock_scan(data: PdfData) -> bytes:
+        """
+        Mock function that scans the first bytes of raw PDF data.
+
+        :param data: Raw PDF data.
+        :returns: First bytes of the raw PDF data.
+        """
+
+        return data[:5]
+
+    assert _scan_pdf_file(str(tmp_path / "test.pdf"), _mock_scan) == b"%PDF-"
+
+@mark.parametrize("test_content", [None, b""])
+def test_scan_pdf_file_returns_none(tmp_path: Path, test_content: bytes | None) -> None:
+    """
+    Assert that `_scan_pdf_file`
+    returns `None`
+    when the PDF file is missing or empty.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_content: Content of the PDF file, or `None` if it is missing.
+    """
+
+    if test_content is not None:
+        (tmp_path / "test.pdf").write_bytes(test_content)
+
+    assert _scan_pdf_file(str(tmp_path / "test.pdf"), lambda data: True) is None
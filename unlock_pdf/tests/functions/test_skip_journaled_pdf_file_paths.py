@@ -0,0 +1,54 @@
+"""Tests for `_skip_journaled_pdf_file_paths`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.functions import _get_file_signature, _skip_journaled_pdf_file_paths
+from unlock_pdf.types import GroupedPaths, Journal
+
+def test_skip_journaled_pdf_file_paths_skips_finished_pdf_files(tmp_path: Path) -> None:
+    """
+    Assert that `_skip_journaled_pdf_file_paths`
+    skips PDF files whose final file state was journaled and which have not changed since,
+    grouping them by said file state,
+    while still yielding PDF files that failed, were aborted, changed, or were never journaled.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_paths = [str(tmp_path / f"test-{index}.pdf") for index in range(6)]
+
+    for test_file_path in test_file_paths[:5]:
+        Path(test_file_path).write_bytes(b"%PDF-1.7\n")
+
+    test_journal: Journal = {}
+
+    for test_file_path, test_file_state in zip(
+        test_file_paths[:4],
+        [FileState.UNLOCKED, FileState.FAILED, FileState.ABORTED, FileState.NOT_LOCKED]
+    ):
+        test_file_signature = _get_file_signature(test_file_path)
+
+        assert test_file_signature is not None
+
+        test_journal[test_file_signature] = test_file_state
+
+    Path(test_file_paths[3]).write_bytes(b"%PDF-1.7\nchanged\n")
+
+    test_grouped_pdf_file_paths: GroupedPaths = {
+        key: []
+        for key in [
+            file_state for file_state in FileState
+        ]
+    }
+
+    assert list(
+        _skip_journaled_pdf_file_paths(
+            grouped_pdf_file_paths = test_grouped_pdf_file_paths,
+            journal = test_journal,
+            pdf_file_paths = iter(test_file_paths)
+        )
+    ) == test_file_paths[1:]
+    assert list(test_grouped_pdf_file_paths[FileState.UNLOCKED]) == [test_file_paths[0]]
+    assert sum(len(paths) for paths in test_grouped_pdf_file_paths.values()) == 1
@@ -0,0 +1,66 @@
+"""Tests for `_skip_known_pdf_file_paths`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import mark
+from unlock_pdf.classes import FileOutcomes
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.functions import _get_file_signature, _skip_known_pdf_file_paths
+from unlock_pdf.types import GroupedPaths
+
+@mark.parametrize(
+    "test_output_dir, test_skipped_count",
+    [
+        (None, 2),
+        ("output", 1)
+    ]
+)
+def test_skip_known_pdf_file_paths_skips_known_pdf_files(
+    tmp_path: Path,
+    test_output_dir: str | None,
+    test_skipped_count: int
+) -> None:
+    """
+    Assert that `_skip_known_pdf_file_paths`
+    skips PDF files whose last outcome is known and which have not changed since,
+    grouping them by said outcome,
+    while still yielding PDF files that are unknown, missing,
+    or not locked when an output directory is given.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_output_dir: Output directory to write unlocked PDF files in, if any.
+    :param test_skipped_count: Expected number of skipped PDF files.
+    """
+
+    test_file_paths = [str(tmp_path / f"test-{index}.pdf") for index in range(4)]
+
+    for test_file_path in test_file_paths[:3]:
+        Path(test_file_path).write_bytes(b"%PDF-1.7\n")
+
+    test_file_outcomes = FileOutcomes(["password"])
+
+    for test_file_path, test_is_locked in zip(test_file_paths[:2], [True, False]):
+        test_file_signature = _get_file_signature(test_file_path)
+
+        assert test_file_signature is not None
+
+        test_file_outcomes.add(test_file_signature, test_is_locked)
+
+    test_grouped_pdf_file_paths: GroupedPaths = {
+        key: []
+        for key in [
+            file_state for file_state in FileState
+        ]
+    }
+
+    assert list(
+        _skip_known_pdf_file_paths(
+            file_outcomes = test_file_outcomes,
+            grouped_pdf_file_paths = test_grouped_pdf_file_paths,
+            output_dir = test_output_dir,
+            pdf_file_paths = iter(test_file_paths)
+        )
+    ) == test_file_paths[test_skipped_count:]
+    assert list(test_grouped_pdf_file_paths[FileState.LOCKED]) == [test_file_paths[0]]
+    assert len(test_grouped_pdf_file_paths[FileState.NOT_LOCKED]) == test_skipped_count - 1
@@ -0,0 +1,38 @@
+"""Tests for `_start_isolated_worker`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.enumerations import FileState, SaveProfile
+from unlock_pdf.functions import _start_isolated_worker, _stop_isolated_worker
+from unlock_pdf.types import UnlockResult
+
+def test_start_isolated_worker_unlocks_pdf_files(tmp_path: Path) -> None:
+    """
+    Assert that `_start_isolated_worker`
+    starts a worker process that unlocks every PDF file sent to it
+    with the passwords it was started with
+    and sends back its result.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_paths = [
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / f"test-{index}.pdf",
+                test_password = "password"
+            )
+        )
+        for index in range(2)
+    ]
+    worker = _start_isolated_worker(1 << 40, ["wrong", "password"])
+
+    try:
+        for test_file_path in test_file_paths:
+            worker.connection.send((test_file_path, [], SaveProfile.FAST, None))
+
+            assert worker.connection.recv() == UnlockResult(test_file_path, FileState.UNLOCKED, "password", 2)
+    finally:
+        _stop_isolated_worker(worker)
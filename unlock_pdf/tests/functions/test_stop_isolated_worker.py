@@ -0,0 +1,19 @@
+"""Tests for `_stop_isolated_worker`."""
+
+# pyright: reportPrivateUsage=false
+
+from unlock_pdf.functions import _start_isolated_worker, _stop_isolated_worker
+
+def test_stop_isolated_worker_kills_worker_process() -> None:
+    """
+    Assert that `_stop_isolated_worker`
+    kills an isolated worker process right away
+    and closes the connection to it.
+    """
+
+    worker = _start_isolated_worker(None, ["password"])
+
+    _stop_isolated_worker(worker)
+
+    assert not worker.process.is_alive()
+    assert worker.connection.closed
@@ -0,0 +1,74 @@
+"""Tests for `_sync_directory`."""
+
+# pyright: reportPrivateUsage=false
+
+from os import close
+from pathlib import Path
+from pytest import MonkeyPatch
+from unlock_pdf.functions import _sync_directory
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+def test_sync_directory_flushes_directory(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Assert that `_sync_directory`
+    flushes a directory to disk and closes it afterwards.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    synced_file_descriptors: list[int] = []
+    closed_file_descriptors: list[int] = []
+
+    monkeypatch.setattr(
+        name = "fsync",
+        target = target,
+        value = synced_file_descriptors.append
+    )
+    monkeypatch.setattr(
+        name = "close",
+        target = target,
+        value = lambda file_descriptor: closed_file_descriptors.append(file_descriptor) or close(file_descriptor)
+    )
+
+    _sync_directory(str(tmp_path))
+
+    assert len(synced_file_descriptors) == 1
+    assert closed_file_descriptors == synced_file_descriptors
+
+def test_sync_directory_ignores_unsupported_directory(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Assert that `_sync_directory`
+    does nothing without failing
+    when a directory cannot be opened or flushed.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    def _mock_fsync(file_descriptor: int) -> None:
+        """
+        Mock function of `os.fsync` that
+        fails to flush a directory.
+
+        :param file_descriptor: File descriptor of the directory.
+        :raises OSError: Always.
+        """
+
+        raise OSError
+
+    monkeypatch.setattr(
+        name = "fsync",
+        target = target,
+        value = _mock_fsync
+    )
+
+    _sync_directory(str(tmp_path))
+    _sync_directory(str(tmp_path / "missing"))
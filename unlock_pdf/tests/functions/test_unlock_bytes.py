@@ -0,0 +1,91 @@
+"""Tests for `unlock_bytes`."""
+
+from io import BytesIO
+from pathlib import Path
+from pikepdf import (
+    PasswordError,
+    Pdf,
+    PdfError
+)
+from pytest import mark, raises
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.enumerations import SaveProfile
+from unlock_pdf.functions import unlock_bytes
+
+@mark.parametrize("test_revision", [4, 6])
+@mark.parametrize("test_save_profile", list(SaveProfile))
+def test_unlock_bytes_returns_unlocked_data(
+    tmp_path: Path,
+    test_revision: int,
+    test_save_profile: SaveProfile
+) -> None:
+    """
+    Assert that `unlock_bytes`
+    returns the raw data of the unlocked version of an in-memory PDF file
+    without touching the PDF file it came from.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_revision: Revision of the standard security handler.
+    :param test_save_profile: Profile to save the unlocked PDF file with.
+    """
+
+    test_file_path = generate_test_pdf_file(
+        file_path = tmp_path / "test.pdf",
+        test_password = "password",
+        test_revision = test_revision
+    )
+    test_data = test_file_path.read_bytes()
+
+    with Pdf.open(
+        BytesIO(
+            unlock_bytes(test_data, iter(["password-0", "password", "password"]), test_save_profile)
+        )
+    ) as test_pdf:
+        assert not test_pdf.is_encrypted
+
+    assert test_file_path.read_bytes() == test_data
+
+def test_unlock_bytes_returns_data_that_is_not_locked(tmp_path: Path) -> None:
+    """
+    Assert that `unlock_bytes`
+    returns the given data as is
+    when the in-memory PDF file is not locked.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_data = generate_test_pdf_file(tmp_path / "test.pdf").read_bytes()
+
+    assert unlock_bytes(test_data, ["password"]) is test_data
+
+def test_unlock_bytes_raises_exception(tmp_path: Path) -> None:
+    """
+    Assert that `unlock_bytes`
+    raises an appropriate exception
+    when given no password, no password that unlocks the PDF file, or malformed PDF data.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_data = generate_test_pdf_file(
+        file_path = tmp_path / "test.pdf",
+        test_password = "password"
+    ).read_bytes()
+
+    with raises(
+        expected_exception = ValueError,
+        match = "At least one password must be given."
+    ):
+        unlock_bytes(test_data, [])
+
+    with raises(
+        expected_exception = PasswordError,
+        match = "At least one password must unlock the PDF data."
+    ):
+        unlock_bytes(test_data, ["password-0"])
+
+    with raises(
+        expected_exception = PdfError,
+        match = "Unlocking PDF data failed."
+    ):
+        unlock_bytes(b"%PDF-1.7\ntrailer\n<< /Encrypt 1 0 R >>\n%%EOF\n", ["password"])
@@ -0,0 +1,112 @@
+"""Tests for `unlock_many`."""
+
+from pathlib import Path
+from pikepdf import Pdf
+from pytest import (
+    CaptureFixture,
+    MonkeyPatch,
+    mark,
+    raises
+)
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.functions import unlock_many
+from unlock_pdf.types import UnlockResult
+
+@mark.parametrize("test_job_count", [1, 2])
+def test_unlock_many_generates_unlock_results(
+    capsys: CaptureFixture[str],
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    test_job_count: int
+) -> None:
+    """
+    Assert that `unlock_many`
+    unlocks PDF files in given paths in discovery order while ignoring duplicates
+    without reading from standard input or writing to standard output.
+
+    :param capsys: `pytest` fixture for capturing outputs.
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_job_count: Number of worker processes.
+    """
+
+    def _mock_fail(*arguments: object, **keyword_arguments: object) -> None:
+        """
+        Mock function of `input` that
+        fails as it must not be called.
+
+        :param arguments: Positional arguments.
+        :param keyword_arguments: Keyword arguments.
+        """
+
+        raise AssertionError
+
+    monkeypatch.setattr("builtins.input", _mock_fail)
+
+    test_file_paths = [
+        str(generate_test_pdf_file(tmp_path / "test-0.pdf", test_password = "password")),
+        str(generate_test_pdf_file(tmp_path / "test-1.pdf")),
+        str(generate_test_pdf_file(tmp_path / "test-2.pdf", test_password = "password-0"))
+    ]
+
+    assert list(
+        unlock_many(
+            [test_file_paths[0], test_file_paths[1], test_file_paths[0], test_file_paths[2]],
+            ["password", "password"],
+            jobs = test_job_count,
+            output_dir = str(tmp_path / "output")
+        )
+    ) == [
+        UnlockResult(test_file_paths[0], FileState.UNLOCKED, "password", 1),
+        UnlockResult(test_file_paths[1], FileState.NOT_LOCKED),
+        UnlockResult(test_file_paths[2], FileState.LOCKED)
+    ]
+    assert capsys \
+        .readouterr() \
+        .out == ""
+
+    with Pdf.open(test_file_paths[0], password = "password") as test_pdf:
+        assert test_pdf.is_encrypted
+
+def test_unlock_many_defaults_to_cpu_count(tmp_path: Path) -> None:
+    """
+    Assert that `unlock_many`
+    unlocks PDF files across as many worker processes as the CPU count by default.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_path = str(generate_test_pdf_file(tmp_path / "test.pdf", test_password = "password"))
+
+    assert list(
+        unlock_many([test_file_path], ["password"])
+    ) == [UnlockResult(test_file_path, FileState.UNLOCKED, "password", 1)]
+
+@mark.parametrize(
+    "test_passwords, test_job_count, test_message",
+    [
+        ([], 1, "At least one password must be given."),
+        (["password"], 0, "Job count must be a positive integer.")
+    ]
+)
+def test_unlock_many_raises_exception(
+    test_job_count: int,
+    test_message: str,
+    test_passwords: list[str]
+) -> None:
+    """
+    Assert that `unlock_many`
+    raises an appropriate exception
+    as soon as it is called with no password or a non-positive job count.
+
+    :param test_job_count: Mock number of worker processes.
+    :param test_message: Expected error message.
+    :param test_passwords: Mock passwords.
+    """
+
+    with raises(
+        expected_exception = ValueError,
+        match = test_message
+    ):
+        unlock_many([], test_passwords, jobs = test_job_count)
@@ -1,9 +1,21 @@
 """Tests for `unlock_pdf`."""
 
-from pytest import MonkeyPatch, mark
-from unlock_pdf.enumerations import FileState
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from pytest import (
+    CaptureFixture,
+    MonkeyPatch,
+    mark
+)
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.classes import (
+    FingerprintPasswords,
+    PasswordHits,
+    ServeOptions
+)
+from unlock_pdf.enumerations import FileState, SaveProfile
 from unlock_pdf.functions import unlock_pdf
-from unlock_pdf.types import GroupedPaths
+from unlock_pdf.types import GroupedPaths, UnlockResult
 
 # <NOTE>
 # As the source code prefers named imports over default imports,
@@ -12,12 +24,13 @@ from unlock_pdf.types import GroupedPaths
 #
 # See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
 import unlock_pdf.functions as target
+import unlock_pdf.server as server_target
 
 @mark.parametrize(
     "test_pdf_file_paths",
     [
         ["test-0.pdf"],
-        ["test-0.pdf, test-1.pdf"]
+        ["test-0.pdf", "test-1.pdf"]
     ]
 )
 def test_unlock_pdf_calls_helper_functions(
@@ -30,8 +43,8 @@ def test_unlock_pdf_calls_helper_functions(
     
     - `_get_passwords`
     - `_get_pdf_file_paths`
-    - `_log_unlock_attempt`, and
-    - `_unlock_pdf_file`.
+    - `_get_unlock_result`, and
+    - `_log_unlock_attempt`.
     
     :param monkeypatch: `pytest` fixture for mocking functions.
     :param test_pdf_file_paths: Ordered list of unique paths of all PDF files to unlock.
@@ -57,50 +70,748 @@ def test_unlock_pdf_calls_helper_functions(
 
         assert grouped_pdf_file_paths == test_grouped_pdf_file_paths
 
-    def _mock_unlock_pdf_file(
+    def _mock_get_unlock_result(
         file_path: str,
-        grouped_pdf_file_paths: GroupedPaths,
-        passwords: list[str]
-    ) -> None:
+        passwords: list[str],
+        save_profile: SaveProfile,
+        output_dir: str | None
+    ) -> UnlockResult:
         """
-        Mock function of `unlock_pdf.functions._mock_unlock_pdf_file` that
+        Mock function of `unlock_pdf.functions._get_unlock_result` that
         mocks unlocking of a PDF file.
 
         :param file_path: Sanitized file path of the PDF file to unlock.
-        :param grouped_pdf_file_paths: Dictionary that maps file states
-                                       with file paths of PDF files.
         :param passwords: Passwords to attempt unlocking the PDF file with.
+        :param save_profile: Profile to save the unlocked PDF file with.
+        :param output_dir: Output directory to write the unlocked PDF file in, if any.
+        :returns: Result of attempting to unlock the PDF file.
         """
 
         nonlocal unlock_count
 
         assert file_path in test_pdf_file_paths
-        assert grouped_pdf_file_paths == test_grouped_pdf_file_paths
         assert passwords == test_passwords
+        assert save_profile == SaveProfile.FAST
+        assert output_dir is None
 
         unlock_count += 1
+        test_grouped_pdf_file_paths[FileState.UNLOCKED].append(file_path)
+
+        return UnlockResult(file_path, FileState.UNLOCKED, "password", 1)
 
     monkeypatch.setattr(
         name = "_get_passwords",
         target = target,
-        value = lambda: test_passwords
+        value = lambda source, separator: test_passwords
     )
     monkeypatch.setattr(
         name = "_get_pdf_file_paths",
         target = target,
-        value = lambda: test_pdf_file_paths
+        value = lambda directory_manifest, paths, should_sniff: test_pdf_file_paths
     )
     monkeypatch.setattr(
         name = "_log_unlock_attempt",
         target = target,
         value = _mock_log_unlock_attempt
     )
+    monkeypatch.setattr(
+        name = "_get_unlock_result",
+        target = target,
+        value = _mock_get_unlock_result
+    )
+
+    unlock_pdf(["--jobs", "1"])
+
+    assert unlock_count == len(test_pdf_file_paths)
+
+def test_unlock_pdf_only_classifies(
+    capsys: CaptureFixture[str],
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path
+) -> None:
+    """
+    Assert that `unlock_pdf`
+    only logs how many PDF files are locked or not
+    without asking for passwords or unlocking any PDF file
+    when only classifying is asked for,
+    while still persisting the manifest of walked directories in the cache directory.
+
+    :param capsys: `pytest` fixture for capturing outputs.
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    def _mock_fail() -> None:
+        """
+        Mock function of either
+        
+        - `unlock_pdf.functions._get_passwords`, or
+        - `unlock_pdf.functions._unlock_pdf_file`
+        
+        that
+        fails as it must not be called.
+        """
+
+        raise AssertionError
+
+    monkeypatch.setattr(
+        name = "_detect_file_state",
+        target = target,
+        value = lambda file_path: (
+            FileState.LOCKED
+            if file_path == "test-0.pdf"
+            else FileState.NOT_LOCKED
+        )
+    )
+    monkeypatch.setattr(
+        name = "_get_passwords",
+        target = target,
+        value = _mock_fail
+    )
+    monkeypatch.setattr(
+        name = "_get_pdf_file_paths",
+        target = target,
+        value = lambda directory_manifest, paths, should_sniff: iter(["test-0.pdf", "test-1.pdf", "test-2.pdf"])
+    )
     monkeypatch.setattr(
         name = "_unlock_pdf_file",
         target = target,
-        value = _mock_unlock_pdf_file
+        value = _mock_fail
+    )
+
+    unlock_pdf(["--classify-only", "--cache-dir", str(tmp_path / "cache")])
+
+    assert (
+        capsys \
+            .readouterr() \
+            .out
+    ) == (
+        "1 PDF file is still locked." + "\n"
+        + "2 PDF files are not locked." + "\n"
+        + "\n"
+    )
+    assert (tmp_path / "cache" / "directory-manifest.json").is_file()
+
+@mark.parametrize(
+    "test_arguments, test_generator",
+    [
+        (["--jobs", "2", "--shard-passwords"], "sharded"),
+        (["--jobs", "2"], "regular"),
+        (["--jobs", "2", "--memory-budget", "512"], "budgeted"),
+        (["--jobs", "1", "--timeout", "30"], "isolated"),
+        (["--jobs", "2", "--memory-limit", "512"], "isolated")
+    ]
+)
+def test_unlock_pdf_picks_unlock_results_generator(
+    monkeypatch: MonkeyPatch,
+    test_arguments: list[str],
+    test_generator: str
+) -> None:
+    """
+    Assert that `unlock_pdf`
+    unlocks PDF files one at a time with their passwords sharded across worker processes,
+    or within a memory budget,
+    only when asked for,
+    and unlocks PDF files in isolated worker processes whenever asked to limit each of them.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param test_arguments: Mock command-line arguments.
+    :param test_generator: Kind of generator of unlock results that should be used.
+    """
+
+    used_generators: list[str] = []
+
+    monkeypatch.setattr(
+        name = "_generate_budgeted_unlock_results",
+        target = target,
+        value = lambda fingerprint_passwords, job_count, memory_budget, output_dir, passwords, pdf_file_paths, \
+            save_profile, should_preserve_order: (
+            used_generators.append("budgeted" if memory_budget == 512 << 20 else "unknown")
+            or iter([UnlockResult("test.pdf", FileState.UNLOCKED)])
+        )
+    )
+    monkeypatch.setattr(
+        name = "_generate_isolated_unlock_results",
+        target = target,
+        value = lambda fingerprint_passwords, job_count, memory_limit, output_dir, passwords, pdf_file_paths, \
+            save_profile, should_preserve_order, timeout: (
+            used_generators.append("isolated" if timeout == 30.0 or memory_limit == 512 << 20 else "unknown")
+            or iter([UnlockResult("test.pdf", FileState.UNLOCKED)])
+        )
+    )
+    monkeypatch.setattr(
+        name = "_generate_sharded_unlock_results",
+        target = target,
+        value = lambda fingerprint_passwords, job_count, output_dir, passwords, pdf_file_paths, save_profile: (
+            used_generators.append("sharded") or iter([UnlockResult("test.pdf", FileState.UNLOCKED)])
+        )
+    )
+    monkeypatch.setattr(
+        name = "_generate_unlock_results",
+        target = target,
+        value = lambda fingerprint_passwords, job_count, output_dir, passwords, pdf_file_paths, save_profile, \
+            should_preserve_order: (
+            used_generators.append("regular") or iter([UnlockResult("test.pdf", FileState.UNLOCKED)])
+        )
+    )
+    monkeypatch.setattr(
+        name = "_get_passwords",
+        target = target,
+        value = lambda source, separator: ["password"]
+    )
+    monkeypatch.setattr(
+        name = "_get_pdf_file_paths",
+        target = target,
+        value = lambda directory_manifest, paths, should_sniff: iter(["test.pdf"])
+    )
+    monkeypatch.setattr(
+        name = "_log_unlock_attempt",
+        target = target,
+        value = lambda grouped_pdf_file_paths: None
+    )
+
+    unlock_pdf(test_arguments)
+
+    assert used_generators == [test_generator]
+
+def test_unlock_pdf_persists_password_hits(
+    capsys: CaptureFixture[str],
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path
+) -> None:
+    """
+    Assert that `unlock_pdf`
+    attempts first the passwords that unlocked the most PDF files in previous runs,
+    logs the error that made each failed PDF file fail,
+    persists how many PDF files each password unlocked in the cache directory
+    along with which password unlocked PDF files with each encryption fingerprint,
+    and logs how many passwords were attempted on average per unlocked PDF file.
+
+    :param capsys: `pytest` fixture for capturing outputs.
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_password_hits = PasswordHits()
+    test_password_hits.add("password-1")
+    test_password_hits.dump(str(tmp_path / "password-hits.json"))
+    test_fingerprint_passwords = FingerprintPasswords(["password-0", "password-1"])
+    test_fingerprint_passwords.add("fingerprint-1", "password-1")
+    test_fingerprint_passwords.dump(str(tmp_path / "fingerprint-passwords.json"))
+
+    def _mock_generate_unlock_results(
+        fingerprint_passwords: FingerprintPasswords,
+        job_count: int,
+        output_dir: str | None,
+        passwords: list[str],
+        pdf_file_paths: Iterable[str],
+        save_profile: SaveProfile,
+        should_preserve_order: bool
+    ) -> list[UnlockResult]:
+        """
+        Mock function of `unlock_pdf.functions._generate_unlock_results` that
+        mocks unlocking every PDF file with the first password.
+
+        :param fingerprint_passwords: Passwords that unlocked PDF files keyed on their encryption fingerprints.
+        :param job_count: Number of worker processes.
+        :param output_dir: Output directory to write unlocked PDF files in, if any.
+        :param passwords: Passwords to attempt unlocking each PDF file with.
+        :param pdf_file_paths: Sanitized file paths of the PDF files to unlock.
+        :param save_profile: Profile to save unlocked PDF files with.
+        :param should_preserve_order: Whether to generate results in the same order as their file paths or not.
+        :returns: Results of unlocking each PDF file.
+        """
+
+        assert passwords == ["password-1", "password-0"]
+        assert should_preserve_order
+        assert save_profile == SaveProfile.COMPACT
+        assert output_dir is None
+        assert fingerprint_passwords["fingerprint-1"] == "password-1"
+
+        fingerprint_passwords.add("fingerprint-0", "password-0")
+
+        pdf_file_paths = list(pdf_file_paths)
+
+        return [
+            UnlockResult(pdf_file_paths[0], FileState.UNLOCKED, "password-1", 1),
+            UnlockResult(pdf_file_paths[1], FileState.UNLOCKED, "password-0", 2),
+            UnlockResult(pdf_file_paths[2], FileState.LOCKED),
+            UnlockResult(
+                error = "PdfError: damaged",
+                file_path = pdf_file_paths[3],
+                file_state = FileState.FAILED
+            )
+        ]
+
+    monkeypatch.setattr(
+        name = "_generate_unlock_results",
+        target = target,
+        value = _mock_generate_unlock_results
+    )
+    monkeypatch.setattr(
+        name = "_get_passwords",
+        target = target,
+        value = lambda source, separator: ["password-0", "password-1"]
+    )
+    monkeypatch.setattr(
+        name = "_get_pdf_file_paths",
+        target = target,
+        value = lambda directory_manifest, paths, should_sniff: ["test-0.pdf", "test-1.pdf", "test-2.pdf", "test-3.pdf"]
+    )
+
+    unlock_pdf(["--jobs", "1", "--cache-dir", str(tmp_path), "--save-profile", "compact"])
+
+    test_password_hits = PasswordHits.read(str(tmp_path / "password-hits.json"))
+
+    assert test_password_hits["password-0"] == 1
+    assert test_password_hits["password-1"] == 2
+
+    test_fingerprint_passwords = FingerprintPasswords.read(
+        str(tmp_path / "fingerprint-passwords.json"),
+        ["password-0", "password-1"]
+    )
+
+    assert test_fingerprint_passwords["fingerprint-0"] == "password-0"
+    assert test_fingerprint_passwords["fingerprint-1"] == "password-1"
+    assert capsys \
+        .readouterr() \
+        .out \
+        .endswith(
+            "Unlocking test-3.pdf failed due to PdfError: damaged" + "\n"
+            + "\n"
+            + "Each unlocked PDF file took 1.50 attempts on average." + "\n"
+            + "\n"
+        )
+
+def test_unlock_pdf_resumes_from_journal(
+    capsys: CaptureFixture[str],
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path
+) -> None:
+    """
+    Assert that `unlock_pdf`
+    journals the final file state of each PDF file
+    and skips PDF files whose final file state is in the journal when resuming,
+    while still logging them by said file state.
+
+    :param capsys: `pytest` fixture for capturing outputs.
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_paths = [
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / "test-0.pdf",
+                test_password = "password"
+            )
+        ),
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / "test-1.pdf"
+            )
+        )
+    ]
+    test_journal_file_path = str(tmp_path / "journal" / "journal.jsonl")
+
+    def _mock_fail(*arguments: object, **keyword_arguments: object) -> None:
+        """
+        Mock function of `unlock_pdf.functions._unlock_pdf_file` that
+        fails as it must not be called.
+
+        :param arguments: Positional arguments.
+        :param keyword_arguments: Keyword arguments.
+        """
+
+        raise AssertionError
+
+    monkeypatch.setattr(
+        name = "_get_passwords",
+        target = target,
+        value = lambda source, separator: ["password"]
+    )
+    monkeypatch.setattr(
+        name = "_get_pdf_file_paths",
+        target = target,
+        value = lambda directory_manifest, paths, should_sniff: iter(test_file_paths)
+    )
+
+    unlock_pdf(["--jobs", "1", "--journal", test_journal_file_path])
+
+    test_first_output = capsys \
+        .readouterr() \
+        .out
+
+    monkeypatch.setattr(
+        name = "_unlock_pdf_file",
+        target = target,
+        value = _mock_fail
+    )
+
+    unlock_pdf(["--jobs", "1", "--journal", test_journal_file_path, "--resume"])
+
+    test_second_output = capsys \
+        .readouterr() \
+        .out
+
+    assert "1 PDF file is not locked:" + "\n" + test_file_paths[1] in test_first_output
+    assert "1 PDF file is unlocked:" + "\n" + test_file_paths[0] in test_first_output
+    assert "1 PDF file is not locked:" + "\n" + test_file_paths[1] in test_second_output
+    assert "1 PDF file is unlocked:" + "\n" + test_file_paths[0] in test_second_output
+    assert len(
+        Path(test_journal_file_path)
+            .read_text(encoding = "utf-8")
+            .splitlines()
+    ) == 2
+
+def test_unlock_pdf_skips_known_pdf_files(
+    capsys: CaptureFixture[str],
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path
+) -> None:
+    """
+    Assert that `unlock_pdf`
+    persists the last outcome of each PDF file in the cache directory
+    and skips PDF files whose last outcome is known and which have not changed since,
+    unless they were still locked with another set of passwords.
+
+    :param capsys: `pytest` fixture for capturing outputs.
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_paths = [
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / "test-0.pdf",
+                test_password = "password-0"
+            )
+        ),
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / "test-1.pdf",
+                test_password = "password-1"
+            )
+        )
+    ]
+    test_passwords: list[str] = []
+    unlocked_file_paths: list[str] = []
+
+    def _mock_get_unlock_result(
+        file_path: str,
+        passwords: list[str],
+        save_profile: SaveProfile,
+        output_dir: str | None
+    ) -> UnlockResult:
+        """
+        Mock function of `unlock_pdf.functions._get_unlock_result` that
+        records which PDF files are attempted to be unlocked.
+
+        :param file_path: Sanitized file path of the PDF file to unlock.
+        :param passwords: Passwords to attempt unlocking the PDF file with.
+        :param save_profile: Profile to save the unlocked PDF file with.
+        :param output_dir: Output directory to write the unlocked PDF file in, if any.
+        :returns: Result of attempting to unlock the PDF file.
+        """
+
+        unlocked_file_paths.append(file_path)
+
+        return original_get_unlock_result(file_path, passwords, save_profile, output_dir)
+
+    original_get_unlock_result = target._get_unlock_result
+
+    monkeypatch.setattr(
+        name = "_get_passwords",
+        target = target,
+        value = lambda source, separator: test_passwords
+    )
+    monkeypatch.setattr(
+        name = "_get_pdf_file_paths",
+        target = target,
+        value = lambda directory_manifest, paths, should_sniff: iter(test_file_paths)
+    )
+    monkeypatch.setattr(
+        name = "_get_unlock_result",
+        target = target,
+        value = _mock_get_unlock_result
+    )
+
+    for test_passwords in [["password-0"], ["password-0"], ["password-1"]]:
+        capsys.readouterr()
+
+        unlock_pdf(["--jobs", "1", "--cache-dir", str(tmp_path / "cache")])
+
+    test_output = capsys \
+        .readouterr() \
+        .out
+
+    assert unlocked_file_paths == test_file_paths + [test_file_paths[1]]
+    assert "1 PDF file is not locked:" + "\n" + test_file_paths[0] in test_output
+    assert "1 PDF file is unlocked:" + "\n" + test_file_paths[1] in test_output
+
+def test_unlock_pdf_watches_directories(
+    capsys: CaptureFixture[str],
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path
+) -> None:
+    """
+    Assert that `unlock_pdf`
+    logs each PDF file as soon as it is unlocked in watched directories
+    and logs every result so far once interrupted.
+
+    :param capsys: `pytest` fixture for capturing outputs.
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_path = str(tmp_path / "test.pdf")
+
+    def _mock_generate_watched_unlock_results(
+        directory_paths: list[str],
+        passwords: list[str],
+        job_count: int,
+        fingerprint_passwords: FingerprintPasswords,
+        save_profile: SaveProfile,
+        output_dir: str | None,
+        should_sniff: bool
+    ) -> Iterator[UnlockResult]:
+        """
+        Mock function of `unlock_pdf.functions._generate_watched_unlock_results` that
+        unlocks a mock PDF file before being interrupted.
+
+        :param directory_paths: Paths of the directories to watch.
+        :param passwords: Passwords to attempt unlocking each PDF file with.
+        :param job_count: Number of worker processes.
+        :param fingerprint_passwords: Passwords that unlocked PDF files keyed on their encryption fingerprints.
+        :param save_profile: Profile to save unlocked PDF files with.
+        :param output_dir: Output directory to write unlocked PDF files in, if any.
+        :param should_sniff: Whether to skip PDF files that do not start with the PDF file signature or not.
+        :raises KeyboardInterrupt: After the mock PDF file is unlocked.
+        :returns: Iterator of the result of unlocking the mock PDF file.
+        """
+
+        assert directory_paths == [str(tmp_path)]
+        assert passwords == ["password"]
+
+        yield UnlockResult(test_file_path, FileState.UNLOCKED, "password", 1)
+
+        raise KeyboardInterrupt
+
+    def _mock_fail(*arguments: object, **keyword_arguments: object) -> None:
+        """
+        Mock function of `unlock_pdf.functions._get_pdf_file_paths` that
+        fails as it must not be called.
+
+        :param arguments: Positional arguments.
+        :param keyword_arguments: Keyword arguments.
+        """
+
+        raise AssertionError
+
+    monkeypatch.setattr(
+        name = "_get_directory_paths",
+        target = target,
+        value = lambda paths: [str(tmp_path)]
+    )
+    monkeypatch.setattr(
+        name = "_get_pdf_file_paths",
+        target = target,
+        value = _mock_fail
+    )
+    monkeypatch.setattr(
+        name = "_get_passwords",
+        target = target,
+        value = lambda source, separator: ["password"]
+    )
+    monkeypatch.setattr(
+        name = "_generate_watched_unlock_results",
+        target = target,
+        value = _mock_generate_watched_unlock_results
+    )
+
+    unlock_pdf(["--watch"])
+
+    test_output = capsys \
+        .readouterr() \
+        .out
+
+    assert test_output.startswith(test_file_path + " is unlocked.\n")
+    assert "1 PDF file is unlocked:" + "\n" + test_file_path in test_output
+
+def test_unlock_pdf_reads_input_sources(
+    capsys: CaptureFixture[str],
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path
+) -> None:
+    """
+    Assert that `unlock_pdf`
+    unlocks PDF files in given paths and in paths streamed from an input source
+    with passwords read from an input source
+    without asking for any.
+
+    :param capsys: `pytest` fixture for capturing outputs.
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_paths = [
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / f"test-{index}.pdf",
+                test_password = "password"
+            )
+        )
+        for index in range(2)
+    ]
+
+    def _mock_fail(*arguments: object, **keyword_arguments: object) -> None:
+        """
+        Mock function of `unlock_pdf.functions._get_unique_inputs` that
+        fails as it must not be called.
+
+        :param arguments: Positional arguments.
+        :param keyword_arguments: Keyword arguments.
+        """
+
+        raise AssertionError
+
+    monkeypatch.setattr(
+        name = "_get_unique_inputs",
+        target = target,
+        value = _mock_fail
+    )
+    monkeypatch.setenv("TEST_PASSWORDS", "password")
+    (tmp_path / "paths.txt").write_bytes(
+        "\0".join(test_file_paths).encode()
+    )
+
+    unlock_pdf(
+        [
+            test_file_paths[0],
+            "--paths-from", str(tmp_path / "paths.txt"),
+            "--passwords-from", "env:TEST_PASSWORDS",
+            "--null",
+            "--jobs", "1"
+        ]
+    )
+
+    assert "2 PDF files are unlocked:" + "\n" + "\n".join(test_file_paths) in capsys \
+        .readouterr() \
+        .out
+
+def test_unlock_pdf_schedules_costliest_pdf_files_first(
+    capsys: CaptureFixture[str],
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path
+) -> None:
+    """
+    Assert that `unlock_pdf`
+    unlocks the PDF files estimated to be the costliest first
+    and logs their estimated costs
+    when asked to schedule PDF files from the costliest.
+
+    :param capsys: `pytest` fixture for capturing outputs.
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_paths = [
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / f"test-{index}.pdf",
+                test_password = "password",
+                test_revision = test_revision
+            )
+        )
+        for index, test_revision in enumerate([2, 6, 4])
+    ]
+    unlocked_file_paths: list[str] = []
+
+    def _mock_get_unlock_result(
+        file_path: str,
+        passwords: list[str],
+        save_profile: SaveProfile,
+        output_dir: str | None
+    ) -> UnlockResult:
+        """
+        Mock function of `unlock_pdf.functions._get_unlock_result` that
+        records the order PDF files are unlocked in.
+
+        :param file_path: Sanitized file path of the PDF file.
+        :param passwords: Passwords to attempt, in order.
+        :param save_profile: Profile to save the unlocked PDF file with.
+        :param output_dir: Directory to write the unlocked PDF file to, if any.
+        :returns: Mock result of unlocking the PDF file.
+        """
+
+        unlocked_file_paths.append(file_path)
+
+        return UnlockResult(file_path, FileState.UNLOCKED, "password", 1)
+
+    monkeypatch.setattr(
+        name = "_get_unlock_result",
+        target = target,
+        value = _mock_get_unlock_result
+    )
+    monkeypatch.setenv("TEST_PASSWORDS", "password")
+
+    unlock_pdf(
+        [
+            *test_file_paths,
+            "--passwords-from", "env:TEST_PASSWORDS",
+            "--schedule", "longest-first",
+            "--jobs", "1"
+        ]
+    )
+
+    output = capsys \
+        .readouterr() \
+        .out
+
+    assert unlocked_file_paths == [test_file_paths[1], test_file_paths[2], test_file_paths[0]]
+    assert "Unlocking was estimated to take ~" in output
+    assert output.index(f"{test_file_paths[1]} (~") < output.index(f"{test_file_paths[0]} (~")
+
+def test_unlock_pdf_serves_unlock_requests(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `unlock_pdf`
+    serves unlock requests instead of unlocking PDF files
+    when given the `serve` subcommand.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    test_served_options: list[ServeOptions] = []
+
+    def _mock_fail(*arguments: object, **keyword_arguments: object) -> None:
+        """
+        Mock function of `unlock_pdf.functions._get_options` that
+        fails as it must not be called.
+
+        :param arguments: Positional arguments.
+        :param keyword_arguments: Keyword arguments.
+        """
+
+        raise AssertionError
+
+    monkeypatch.setattr(
+        name = "_get_options",
+        target = target,
+        value = _mock_fail
+    )
+    monkeypatch.setattr(
+        name = "serve_unlock_requests",
+        target = server_target,
+        value = test_served_options.append
+    )
+    monkeypatch.setattr(
+        name = "argv",
+        target = target,
+        value = ["unlock-pdf", "serve", "--port", "0"]
     )
 
     unlock_pdf()
 
-    assert unlock_count == len(test_pdf_file_paths)
+    assert [
+        test_options.port for test_options in test_served_options
+    ] == [0]
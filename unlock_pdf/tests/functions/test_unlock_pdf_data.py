@@ -0,0 +1,60 @@
+"""Tests for `_unlock_pdf_data`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pikepdf import Pdf
+from pytest import mark
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.functions import _unlock_pdf_data
+
+@mark.parametrize(
+    "test_password, test_passwords," \
+    "test_file_state, test_unlocking_password",
+    [
+        (
+            None, ["password"],
+            FileState.NOT_LOCKED, None
+        ),
+        (
+            "password", ["password-0", "password"],
+            FileState.UNLOCKED, "password"
+        ),
+        (
+            "password", ["password-0"],
+            FileState.LOCKED, None
+        )
+    ]
+)
+def test_unlock_pdf_data_returns_file_state(
+    tmp_path: Path,
+    test_file_state: FileState,
+    test_password: str | None,
+    test_passwords: list[str],
+    test_unlocking_password: str | None
+) -> None:
+    """
+    Assert that `_unlock_pdf_data`
+    returns the file state of raw PDF data after attempting to unlock it
+    along with the password that unlocked it, if any,
+    saving it via the callback only if it got unlocked.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_file_state: Expected file state.
+    :param test_password: User password to encrypt the PDF file with, if any.
+    :param test_passwords: Passwords to attempt unlocking the PDF file with.
+    :param test_unlocking_password: Expected password that unlocked the PDF file, if any.
+    """
+
+    test_saved_pdfs: list[Pdf] = []
+
+    assert _unlock_pdf_data(
+        generate_test_pdf_file(
+            file_path = tmp_path / "test.pdf",
+            test_password = test_password
+        ).read_bytes(),
+        test_passwords,
+        test_saved_pdfs.append
+    ) == (test_file_state, test_unlocking_password)
+    assert len(test_saved_pdfs) == (test_file_state == FileState.UNLOCKED)
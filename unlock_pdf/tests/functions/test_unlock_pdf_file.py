@@ -2,16 +2,22 @@
 
 # pyright: reportPrivateUsage=false
 
-from copy import deepcopy
-from pikepdf import PasswordError, PdfError
+from io import BufferedReader, BytesIO
+from pathlib import Path
+from pikepdf import (
+    PasswordError,
+    Pdf,
+    PdfError
+)
 from pytest import (
     MonkeyPatch,
     mark,
     raises
 )
+from tests.utilities import generate_test_pdf_file
 from unlock_pdf.enumerations import FileState
 from unlock_pdf.functions import _unlock_pdf_file
-from unlock_pdf.types import GroupedPaths, Passwords
+from unlock_pdf.types import Passwords
 
 # <NOTE>
 # As the source code prefers named imports over default imports,
@@ -21,12 +27,7 @@ from unlock_pdf.types import GroupedPaths, Passwords
 # See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
 import unlock_pdf.functions as target
 
-BASE_GROUPED_PDF_FILE_PATHS: GroupedPaths = {
-    key: []
-    for key in [
-        file_state for file_state in FileState
-    ]
-}
+TEST_DATA = b"%PDF-1.7\n%%EOF\n"
 
 class _MockPDF:
     """Mock class of `pikepdf.Pdf`."""
@@ -44,14 +45,34 @@ class _MockPDF:
         """
 
         self.did_unlock = False
+        self.is_open = False
         self.test_pdf_password = test_pdf_password
         self.test_should_fail_on_open = test_should_fail_on_open
         self.test_should_fail_on_save = test_should_fail_on_save
 
+    def __enter__(self) -> "_MockPDF":
+        """
+        Mock function of `pikepdf.Pdf.__enter__` that
+        mocks entering the context of an opened PDF file.
+
+        :returns: Opened PDF file.
+        """
+
+        self.is_open = True
+
+        return self
+
+    def __exit__(self, *arguments: object) -> None:
+        """
+        Mock function of `pikepdf.Pdf.__exit__` that
+        mocks closing an opened PDF file.
+        """
+
+        self.is_open = False
+
     def open(
         self,
-        filename_or_stream: str,
-        allow_overwriting_input: bool = False,
+        filename_or_stream: BytesIO,
         password: str = "",
     ) -> "_MockPDF":
         """
@@ -63,8 +84,7 @@ class _MockPDF:
           - opening said PDF file fails, or
           - said PDF file is not locked.
         
-        :param allow_overwriting_input: Whether if the PDF file can be overwritten or not.
-        :param filename_or_stream: Sanitized file path of the PDF file to unlock.
+        :param filename_or_stream: Stream of the PDF data read from the PDF file to unlock.
         :param password: Password needed to unlock the PDF file with.
         :raises PasswordError: If the PDF file is not unlocked.
         :raises PdfError: If opening the PDF file fails.
@@ -73,8 +93,7 @@ class _MockPDF:
         if self.test_should_fail_on_open:
             raise PdfError
 
-        assert allow_overwriting_input == (password != "")
-        assert filename_or_stream == "test.pdf"
+        assert filename_or_stream.getvalue() == TEST_DATA
 
         if password != self.test_pdf_password:
             raise PasswordError
@@ -84,7 +103,7 @@ class _MockPDF:
 
         return self
 
-    def save(self, filename_or_stream: str) -> None:
+    def save(self, filename_or_stream: str, **keyword_arguments: object) -> None:
         """
         Mock function of `pikepdf.Pdf.save` that
         mocks
@@ -92,6 +111,8 @@ class _MockPDF:
         - overwriting a PDF file, or
         - raising an appropriate exception if overwriting said PDF file fails.
 
+        :param filename_or_stream: File path of the temporary file to write the PDF file to.
+        :param keyword_arguments: Keyword arguments of the profile to save the PDF file with.
         :raises PdfError: If saving the PDF file fails.
         """
 
@@ -99,7 +120,11 @@ class _MockPDF:
             raise PdfError
 
         assert self.did_unlock is True
-        assert filename_or_stream == "test.pdf"
+        assert self.is_open is True
+        assert Path(filename_or_stream).name.startswith(".")
+        assert Path(filename_or_stream).parent == Path("test.pdf").resolve().parent
+
+        Path(filename_or_stream).write_bytes(b"unlocked")
 
 @mark.parametrize(
     "test_passwords, test_pdf_password," \
@@ -125,6 +150,7 @@ class _MockPDF:
 )
 def test_unlock_pdf_file_attempts_unlocking(
     monkeypatch: MonkeyPatch,
+    tmp_path: Path,
     test_passwords: Passwords,
     test_pdf_password: str,
     test_should_unlock: bool
@@ -134,11 +160,15 @@ def test_unlock_pdf_file_attempts_unlocking(
     attempts unlocking a PDF file pointed at by the given file path.
 
     :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
     :param test_passwords: Passwords to attempt unlocking the PDF file with.
     :param test_pdf_password: Password needed to unlock the PDF file with.
     :param test_should_unlock: Whether the PDF file should have been unlocked or not.
     """
 
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "test.pdf").write_bytes(TEST_DATA)
+
     test_pikepdf_pdf = _MockPDF(test_pdf_password)
 
     monkeypatch.setattr(
@@ -149,11 +179,12 @@ def test_unlock_pdf_file_attempts_unlocking(
 
     _unlock_pdf_file(
         file_path = "test.pdf",
-        grouped_pdf_file_paths = deepcopy(BASE_GROUPED_PDF_FILE_PATHS),
         passwords = test_passwords
     )
 
     assert test_pikepdf_pdf.did_unlock == test_should_unlock
+    assert ((tmp_path / "test.pdf").read_bytes() == b"unlocked") == test_should_unlock
+    assert test_pikepdf_pdf.is_open is False
 
 @mark.parametrize(
     "test_should_fail_on_open, test_should_fail_on_save",
@@ -164,6 +195,7 @@ def test_unlock_pdf_file_attempts_unlocking(
 )
 def test_unlock_pdf_file_raises_exception(
     monkeypatch: MonkeyPatch,
+    tmp_path: Path,
     test_should_fail_on_open: bool,
     test_should_fail_on_save: bool
 ) -> None:
@@ -173,10 +205,14 @@ def test_unlock_pdf_file_raises_exception(
     when `pikepdf` fails.
 
     :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
     :param test_should_fail_on_open: Whether `pikepdf` should fail
                                      on attempt to open the PDF file or not.
     """
 
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "test.pdf").write_bytes(TEST_DATA)
+
     monkeypatch.setattr(
         name = "Pdf",
         target = target,
@@ -193,81 +229,302 @@ def test_unlock_pdf_file_raises_exception(
     ):
         _unlock_pdf_file(
             file_path = "test.pdf",
-            grouped_pdf_file_paths = deepcopy(BASE_GROUPED_PDF_FILE_PATHS),
             passwords = ["password"]
         )
 
-locked_grouped_pdf_file_paths = deepcopy(BASE_GROUPED_PDF_FILE_PATHS)
-not_locked_grouped_pdf_file_paths = deepcopy(BASE_GROUPED_PDF_FILE_PATHS)
-unlocked_grouped_pdf_file_paths = deepcopy(BASE_GROUPED_PDF_FILE_PATHS)
+@mark.parametrize(
+    "test_pdf_password, test_file_state, test_unlocking_password",
+    [
+        ("password-0", FileState.LOCKED, None),
+        ("", FileState.NOT_LOCKED, None),
+        ("password", FileState.UNLOCKED, "password")
+    ]
+)
+def test_unlock_pdf_file_returns_file_state(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    test_file_state: FileState,
+    test_pdf_password: str,
+    test_unlocking_password: str | None
+) -> None:
+    """
+    Assert that `_unlock_pdf_file`
+    returns an appropriate file state and unlocking password
+    based on unlocking result.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_file_state: Expected file state.
+    :param test_pdf_password: Password needed to unlock the PDF file with.
+    :param test_unlocking_password: Expected password that unlocked the PDF file, if any.
+    """
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "test.pdf").write_bytes(TEST_DATA)
+
+    # <NOTE>
+    # Replacing the PDF file is tested elsewhere, so only the result is tested here.
+    monkeypatch.setattr(
+        name = "_replace_file_atomically",
+        target = target,
+        value = lambda file_path, write, source_file_path: None
+    )
+    monkeypatch.setattr(
+        name = "Pdf",
+        target = target,
+        value = _MockPDF(test_pdf_password)
+    )
+
+    assert _unlock_pdf_file(
+        file_path = "test.pdf",
+        passwords = ["password"]
+    ) == (test_file_state, test_unlocking_password)
+
+def test_unlock_pdf_file_skips_opening_unencrypted_pdf_file(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path
+) -> None:
+    """
+    Assert that `_unlock_pdf_file`
+    groups a PDF file as not locked without opening it via `pikepdf`
+    when its trailer has no encryption dictionary.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "test.pdf").write_bytes(TEST_DATA)
+
+    monkeypatch.setattr(
+        name = "_classify_pdf_data",
+        target = target,
+        value = lambda data: FileState.NOT_LOCKED
+    )
+    monkeypatch.setattr(
+        name = "Pdf",
+        target = target,
+        value = _MockPDF(
+            test_pdf_password = "",
+            test_should_fail_on_open = True
+        )
+    )
+
+    assert _unlock_pdf_file(
+        file_path = "test.pdf",
+        passwords = ["password"]
+    ) == (FileState.NOT_LOCKED, None)
+
+class _CountingPDF:
+    """Wrapper class of `pikepdf.Pdf` that counts attempts to open PDF files."""
+
+    def __init__(self) -> None:
+        """Initialize a wrapper instance of `pikepdf.Pdf`."""
+
+        self.open_count = 0
+
+    def open(self, *arguments: object, **keyword_arguments: object) -> Pdf:
+        """
+        Wrapper function of `pikepdf.Pdf.open` that counts attempts to open PDF files.
+
+        :returns: Opened PDF file.
+        """
+
+        self.open_count += 1
 
-locked_grouped_pdf_file_paths[FileState.LOCKED] = ["test.pdf"]
-not_locked_grouped_pdf_file_paths[FileState.NOT_LOCKED] = ["test.pdf"]
-unlocked_grouped_pdf_file_paths[FileState.UNLOCKED] = ["test.pdf"]
+        return Pdf.open(*arguments, **keyword_arguments) # pyright: ignore[reportArgumentType]
 
+@mark.parametrize("test_revision", [2, 4, 5])
 @mark.parametrize(
-    "test_initial_grouped_pdf_file_paths, test_passwords, test_pdf_password," \
-    "test_final_grouped_pdf_file_paths",
+    "test_pdf_password, test_passwords," \
+    "test_file_state, test_open_count",
     [
         (
-            BASE_GROUPED_PDF_FILE_PATHS, ["password"], "password-0",
-            locked_grouped_pdf_file_paths,
-        ),
-        (
-            BASE_GROUPED_PDF_FILE_PATHS, ["password"], "",
-            not_locked_grouped_pdf_file_paths
+            "password", ["password-0", "password", "password-1"],
+            FileState.UNLOCKED, 1
         ),
         (
-            BASE_GROUPED_PDF_FILE_PATHS, ["password"], "password",
-            unlocked_grouped_pdf_file_paths
+            "password", ["password-0", "owner-password"],
+            FileState.UNLOCKED, 1
         ),
         (
-            locked_grouped_pdf_file_paths, ["password"], "password-0",
-            locked_grouped_pdf_file_paths
+            "password", ["password-0", "password-1"],
+            FileState.LOCKED, 0
         ),
         (
-            not_locked_grouped_pdf_file_paths, ["password"], "",
-            not_locked_grouped_pdf_file_paths
+            "password", ["pässword"],
+            FileState.LOCKED, 1
         ),
         (
-            unlocked_grouped_pdf_file_paths, ["password"], "password",
-            unlocked_grouped_pdf_file_paths
+            "", ["password"],
+            FileState.NOT_LOCKED, 0
         )
     ]
 )
-def test_unlock_pdf_file_groups_pdf_file_path(
+def test_unlock_pdf_file_verifies_passwords_before_opening(
     monkeypatch: MonkeyPatch,
-    test_final_grouped_pdf_file_paths: GroupedPaths,
-    test_initial_grouped_pdf_file_paths: GroupedPaths,
+    tmp_path: Path,
+    test_file_state: FileState,
+    test_open_count: int,
     test_passwords: Passwords,
-    test_pdf_password: str
+    test_pdf_password: str,
+    test_revision: int
 ) -> None:
     """
     Assert that `_unlock_pdf_file`
-    adds a PDF file path to an appropriate file state group
-    based on unlocking result.
+    reads a PDF file from disk only once and
+    opens it via `pikepdf` at most once
+    with the first password that is verified against its encryption dictionary,
+    unless only non-ASCII passwords remain unverified.
 
     :param monkeypatch: `pytest` fixture for mocking functions.
-    :param test_final_grouped_pdf_file_paths: Resulting dictionary that maps file states with
-                                              file paths of PDF files.
-    :param test_initial_grouped_pdf_file_paths: Starting dictionary that maps file states with
-                                                file paths of PDF files.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_file_state: Expected file state.
+    :param test_open_count: Expected number of attempts to open the PDF file via `pikepdf`.
     :param test_passwords: Passwords to attempt unlocking the PDF file with.
-    :param test_pdf_password: Password needed to unlock the PDF file with.
+    :param test_pdf_password: User password to encrypt the PDF file with.
+    :param test_revision: Revision of the standard security handler.
     """
 
-    test_grouped_pdf_file_paths = deepcopy(test_initial_grouped_pdf_file_paths)
+    test_file_path = str(
+        generate_test_pdf_file(
+            file_path = tmp_path / "test.pdf",
+            test_password = test_pdf_password,
+            test_revision = test_revision
+        )
+    )
+    test_pikepdf_pdf = _CountingPDF()
+    test_file_paths_read: list[str] = []
+
+    def _mock_open(file: str, mode: str) -> BufferedReader:
+        """
+        Wrapper function of `open` that records which files are read from.
+
+        :param file: Path of the file to read.
+        :param mode: Mode to open the file in.
+        :returns: Opened file.
+        """
+
+        if mode == "rb":
+            test_file_paths_read.append(file)
+
+        return open(file, mode)
 
     monkeypatch.setattr(
         name = "Pdf",
         target = target,
-        value = _MockPDF(test_pdf_password)
+        value = test_pikepdf_pdf
+    )
+    monkeypatch.setattr(
+        name = "open",
+        raising = False,
+        target = target,
+        value = _mock_open
     )
 
-    _unlock_pdf_file(
-        file_path = "test.pdf",
-        grouped_pdf_file_paths = test_grouped_pdf_file_paths,
+    test_result_file_state, _ = _unlock_pdf_file(
+        file_path = test_file_path,
         passwords = test_passwords
     )
 
-    assert test_grouped_pdf_file_paths == test_final_grouped_pdf_file_paths
+    assert test_result_file_state == test_file_state
+    assert test_pikepdf_pdf.open_count == test_open_count
+    assert test_file_paths_read == [test_file_path]
+
+def test_unlock_pdf_file_raises_exception_for_unreadable_file(tmp_path: Path) -> None:
+    """
+    Assert that `_unlock_pdf_file`
+    raises an appropriate exception
+    when the PDF file cannot be read.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    with raises(
+        expected_exception = PdfError,
+        match = "Unlocking .+ failed."
+    ):
+        _unlock_pdf_file(
+            file_path = str(tmp_path),
+            passwords = ["password"]
+        )
+
+@mark.parametrize(
+    "test_pdf_password, test_file_state",
+    [
+        ("password", FileState.UNLOCKED),
+        (None, FileState.NOT_LOCKED),
+        ("unknown", FileState.LOCKED)
+    ]
+)
+def test_unlock_pdf_file_writes_output_dir(
+    tmp_path: Path,
+    test_file_state: FileState,
+    test_pdf_password: str | None
+) -> None:
+    """
+    Assert that `_unlock_pdf_file`
+    writes an unlocked PDF file or clones a PDF file that is not locked
+    into an output directory that mirrors its file path,
+    leaving the PDF file as is.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_file_state: Expected file state.
+    :param test_pdf_password: User password to encrypt the PDF file with, if any.
+    """
+
+    (tmp_path / "input").mkdir()
+
+    test_file_path = str(
+        generate_test_pdf_file(
+            file_path = tmp_path / "input" / "test.pdf",
+            test_password = test_pdf_password
+        )
+    )
+    test_data = Path(test_file_path).read_bytes()
+    test_result_file_state, _ = _unlock_pdf_file(
+        file_path = test_file_path,
+        output_dir = str(tmp_path / "output"),
+        passwords = ["password"]
+    )
+
+    test_output_file_paths = list((tmp_path / "output").rglob("*.pdf"))
+
+    assert test_result_file_state == test_file_state
+    assert Path(test_file_path).read_bytes() == test_data
+
+    if test_file_state == FileState.LOCKED:
+        assert test_output_file_paths == []
+
+        return
+
+    assert [
+        test_output_file_path.relative_to(tmp_path / "output").parts[-2:]
+        for test_output_file_path in test_output_file_paths
+    ] == [("input", "test.pdf")]
+
+    with Pdf.open(test_output_file_paths[0]) as test_pdf:
+        assert not test_pdf.is_encrypted
+
+def test_unlock_pdf_file_raises_exception_for_unwritable_output_dir(tmp_path: Path) -> None:
+    """
+    Assert that `_unlock_pdf_file`
+    raises an appropriate exception
+    when a PDF file that is not locked cannot be cloned into the output directory.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_path = str(generate_test_pdf_file(file_path = tmp_path / "test.pdf"))
+
+    (tmp_path / "output").write_bytes(b"")
+
+    with raises(
+        expected_exception = PdfError,
+        match = "Unlocking .+ failed."
+    ):
+        _unlock_pdf_file(
+            file_path = test_file_path,
+            output_dir = str(tmp_path / "output"),
+            passwords = ["password"]
+        )
@@ -0,0 +1,110 @@
+"""Tests for `_verify_password`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import mark
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.functions import _read_encryption_parameters, _verify_password
+
+@mark.parametrize("test_revision", [2, 3, 4, 5])
+@mark.parametrize(
+    "test_user_password, test_password," \
+    "test_is_verified",
+    [
+        (
+            "password", "password",
+            True
+        ),
+        (
+            "password", "owner-password",
+            True
+        ),
+        (
+            "password", "password-0",
+            False
+        ),
+        (
+            "password", "",
+            False
+        ),
+        (
+            "", "",
+            True
+        ),
+        (
+            "pässword", "pässword",
+            True
+        ),
+        (
+            "pässword", "password",
+            False
+        )
+    ]
+)
+def test_verify_password_returns_whether_password_is_verified(
+    tmp_path: Path,
+    test_is_verified: bool,
+    test_password: str,
+    test_revision: int,
+    test_user_password: str
+) -> None:
+    """
+    Assert that `_verify_password`
+    returns whether a password is either the user password or the owner password of a PDF file
+    for revisions 2 to 5 of the standard security handler.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_is_verified: Whether the password should be verified or not.
+    :param test_password: Password to verify.
+    :param test_revision: Revision of the standard security handler.
+    :param test_user_password: User password to encrypt the PDF file with.
+    """
+
+    test_encryption_parameters = _read_encryption_parameters(
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / "test.pdf",
+                test_password = test_user_password,
+                test_revision = test_revision
+            )
+        )
+    )
+
+    assert test_encryption_parameters is not None
+    assert _verify_password(test_encryption_parameters, test_password) == test_is_verified
+
+@mark.parametrize(
+    "test_password, test_is_verified",
+    [
+        ("パスワード", True),
+        ("password", False)
+    ]
+)
+def test_verify_password_encodes_password_as_utf_8(
+    tmp_path: Path,
+    test_is_verified: bool,
+    test_password: str
+) -> None:
+    """
+    Assert that `_verify_password`
+    returns whether a password is the user password of a PDF file
+    when said password can only be encoded in UTF-8.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_is_verified: Whether the password should be verified or not.
+    :param test_password: Password to verify.
+    """
+
+    test_encryption_parameters = _read_encryption_parameters(
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / "test.pdf",
+                test_password = "パスワード",
+                test_revision = 5
+            )
+        )
+    )
+
+    assert test_encryption_parameters is not None
+    assert _verify_password(test_encryption_parameters, test_password) == test_is_verified
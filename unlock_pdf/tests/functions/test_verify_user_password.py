@@ -0,0 +1,50 @@
+"""Tests for `_verify_user_password`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pytest import mark
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.functions import _read_encryption_parameters, _verify_user_password
+
+@mark.parametrize("test_revision", [2, 3, 4])
+@mark.parametrize(
+    "test_password, test_is_verified",
+    [
+        (b"password", True),
+        (b"owner-password", False),
+        (b"", False)
+    ]
+)
+def test_verify_user_password_returns_whether_password_is_user_password(
+    tmp_path: Path,
+    test_is_verified: bool,
+    test_password: bytes,
+    test_revision: int
+) -> None:
+    """
+    Assert that `_verify_user_password`
+    returns whether a password is the user password of a PDF file
+    for revisions 2 to 4 of the standard security handler.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_is_verified: Whether the password should be verified or not.
+    :param test_password: Password to verify, encoded.
+    :param test_revision: Revision of the standard security handler.
+    """
+
+    test_encryption_parameters = _read_encryption_parameters(
+        str(
+            generate_test_pdf_file(
+                file_path = tmp_path / "test.pdf",
+                test_password = "password",
+                test_revision = test_revision
+            )
+        )
+    )
+
+    assert test_encryption_parameters is not None
+    assert _verify_user_password(
+        test_encryption_parameters,
+        test_password
+    ) == test_is_verified
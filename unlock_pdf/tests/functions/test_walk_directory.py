@@ -0,0 +1,213 @@
+"""Tests for `_walk_directory`."""
+
+# pyright: reportPrivateUsage=false
+
+from os import chmod, getuid, stat, utime
+from pathlib import Path
+from pytest import MonkeyPatch, mark
+from unlock_pdf.classes import DirectoryManifest
+from unlock_pdf.functions import _walk_directory
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
+def test_walk_directory_yields_pdf_file_paths(tmp_path: Path) -> None:
+    """
+    Assert that `_walk_directory`
+    yields the paths of every PDF file in a directory tree
+
+    - including those in subdirectories,
+    - excluding hidden ones and files of other types, and
+    - with the PDF files of a directory before those of its subdirectories.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "subdirectory" / ".hidden-directory").mkdir(parents = True)
+
+    for file_path in [
+        "test-0.pdf",
+        "test.txt",
+        "TEST-1.PDF",
+        ".hidden-test.pdf",
+        "subdirectory/test-2.pdf",
+        "subdirectory/.hidden-directory/test-3.pdf"
+    ]:
+        (tmp_path / file_path).write_bytes(b"%PDF-1.7")
+
+    pdf_file_paths = [
+        pdf_file_path
+        for pdf_file_path, _ in _walk_directory(str(tmp_path))
+    ]
+
+    # <NOTE>
+    # Entries of the same directory are in no particular order.
+    assert sorted(pdf_file_paths[:2]) == [
+        str(tmp_path / "TEST-1.PDF"),
+        str(tmp_path / "test-0.pdf")
+    ]
+    assert pdf_file_paths[2:] == [
+        str(tmp_path / "subdirectory" / "test-2.pdf")
+    ]
+
+def test_walk_directory_yields_pdf_file_identities(tmp_path: Path) -> None:
+    """
+    Assert that `_walk_directory`
+    yields the device number and inode number of every PDF file along with its path,
+    except for symbolic links, whose identity is left to be queried.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(b"%PDF-1.7")
+    (tmp_path / "test-link.pdf").symlink_to(tmp_path / "test.pdf")
+
+    file_stat = stat(tmp_path / "test.pdf")
+
+    assert dict(
+        _walk_directory(str(tmp_path))
+    ) == {
+        str(tmp_path / "test.pdf"): (file_stat.st_dev, file_stat.st_ino),
+        str(tmp_path / "test-link.pdf"): None
+    }
+
+def test_walk_directory_stops_at_symbolic_link_loops(tmp_path: Path) -> None:
+    """
+    Assert that `_walk_directory`
+    visits every directory only once
+    when symbolic links to directories form a loop.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "subdirectory").mkdir()
+    (tmp_path / "subdirectory" / "test.pdf").write_bytes(b"%PDF-1.7")
+    (tmp_path / "subdirectory" / "loop").symlink_to(tmp_path)
+
+    assert [
+        pdf_file_path
+        for pdf_file_path, _ in _walk_directory(str(tmp_path))
+    ] == [
+        str(tmp_path / "subdirectory" / "test.pdf")
+    ]
+
+@mark.skipif(getuid() == 0, reason = "Permissions are not enforced for the root user.")
+def test_walk_directory_skips_unreadable_directories(tmp_path: Path) -> None:
+    """
+    Assert that `_walk_directory`
+    skips directories that cannot be read.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "unreadable-directory").mkdir()
+    (tmp_path / "unreadable-directory" / "test.pdf").touch()
+    chmod(tmp_path / "unreadable-directory", 0)
+
+    try:
+        assert not list(
+            _walk_directory(str(tmp_path))
+        )
+    finally:
+        chmod(tmp_path / "unreadable-directory", 0o755)
+
+def test_walk_directory_skips_missing_directories(tmp_path: Path) -> None:
+    """
+    Assert that `_walk_directory`
+    yields nothing
+    when the directory does not exist.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    assert not list(
+        _walk_directory(str(tmp_path / "missing-directory"))
+    )
+
+def test_walk_directory_serves_unchanged_directories_from_manifest(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path
+) -> None:
+    """
+    Assert that `_walk_directory`
+    adds scanned directories to a manifest
+    and serves directories whose modification time has not changed from it without scanning them,
+    while still scanning directories that changed since.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "subdirectory").mkdir()
+    (tmp_path / "test-0.pdf").write_bytes(b"%PDF-1.7")
+    (tmp_path / "subdirectory" / "test-1.pdf").write_bytes(b"%PDF-1.7")
+
+    for directory_path in [tmp_path / "subdirectory", tmp_path]:
+        utime(
+            ns = (0, 0),
+            path = directory_path
+        )
+
+    directory_manifest = DirectoryManifest()
+    test_pdf_file_paths = [
+        (str(file_path), (stat(file_path).st_dev, stat(file_path).st_ino))
+        for file_path in [tmp_path / "test-0.pdf", tmp_path / "subdirectory" / "test-1.pdf"]
+    ]
+
+    assert list(
+        _walk_directory(str(tmp_path), directory_manifest)
+    ) == test_pdf_file_paths
+
+    scanned_directory_paths: list[str] = []
+    original_scandir = target.scandir
+
+    def _mock_scandir(path: str) -> object:
+        """
+        Mock function of `unlock_pdf.functions.scandir` that
+        records which directories are scanned.
+
+        :param path: Path of the directory to scan.
+        :returns: Iterator of the entries of the directory.
+        """
+
+        scanned_directory_paths.append(path)
+
+        return original_scandir(path)
+
+    monkeypatch.setattr(
+        name = "scandir",
+        target = target,
+        value = _mock_scandir
+    )
+
+    assert list(
+        _walk_directory(str(tmp_path), directory_manifest)
+    ) == test_pdf_file_paths
+    assert not scanned_directory_paths
+
+    (tmp_path / "subdirectory" / "test-2.pdf").write_bytes(b"%PDF-1.7")
+
+    assert [
+        pdf_file_path
+        for pdf_file_path, _ in _walk_directory(str(tmp_path), directory_manifest)
+    ] == [
+        str(tmp_path / "test-0.pdf"),
+        str(tmp_path / "subdirectory" / "test-1.pdf"),
+        str(tmp_path / "subdirectory" / "test-2.pdf")
+    ]
+    assert scanned_directory_paths == [str(tmp_path / "subdirectory")]
+
+    scanned_directory_paths.clear()
+
+    list(
+        _walk_directory(str(tmp_path), directory_manifest)
+    )
+
+    # <NOTE>
+    # The subdirectory was modified too recently to be trusted, so it is scanned again.
+    assert scanned_directory_paths == [str(tmp_path / "subdirectory")]
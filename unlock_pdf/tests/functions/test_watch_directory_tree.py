@@ -0,0 +1,64 @@
+"""Tests for `_watch_directory_tree`."""
+
+# pyright: reportPrivateUsage=false
+
+from ctypes import CDLL
+from ctypes.util import find_library
+from os import close
+from pathlib import Path
+from pytest import mark
+from sys import platform
+from unlock_pdf.functions import _open_inotify, _watch_directory_tree
+from unlock_pdf.types import Inotify
+
+@mark.skipif(
+    platform != "linux",
+    reason = "inotify is only supported on Linux."
+)
+def test_watch_directory_tree_watches_every_directory(tmp_path: Path) -> None:
+    """
+    Assert that `_watch_directory_tree`
+    watches every directory of a directory tree except hidden ones.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "subdirectory" / ".hidden-directory").mkdir(parents = True)
+
+    test_inotify = _open_inotify()
+
+    assert test_inotify is not None
+
+    _watch_directory_tree(test_inotify, str(tmp_path))
+    close(test_inotify.file_descriptor)
+
+    assert sorted(test_inotify.directory_paths.values()) == [
+        str(tmp_path),
+        str(tmp_path / "subdirectory")
+    ]
+
+@mark.skipif(
+    platform != "linux",
+    reason = "inotify is only supported on Linux."
+)
+def test_watch_directory_tree_skips_unwatchable_directories(tmp_path: Path) -> None:
+    """
+    Assert that `_watch_directory_tree`
+    skips directories that cannot be watched.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_library_path = find_library("c")
+
+    assert test_library_path is not None
+
+    test_inotify = Inotify(
+        directory_paths = {},
+        file_descriptor = -1,
+        library = CDLL(test_library_path, use_errno = True)
+    )
+
+    _watch_directory_tree(test_inotify, str(tmp_path))
+
+    assert test_inotify.directory_paths == {}
@@ -0,0 +1,23 @@
+"""Tests for `_write_caches`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from unlock_pdf.classes import PasswordHits
+from unlock_pdf.functions import _write_caches
+
+def test_write_caches_writes_to_cache_directory(tmp_path: Path) -> None:
+    """
+    Assert that `_write_caches`
+    writes every cache to its file in a cache directory, creating said directory if missing.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_password_hits = PasswordHits()
+
+    test_password_hits.add("password")
+
+    _write_caches(str(tmp_path / "cache"), {"password-hits.json": test_password_hits})
+
+    assert PasswordHits.read(str(tmp_path / "cache" / "password-hits.json"))["password"] == 1
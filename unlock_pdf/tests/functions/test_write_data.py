@@ -0,0 +1,18 @@
+"""Tests for `_write_data`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from unlock_pdf.functions import _write_data
+
+def test_write_data_writes_file(tmp_path: Path) -> None:
+    """
+    Assert that `_write_data`
+    writes raw data to a file.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    _write_data(str(tmp_path / "test.pdf"), b"%PDF-1.7")
+
+    assert (tmp_path / "test.pdf").read_bytes() == b"%PDF-1.7"
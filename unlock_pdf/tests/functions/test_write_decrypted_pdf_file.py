@@ -0,0 +1,92 @@
+"""Tests for `_write_decrypted_pdf_file`."""
+
+# pyright: reportPrivateUsage=false
+
+from pathlib import Path
+from pikepdf import PdfError
+from pytest import mark, raises
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.functions import _get_output_file_path, _write_decrypted_pdf_file
+from unlock_pdf.types import DecryptedPdfFile
+
+def test_write_decrypted_pdf_file_overwrites_pdf_file(tmp_path: Path) -> None:
+    """
+    Assert that `_write_decrypted_pdf_file`
+    overwrites a PDF file that got unlocked as its unlocked version
+    when no output directory is given.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_path = str(tmp_path / "test.pdf")
+
+    (tmp_path / "test.pdf").write_bytes(b"locked")
+
+    _write_decrypted_pdf_file(
+        DecryptedPdfFile(test_file_path, FileState.UNLOCKED, "password", 1, b"unlocked"),
+        None
+    )
+
+    assert (tmp_path / "test.pdf").read_bytes() == b"unlocked"
+
+@mark.parametrize(
+    "test_file_state, test_data, test_output_data",
+    [
+        (FileState.UNLOCKED, b"unlocked", b"unlocked"),
+        (FileState.NOT_LOCKED, None, b"original"),
+        (FileState.LOCKED, None, None)
+    ]
+)
+def test_write_decrypted_pdf_file_writes_output_dir(
+    tmp_path: Path,
+    test_data: bytes | None,
+    test_file_state: FileState,
+    test_output_data: bytes | None
+) -> None:
+    """
+    Assert that `_write_decrypted_pdf_file`
+    writes a PDF file that got unlocked or clones a PDF file that is not locked into the output directory
+    while leaving the PDF file as is.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_data: Raw data of the unlocked PDF file, if any.
+    :param test_file_state: File state of the PDF file.
+    :param test_output_data: Expected raw data in the output directory, if any.
+    """
+
+    test_file_path = str(tmp_path / "test.pdf")
+    test_output_file_path = Path(_get_output_file_path(test_file_path, str(tmp_path / "output")))
+
+    (tmp_path / "test.pdf").write_bytes(b"original")
+
+    _write_decrypted_pdf_file(
+        DecryptedPdfFile(test_file_path, test_file_state, data = test_data),
+        str(tmp_path / "output")
+    )
+
+    assert (tmp_path / "test.pdf").read_bytes() == b"original"
+    assert (
+        test_output_file_path.read_bytes()
+        if test_output_file_path.exists()
+        else None
+    ) == test_output_data
+
+def test_write_decrypted_pdf_file_raises_exception(tmp_path: Path) -> None:
+    """
+    Assert that `_write_decrypted_pdf_file`
+    raises an appropriate exception
+    when the PDF file cannot be written.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "output").write_bytes(b"")
+
+    with raises(
+        expected_exception = PdfError,
+        match = "Unlocking .+ failed."
+    ):
+        _write_decrypted_pdf_file(
+            DecryptedPdfFile(str(tmp_path / "test.pdf"), FileState.UNLOCKED, "password", 1, b"unlocked"),
+            str(tmp_path / "output")
+        )
@@ -0,0 +1,57 @@
+"""Tests for `_write_journal_entry`."""
+
+# pyright: reportPrivateUsage=false
+
+from json import loads
+from pathlib import Path
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.functions import _get_file_signature, _write_journal_entry
+from unlock_pdf.types import UnlockResult
+
+def test_write_journal_entry_appends_entry(tmp_path: Path) -> None:
+    """
+    Assert that `_write_journal_entry`
+    appends the final file state of a PDF file along with its signature to a journal,
+    and flushes it.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "test.pdf").write_bytes(b"%PDF-1.7\n")
+
+    test_file_path = str(tmp_path / "test.pdf")
+    test_file_signature = _get_file_signature(test_file_path)
+
+    assert test_file_signature is not None
+
+    with open(tmp_path / "journal.jsonl", "a", encoding = "utf-8") as test_journal_file:
+        _write_journal_entry(
+            test_journal_file,
+            UnlockResult(test_file_path, FileState.UNLOCKED, "password", 1)
+        )
+
+        assert loads((tmp_path / "journal.jsonl").read_text(encoding = "utf-8")) == {
+            "device": test_file_signature[0],
+            "file_path": test_file_path,
+            "file_state": "UNLOCKED",
+            "inode": test_file_signature[1],
+            "mtime_ns": test_file_signature[3],
+            "size": test_file_signature[2]
+        }
+
+def test_write_journal_entry_skips_missing_file(tmp_path: Path) -> None:
+    """
+    Assert that `_write_journal_entry`
+    appends nothing
+    when the PDF file cannot be queried.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    with open(tmp_path / "journal.jsonl", "a", encoding = "utf-8") as test_journal_file:
+        _write_journal_entry(
+            test_journal_file,
+            UnlockResult(str(tmp_path / "missing-test.pdf"), FileState.FAILED, error = "OSError")
+        )
+
+    assert (tmp_path / "journal.jsonl").read_text(encoding = "utf-8") == ""
@@ -0,0 +1,215 @@
+"""Tests for `_decrypt_pdf_file_data`."""
+
+# pyright: reportPrivateUsage=false
+
+from asyncio import get_running_loop, run
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from pytest import MonkeyPatch
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.classes import FingerprintPasswords
+from unlock_pdf.enumerations import FileState, SaveProfile
+from unlock_pdf.functions import _parse_encryption_fingerprint
+from unlock_pdf.pipeline import _decrypt_pdf_file_data
+from unlock_pdf.types import DecryptedPdfFile, PdfFileData, UnlockResult
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as functions_target
+import unlock_pdf.pipeline as target
+
+def test_decrypt_pdf_file_data_passes_unlock_result_through() -> None:
+    """
+    Assert that `_decrypt_pdf_file_data`
+    returns the result of a PDF file as is
+    when said PDF file already failed.
+    """
+
+    test_unlock_result = UnlockResult("test.pdf", FileState.FAILED, error = "OSError: test")
+
+    with ThreadPoolExecutor() as test_executor:
+        assert run(
+            _decrypt_pdf_file_data(
+                test_unlock_result,
+                ["password"],
+                FingerprintPasswords(["password"]),
+                test_executor,
+                SaveProfile.FAST
+            )
+        ) == test_unlock_result
+
+def test_decrypt_pdf_file_data_prioritizes_passwords(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Assert that `_decrypt_pdf_file_data`
+    attempts the password that unlocked the latest PDF file with the same encryption fingerprint first
+    and remembers the password that unlocked the PDF file for the next ones,
+    sending only those passwords along with the PDF file.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_data = generate_test_pdf_file(tmp_path / "test.pdf", test_password = "password-1").read_bytes()
+    test_fingerprint = _parse_encryption_fingerprint(test_data)
+    test_passwords = ["password-0", "password-1", "password-2"]
+    test_prioritized_passwords: list[str] = []
+    test_fingerprint_passwords = FingerprintPasswords(list(test_passwords))
+
+    assert test_fingerprint is not None
+
+    monkeypatch.setattr(
+        name = "_worker_passwords",
+        target = functions_target,
+        value = list(test_passwords)
+    )
+
+    with ThreadPoolExecutor() as test_executor:
+        decrypted_pdf_file = run(
+            _decrypt_pdf_file_data(
+                PdfFileData("test.pdf", test_data),
+                test_prioritized_passwords,
+                test_fingerprint_passwords,
+                test_executor,
+                SaveProfile.FAST
+            )
+        )
+
+        assert isinstance(decrypted_pdf_file, DecryptedPdfFile)
+        assert decrypted_pdf_file.data is not None
+        assert decrypted_pdf_file._replace(data = None) == DecryptedPdfFile(
+            "test.pdf",
+            FileState.UNLOCKED,
+            "password-1",
+            2
+        )
+        assert test_prioritized_passwords == ["password-1"]
+        assert test_fingerprint_passwords[test_fingerprint] == "password-1"
+
+        test_prioritized_passwords[:] = ["password-2"]
+
+        assert run(
+            _decrypt_pdf_file_data(
+                PdfFileData("test.pdf", test_data),
+                test_prioritized_passwords,
+                test_fingerprint_passwords,
+                test_executor,
+                SaveProfile.FAST
+            )
+        ).attempt_count == 1
+
+def test_decrypt_pdf_file_data_returns_not_locked_pdf_file(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Assert that `_decrypt_pdf_file_data`
+    returns a PDF file without data or replacing the passwords to attempt first
+    when said PDF file is not locked.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_data = generate_test_pdf_file(tmp_path / "test.pdf").read_bytes()
+    test_passwords = ["password-0", "password-1"]
+
+    monkeypatch.setattr(
+        name = "_worker_passwords",
+        target = functions_target,
+        value = ["password-1", "password-0"]
+    )
+
+    with ThreadPoolExecutor() as test_executor:
+        assert run(
+            _decrypt_pdf_file_data(
+                PdfFileData("test.pdf", test_data),
+                test_passwords,
+                FingerprintPasswords(list(test_passwords)),
+                test_executor,
+                SaveProfile.FAST
+            )
+        ) == DecryptedPdfFile("test.pdf", FileState.NOT_LOCKED)
+
+    assert test_passwords == ["password-0", "password-1"]
+
+def test_decrypt_pdf_file_data_returns_failed_unlock_result(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_decrypt_pdf_file_data`
+    returns a failed result along with its error
+    when the raw data of the PDF file is malformed.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    monkeypatch.setattr(
+        name = "_worker_passwords",
+        target = functions_target,
+        value = ["password"]
+    )
+
+    with ThreadPoolExecutor() as test_executor:
+        unlock_result = run(
+            _decrypt_pdf_file_data(
+                PdfFileData("test.pdf", b"%PDF-1.7"),
+                ["password"],
+                FingerprintPasswords(["password"]),
+                test_executor,
+                SaveProfile.FAST
+            )
+        )
+
+    assert isinstance(unlock_result, UnlockResult)
+    assert unlock_result.file_state == FileState.FAILED
+    assert unlock_result.error is not None
+    assert unlock_result.error.startswith("PdfError: ")
+
+def test_decrypt_pdf_file_data_parses_fingerprint_off_event_loop(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_decrypt_pdf_file_data`
+    scans the trailer of a PDF file for its encryption fingerprint
+    outside of the event loop.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    test_running_loops: list[bool] = []
+
+    def _mock_parse_encryption_fingerprint(data: bytes) -> None:
+        """
+        Mock function of `_parse_encryption_fingerprint` that
+        records whether it is called on the event loop.
+
+        :param data: Raw PDF data.
+        """
+
+        try:
+            get_running_loop()
+        except RuntimeError:
+            test_running_loops.append(False)
+        else:
+            test_running_loops.append(True)
+
+    monkeypatch.setattr(
+        name = "_parse_encryption_fingerprint",
+        target = target,
+        value = _mock_parse_encryption_fingerprint
+    )
+    monkeypatch.setattr(
+        name = "_worker_passwords",
+        target = functions_target,
+        value = ["password"]
+    )
+
+    with ThreadPoolExecutor() as test_executor:
+        run(
+            _decrypt_pdf_file_data(
+                PdfFileData("test.pdf", b"%PDF-1.7"),
+                ["password"],
+                FingerprintPasswords(["password"]),
+                test_executor,
+                SaveProfile.FAST
+            )
+        )
+
+    assert test_running_loops == [False]
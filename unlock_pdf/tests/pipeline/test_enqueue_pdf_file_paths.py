@@ -0,0 +1,57 @@
+"""Tests for `_enqueue_pdf_file_paths`."""
+
+# pyright: reportPrivateUsage=false
+
+from asyncio import Queue, create_task, run, sleep
+from unlock_pdf.pipeline import _enqueue_pdf_file_paths
+
+def test_enqueue_pdf_file_paths_enqueues_end_markers() -> None:
+    """
+    Assert that `_enqueue_pdf_file_paths`
+    enqueues the paths of PDF files followed by one end marker per consumer.
+    """
+
+    async def _test() -> list[str | None]:
+        """
+        Enqueue the paths of PDF files in a queue and dequeue them.
+
+        :returns: Items of the queue.
+        """
+
+        test_queue: Queue[str | None] = Queue()
+
+        await _enqueue_pdf_file_paths(iter(["test-0.pdf", "test-1.pdf"]), test_queue, 2)
+
+        return [test_queue.get_nowait() for _ in range(test_queue.qsize())]
+
+    assert run(_test()) == ["test-0.pdf", "test-1.pdf", None, None]
+
+def test_enqueue_pdf_file_paths_skips_end_markers_when_cancelled() -> None:
+    """
+    Assert that `_enqueue_pdf_file_paths`
+    enqueues no end marker
+    when it is cancelled while the queue is full.
+    """
+
+    async def _test() -> list[str | None]:
+        """
+        Cancel enqueuing the paths of PDF files in a full queue and dequeue them.
+
+        :returns: Items of the queue.
+        """
+
+        test_queue: Queue[str | None] = Queue(1)
+        test_task = create_task(
+            _enqueue_pdf_file_paths(iter(["test-0.pdf", "test-1.pdf"]), test_queue, 1)
+        )
+
+        while not test_queue.full():
+            await sleep(0)
+
+        test_task.cancel()
+
+        await sleep(0)
+
+        return [test_queue.get_nowait() for _ in range(test_queue.qsize())]
+
+    assert run(_test()) == ["test-0.pdf"]
@@ -0,0 +1,38 @@
+"""Tests for `_is_cancelling`."""
+
+# pyright: reportPrivateUsage=false
+
+from asyncio import CancelledError, current_task, run, sleep
+from unlock_pdf.pipeline import _is_cancelling
+
+def test_is_cancelling_returns_whether_task_is_cancelled() -> None:
+    """
+    Assert that `_is_cancelling`
+    returns whether the current task is being cancelled or not.
+    """
+
+    async def _test() -> tuple[bool, bool]:
+        """
+        Check if the current task is being cancelled before and after cancelling it.
+
+        :returns: Whether the current task was being cancelled before and after cancelling it.
+        """
+
+        test_task = current_task()
+
+        assert test_task is not None
+
+        is_cancelling = _is_cancelling()
+
+        test_task.cancel()
+
+        try:
+            await sleep(0)
+        except CancelledError:
+            return is_cancelling, _is_cancelling()
+        finally:
+            test_task.uncancel()
+
+        raise AssertionError
+
+    assert run(_test()) == (False, True)
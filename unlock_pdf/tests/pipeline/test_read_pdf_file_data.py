@@ -0,0 +1,39 @@
+"""Tests for `_read_pdf_file_data`."""
+
+# pyright: reportPrivateUsage=false
+
+from asyncio import run
+from pathlib import Path
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.pipeline import _read_pdf_file_data
+from unlock_pdf.types import PdfFileData
+
+def test_read_pdf_file_data_returns_pdf_file_data(tmp_path: Path) -> None:
+    """
+    Assert that `_read_pdf_file_data`
+    returns the raw data of a PDF file.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_path = str(tmp_path / "test.pdf")
+
+    (tmp_path / "test.pdf").write_bytes(b"%PDF-1.7")
+
+    assert run(_read_pdf_file_data(test_file_path)) == PdfFileData(test_file_path, b"%PDF-1.7")
+
+def test_read_pdf_file_data_returns_failed_unlock_result(tmp_path: Path) -> None:
+    """
+    Assert that `_read_pdf_file_data`
+    returns a failed result along with its error
+    when the PDF file cannot be read.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    unlock_result = run(_read_pdf_file_data(str(tmp_path / "test.pdf")))
+
+    assert not isinstance(unlock_result, PdfFileData)
+    assert unlock_result.file_state == FileState.FAILED
+    assert unlock_result.error is not None
+    assert unlock_result.error.startswith("FileNotFoundError: ")
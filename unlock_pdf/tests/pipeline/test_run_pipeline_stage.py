@@ -0,0 +1,113 @@
+"""Tests for `_run_pipeline_stage`."""
+
+# pyright: reportPrivateUsage=false
+
+from asyncio import (
+    Queue,
+    create_task,
+    gather,
+    run,
+    sleep
+)
+from pytest import raises
+from unlock_pdf.pipeline import _run_pipeline_stage
+
+async def _double(item: int) -> int:
+    """
+    Double an item, failing for a negative one.
+
+    :param item: Item to double.
+    :raises ValueError: If the item is negative.
+    :returns: Doubled item.
+    """
+
+    if item < 0:
+        raise ValueError("test")
+
+    return item * 2
+
+def test_run_pipeline_stage_enqueues_end_markers() -> None:
+    """
+    Assert that `_run_pipeline_stage`
+    processes items across its workers
+    followed by one end marker per consumer of the output queue.
+    """
+
+    async def _test() -> list[int | None]:
+        """
+        Run a stage over a queue of items and dequeue the processed items.
+
+        :returns: Processed items.
+        """
+
+        test_input_queue: Queue[int | None] = Queue()
+        test_output_queue: Queue[int | None] = Queue()
+
+        for item in [1, 2, 3, None, None]:
+            test_input_queue.put_nowait(item)
+
+        await _run_pipeline_stage(test_input_queue, test_output_queue, _double, 2, 3)
+
+        return [test_output_queue.get_nowait() for _ in range(test_output_queue.qsize())]
+
+    assert run(_test()) == [2, 4, 6, None, None, None]
+
+def test_run_pipeline_stage_raises_exception() -> None:
+    """
+    Assert that `_run_pipeline_stage`
+    raises an exception group with the error of processing an item
+    while still enqueuing end markers so that the next stages finish.
+    """
+
+    async def _test() -> list[int | None]:
+        """
+        Run a stage over a queue of items that fails and dequeue the processed items.
+
+        :returns: Processed items.
+        """
+
+        test_input_queue: Queue[int | None] = Queue()
+        test_output_queue: Queue[int | None] = Queue()
+
+        for item in [1, -1, None]:
+            test_input_queue.put_nowait(item)
+
+        with raises(ExceptionGroup) as exception_info:
+            await _run_pipeline_stage(test_input_queue, test_output_queue, _double, 1, 1)
+
+        assert exception_info.group_contains(ValueError, match = "test")
+
+        return [test_output_queue.get_nowait() for _ in range(test_output_queue.qsize())]
+
+    assert run(_test()) == [2, None]
+
+def test_run_pipeline_stage_skips_end_markers_when_cancelled() -> None:
+    """
+    Assert that `_run_pipeline_stage`
+    enqueues no end marker
+    when it is cancelled while waiting for items.
+    """
+
+    async def _test() -> int:
+        """
+        Cancel a stage that waits for items.
+
+        :returns: Number of items in the output queue.
+        """
+
+        test_output_queue: Queue[int | None] = Queue()
+        test_task = create_task(
+            _run_pipeline_stage(Queue(), test_output_queue, _double, 2, 2)
+        )
+
+        await sleep(0)
+
+        test_task.cancel()
+
+        await gather(test_task, return_exceptions = True)
+
+        assert test_task.cancelled()
+
+        return test_output_queue.qsize()
+
+    assert run(_test()) == 0
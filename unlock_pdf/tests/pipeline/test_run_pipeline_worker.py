@@ -0,0 +1,41 @@
+"""Tests for `_run_pipeline_worker`."""
+
+# pyright: reportPrivateUsage=false
+
+from asyncio import Queue, run
+from unlock_pdf.pipeline import _run_pipeline_worker
+
+def test_run_pipeline_worker_processes_items() -> None:
+    """
+    Assert that `_run_pipeline_worker`
+    processes items in order until it reaches an end marker.
+    """
+
+    async def _double(item: int) -> int:
+        """
+        Double an item.
+
+        :param item: Item to double.
+        :returns: Doubled item.
+        """
+
+        return item * 2
+
+    async def _test() -> list[int | None]:
+        """
+        Run a worker over a queue of items and dequeue the processed items.
+
+        :returns: Processed items.
+        """
+
+        test_input_queue: Queue[int | None] = Queue()
+        test_output_queue: Queue[int | None] = Queue()
+
+        for item in [1, 2, None, 3]:
+            test_input_queue.put_nowait(item)
+
+        await _run_pipeline_worker(test_input_queue, test_output_queue, _double)
+
+        return [test_output_queue.get_nowait() for _ in range(test_output_queue.qsize())]
+
+    assert run(_test()) == [2, 4]
@@ -0,0 +1,246 @@
+"""Tests for `unlock_many_async`."""
+
+from asyncio import run
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from pikepdf import Pdf
+from pytest import (
+    CaptureFixture,
+    MonkeyPatch,
+    mark,
+    raises
+)
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.pipeline import unlock_many_async
+from unlock_pdf.types import UnlockResult
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as functions_target
+import unlock_pdf.pipeline as target
+
+async def _collect_unlock_results(*arguments: object, **keyword_arguments: object) -> list[UnlockResult]:
+    """
+    Collect the results of unlocking PDF files via `unlock_many_async`.
+
+    :param arguments: Positional arguments of `unlock_many_async`.
+    :param keyword_arguments: Keyword arguments of `unlock_many_async`.
+    :returns: Results of unlocking each PDF file.
+    """
+
+    return [
+        unlock_result
+        async for unlock_result in unlock_many_async(*arguments, **keyword_arguments) # type: ignore
+    ]
+
+def _mock_process_pool_executor(monkeypatch: MonkeyPatch) -> None:
+    """
+    Mock `unlock_pdf.pipeline.ProcessPoolExecutor` with `ThreadPoolExecutor`,
+    as forking worker processes while the threads of the pipeline are running may deadlock them,
+    and as spawning them is slow.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    # <NOTE>
+    # Worker threads keep their passwords in this process, so they are restored afterwards.
+    monkeypatch.setattr(
+        name = "_worker_passwords",
+        target = functions_target,
+        value = functions_target._worker_passwords # pyright: ignore[reportPrivateUsage]
+    )
+    monkeypatch.setattr(
+        name = "ProcessPoolExecutor",
+        target = target,
+        value = ThreadPoolExecutor
+    )
+
+@mark.parametrize("test_job_count", [1, 2])
+def test_unlock_many_async_generates_unlock_results(
+    capsys: CaptureFixture[str],
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    test_job_count: int
+) -> None:
+    """
+    Assert that `unlock_many_async`
+    unlocks PDF files in given paths in completion order while ignoring duplicates
+    without reading from standard input or writing to standard output.
+
+    :param capsys: `pytest` fixture for capturing outputs.
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_job_count: Number of worker processes.
+    """
+
+    def _mock_fail(*arguments: object, **keyword_arguments: object) -> None:
+        """
+        Mock function of `input` that
+        fails as it must not be called.
+
+        :param arguments: Positional arguments.
+        :param keyword_arguments: Keyword arguments.
+        """
+
+        raise AssertionError
+
+    monkeypatch.setattr("builtins.input", _mock_fail)
+    _mock_process_pool_executor(monkeypatch)
+
+    test_file_paths = [
+        str(generate_test_pdf_file(tmp_path / "test-0.pdf", test_password = "password")),
+        str(generate_test_pdf_file(tmp_path / "test-1.pdf")),
+        str(generate_test_pdf_file(tmp_path / "test-2.pdf", test_password = "password-0"))
+    ]
+
+    (tmp_path / "test-3.pdf").write_bytes(b"%PDF-1.7")
+
+    unlock_results = run(
+        _collect_unlock_results(
+            [
+                test_file_paths[0],
+                test_file_paths[1],
+                test_file_paths[0],
+                test_file_paths[2],
+                str(tmp_path / "test-3.pdf")
+            ],
+            ["password", "password"],
+            jobs = test_job_count,
+            output_dir = str(tmp_path / "output")
+        )
+    )
+
+    assert all(
+        (unlock_result.error is not None) == (unlock_result.file_state == FileState.FAILED)
+        for unlock_result in unlock_results
+    )
+    assert sorted(
+        unlock_result._replace(error = None)
+        for unlock_result in unlock_results
+    ) == [
+        UnlockResult(test_file_paths[0], FileState.UNLOCKED, "password", 1),
+        UnlockResult(test_file_paths[1], FileState.NOT_LOCKED),
+        UnlockResult(test_file_paths[2], FileState.LOCKED),
+        UnlockResult(str(tmp_path / "test-3.pdf"), FileState.FAILED)
+    ]
+    assert capsys \
+        .readouterr() \
+        .out == ""
+
+    with Pdf.open(test_file_paths[0], password = "password") as test_pdf:
+        assert test_pdf.is_encrypted
+
+def test_unlock_many_async_defaults_to_cpu_count(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Assert that `unlock_many_async`
+    unlocks PDF files across as many worker processes as the CPU count by default.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    _mock_process_pool_executor(monkeypatch)
+
+    test_file_path = str(generate_test_pdf_file(tmp_path / "test.pdf", test_password = "password"))
+
+    assert run(
+        _collect_unlock_results([test_file_path], ["password"])
+    ) == [UnlockResult(test_file_path, FileState.UNLOCKED, "password", 1)]
+
+def test_unlock_many_async_stops_when_closed(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Assert that `unlock_many_async`
+    stops unlocking the remaining PDF files
+    when it is closed after its first result.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    _mock_process_pool_executor(monkeypatch)
+
+    test_file_paths = [
+        str(generate_test_pdf_file(tmp_path / f"test-{index}.pdf", test_password = "password"))
+        for index in range(8)
+    ]
+
+    async def _test() -> UnlockResult:
+        """
+        Get the first result of unlocking PDF files and close the pipeline.
+
+        :returns: First result.
+        """
+
+        unlock_results = unlock_many_async(test_file_paths, ["password"], jobs = 1)
+
+        try:
+            return await anext(unlock_results)
+        finally:
+            await unlock_results.aclose()
+
+    assert run(_test()).file_state == FileState.UNLOCKED
+
+def test_unlock_many_async_raises_stage_exception(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `unlock_many_async`
+    raises the exception of a stage of the pipeline that failed as a whole.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    def _mock_generate_pdf_file_paths(*arguments: object, **keyword_arguments: object) -> None:
+        """
+        Mock function of `_generate_pdf_file_paths` that
+        fails to discover PDF files.
+
+        :param arguments: Positional arguments.
+        :param keyword_arguments: Keyword arguments.
+        :raises RuntimeError: Always.
+        """
+
+        raise RuntimeError("test")
+
+    monkeypatch.setattr(
+        name = "_generate_pdf_file_paths",
+        target = target,
+        value = _mock_generate_pdf_file_paths
+    )
+
+    with raises(
+        expected_exception = RuntimeError,
+        match = "test"
+    ):
+        run(_collect_unlock_results([], ["password"], jobs = 1))
+
+@mark.parametrize(
+    "test_passwords, test_job_count, test_message",
+    [
+        ([], 1, "At least one password must be given."),
+        (["password"], 0, "Job count must be a positive integer.")
+    ]
+)
+def test_unlock_many_async_raises_exception(
+    test_job_count: int,
+    test_message: str,
+    test_passwords: list[str]
+) -> None:
+    """
+    Assert that `unlock_many_async`
+    raises an appropriate exception
+    as soon as it is iterated with no password or a non-positive job count.
+
+    :param test_job_count: Mock number of worker processes.
+    :param test_message: Expected error message.
+    :param test_passwords: Mock passwords.
+    """
+
+    with raises(
+        expected_exception = ValueError,
+        match = test_message
+    ):
+        run(_collect_unlock_results([], test_passwords, jobs = test_job_count))
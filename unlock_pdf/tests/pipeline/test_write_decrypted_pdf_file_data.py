@@ -0,0 +1,62 @@
+"""Tests for `_write_decrypted_pdf_file_data`."""
+
+# pyright: reportPrivateUsage=false
+
+from asyncio import run
+from pathlib import Path
+from unlock_pdf.enumerations import FileState
+from unlock_pdf.pipeline import _write_decrypted_pdf_file_data
+from unlock_pdf.types import DecryptedPdfFile, UnlockResult
+
+def test_write_decrypted_pdf_file_data_passes_unlock_result_through() -> None:
+    """
+    Assert that `_write_decrypted_pdf_file_data`
+    returns the result of a PDF file as is
+    when said PDF file already failed.
+    """
+
+    test_unlock_result = UnlockResult("test.pdf", FileState.FAILED, error = "OSError: test")
+
+    assert run(_write_decrypted_pdf_file_data(test_unlock_result, None)) == test_unlock_result
+
+def test_write_decrypted_pdf_file_data_returns_unlock_result(tmp_path: Path) -> None:
+    """
+    Assert that `_write_decrypted_pdf_file_data`
+    writes a PDF file that got unlocked
+    and returns its result.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_file_path = str(tmp_path / "test.pdf")
+
+    (tmp_path / "test.pdf").write_bytes(b"locked")
+
+    assert run(
+        _write_decrypted_pdf_file_data(
+            DecryptedPdfFile(test_file_path, FileState.UNLOCKED, "password", 2, b"unlocked"),
+            None
+        )
+    ) == UnlockResult(test_file_path, FileState.UNLOCKED, "password", 2)
+    assert (tmp_path / "test.pdf").read_bytes() == b"unlocked"
+
+def test_write_decrypted_pdf_file_data_returns_failed_unlock_result(tmp_path: Path) -> None:
+    """
+    Assert that `_write_decrypted_pdf_file_data`
+    returns a failed result along with its error
+    when the PDF file cannot be written.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "output").write_bytes(b"")
+
+    unlock_result = run(
+        _write_decrypted_pdf_file_data(
+            DecryptedPdfFile(str(tmp_path / "test.pdf"), FileState.UNLOCKED, "password", 1, b"unlocked"),
+            str(tmp_path / "output")
+        )
+    )
+
+    assert unlock_result.file_state == FileState.FAILED
+    assert unlock_result.error is not None
@@ -0,0 +1 @@
+"""Tests for `unlock-pdf` server functions."""
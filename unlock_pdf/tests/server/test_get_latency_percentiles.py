@@ -0,0 +1,40 @@
+"""Tests for `_get_latency_percentiles`."""
+
+# pyright: reportPrivateUsage=false
+
+from pytest import mark
+from unlock_pdf.server import _get_latency_percentiles
+
+@mark.parametrize(
+    "test_latencies, test_latency_percentiles",
+    [
+        (
+            [],
+            {}
+        ),
+        (
+            [0.005],
+            {"p50": 5.0, "p90": 5.0, "p99": 5.0}
+        ),
+        (
+            [index / 1000 for index in range(100, 0, -1)],
+            {"p50": 50.0, "p90": 90.0, "p99": 99.0}
+        )
+    ]
+)
+def test_get_latency_percentiles_returns_latency_percentiles(
+    test_latencies: list[float],
+    test_latency_percentiles: dict[str, float]
+) -> None:
+    """
+    Assert that `_get_latency_percentiles`
+    returns the nearest-rank latency percentiles in milliseconds regardless of the order of latencies.
+
+    :param test_latencies: Mock latencies, in seconds.
+    :param test_latency_percentiles: Expected latency percentiles, in milliseconds.
+    """
+
+    assert _get_latency_percentiles(test_latencies) == {
+        name: latency
+        for name, latency in test_latency_percentiles.items()
+    }
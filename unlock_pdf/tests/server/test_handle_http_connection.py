@@ -0,0 +1,152 @@
+"""Tests for `_handle_http_connection`."""
+
+# pyright: reportPrivateUsage=false
+
+from asyncio import Semaphore, run, start_server
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from json import loads
+from pytest import MonkeyPatch, mark
+from tests.utilities import send_test_http_request
+from unlock_pdf.enumerations import SaveProfile
+from unlock_pdf.server import _handle_http_connection
+from unlock_pdf.types import HttpRequest, HttpResponse
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.server as target
+
+async def _handle_test_http_request(
+    test_request: bytes,
+    test_latencies: deque[float]
+) -> tuple[int, dict[str, str], bytes]:
+    """
+    Send a raw HTTP request to a local server that handles each connection via `_handle_http_connection`.
+
+    :param test_request: Raw HTTP request.
+    :param test_latencies: Latencies of served unlock requests.
+    :returns: Status code, headers, and body of the HTTP response.
+    """
+
+    with ThreadPoolExecutor() as test_executor:
+        test_server = await start_server(
+            lambda reader, writer: _handle_http_connection(
+                executor = test_executor,
+                latencies = test_latencies,
+                max_request_size = 16,
+                passwords = ["password"],
+                reader = reader,
+                save_profile = SaveProfile.FAST,
+                semaphore = Semaphore(1),
+                writer = writer
+            ),
+            host = "127.0.0.1",
+            port = 0
+        )
+
+        async with test_server:
+            return await send_test_http_request(
+                test_server.sockets[0].getsockname()[1],
+                test_request
+            )
+
+def test_handle_http_connection_unlocks_http_request(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_handle_http_connection`
+    answers an unlock request with its HTTP response and records its latency.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    async def _mock_unlock_http_request(
+        request: HttpRequest,
+        passwords: list[str],
+        executor: object,
+        save_profile: SaveProfile
+    ) -> HttpResponse:
+        """
+        Mock function of `unlock_pdf.server._unlock_http_request` that
+        returns the body of the unlock request as is.
+
+        :param request: Unlock request.
+        :param passwords: Passwords of the unlock server.
+        :param executor: Executor to unlock the PDF file in.
+        :param save_profile: Profile to save the unlocked PDF file with.
+        :returns: Mock HTTP response.
+        """
+
+        assert passwords == ["password"]
+
+        return HttpResponse(HTTPStatus.OK, request.body)
+
+    monkeypatch.setattr(
+        name = "_unlock_http_request",
+        target = target,
+        value = _mock_unlock_http_request
+    )
+
+    test_latencies: deque[float] = deque()
+
+    assert run(
+        _handle_test_http_request(
+            b"POST /unlock HTTP/1.1\r\nContent-Length: 4\r\n\r\n%PDF",
+            test_latencies
+        )
+    ) == (
+        200,
+        {"content-type": "application/json", "content-length": "4", "connection": "close"},
+        b"%PDF"
+    )
+    assert len(test_latencies) == 1
+
+def test_handle_http_connection_returns_latency_percentiles() -> None:
+    """
+    Assert that `_handle_http_connection`
+    answers a stats request with the count and percentiles of the latencies of served unlock requests.
+    """
+
+    status, _, body = run(
+        _handle_test_http_request(
+            b"GET /stats HTTP/1.1\r\n\r\n",
+            deque([0.001, 0.002])
+        )
+    )
+
+    assert status == 200
+    assert loads(body) == {"count": 2, "p50": 1.0, "p90": 2.0, "p99": 2.0}
+
+@mark.parametrize(
+    "test_request, test_status",
+    [
+        (b"GET /unknown HTTP/1.1\r\n\r\n", HTTPStatus.NOT_FOUND),
+        (b"GET /unlock HTTP/1.1\r\n\r\n", HTTPStatus.METHOD_NOT_ALLOWED),
+        (b"POST /stats HTTP/1.1\r\n\r\n", HTTPStatus.METHOD_NOT_ALLOWED),
+        (b"GET /stats\r\n\r\n", HTTPStatus.BAD_REQUEST),
+        (b"POST /unlock HTTP/1.1\r\nContent-Length: 17\r\n\r\n", HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+    ]
+)
+def test_handle_http_connection_rejects_http_request(
+    test_request: bytes,
+    test_status: HTTPStatus
+) -> None:
+    """
+    Assert that `_handle_http_connection`
+    answers an HTTP request with an appropriate status and error without recording its latency
+    when it targets an unknown route or method, or when it is malformed or too large.
+
+    :param test_request: Mock raw HTTP request.
+    :param test_status: Expected status.
+    """
+
+    test_latencies: deque[float] = deque()
+
+    status, _, body = run(_handle_test_http_request(test_request, test_latencies))
+
+    assert status == test_status
+    assert "error" in loads(body)
+    assert not test_latencies
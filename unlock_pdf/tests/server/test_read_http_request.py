@@ -0,0 +1,86 @@
+"""Tests for `_read_http_request`."""
+
+# pyright: reportPrivateUsage=false
+
+from asyncio import StreamReader, run
+from http import HTTPStatus
+from pytest import mark
+from unlock_pdf.server import _read_http_request
+from unlock_pdf.types import HttpRequest, HttpResponse
+
+async def _read_test_http_request(test_request: bytes, test_limit: int = 65536) -> HttpRequest | HttpResponse:
+    """
+    Read a raw HTTP request from a stream.
+
+    :param test_request: Raw HTTP request.
+    :param test_limit: Limit of the stream.
+    :returns: HTTP request, or the HTTP response to answer it with.
+    """
+
+    reader = StreamReader(limit = test_limit)
+
+    reader.feed_data(test_request)
+    reader.feed_eof()
+
+    return await _read_http_request(reader, 16)
+
+@mark.parametrize(
+    "test_request, test_http_request",
+    [
+        (
+            b"GET /stats?verbose HTTP/1.1\r\nHost: localhost\r\n\r\n",
+            HttpRequest("GET", "/stats", {"host": "localhost"})
+        ),
+        (
+            b"POST /unlock HTTP/1.1\r\nContent-Length: 4\r\nX-Passwords: [\"a\"]\r\n\r\n%PDF",
+            HttpRequest("POST", "/unlock", {"content-length": "4", "x-passwords": "[\"a\"]"}, b"%PDF")
+        )
+    ]
+)
+def test_read_http_request_returns_http_request(
+    test_http_request: HttpRequest,
+    test_request: bytes
+) -> None:
+    """
+    Assert that `_read_http_request`
+    returns an HTTP request along with its body
+    when the HTTP request is well-formed.
+
+    :param test_http_request: Expected HTTP request.
+    :param test_request: Mock raw HTTP request.
+    """
+
+    assert run(_read_test_http_request(test_request)) == test_http_request
+
+@mark.parametrize(
+    "test_request, test_limit, test_status",
+    [
+        (b"GET /stats HTTP/1.1\r\n", 65536, HTTPStatus.BAD_REQUEST),
+        (b"GET /stats HTTP/1.1\r\n" + b"A: " + b"a" * 64 + b"\r\n\r\n", 32, HTTPStatus.BAD_REQUEST),
+        (b"GET /stats\r\n\r\n", 65536, HTTPStatus.BAD_REQUEST),
+        (b"GET /stats FTP/1.1\r\n\r\n", 65536, HTTPStatus.BAD_REQUEST),
+        (b"GET /stats HTTP/1.1\r\nHost\r\n\r\n", 65536, HTTPStatus.BAD_REQUEST),
+        (b"POST /unlock HTTP/1.1\r\nContent-Length: -1\r\n\r\n", 65536, HTTPStatus.BAD_REQUEST),
+        (b"POST /unlock HTTP/1.1\r\nContent-Length: 17\r\n\r\n", 65536, HTTPStatus.REQUEST_ENTITY_TOO_LARGE),
+        (b"POST /unlock HTTP/1.1\r\nContent-Length: 8\r\n\r\n%PDF", 65536, HTTPStatus.BAD_REQUEST)
+    ]
+)
+def test_read_http_request_returns_http_response(
+    test_limit: int,
+    test_request: bytes,
+    test_status: HTTPStatus
+) -> None:
+    """
+    Assert that `_read_http_request`
+    returns an HTTP response with an appropriate status
+    when the HTTP request is malformed, cut off, or too large.
+
+    :param test_limit: Mock limit of the stream.
+    :param test_request: Mock raw HTTP request.
+    :param test_status: Expected status.
+    """
+
+    http_response = run(_read_test_http_request(test_request, test_limit))
+
+    assert isinstance(http_response, HttpResponse)
+    assert http_response.status == test_status
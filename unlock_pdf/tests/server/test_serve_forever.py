@@ -0,0 +1,53 @@
+"""Tests for `_serve_forever`."""
+
+# pyright: reportPrivateUsage=false
+
+from asyncio import create_task, gather, run, sleep
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pytest import CaptureFixture
+from re import search
+from tests.utilities import send_test_http_request
+from unlock_pdf.classes import ServeOptions
+from unlock_pdf.functions import _get_serve_options
+from unlock_pdf.server import _serve_forever
+
+def test_serve_forever_serves_until_cancelled(capsys: CaptureFixture[str]) -> None:
+    """
+    Assert that `_serve_forever`
+    logs where it serves unlock requests and keeps serving them until cancelled.
+
+    :param capsys: `pytest` fixture for capturing outputs.
+    """
+
+    test_options: ServeOptions = _get_serve_options(["--port", "0", "--jobs", "1"])
+
+    async def _test() -> int:
+        """
+        Serve unlock requests, send a stats request, and cancel serving.
+
+        :returns: Status code of the HTTP response.
+        """
+
+        with ThreadPoolExecutor() as test_executor:
+            test_task = create_task(
+                _serve_forever(test_options, test_executor, deque(), ["password"])
+            )
+
+            while (match := search(r":(\d+) ", capsys.readouterr().out)) is None:
+                await sleep(0.01)
+
+            status, _, _ = await send_test_http_request(
+                int(match.group(1)),
+                b"GET /stats HTTP/1.1\r\n\r\n"
+            )
+
+            test_task.cancel()
+
+            await gather(test_task, return_exceptions = True)
+
+            assert test_task.cancelled()
+
+            return status
+
+    assert run(_test()) == 200
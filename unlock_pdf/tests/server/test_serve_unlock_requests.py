@@ -0,0 +1,99 @@
+"""Tests for `serve_unlock_requests`."""
+
+# pyright: reportPrivateUsage=false
+
+from collections import deque
+from concurrent.futures import Executor
+from pytest import CaptureFixture, MonkeyPatch, mark
+from unlock_pdf.classes import ServeOptions
+from unlock_pdf.enumerations import InputSeparator
+from unlock_pdf.functions import _get_serve_options
+from unlock_pdf.server import serve_unlock_requests
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.server as target
+
+@mark.parametrize(
+    "test_arguments, test_passwords",
+    [
+        (["--jobs", "1"], []),
+        (["--jobs", "2", "--passwords-from", "env:PASSWORDS", "--null"], ["password"])
+    ]
+)
+def testserve_unlock_requests_logs_latency_percentiles(
+    capsys: CaptureFixture[str],
+    monkeypatch: MonkeyPatch,
+    test_arguments: list[str],
+    test_passwords: list[str]
+) -> None:
+    """
+    Assert that `serve_unlock_requests`
+    serves unlock requests with the passwords read from the input source, if any, until interrupted
+    and logs the latency percentiles of served unlock requests afterwards.
+
+    :param capsys: `pytest` fixture for capturing outputs.
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    :param test_arguments: Mock command-line arguments.
+    :param test_passwords: Expected passwords of the unlock server.
+    """
+
+    def _mock_get_passwords(source: str | None, separator: InputSeparator) -> list[str]:
+        """
+        Mock function of `unlock_pdf.server._get_passwords` that
+        returns a mock password.
+
+        :param source: Input source to read passwords from.
+        :param separator: Separator between passwords in the input source.
+        :returns: Mock passwords.
+        """
+
+        assert source == "env:PASSWORDS"
+        assert separator == InputSeparator.NULL
+
+        return ["password"]
+
+    async def _mock_serve_forever(
+        options: ServeOptions,
+        executor: Executor,
+        latencies: deque[float],
+        passwords: list[str]
+    ) -> None:
+        """
+        Mock function of `unlock_pdf.server._serve_forever` that
+        serves an unlock request before being interrupted.
+
+        :param options: Command-line options of the unlock server.
+        :param executor: Executor to unlock PDF files in.
+        :param latencies: Latencies of served unlock requests.
+        :param passwords: Passwords of the unlock server.
+        :raises KeyboardInterrupt: After the unlock request is served.
+        """
+
+        assert passwords == test_passwords
+        assert executor.submit(sum, [1, 2]).result() == 3
+
+        latencies.append(0.005)
+
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(
+        name = "_get_passwords",
+        target = target,
+        value = _mock_get_passwords
+    )
+    monkeypatch.setattr(
+        name = "_serve_forever",
+        target = target,
+        value = _mock_serve_forever
+    )
+
+    serve_unlock_requests(_get_serve_options(test_arguments))
+
+    assert capsys \
+        .readouterr() \
+        .out == "Unlock requests took 5.00 ms at p50, 5.00 ms at p90, 5.00 ms at p99.\n"
@@ -0,0 +1,100 @@
+"""Tests for `_start_unlock_server`."""
+
+# pyright: reportPrivateUsage=false
+
+from asyncio import gather, run, sleep
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from pytest import MonkeyPatch
+from tests.utilities import send_test_http_request
+from unlock_pdf.enumerations import SaveProfile
+from unlock_pdf.server import _start_unlock_server
+from unlock_pdf.types import HttpRequest, HttpResponse
+
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.server as target
+
+def test_start_unlock_server_limits_concurrency(monkeypatch: MonkeyPatch) -> None:
+    """
+    Assert that `_start_unlock_server`
+    serves every unlock request while unlocking at most the given number of them at once.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
+    """
+
+    test_unlock_counts = [0, 0]
+
+    async def _mock_unlock_http_request(
+        request: HttpRequest,
+        passwords: list[str],
+        executor: object,
+        save_profile: SaveProfile
+    ) -> HttpResponse:
+        """
+        Mock function of `unlock_pdf.server._unlock_http_request` that
+        keeps track of how many unlock requests are unlocked at once.
+
+        :param request: Unlock request.
+        :param passwords: Passwords of the unlock server.
+        :param executor: Executor to unlock the PDF file in.
+        :param save_profile: Profile to save the unlocked PDF file with.
+        :returns: Mock HTTP response.
+        """
+
+        test_unlock_counts[0] += 1
+        test_unlock_counts[1] = max(test_unlock_counts)
+
+        await sleep(0.01)
+
+        test_unlock_counts[0] -= 1
+
+        return HttpResponse(HTTPStatus.OK)
+
+    monkeypatch.setattr(
+        name = "_unlock_http_request",
+        target = target,
+        value = _mock_unlock_http_request
+    )
+
+    async def _test() -> list[int]:
+        """
+        Send several unlock requests at once to a started unlock server.
+
+        :returns: Status codes of the HTTP responses.
+        """
+
+        test_latencies: deque[float] = deque()
+
+        with ThreadPoolExecutor() as test_executor:
+            test_server = await _start_unlock_server(
+                executor = test_executor,
+                host = "127.0.0.1",
+                latencies = test_latencies,
+                max_concurrency = 2,
+                max_request_size = 16,
+                passwords = ["password"],
+                port = 0,
+                save_profile = SaveProfile.FAST
+            )
+
+            async with test_server:
+                test_responses = await gather(*[
+                    send_test_http_request(
+                        test_server.sockets[0].getsockname()[1],
+                        b"POST /unlock HTTP/1.1\r\nContent-Length: 0\r\n\r\n"
+                    )
+                    for _ in range(6)
+                ])
+
+        assert len(test_latencies) == 6
+
+        return [status for status, _, _ in test_responses]
+
+    assert run(_test()) == [200] * 6
+    assert test_unlock_counts == [0, 2]
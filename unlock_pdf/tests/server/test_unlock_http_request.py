@@ -0,0 +1,168 @@
+"""Tests for `_unlock_http_request`."""
+
+# pyright: reportPrivateUsage=false
+
+from asyncio import run
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from io import BytesIO
+from json import loads
+from pathlib import Path
+from pikepdf import Pdf
+from pytest import mark
+from tests.utilities import generate_test_pdf_file
+from unlock_pdf.enumerations import ContentType, SaveProfile
+from unlock_pdf.server import _unlock_http_request
+from unlock_pdf.types import HttpRequest, HttpResponse
+
+def _unlock_test_http_request(
+    test_body: bytes,
+    test_headers: dict[str, str],
+    test_passwords: list[str]
+) -> HttpResponse:
+    """
+    Unlock the PDF file in the body of an unlock request in a thread pool.
+
+    :param test_body: Body of the unlock request.
+    :param test_headers: Headers of the unlock request, besides its content length.
+    :param test_passwords: Passwords of the unlock server.
+    :returns: HTTP response.
+    """
+
+    with ThreadPoolExecutor() as test_executor:
+        return run(
+            _unlock_http_request(
+                HttpRequest(
+                    "POST",
+                    "/unlock",
+                    {"content-length": str(len(test_body))} | test_headers,
+                    test_body
+                ),
+                test_passwords,
+                test_executor,
+                SaveProfile.FAST
+            )
+        )
+
+@mark.parametrize(
+    "test_headers, test_passwords, test_attempt_count",
+    [
+        ({"x-passwords": "[\"password-0\", \"password\"]"}, [], "2"),
+        ({}, ["password"], "1"),
+        ({"x-passwords": "[]"}, ["password-0", "password"], "2")
+    ]
+)
+def test_unlock_http_request_returns_unlocked_pdf_file(
+    tmp_path: Path,
+    test_attempt_count: str,
+    test_headers: dict[str, str],
+    test_passwords: list[str]
+) -> None:
+    """
+    Assert that `_unlock_http_request`
+    returns the unlocked PDF file along with its attempt count
+    using the passwords of the unlock request, or those of the unlock server if it has none.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_attempt_count: Expected attempt count.
+    :param test_headers: Mock headers of the unlock request.
+    :param test_passwords: Mock passwords of the unlock server.
+    """
+
+    test_data = generate_test_pdf_file(tmp_path / "test.pdf", test_password = "password").read_bytes()
+
+    http_response = _unlock_test_http_request(test_data, test_headers, test_passwords)
+
+    assert http_response.status == HTTPStatus.OK
+    assert http_response.content_type == ContentType.PDF
+    assert http_response.headers == {"x-attempt-count": test_attempt_count, "x-file-state": "unlocked"}
+
+    with Pdf.open(BytesIO(http_response.body)) as test_pdf:
+        assert not test_pdf.is_encrypted
+
+@mark.parametrize(
+    "test_password, test_status, test_file_state",
+    [
+        (None, HTTPStatus.OK, "not locked"),
+        ("password-0", HTTPStatus.UNPROCESSABLE_ENTITY, "still locked")
+    ]
+)
+def test_unlock_http_request_returns_file_state(
+    tmp_path: Path,
+    test_file_state: str,
+    test_password: str | None,
+    test_status: HTTPStatus
+) -> None:
+    """
+    Assert that `_unlock_http_request`
+    returns the file state of the PDF file as JSON
+    when it is not locked or is still locked.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_file_state: Expected file state.
+    :param test_password: User password to encrypt the PDF file with, if any.
+    :param test_status: Expected status.
+    """
+
+    test_data = generate_test_pdf_file(tmp_path / "test.pdf", test_password = test_password).read_bytes()
+
+    assert _unlock_test_http_request(test_data, {}, ["password"]) == HttpResponse(
+        test_status,
+        f"{{\"file_state\": \"{test_file_state}\"}}".encode()
+    )
+
+def test_unlock_http_request_returns_error() -> None:
+    """
+    Assert that `_unlock_http_request`
+    returns the error that made unlocking the PDF file fail as JSON
+    when the PDF file is malformed.
+    """
+
+    http_response = _unlock_test_http_request(b"%PDF-1.7", {}, ["password"])
+
+    assert http_response.status == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert loads(http_response.body)["file_state"] == "in error"
+    assert loads(http_response.body)["error"].startswith("PdfError: ")
+
+@mark.parametrize(
+    "test_headers, test_passwords, test_status",
+    [
+        ({"x-passwords": "password"}, ["password"], HTTPStatus.BAD_REQUEST),
+        ({"x-passwords": "{\"password\": 1}"}, ["password"], HTTPStatus.BAD_REQUEST),
+        ({"x-passwords": "[1]"}, ["password"], HTTPStatus.BAD_REQUEST),
+        ({}, [], HTTPStatus.BAD_REQUEST)
+    ]
+)
+def test_unlock_http_request_rejects_passwords(
+    test_headers: dict[str, str],
+    test_passwords: list[str],
+    test_status: HTTPStatus
+) -> None:
+    """
+    Assert that `_unlock_http_request`
+    returns an HTTP response with an appropriate status
+    when the passwords header is malformed or when no password is given at all.
+
+    :param test_headers: Mock headers of the unlock request.
+    :param test_passwords: Mock passwords of the unlock server.
+    :param test_status: Expected status.
+    """
+
+    assert _unlock_test_http_request(b"%PDF-1.7", test_headers, test_passwords).status == test_status
+
+def test_unlock_http_request_requires_content_length() -> None:
+    """
+    Assert that `_unlock_http_request`
+    returns an HTTP response with an appropriate status
+    when the unlock request has no content length.
+    """
+
+    with ThreadPoolExecutor() as test_executor:
+        assert run(
+            _unlock_http_request(
+                HttpRequest("POST", "/unlock", {}),
+                ["password"],
+                test_executor,
+                SaveProfile.FAST
+            )
+        ).status == HTTPStatus.LENGTH_REQUIRED
@@ -0,0 +1,52 @@
+"""Tests for `_write_http_response`."""
+
+# pyright: reportPrivateUsage=false
+
+from asyncio import open_connection, run
+from http import HTTPStatus
+from socket import socketpair
+from unlock_pdf.enumerations import ContentType
+from unlock_pdf.server import _write_http_response
+from unlock_pdf.types import HttpResponse
+
+def test_write_http_response_writes_http_response() -> None:
+    """
+    Assert that `_write_http_response`
+    writes an HTTP response with its content type, content length, and additional headers.
+    """
+
+    async def _test() -> bytes:
+        """
+        Write an HTTP response to one end of a socket pair and read it from the other end.
+
+        :returns: Raw HTTP response.
+        """
+
+        test_reader_socket, test_writer_socket = socketpair()
+        # <NOTE>
+        # Both streams of each end are kept referenced,
+        # as a stream writer closes its end once it is garbage-collected.
+        test_reader, test_reader_writer = await open_connection(sock = test_reader_socket)
+        _, test_writer = await open_connection(sock = test_writer_socket)
+
+        await _write_http_response(
+            test_writer,
+            HttpResponse(HTTPStatus.OK, b"%PDF", ContentType.PDF, {"x-file-state": "unlocked"})
+        )
+
+        test_writer.close()
+        await test_writer.wait_closed()
+
+        response = await test_reader.read()
+
+        test_reader_writer.close()
+
+        return response
+
+    assert run(_test()) == b"HTTP/1.1 200 OK\r\n" \
+        b"Content-Type: application/pdf\r\n" \
+        b"Content-Length: 4\r\n" \
+        b"Connection: close\r\n" \
+        b"X-File-State: unlocked\r\n" \
+        b"\r\n" \
+        b"%PDF"
@@ -1,7 +1,237 @@
 """Tests for `unlock-pdf` classes."""
 
+from json import dumps
+from pathlib import Path
+from pytest import mark, raises
+from unlock_pdf.classes import (
+    DirectoryManifest,
+    FileOutcomes,
+    FingerprintPasswords,
+    JsonCache,
+    MemoryFootprints,
+    PasswordHits,
+    UniquePaths
+)
 from unlock_pdf.enumerations import MessageEnum
 
+def test_directory_manifest_remembers_and_persists_directories(tmp_path: Path) -> None:
+    """
+    Assert that PDF files and subdirectories of directories
+    are remembered per directory, persisted across runs,
+    and only served as long as the modification time of their directory has not changed.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    directory_manifest = DirectoryManifest()
+
+    directory_manifest.add("directory", 1, {"test.pdf": 2, "test-link.pdf": None}, ["subdirectory"])
+    directory_manifest.dump(str(tmp_path / "directory-manifest.json"))
+
+    read_directory_manifest = DirectoryManifest.read(str(tmp_path / "directory-manifest.json"))
+
+    assert read_directory_manifest.get("directory", 1) == ({"test.pdf": 2, "test-link.pdf": None}, ["subdirectory"])
+    assert read_directory_manifest.get("directory", 2) is None
+    assert read_directory_manifest.get("other-directory", 1) is None
+
+@mark.parametrize(
+    "test_content",
+    [
+        None,
+        "not-json",
+        dumps([]),
+        dumps({"directories": []}),
+        dumps({"directories": {"directory": [1, {}]}}),
+        dumps({"directories": {"directory": ["1", {}, []]}}),
+        dumps({"directories": {"directory": [1, [], []]}}),
+        dumps({"directories": {"directory": [1, {"test.pdf": "2"}, []]}}),
+        dumps({"directories": {"directory": [1, {}, {}]}}),
+        dumps({"directories": {"directory": [1, {}, [0]]}})
+    ]
+)
+def test_directory_manifest_reads_no_directories(tmp_path: Path, test_content: str | None) -> None:
+    """
+    Assert that PDF files and subdirectories of directories
+    are read as none if their JSON file is missing or malformed.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_content: Content of the JSON file, or `None` if it is missing.
+    """
+
+    if test_content is not None:
+        (tmp_path / "directory-manifest.json").write_text(test_content)
+
+    assert DirectoryManifest.read(str(tmp_path / "directory-manifest.json")).get("directory", 1) is None
+
+def test_file_outcomes_remembers_and_persists_outcomes(tmp_path: Path) -> None:
+    """
+    Assert that last outcomes of attempting to unlock PDF files
+    are remembered per signature, persisted across runs,
+    only kept for PDF files that are still locked with the same set of passwords,
+    and never persist any password as is.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    file_outcomes = FileOutcomes(["password-0", "password-1"])
+
+    file_outcomes.add((1, 2, 3, 4), True)
+    file_outcomes.add((1, 5, 6, 7), False)
+    file_outcomes.dump(str(tmp_path / "file-outcomes.json"))
+
+    read_file_outcomes = FileOutcomes.read(
+        str(tmp_path / "file-outcomes.json"),
+        ["password-1", "password-0", "password-0"]
+    )
+
+    assert [
+        read_file_outcomes.is_locked(file_signature)
+        for file_signature in [(1, 2, 3, 4), (1, 5, 6, 7), (1, 8, 9, 10)]
+    ] == [True, False, None]
+    assert "password" not in (tmp_path / "file-outcomes.json").read_text()
+
+    changed_file_outcomes = FileOutcomes.read(
+        str(tmp_path / "file-outcomes.json"),
+        ["password-0", "password-2"]
+    )
+
+    assert changed_file_outcomes.is_locked((1, 2, 3, 4)) is None
+    assert changed_file_outcomes.is_locked((1, 5, 6, 7)) is False
+
+@mark.parametrize(
+    "test_content",
+    [
+        None,
+        "not-json",
+        dumps([]),
+        dumps({"outcomes": {}}),
+        dumps({"outcomes": {}, "salt": "not-hexadecimal"}),
+        dumps({"outcomes": [], "salt": "00"}),
+        dumps({"outcomes": {"1:5:6:7": 0}, "salt": "00"})
+    ]
+)
+def test_file_outcomes_reads_no_outcomes(tmp_path: Path, test_content: str | None) -> None:
+    """
+    Assert that last outcomes of attempting to unlock PDF files
+    are read as none if their JSON file is missing or malformed.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_content: Content of the JSON file, or `None` if it is missing.
+    """
+
+    if test_content is not None:
+        (tmp_path / "file-outcomes.json").write_text(test_content)
+
+    assert FileOutcomes.read(
+        str(tmp_path / "file-outcomes.json"),
+        ["password"]
+    ).is_locked((1, 5, 6, 7)) is None
+
+def test_fingerprint_passwords_remembers_and_persists_passwords(tmp_path: Path) -> None:
+    """
+    Assert that passwords that unlocked PDF files keyed on their encryption fingerprints
+    are remembered per fingerprint, persisted across runs
+    even if passwords are given in another order,
+    and never persist any password as is.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    test_passwords = ["password-0", "password-1"]
+    fingerprint_passwords = FingerprintPasswords(test_passwords)
+
+    fingerprint_passwords.add("fingerprint-0", "password-0")
+    fingerprint_passwords.add("fingerprint-1", "password-0")
+    fingerprint_passwords.add("fingerprint-1", "password-1")
+    fingerprint_passwords.dump(str(tmp_path / "fingerprint-passwords.json"))
+
+    read_fingerprint_passwords = FingerprintPasswords.read(
+        str(tmp_path / "fingerprint-passwords.json"),
+        test_passwords
+    )
+
+    assert [
+        read_fingerprint_passwords[fingerprint]
+        for fingerprint in ["fingerprint-0", "fingerprint-1", "fingerprint-2"]
+    ] == ["password-0", "password-1", None]
+    assert "password" not in (tmp_path / "fingerprint-passwords.json").read_text()
+    assert FingerprintPasswords.read(
+        str(tmp_path / "fingerprint-passwords.json"),
+        ["password-1", "password-0"]
+    )["fingerprint-1"] == "password-1"
+    assert FingerprintPasswords.read(
+        str(tmp_path / "fingerprint-passwords.json"),
+        ["password-0"]
+    )["fingerprint-1"] is None
+
+@mark.parametrize(
+    "test_content",
+    [
+        None,
+        "not-json",
+        dumps([]),
+        dumps({}),
+        dumps({"identities": {}, "salt": "not-hexadecimal"}),
+        dumps({"identities": [], "salt": "00"}),
+        dumps({"identities": {"fingerprint": 0}, "salt": "00"})
+    ]
+)
+def test_fingerprint_passwords_reads_no_passwords(tmp_path: Path, test_content: str | None) -> None:
+    """
+    Assert that passwords that unlocked PDF files keyed on their encryption fingerprints
+    are read as none if their JSON file is missing or malformed.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_content: Content of the JSON file, or `None` if it is missing.
+    """
+
+    if test_content is not None:
+        (tmp_path / "fingerprint-passwords.json").write_text(test_content)
+
+    assert FingerprintPasswords.read(
+        str(tmp_path / "fingerprint-passwords.json"),
+        ["password"]
+    )["fingerprint"] is None
+
+def test_json_cache_requires_conversion() -> None:
+    """
+    Assert that a cache that does not convert itself into a JSON-serializable object
+    cannot be instantiated.
+    """
+
+    with raises(TypeError):
+        JsonCache() # pyright: ignore[reportAbstractUsage]
+
+def test_memory_footprints_follows_largest_measured_ratio() -> None:
+    """
+    Assert that memory footprints
+    are estimated via their initial ratio until a large enough PDF file is measured,
+    and then via the largest ratio measured since.
+    """
+
+    memory_footprints = MemoryFootprints(
+        minimum_size = 1000,
+        ratio = 4.0
+    )
+
+    assert memory_footprints.estimate(1000) == 4000
+
+    memory_footprints.measure(999, 999_000)
+
+    assert memory_footprints.estimate(1000) == 4000
+
+    memory_footprints.measure(1000, 1500)
+
+    assert memory_footprints.estimate(1000) == 1500
+
+    memory_footprints.measure(2000, 2000)
+
+    assert memory_footprints.estimate(1000) == 1500
+
+    memory_footprints.measure(1000, 2500)
+
+    assert memory_footprints.estimate(3) == 8
+
 def test_message_enum_stringifies() -> None:
     """
     Assert that a message enumeration
@@ -17,3 +247,119 @@ def test_message_enum_stringifies() -> None:
 
     assert str(_TestMessageEnum.NON_STRING) == "_TestMessageEnum.NON_STRING"
     assert str(_TestMessageEnum.STRING) == "test-value"
+
+def test_password_hits_counts_and_persists_hits(tmp_path: Path) -> None:
+    """
+    Assert that counts of how many PDF files each password unlocked
+    are counted per password, persisted across runs,
+    and never persist any password as is.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    password_hits = PasswordHits()
+
+    password_hits.add("password-0")
+    password_hits.add("password-1")
+    password_hits.add("password-1")
+    password_hits.dump(str(tmp_path / "password-hits.json"))
+
+    read_password_hits = PasswordHits.read(str(tmp_path / "password-hits.json"))
+
+    assert [
+        read_password_hits[password]
+        for password in ["password-0", "password-1", "password-2"]
+    ] == [1, 2, 0]
+    assert "password" not in (tmp_path / "password-hits.json").read_text()
+    assert not (tmp_path / "password-hits.json.tmp").exists()
+    assert PasswordHits().identify("password") != PasswordHits().identify("password")
+
+@mark.parametrize(
+    "test_content",
+    [
+        None,
+        "not-json",
+        dumps([]),
+        dumps({"counts": {}}),
+        dumps({"counts": {}, "salt": "not-hexadecimal"}),
+        dumps({"counts": {}, "salt": 0}),
+        dumps({"counts": [], "salt": "00"}),
+        dumps({"counts": {"identity": "1"}, "salt": "00"}),
+        dumps({"counts": {"identity": True}, "salt": "00"})
+    ]
+)
+def test_password_hits_reads_empty_hits(tmp_path: Path, test_content: str | None) -> None:
+    """
+    Assert that counts of how many PDF files each password unlocked
+    are read as empty
+    when their JSON file is missing or malformed.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    :param test_content: Mock content of the JSON file, if any.
+    """
+
+    if test_content is not None:
+        (tmp_path / "password-hits.json").write_text(test_content)
+
+    read_password_hits = PasswordHits.read(str(tmp_path / "password-hits.json"))
+
+    assert read_password_hits["password"] == 0
+    assert len(read_password_hits.identify("password")) == 64
+
+def test_unique_paths_deduplicates_by_file_identity(tmp_path: Path) -> None:
+    """
+    Assert that an insertion-ordered set of paths
+    keeps only the first path to every file
+    even when the same file is reached via symbolic links or hard links.
+
+    :param tmp_path: `pytest` fixture for a temporary directory.
+    """
+
+    (tmp_path / "test-0.pdf").touch()
+    (tmp_path / "test-1.pdf").touch()
+    (tmp_path / "hard-link.pdf").hardlink_to(tmp_path / "test-0.pdf")
+    (tmp_path / "symbolic-link.pdf").symlink_to(tmp_path / "test-1.pdf")
+
+    unique_paths = UniquePaths()
+
+    assert [
+        unique_paths.add(str(tmp_path / file_name))
+        for file_name in [
+            "test-0.pdf",
+            "hard-link.pdf",
+            "test-1.pdf",
+            "symbolic-link.pdf",
+            "test-0.pdf"
+        ]
+    ] == [True, False, True, False, False]
+    assert list(unique_paths) == [
+        str(tmp_path / "test-0.pdf"),
+        str(tmp_path / "test-1.pdf")
+    ]
+    assert len(unique_paths) == 2
+    assert str(tmp_path / "hard-link.pdf") in unique_paths
+    assert 0 not in unique_paths
+
+def test_unique_paths_trusts_known_identities() -> None:
+    """
+    Assert that an insertion-ordered set of paths
+    keys paths on the identities they are added with instead of querying them.
+    """
+
+    unique_paths = UniquePaths()
+
+    assert unique_paths.add("missing-test-0.pdf", (1, 2))
+    assert not unique_paths.add("missing-test-1.pdf", (1, 2))
+    assert list(unique_paths) == ["missing-test-0.pdf"]
+
+def test_unique_paths_identifies_missing_files_by_real_path() -> None:
+    """
+    Assert that an insertion-ordered set of paths
+    keys paths that cannot be queried on their resolved real path.
+    """
+
+    unique_paths = UniquePaths(["missing-test.pdf", "./missing-test.pdf"])
+
+    assert unique_paths == UniquePaths(["missing-test.pdf"])
+    assert unique_paths != ["missing-test.pdf"]
+    assert repr(unique_paths) == "UniquePaths(['missing-test.pdf'])"
@@ -1,9 +1,21 @@
 """Tests for `unlock-pdf` entry point."""
 
-from pytest import mark, raises
+from pytest import (
+    MonkeyPatch,
+    mark,
+    raises
+)
 from runpy import run_module
 from unlock_pdf.enumerations import Module
 
+# <NOTE>
+# As the source code prefers named imports over default imports,
+# those named imports must be mocked by having the target be where they are named
+# instead of where they actually came from.
+#
+# See https://pytest.org/en/7.4.x/reference/reference.html#pytest.MonkeyPatch.setattr.
+import unlock_pdf.functions as target
+
 @mark.parametrize(
     "test_executed_module," \
     "test_exception_type, test_exception_message",
@@ -25,6 +37,7 @@ from unlock_pdf.enumerations import Module
     ]
 )
 def test_entry_point_raises_exception(
+    monkeypatch: MonkeyPatch,
     test_exception_message: str | None,
     test_exception_type: type[Exception],
     test_executed_module: str
@@ -40,12 +53,21 @@ def test_entry_point_raises_exception(
     - inputs are expected, and
     - no mock function of `builtins.input` is provided.
 
+    The command-line arguments are mocked as none so that those of `pytest` are not parsed.
+
+    :param monkeypatch: `pytest` fixture for mocking functions.
     :param test_exception_message: Message of exception raised, if relevant to be tested.
                                    Otherwise, `None`.
     :param test_exception_type: Type of exception raised.
     :param test_executed_module: Name of executed module.
     """
 
+    monkeypatch.setattr(
+        name = "argv",
+        target = target,
+        value = ["unlock-pdf"]
+    )
+
     with raises(
         expected_exception = test_exception_type,
         match = test_exception_message
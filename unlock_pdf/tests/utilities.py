@@ -1,6 +1,10 @@
 """`unlock-pdf` test utility functions."""
 
+from asyncio import open_connection
+from pathlib import Path
+from pikepdf import Encryption, ObjectStreamMode, Pdf
 from typing import Callable
+from warnings import catch_warnings, simplefilter
 from unlock_pdf.types import Inputs
 
 def generate_mock_boolean(test_boolean: bool, test_path: str) -> Callable[[str], bool]:
@@ -8,7 +12,8 @@ def generate_mock_boolean(test_boolean: bool, test_path: str) -> Callable[[str],
     Generate either
     
     - `_mock_isdir`,
-    - `_mock_isfile`, or
+    - `_mock_isfile`,
+    - `_mock_has_pdf_file_signature`, or
     - `_mock_is_pdf_file`
     
     given
@@ -18,7 +23,8 @@ def generate_mock_boolean(test_boolean: bool, test_path: str) -> Callable[[str],
     
     :param test_boolean: Mock boolean that tells whether the path satisfies a condition or not.
     :param test_path: Path.
-    :returns: Mock function of either `os.path.isdir`, `os.path.isfile`, or
+    :returns: Mock function of either `os.path.isdir`, `os.path.isfile`,
+              `unlock-pdf.functions._has_pdf_file_signature`, or
               `unlock-pdf.functions._is_pdf_file`.
     """
 
@@ -27,7 +33,8 @@ def generate_mock_boolean(test_boolean: bool, test_path: str) -> Callable[[str],
         Mock function of either
         
         - `os.path.isdir`,
-        - `os.path.isfile`, or
+        - `os.path.isfile`,
+        - `unlock-pdf.functions._has_pdf_file_signature`, or
         - `unlock-pdf.functions._is_pdf_file`
         
         that
@@ -70,3 +77,87 @@ def generate_mock_get_unique_inputs(
         return test_inputs
 
     return _mock_get_unique_inputs
+
+def generate_test_pdf_file(
+    file_path: Path,
+    test_password: str | None = None,
+    test_revision: int = 6,
+    test_should_generate_object_streams: bool = False,
+    test_owner_password: str = "owner-password"
+) -> Path:
+    """
+    Generate a one-page PDF file via `pikepdf` that is encrypted if a password is given.
+
+    :param file_path: Path of the PDF file to generate.
+    :param test_password: User password to encrypt the PDF file with, if any.
+    :param test_revision: Revision of the standard security handler to encrypt the PDF file with.
+    :param test_should_generate_object_streams: Whether to use a cross-reference stream
+                                                instead of a cross-reference table or not.
+    :param test_owner_password: Owner password to encrypt the PDF file with.
+    :returns: Path of the generated PDF file.
+    """
+
+    with Pdf.new() as pdf:
+        pdf.add_blank_page()
+
+        with catch_warnings():
+            # <NOTE>
+            # Revision 5 is deprecated but still needs to be supported.
+            simplefilter("ignore")
+
+            pdf.save(
+                file_path,
+                encryption = (
+                    Encryption(
+                        aes = test_revision >= 4,
+                        metadata = test_revision >= 4,
+                        owner = test_owner_password,
+                        R = test_revision,
+                        user = test_password
+                    )
+                    if test_password is not None
+                    else False
+                ),
+                object_stream_mode = (
+                    ObjectStreamMode.generate
+                    if test_should_generate_object_streams
+                    else ObjectStreamMode.disable
+                )
+            )
+
+    return file_path
+
+async def send_test_http_request(port: int, test_request: bytes) -> tuple[int, dict[str, str], bytes]:
+    """
+    Send a raw HTTP request to a local server and read its whole HTTP response.
+
+    :param port: Port the local server is bound to.
+    :param test_request: Raw HTTP request.
+    :returns: Status code, headers keyed on their lowercase names, and body of the HTTP response.
+    """
+
+    reader, writer = await open_connection("127.0.0.1", port)
+
+    writer.write(test_request)
+    await writer.drain()
+
+    response = await reader.read()
+
+    writer.close()
+    await writer.wait_closed()
+
+    head, _, body = response.partition(b"\r\n\r\n")
+    status_line, *header_lines = head \
+        .decode("latin-1") \
+        .split("\r\n")
+
+    return (
+        int(status_line.split(" ")[1]),
+        {
+            name.lower(): value.strip()
+            for name, _, value in [
+                header_line.partition(":") for header_line in header_lines
+            ]
+        },
+        body
+    )